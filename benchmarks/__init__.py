@@ -0,0 +1,15 @@
+"""Feed-build benchmark suite.
+
+``benchmarks.generator`` builds deterministic synthetic provider payloads
+(WL, ÖBB, Baustellen, Stammstrecke ledger) at a multiple of today's
+volume; ``benchmarks.run`` drives the feed-build stages over them and
+stores the timings as JSON so runs can be compared across commits::
+
+    python -m benchmarks.run --scale 1 10 100
+    python -m benchmarks.run --compare benchmarks/results/<old>.json
+
+``benchmarks.translation`` compares the float32 and int8 translation
+model.
+
+See ``docs/development.md`` (Abschnitt "Benchmarks") for details.
+"""
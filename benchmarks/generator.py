@@ -0,0 +1,342 @@
+"""Deterministic synthetic provider payloads for the feed-build benchmarks.
+
+The payloads mirror the on-disk shapes the feed build consumes — the
+``cache/<provider>/events.json`` lists written by ``update_wl_cache.py``,
+``update_oebb_cache.py`` and ``update_baustellen_cache.py`` and the
+``stammstrecke_<YYYY>.csv`` ledger appended by the Stammstrecke monitor —
+at ``scale`` × today's volume (:data:`BASE_VOLUME`).
+
+Everything derives from ``random.Random(seed)`` and the ``now`` anchor, so
+two calls with the same ``(scale, seed, now)`` produce byte-identical
+payloads. ``now`` is an input rather than a constant because the feed
+build filters by wall-clock age (expired items, the one-hour Stammstrecke
+window); anchoring the synthetic dates at the benchmark's ``now`` keeps
+every run measuring the same survivor set.
+
+The generator deliberately plants the duplicate shapes the dedupe stages
+exist for: exact re-emissions (same ``guid``/``_identity``, as seen when a
+provider returns a message twice) and fuzzy siblings (same stop, subset of
+the lines, different wording) that only :func:`deduplicate_fuzzy` merges.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import math
+import random
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Final
+from zoneinfo import ZoneInfo
+
+from src.utils.files import sanitize_filename
+from src.utils.stats import STAMMSTRECKE_HEADER, WEEKDAY_LABELS
+
+__all__ = [
+    "BASE_VOLUME",
+    "SandboxPaths",
+    "SyntheticPayloads",
+    "generate_payloads",
+    "write_sandbox",
+]
+
+_VIENNA_TZ: Final = ZoneInfo("Europe/Vienna")
+
+# Items per provider cache in a typical production build (WL ~100,
+# ÖBB ~10, Baustellen ~30) and ledger samples per direction and hour.
+BASE_VOLUME: Final[Mapping[str, int]] = {
+    "wl": 100,
+    "oebb": 10,
+    "baustellen": 30,
+    "stammstrecke_samples_per_hour": 2,
+}
+
+# Every n-th WL item is re-emitted verbatim / gets a fuzzy sibling.
+_EXACT_DUPLICATE_EVERY: Final = 12
+_FUZZY_SIBLING_EVERY: Final = 10
+_LEDGER_HOURS: Final = 24
+
+_WL_STOPS: Final = (
+    "Karlsplatz", "Stephansplatz", "Praterstern", "Schwedenplatz",
+    "Westbahnhof", "Volkstheater", "Schottentor", "Längenfeldgasse",
+    "Spittelau", "Floridsdorf", "Kagran", "Meidling Hauptstraße",
+    "Rathaus", "Josefstädter Straße", "Quellenplatz", "Hütteldorf",
+    "Simmering", "Ottakring", "Heiligenstadt", "Siebenhirten",
+    "Schwedenbrücke", "Burggasse-Stadthalle", "Reumannplatz", "Kaisermühlen",
+)
+_WL_LINES: Final = (
+    "U1", "U2", "U3", "U4", "U6", "1", "2", "5", "6", "9", "18", "43",
+    "49", "71", "D", "O", "13A", "48A", "10A", "59A",
+)
+_WL_EVENTS: Final = (
+    ("Störung", "Verkehrsunfall"),
+    ("Störung", "Fahrtbehinderung"),
+    ("Störung", "Schadhaftes Fahrzeug"),
+    ("Baustelle", "Gleisbauarbeiten"),
+    ("Hinweis", "Umleitung"),
+    ("Hinweis", "Haltestellenverlegung"),
+)
+_WL_SIBLING_WORDING: Final = ("Betriebsbehinderung", "Verzögerungen", "Kurzführung")
+
+_OEBB_WIEN: Final = (
+    "Wien Hauptbahnhof", "Wien Meidling", "Wien Floridsdorf",
+    "Wien Praterstern", "Wien Westbahnhof", "Wien Simmering",
+)
+_OEBB_PENDLER: Final = (
+    "Mödling", "Baden", "Felixdorf", "Wiener Neustadt Hbf", "Tullnerfeld",
+    "Gänserndorf", "Stockerau", "Bruck an der Leitha", "Purkersdorf",
+    "Klosterneuburg-Kierling",
+)
+_OEBB_TRAINS: Final = ("S1", "S2", "S3", "S7", "S45", "S50", "S60", "R95", "REX 7")
+
+_BAUSTELLEN_STREETS: Final = (
+    "Matzleinsdorfer Platz", "Gürtel", "Landstraßer Hauptstraße",
+    "Wiedner Hauptstraße", "Praterstraße", "Favoritenstraße",
+    "Brünner Straße", "Simmeringer Hauptstraße", "Linzer Straße",
+    "Währinger Straße", "Alser Straße", "Triester Straße",
+)
+_BAUSTELLEN_MEASURES: Final = ("U-Bahnbau", "Gleisbau", "Leitungsbau", "Fahrbahnsanierung")
+# Rough Vienna bounding box for synthetic site coordinates.
+_VIENNA_LAT: Final = (48.12, 48.32)
+_VIENNA_LON: Final = (16.18, 16.58)
+
+
+@dataclass(frozen=True)
+class SyntheticPayloads:
+    """One generated data set: three provider caches plus the ledger rows."""
+
+    scale: float
+    seed: int
+    now: datetime
+    wl: list[dict[str, Any]]
+    oebb: list[dict[str, Any]]
+    baustellen: list[dict[str, Any]]
+    stammstrecke_rows: list[tuple[str, ...]]
+
+    def volume(self) -> dict[str, int]:
+        """Item / row counts per source, as recorded in the results JSON."""
+        return {
+            "wl": len(self.wl),
+            "oebb": len(self.oebb),
+            "baustellen": len(self.baustellen),
+            "stammstrecke_rows": len(self.stammstrecke_rows),
+        }
+
+
+@dataclass(frozen=True)
+class SandboxPaths:
+    """Directories :func:`write_sandbox` populated."""
+
+    root: Path
+    cache_dir: Path
+    stats_dir: Path
+
+
+def _scaled(base: int, scale: float) -> int:
+    return max(1, math.ceil(base * scale))
+
+
+def _digest(*parts: object) -> str:
+    return hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def _iso(dt: datetime) -> str:
+    return dt.astimezone(_VIENNA_TZ).isoformat(timespec="seconds")
+
+
+def _wl_description(rng: random.Random, event: str, stop: str, lines: list[str], start: datetime) -> str:
+    paragraphs = [
+        f"<h2>{event} {stop}</h2>",
+        f"<p>Wegen {event.lower()} im Bereich {stop} kommt es bei den Linien "
+        f"{', '.join(lines)} zu Unregelm&auml;&szlig;igkeiten.</p>",
+        "<p><span style=\"text-decoration: underline;\"><strong>Zeitraum:</strong></span>"
+        f"<br />Ab {start:%d.%m.%Y}, {start:%H:%M} Uhr.</p>",
+    ]
+    for _ in range(rng.randint(1, 4)):
+        paragraphs.append(
+            f"<p><strong>Ersatz:</strong> Weichen Sie auf die Station {rng.choice(_WL_STOPS)} aus. "
+            "Bitte beachten Sie die Durchsagen und Aush&auml;nge vor Ort.</p>"
+        )
+    return " ".join(paragraphs)
+
+
+def _wl_item(rng: random.Random, seed: int, index: int, now: datetime) -> tuple[dict[str, Any], str, list[str]]:
+    category, event = rng.choice(_WL_EVENTS)
+    stop = rng.choice(_WL_STOPS)
+    lines = rng.sample(_WL_LINES, rng.randint(1, 3))
+    start = now - timedelta(hours=rng.randint(0, 24 * 20))
+    end = now + timedelta(hours=rng.randint(1, 24 * 40))
+    item = {
+        "source": "Wiener Linien",
+        "category": category,
+        "title": f"{'/'.join(lines)}: {event} {stop}",
+        "description": _wl_description(rng, event, stop, lines, start),
+        "link": "https://www.wienerlinien.at/ogd_realtime",
+        "guid": _digest("wl", seed, index),
+        "pubDate": _iso(start - timedelta(days=rng.randint(0, 10))),
+        "starts_at": _iso(start),
+        "ends_at": _iso(end),
+        "_identity": f"wl|{category.lower()}|L={','.join(lines)}|D={start.date().isoformat()}|{index}",
+    }
+    return item, stop, lines
+
+
+def _wl_items(rng: random.Random, seed: int, count: int, now: datetime) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    index = 0
+    while len(items) < count:
+        item, stop, lines = _wl_item(rng, seed, index, now)
+        items.append(item)
+        index += 1
+        if index % _EXACT_DUPLICATE_EVERY == 0 and len(items) < count:
+            items.append(dict(item))
+        if index % _FUZZY_SIBLING_EVERY == 0 and len(items) < count:
+            sibling = dict(item)
+            sibling["title"] = f"{lines[0]}: {rng.choice(_WL_SIBLING_WORDING)} {stop}"
+            sibling["guid"] = _digest("wl-sibling", seed, index)
+            sibling["_identity"] = f"{item['_identity']}|sibling"
+            items.append(sibling)
+    return items
+
+
+def _oebb_items(rng: random.Random, seed: int, count: int, now: datetime) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    for index in range(count):
+        wien = rng.choice(_OEBB_WIEN)
+        pendler = rng.choice(_OEBB_PENDLER)
+        train = rng.choice(_OEBB_TRAINS)
+        start = now - timedelta(days=rng.randint(0, 30))
+        end = now + timedelta(days=rng.randint(1, 120))
+        dates = "".join(
+            f"am <b>{start + timedelta(days=7 * week):%d.%m.%Y}</b><br>" for week in range(rng.randint(1, 8))
+        )
+        guid = f"https://fahrplan.oebb.at/bin/query.exe/dn?ujm=1&mapType=TRACKINFO&{800000 + seed * 10_000 + index}"
+        items.append({
+            "source": "ÖBB",
+            "category": "Störung",
+            "title": f"{wien} ↔ {pendler}",
+            "description": (
+                f"{start:%d.%m.%Y} - {end:%d.%m.%Y}<br/><br/>Wegen Bauarbeiten können <br>zwischen "
+                f"<b>{wien}</b> und <b>{pendler}</b><br>{dates}(jeweils 20:00 Uhr - 04:00 Uhr) keine "
+                f"<i>{train}-Züge</i> fahren.<br>Ein Schienenersatzverkehr mit Autobussen wird für Sie "
+                "eingerichtet.<br><b>ACHTUNG:</b><br>Anschlussverbindungen können nicht gewährleistet werden."
+            ),
+            "link": "https://fahrplan.oebb.at/bin/help.exe/dn?L=vs_scotty&tpl=showmap_external&",
+            "guid": guid,
+            "pubDate": _iso(start),
+            "starts_at": _iso(start),
+            "ends_at": _iso(end) if rng.random() < 0.5 else None,
+            "_identity": f"oebb|{guid}",
+        })
+    return items
+
+
+def _baustellen_items(rng: random.Random, seed: int, count: int, now: datetime) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    for index in range(count):
+        street = rng.choice(_BAUSTELLEN_STREETS)
+        measure = rng.choice(_BAUSTELLEN_MEASURES)
+        district = rng.randint(1, 23)
+        start = now - timedelta(days=rng.randint(1, 400))
+        end = now + timedelta(days=rng.randint(10, 900))
+        number = rng.randint(1, 80)
+        line = rng.choice(_WL_LINES)
+        items.append({
+            "source": "Stadt Wien – Baustellen",
+            "category": "Baustelle",
+            "title": f"{street} {number} bis {number + rng.randint(1, 20)}",
+            "description": (
+                f"Im Zuge von {measure} ist seit {start:%d.%m.%Y} eine Fahrspur gesperrt. "
+                f"Die Linie {line} wird in diesem Bereich umgeleitet; Haltestellen können verlegt werden. "
+                f"\nBeginn: {start:%d.%m.%Y %H:%M} Uhr \nGeplant bis: {end:%d.%m.%Y %H:%M} Uhr "
+                f"\nMaßnahme: {measure} \nBezirk: {district}"
+            ),
+            "link": "https://www.data.gv.at/katalog/en/dataset/baustellen-wien-verkehrsbeeintraechtigungen",
+            "guid": _digest("baustellen", seed, index),
+            "pubDate": _iso(start),
+            "starts_at": _iso(start),
+            "ends_at": _iso(end),
+            "context": {"district": str(district), "measure": measure},
+            "location": {
+                "coordinates": {
+                    "lat": round(rng.uniform(*_VIENNA_LAT), 8),
+                    "lon": round(rng.uniform(*_VIENNA_LON), 8),
+                }
+            },
+        })
+    return items
+
+
+def _stammstrecke_rows(rng: random.Random, per_hour: int, now: datetime) -> list[tuple[str, ...]]:
+    """Ledger rows for both directions over the last :data:`_LEDGER_HOURS`.
+
+    The final samples of the Meidling direction exceed the nine-minute
+    trigger, so the Stammstrecke provider emits an event and the feed path
+    for it is exercised as well.
+    """
+    rows: list[tuple[str, ...]] = []
+    step = timedelta(hours=1) / per_hour
+    total = _LEDGER_HOURS * per_hour
+    local_now = now.astimezone(_VIENNA_TZ).replace(microsecond=0)
+    trigger_samples = max(2, per_hour // 2)
+    for offset in range(total - 1, -1, -1):
+        when = local_now - step * offset
+        for direction in ("Meidling", "Praterstern"):
+            delay = rng.uniform(0.0, 4.0)
+            if direction == "Meidling" and offset < trigger_samples:
+                delay = rng.uniform(10.0, 16.0)
+            rows.append((
+                when.isoformat(timespec="seconds"),
+                WEEKDAY_LABELS[when.weekday()],
+                f"{when.hour:02d}",
+                direction,
+                f"{delay:.2f}",
+            ))
+    return rows
+
+
+def generate_payloads(scale: float, *, seed: int = 0, now: datetime) -> SyntheticPayloads:
+    """Build the synthetic payloads for ``scale`` × :data:`BASE_VOLUME`."""
+    if not math.isfinite(scale) or scale <= 0:
+        raise ValueError(f"scale must be a positive finite number, got {scale!r}")
+    rng = random.Random(f"{seed}:{scale}")  # noqa: S311 - benchmark data, not security relevant
+    return SyntheticPayloads(
+        scale=scale,
+        seed=seed,
+        now=now,
+        wl=_wl_items(rng, seed, _scaled(BASE_VOLUME["wl"], scale), now),
+        oebb=_oebb_items(rng, seed, _scaled(BASE_VOLUME["oebb"], scale), now),
+        baustellen=_baustellen_items(rng, seed, _scaled(BASE_VOLUME["baustellen"], scale), now),
+        stammstrecke_rows=_stammstrecke_rows(
+            rng, _scaled(BASE_VOLUME["stammstrecke_samples_per_hour"], scale), now
+        ),
+    )
+
+
+def write_sandbox(payloads: SyntheticPayloads, root: Path) -> SandboxPaths:
+    """Write *payloads* below *root* in the layout the feed build reads.
+
+    ``root/cache/<sanitized provider>/events.json`` for the three provider
+    caches and ``root/stats/stammstrecke_<YYYY>.csv`` for the ledger (one
+    file per Vienna-local year, like :func:`append_stammstrecke_row`).
+    """
+    cache_dir = root / "cache"
+    stats_dir = root / "stats"
+    for provider, items in (("wl", payloads.wl), ("oebb", payloads.oebb), ("baustellen", payloads.baustellen)):
+        target = cache_dir / sanitize_filename(provider) / "events.json"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("w", encoding="utf-8") as handle:
+            json.dump(items, handle, allow_nan=False)
+    stats_dir.mkdir(parents=True, exist_ok=True)
+    by_year: dict[str, list[tuple[str, ...]]] = {}
+    for row in payloads.stammstrecke_rows:
+        by_year.setdefault(row[0][:4], []).append(row)
+    for year, rows in by_year.items():
+        with (stats_dir / f"stammstrecke_{year}.csv").open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(STAMMSTRECKE_HEADER)
+            writer.writerows(rows)
+    return SandboxPaths(root=root, cache_dir=cache_dir, stats_dir=stats_dir)
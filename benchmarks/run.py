@@ -0,0 +1,469 @@
+"""Drive the feed-build stages over synthetic payloads and record timings.
+
+Usage::
+
+    python -m benchmarks.run                          # 1×, 10×, 100×
+    python -m benchmarks.run --scale 1 10 --repeat 5
+    python -m benchmarks.run --compare benchmarks/results/<old>.json
+
+Each scale gets its own sandbox directory (see
+:func:`benchmarks.generator.write_sandbox`); :func:`feed_sandbox` points
+the provider cache reader, the stats ledger, the Stammstrecke episode
+store and the ``first_seen`` state file at it and swaps the translation
+model for a deterministic stub, so a run never touches ``cache/``,
+``data/`` or the network and never downloads the Marian model.
+
+Stages are timed in isolation on fresh copies of their inputs (copies are
+made outside the timed region) and once more end to end (``pipeline``,
+the stage order of :func:`src.build_feed.main` without the feed-file and
+health-report writes). ``network_deadline`` exercises the deadline-
+eviction loop of ``_run_network_fetchers`` with one provider that overruns
+its timeout; its ``cpu_median_s`` staying far below ``median_s`` is the
+measurable claim that the loop does not busy-spin (Apex Phase 1). The
+``us_per_item`` column across scales shows whether a stage stays linear —
+e.g. the ``deduplicate_fuzzy`` parse cache (Apex Phase 2).
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Final, cast
+from unittest import mock
+
+from benchmarks.generator import SandboxPaths, generate_payloads, write_sandbox
+from src import build_feed as bf
+from src.feed import stammstrecke as stammstrecke_module
+from src.feed.merge import deduplicate_fuzzy
+from src.feed.reporting import RunReport
+from src.feed_types import FeedItem
+from src.utils import cache as cache_module
+from src.utils import stats as stats_module
+
+__all__ = [
+    "RESULTS_SCHEMA_VERSION",
+    "StageResult",
+    "compare_results",
+    "feed_sandbox",
+    "main",
+    "run_scale",
+]
+
+log = logging.getLogger("benchmarks")
+
+RESULTS_SCHEMA_VERSION: Final = 1
+PROJECT_ROOT: Final = Path(__file__).resolve().parents[1]
+DEFAULT_RESULTS_DIR: Final = PROJECT_ROOT / "benchmarks" / "results"
+DEFAULT_SCALES: Final = (1.0, 10.0, 100.0)
+# Share of collected items that already have a ``first_seen`` entry, and
+# the age spread of those entries (past ``MAX_ITEM_AGE_DAYS`` and
+# ``ABSOLUTE_MAX_AGE_DAYS`` so the age filter has work to do).
+_STATE_COVERAGE: Final = 0.7
+_STATE_MAX_AGE_DAYS: Final = 600
+_NETWORK_TIMEOUT_S: Final = 0.2
+
+
+def _stub_translator(text: str, **_kwargs: Any) -> list[dict[str, str]]:
+    """Stand-in for the Marian pipeline: cheap, deterministic, never equal to the input."""
+    return [{"translation_text": f"{text} (EN)"}]
+
+
+@contextmanager
+def feed_sandbox(paths: SandboxPaths) -> Iterator[None]:
+    """Point every file the measured stages read or write at *paths*."""
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(cache_module, "_CACHE_DIR", paths.cache_dir))
+        stack.enter_context(mock.patch.object(stats_module, "DEFAULT_STATS_DIR", paths.stats_dir))
+        stack.enter_context(
+            mock.patch.object(stammstrecke_module, "EPISODE_STARTS_PATH", paths.root / "episode_starts.json")
+        )
+        stack.enter_context(mock.patch.object(bf.feed_config, "STATE_FILE", paths.root / "first_seen.json"))
+        # ``validate_path`` pins outputs to the repository roots; the sandbox
+        # lives in a temporary directory by design.
+        stack.enter_context(mock.patch.object(bf, "validate_path", lambda path, _name: Path(path)))
+        stack.enter_context(mock.patch.object(bf, "_get_translation_pipeline", lambda: _stub_translator))
+        stack.enter_context(mock.patch.dict(os.environ, {env: "1" for env, _ in bf.DEFAULT_PROVIDERS}))
+        yield
+
+
+@dataclass
+class StageResult:
+    """Timings of one stage at one scale."""
+
+    name: str
+    wall: list[float] = field(default_factory=list)
+    cpu: list[float] = field(default_factory=list)
+    items_in: int = 0
+    items_out: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        median = statistics.median(self.wall)
+        return {
+            "runs": len(self.wall),
+            "min_s": min(self.wall),
+            "median_s": median,
+            "mean_s": statistics.fmean(self.wall),
+            "cpu_median_s": statistics.median(self.cpu),
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "us_per_item": (median * 1e6 / self.items_in) if self.items_in else None,
+        }
+
+
+def _measure(
+    name: str,
+    repeat: int,
+    setup: Callable[[], tuple[Any, ...]],
+    stage: Callable[..., Any],
+    count_in: Callable[[tuple[Any, ...]], int],
+    count_out: Callable[[Any], int],
+) -> tuple[StageResult, Any]:
+    """Time ``stage(*setup())`` *repeat* times; return the timings and the last output."""
+    result = StageResult(name)
+    output: Any = None
+    for _ in range(repeat):
+        args = setup()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        output = stage(*args)
+        result.cpu.append(time.process_time() - cpu_start)
+        result.wall.append(time.perf_counter() - wall_start)
+        result.items_in = count_in(args)
+    result.items_out = count_out(output)
+    return result, output
+
+
+def _seed_state(items: Sequence[FeedItem], now: datetime, seed: int) -> dict[str, dict[str, Any]]:
+    """A ``first_seen`` state covering part of *items* with a spread of ages."""
+    rng = random.Random(seed)  # noqa: S311 - benchmark data, not security relevant
+    state: dict[str, dict[str, Any]] = {}
+    for item in items:
+        if rng.random() < _STATE_COVERAGE:
+            age = timedelta(days=rng.uniform(0, _STATE_MAX_AGE_DAYS))
+            state[bf._state_key_for_item(item)] = {"first_seen": (now - age).isoformat()}
+    return state
+
+
+def _sorted_for_feed(items: list[FeedItem], now: datetime, state: dict[str, dict[str, Any]]) -> list[FeedItem]:
+    now_utc = bf._to_utc(now)
+    return sorted(items, key=lambda it: bf._recency_sort_key(it, state, now_utc))
+
+
+def _collect() -> list[FeedItem]:
+    return bf._collect_items(RunReport(bf._provider_statuses()))
+
+
+def _fuzzy(items: list[FeedItem]) -> list[FeedItem]:
+    return cast(list[FeedItem], deduplicate_fuzzy(cast(list[dict[str, Any]], items)))
+
+
+def _pipeline(now: datetime, state: dict[str, dict[str, Any]]) -> str:
+    """The stage order of ``build_feed.main`` from collection to ``_save_state``."""
+    items = _collect()
+    items, dropped = bf._drop_old_items(items, now, state)
+    bf._summarize_duplicates(items)
+    items = _fuzzy(bf._dedupe_items(items))
+    items = _sorted_for_feed(items, now, state)
+    rss = bf._make_rss(items, now, state, lang="de")
+    bf._make_rss(items, now, state, lang="en")
+    bf._save_state(state, deletions=dropped)
+    return rss
+
+
+def _network_deadline(items: list[FeedItem], release: threading.Event) -> int:
+    """Run four fake network providers through the deadline-eviction loop.
+
+    Three answer within the deadline; one blocks until *release* is set,
+    far beyond :data:`_NETWORK_TIMEOUT_S`, and must be evicted on time.
+    """
+    collected: list[FeedItem] = []
+    quarter = max(1, len(items) // 4)
+
+    def _provider(index: int, latency: float) -> Callable[[], list[FeedItem]]:
+        def fetch() -> list[FeedItem]:
+            if latency < 0:
+                release.wait(5.0)
+            else:
+                time.sleep(latency)
+            return items[index * quarter:(index + 1) * quarter]
+
+        fetch.__name__ = f"bench_network_{index}"
+        return fetch
+
+    fetchers = [_provider(i, latency) for i, latency in enumerate((0.01, 0.03, 0.05, -1.0))]
+    names = {fetch: fetch.__name__ for fetch in fetchers}
+    envs: dict[Any, str | None] = dict.fromkeys(fetchers)
+    report = RunReport([(name, True) for name in names.values()])
+
+    def merge(_fetch: Any, result: Any, _name: str) -> None:
+        collected.extend(result)
+
+    with mock.patch.object(bf.feed_config, "PROVIDER_TIMEOUT", _NETWORK_TIMEOUT_S):
+        timer = threading.Timer(_NETWORK_TIMEOUT_S * 3, release.set)
+        timer.start()
+        try:
+            bf._run_network_fetchers(fetchers, names, envs, report, merge)
+        finally:
+            release.set()
+            timer.cancel()
+    return len(collected)
+
+
+def run_scale(scale: float, *, repeat: int, seed: int, workdir: Path) -> dict[str, Any]:
+    """Generate the payloads for *scale* and time every stage over them."""
+    now = datetime.now(UTC).replace(microsecond=0)
+    payloads = generate_payloads(scale, seed=seed, now=now)
+    paths = write_sandbox(payloads, workdir / f"scale-{scale:g}")
+    stages: dict[str, StageResult] = {}
+
+    def record(result: StageResult, output: Any) -> Any:
+        stages[result.name] = result
+        return output
+
+    def items_of(args: tuple[Any, ...]) -> int:
+        return len(args[0])
+
+    with feed_sandbox(paths):
+        bf.init_providers()
+        raw = record(*_measure("collect_items", repeat, lambda: (), _collect, lambda _a: 0, len))
+        stages["collect_items"].items_in = sum(payloads.volume().values())
+        state = _seed_state(raw, now, seed)
+
+        kept, _dropped = record(*_measure(
+            "drop_old_items", repeat,
+            lambda: (copy.deepcopy(raw), now, copy.deepcopy(state)),
+            bf._drop_old_items, items_of, lambda out: len(out[0]),
+        ))
+        deduped = record(*_measure(
+            "dedupe_items", repeat, lambda: (copy.deepcopy(kept),), bf._dedupe_items, items_of, len,
+        ))
+        fuzzy = record(*_measure(
+            "deduplicate_fuzzy", repeat, lambda: (copy.deepcopy(deduped),), _fuzzy, items_of, len,
+        ))
+        ordered = _sorted_for_feed(fuzzy, now, state)
+
+        def rss_stage(lang: str, base_state: Callable[[], dict[str, dict[str, Any]]]) -> StageResult:
+            result, _ = _measure(
+                f"make_rss_{lang}", repeat,
+                lambda: (copy.deepcopy(ordered), now, base_state()),
+                lambda items, when, st: bf._make_rss(items, when, st, lang=lang),
+                items_of, lambda _out: min(len(ordered), bf.feed_config.MAX_ITEMS),
+            )
+            return result
+
+        stages["make_rss_de"] = rss_stage("de", lambda: copy.deepcopy(state))
+        stages["make_rss_en"] = rss_stage("en", lambda: copy.deepcopy(state))
+        # Second EN render over a state that already carries the
+        # translations of the first: the per-item translation cache path.
+        warm_state = copy.deepcopy(state)
+        bf._make_rss(copy.deepcopy(ordered), now, warm_state, lang="en")
+        warm = rss_stage("en", lambda: copy.deepcopy(warm_state))
+        warm.name = "make_rss_en_cached"
+        stages[warm.name] = warm
+
+        def fresh_state_file() -> tuple[dict[str, dict[str, Any]]]:
+            Path(bf.feed_config.STATE_FILE).unlink(missing_ok=True)
+            return (copy.deepcopy(warm_state),)
+
+        record(*_measure("save_state", repeat, fresh_state_file, bf._save_state, items_of, lambda _out: 0))
+
+        def fresh_pipeline() -> tuple[datetime, dict[str, dict[str, Any]]]:
+            Path(bf.feed_config.STATE_FILE).unlink(missing_ok=True)
+            return now, copy.deepcopy(state)
+
+        record(*_measure("pipeline", repeat, fresh_pipeline, _pipeline, lambda _a: len(raw), lambda _out: len(ordered)))
+        record(*_measure(
+            "network_deadline", repeat, lambda: (raw, threading.Event()), _network_deadline, items_of, int,
+        ))
+
+    return {
+        "scale": scale,
+        "volume": payloads.volume(),
+        "stages": {name: result.as_dict() for name, result in stages.items()},
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=10, check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def compare_results(
+    baseline: Mapping[str, Any],
+    current: Mapping[str, Any],
+    *,
+    threshold: float,
+    min_delta_s: float,
+) -> list[dict[str, Any]]:
+    """Per scale and stage: median of *baseline* vs. *current*.
+
+    A row is ``regressed`` when the median grew by more than *threshold*
+    (relative) AND by more than *min_delta_s* (absolute) — the absolute
+    floor keeps sub-millisecond stages from flapping on scheduler noise.
+    Stages or scales present in only one of the two runs are skipped.
+    """
+    rows: list[dict[str, Any]] = []
+    for scale_key, new_scale in current.get("scales", {}).items():
+        old_scale = baseline.get("scales", {}).get(scale_key)
+        if not isinstance(old_scale, Mapping):
+            continue
+        for stage, new_stage in new_scale.get("stages", {}).items():
+            old_stage = old_scale.get("stages", {}).get(stage)
+            if not isinstance(old_stage, Mapping):
+                continue
+            old_median = float(old_stage["median_s"])
+            new_median = float(new_stage["median_s"])
+            ratio = new_median / old_median if old_median > 0 else None
+            regressed = (
+                ratio is not None
+                and ratio > 1 + threshold
+                and new_median - old_median > min_delta_s
+            )
+            rows.append({
+                "scale": scale_key,
+                "stage": stage,
+                "baseline_s": old_median,
+                "current_s": new_median,
+                "ratio": ratio,
+                "regressed": regressed,
+            })
+    return rows
+
+
+def _print_summary(results: Mapping[str, Any]) -> None:
+    for scale_key, scale in results["scales"].items():
+        print(f"scale {scale_key}× {scale['volume']}")
+        for stage, timing in scale["stages"].items():
+            per_item = timing["us_per_item"]
+            per_item_text = f"{per_item:9.1f} µs/item" if per_item is not None else ""
+            print(
+                f"  {stage:<22} {timing['median_s'] * 1000:10.2f} ms "
+                f"(cpu {timing['cpu_median_s'] * 1000:8.2f} ms) "
+                f"{timing['items_in']:>7} → {timing['items_out']:<7} {per_item_text}"
+            )
+
+
+def _print_comparison(rows: Sequence[Mapping[str, Any]]) -> None:
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}×" if row["ratio"] is not None else "n/a"
+        marker = "  REGRESSION" if row["regressed"] else ""
+        print(
+            f"  {row['scale']:>6}× {row['stage']:<22} "
+            f"{row['baseline_s'] * 1000:10.2f} ms → {row['current_s'] * 1000:10.2f} ms  {ratio}{marker}"
+        )
+
+
+def _read_results(path: Path) -> dict[str, Any]:
+    with path.open("r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    if not isinstance(payload, dict) or payload.get("schema") != RESULTS_SCHEMA_VERSION:
+        raise ValueError(f"{path} is not a schema-{RESULTS_SCHEMA_VERSION} benchmark result")
+    return payload
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0] if __doc__ else None)
+    parser.add_argument(
+        "--scale", type=float, nargs="+", default=list(DEFAULT_SCALES),
+        help="Volume multipliers relative to today's provider volume (default: 1 10 100).",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (default: 3).")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0).")
+    parser.add_argument(
+        "--output", type=Path, default=None,
+        help="Results file (default: benchmarks/results/<UTC timestamp>-<commit>.json).",
+    )
+    parser.add_argument("--compare", type=Path, default=None, help="Earlier results file to compare against.")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Relative median slowdown counted as a regression with --compare (default: 0.25).",
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=2.0,
+        help="Absolute slowdown floor for a regression with --compare (default: 2 ms).",
+    )
+    parser.add_argument(
+        "--no-warmup", dest="warmup", action="store_false",
+        help="Skip the discarded warm-up pass (imports, regex and station caches) before the timed scales.",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Keep feed-build log output.")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if any(not scale > 0 for scale in args.scale):
+        parser.error("--scale values must be positive")
+    return args
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    if not args.verbose:
+        logging.getLogger("build_feed").setLevel(logging.ERROR)
+
+    commit = _git_commit()
+    results: dict[str, Any] = {
+        "schema": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "scales": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="wien-oepnv-bench-") as tmp:
+        if args.warmup:
+            # First-call costs (lazy provider imports, compiled station
+            # patterns, the translation glossary) would otherwise be
+            # charged to whichever scale happens to run first.
+            run_scale(min(args.scale), repeat=1, seed=args.seed, workdir=Path(tmp) / "warmup")
+        for scale in args.scale:
+            results["scales"][f"{scale:g}"] = run_scale(scale, repeat=args.repeat, seed=args.seed, workdir=Path(tmp))
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        output = DEFAULT_RESULTS_DIR / f"{stamp}-{commit or 'nogit'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2, sort_keys=True, allow_nan=False)
+        handle.write("\n")
+
+    _print_summary(results)
+    print(f"Results written to {output}")
+
+    if args.compare is None:
+        return 0
+    rows = compare_results(
+        _read_results(args.compare), results,
+        threshold=args.threshold, min_delta_s=args.min_delta_ms / 1000,
+    )
+    print(f"Compared with {args.compare}:")
+    _print_comparison(rows)
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""Compare float32 and int8 translation latency and resident memory.
+
+Usage::
+
+    python -m benchmarks.translation                  # Helsinki-NLP/opus-mt-de-en
+    python -m benchmarks.translation --synthetic      # same shape, random weights
+    python -m benchmarks.translation --threads 2 --beams 1 --tokens 32
+
+A variant loads the model the way ``build_feed`` does — float32 from the
+Hugging Face cache, int8 via
+:func:`src.feed.translation_model.quantize_int8` on top of it — and then
+times ``model.generate`` per sentence with a fixed number of new tokens,
+so both variants do the same amount of decoding regardless of what they
+translate to. Each variant runs in its own subprocess so its memory
+figures are its own: ``resident_mb`` is what the process still holds
+after the run on top of the imports, ``peak_rss_mb`` the high-water
+mark, which for int8 includes the float32 model it was quantized from.
+
+``--synthetic`` builds a randomly initialised Marian model with the
+dimensions of opus-mt-de-en and random input ids of the sentences'
+token lengths; it needs no download and measures the same matrix
+shapes, not translation quality (that is the golden-corpus check in
+``build_feed``).
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Final
+
+from src.feed import translation_model
+
+__all__ = ["VARIANTS", "main", "measure"]
+
+VARIANTS: Final = ("float32", "int8")
+PROJECT_ROOT: Final = Path(__file__).resolve().parents[1]
+DEFAULT_MODEL: Final = "Helsinki-NLP/opus-mt-de-en"
+# ``MarianConfig`` of opus-mt-de-en; ``--synthetic`` builds this shape.
+_SYNTHETIC_CONFIG: Final[dict[str, int]] = {
+    "vocab_size": 58101,
+    "d_model": 512,
+    "encoder_layers": 6,
+    "decoder_layers": 6,
+    "encoder_attention_heads": 8,
+    "decoder_attention_heads": 8,
+    "encoder_ffn_dim": 2048,
+    "decoder_ffn_dim": 2048,
+    "max_position_embeddings": 512,
+    "pad_token_id": 58100,
+    "eos_token_id": 0,
+    "decoder_start_token_id": 58100,
+}
+_SENTENCES: Final = (
+    "Wegen Bauarbeiten ist die Linie U6 zwischen Westbahnhof und Längenfeldgasse unterbrochen.",
+    "Verspätungen auf der Linie U4 aufgrund eines Polizeieinsatzes.",
+    "Die Haltestelle Karlsplatz wird in die Operngasse verlegt.",
+    "Ersatzverkehr mit Autobussen zwischen Floridsdorf und Praterstern.",
+    "Wegen einer Fahrzeugstörung kommt es auf der S-Bahn-Stammstrecke zu Verzögerungen.",
+    "Aufzug außer Betrieb.",
+    "Die Linie 13A fährt eine Umleitung über die Mariahilfer Straße.",
+    "Zugausfälle zwischen Wien Meidling und Mödling wegen einer Weichenstörung.",
+)
+
+
+def _peak_rss_mb() -> float:
+    # Linux reports ``ru_maxrss`` in KiB, macOS in bytes.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _resident_mb() -> float:
+    """Current resident set size (Linux ``/proc``), else the peak."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text(encoding="ascii").split()[1])
+    except (OSError, IndexError, ValueError):
+        return _peak_rss_mb()
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _load(model_name: str | None) -> tuple[Any, list[Any]]:
+    """The float32 model plus one ``generate`` input per benchmark sentence."""
+    import torch
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, MarianConfig, MarianMTModel
+
+    if model_name is not None:
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)  # type: ignore[no-untyped-call, unused-ignore]
+        return model, [tokenizer(sentence, return_tensors="pt") for sentence in _SENTENCES]
+    torch.manual_seed(0)
+    config = MarianConfig(**_SYNTHETIC_CONFIG)  # type: ignore[no-untyped-call, unused-ignore]
+    model = MarianMTModel(config)
+    generator = torch.Generator().manual_seed(0)
+    inputs = []
+    for sentence in _SENTENCES:
+        length = 2 * len(sentence.split()) + 1
+        ids = torch.randint(1, config.vocab_size - 1, (1, length), generator=generator)
+        ids[0, -1] = _SYNTHETIC_CONFIG["eos_token_id"]
+        inputs.append({"input_ids": ids, "attention_mask": torch.ones_like(ids)})
+    return model, inputs
+
+
+def measure(variant: str, model_name: str | None, *, tokens: int, beams: int, threads: int) -> dict[str, Any]:
+    """Load *variant* and time one ``generate`` call per benchmark sentence."""
+    import torch
+
+    translation_model.set_num_threads(threads)
+    baseline_mb = _resident_mb()
+    started = time.perf_counter()
+    model, inputs = _load(model_name)
+    model.eval()
+    if variant == "int8":
+        translation_model.quantize_int8(model)
+    load_s = time.perf_counter() - started
+    options = {"min_new_tokens": tokens, "max_new_tokens": tokens, "num_beams": beams, "do_sample": False}
+    timings: list[float] = []
+    with torch.inference_mode():
+        model.generate(**inputs[0], **options)  # warm-up: allocator, packed-weight caches
+        for encoded in inputs:
+            begin = time.perf_counter()
+            model.generate(**encoded, **options)
+            timings.append(time.perf_counter() - begin)
+    timings.sort()
+    gc.collect()
+    return {
+        "variant": variant,
+        "load_s": round(load_s, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 1),
+        "max_ms": round(timings[-1] * 1000, 1),
+        "total_s": round(sum(timings), 3),
+        "resident_mb": round(_resident_mb() - baseline_mb, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def _run_variant(variant: str, args: argparse.Namespace) -> dict[str, Any]:
+    command = [
+        sys.executable, "-m", "benchmarks.translation", "--variant", variant,
+        "--tokens", str(args.tokens), "--beams", str(args.beams), "--threads", str(args.threads),
+    ]
+    command += ["--synthetic"] if args.synthetic else ["--model", args.model]
+    # Fixed argv: this module under the running interpreter.
+    completed = subprocess.run(command, check=True, capture_output=True, text=True, cwd=PROJECT_ROOT)  # nosec B603  # noqa: S603
+    result: dict[str, Any] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0] if __doc__ else None)
+    parser.add_argument("--model", default=DEFAULT_MODEL, help=f"Hugging Face model (default: {DEFAULT_MODEL}).")
+    parser.add_argument(
+        "--synthetic", action="store_true",
+        help="Random weights in the opus-mt-de-en shape instead of downloading the model.",
+    )
+    parser.add_argument("--tokens", type=int, default=24, help="New tokens per sentence (default: 24).")
+    parser.add_argument("--beams", type=int, default=4, help="Beam width, as opus-mt-de-en ships (default: 4).")
+    parser.add_argument("--threads", type=int, default=0, help="torch threads, 0 keeps torch's default.")
+    parser.add_argument("--output", type=Path, default=None, help="Also write the report to this JSON file.")
+    parser.add_argument("--variant", choices=VARIANTS, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.tokens < 1 or args.beams < 1:
+        parser.error("--tokens and --beams must be at least 1")
+    return args
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+    model_name = None if args.synthetic else args.model
+    if args.variant is not None:
+        result = measure(args.variant, model_name, tokens=args.tokens, beams=args.beams, threads=args.threads)
+        print(json.dumps(result, allow_nan=False))
+        return 0
+
+    variants = {variant: _run_variant(variant, args) for variant in VARIANTS}
+    baseline, quantized = variants["float32"], variants["int8"]
+    report = {
+        "model": "synthetic opus-mt-de-en shape" if args.synthetic else args.model,
+        "tokens": args.tokens,
+        "beams": args.beams,
+        "threads": args.threads,
+        "variants": variants,
+        "int8_speedup": round(baseline["total_s"] / quantized["total_s"], 2),
+        "int8_resident_ratio": round(quantized["resident_mb"] / baseline["resident_mb"], 2),
+    }
+    print(json.dumps(report, indent=2, allow_nan=False))
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, allow_nan=False) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution
+    sys.exit(main())
@@ -0,0 +1,533 @@
+"""Record real upstream responses and replay them from a local stand-in.
+
+Usage::
+
+    python -m benchmarks.upstream record wl oebb baustellen vao
+    python -m benchmarks.upstream bench wl --runs 20 --latency-ms 300 --error-rate 0.1
+    python -m benchmarks.upstream bench oebb --scale 5 --concurrency 4
+
+``record`` runs a source's real fetch path once and captures every
+response :func:`src.utils.http.request_safe` reads — WL
+``trafficInfoList``/``newsList``, the ÖBB RSS, the Baustellen WFS layers
+and the VAO ``/departureBoard`` at Wien Hbf — into
+``benchmarks/recordings/<source>/`` (gitignored). Only host, path, the
+non-secret query, status, ``Content-Type`` and body are kept; credential
+query parameters are dropped and secret environment values are redacted
+from the body.
+
+``bench`` serves those recordings from :class:`StandinServer` on
+127.0.0.1 with configurable latency, injected 503s and payload scaling,
+routes the providers' requests there via
+:func:`src.utils.http.loopback_standins` and drives the same fetch-and-
+parse path as the updaters (``wl_fetch.fetch_events``,
+``oebb.fetch_events``, the Baustellen layer fetch, the Hbf departure
+board) *runs* times. Cache writes are not part of the measured path, so
+a run never touches ``cache/``. The report carries per-run latency
+percentiles, runs/s and parsed items/s.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Final
+from unittest import mock
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+import requests
+
+from src.utils import http as http_module
+from src.utils.files import loads_finite
+from src.utils.http import loopback_standins
+
+__all__ = [
+    "SOURCES",
+    "Recording",
+    "ReplayProfile",
+    "StandinServer",
+    "bench",
+    "load_recordings",
+    "main",
+    "record",
+    "save_recordings",
+    "scale_payload",
+    "serve",
+]
+
+log = logging.getLogger("benchmarks.upstream")
+
+PROJECT_ROOT: Final = Path(__file__).resolve().parents[1]
+DEFAULT_RECORDINGS_DIR: Final = PROJECT_ROOT / "benchmarks" / "recordings"
+RECORDINGS_SCHEMA_VERSION: Final = 1
+
+# Query parameters never written to a recording, and parameters that
+# change on every call (the VAO board's date/time) and are ignored when a
+# replayed request is matched against the recordings.
+_SECRET_PARAMS: Final = frozenset({"accessid", "apikey", "api_key", "key", "token"})
+_VOLATILE_PARAMS: Final = frozenset({"date", "time"})
+_SECRET_ENV_RE: Final = re.compile(r"(?:KEY|TOKEN|SECRET|PASSWORD|ACCESS_ID)$")
+_REDACTED: Final = b"REDACTED"
+_RSS_ITEM_RE: Final = re.compile(rb"<item\b.*?</item>", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Recording:
+    """One sanitized upstream response."""
+
+    host: str
+    path: str
+    query: str
+    status: int
+    content_type: str
+    body: bytes
+
+
+@dataclass(frozen=True)
+class ReplayProfile:
+    """How :class:`StandinServer` degrades the recorded upstream."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    scale: int = 1
+    seed: int = 0
+
+
+def _normalized_query(query: str) -> str:
+    pairs = [
+        (name, value)
+        for name, value in parse_qsl(query, keep_blank_values=True)
+        if name.lower() not in _SECRET_PARAMS | _VOLATILE_PARAMS
+    ]
+    return urlencode(sorted(pairs))
+
+
+def _secret_values() -> list[bytes]:
+    values = [
+        value for name, value in os.environ.items()
+        if _SECRET_ENV_RE.search(name.upper()) and len(value) >= 8
+    ]
+    return sorted({value.encode("utf-8") for value in values}, key=len, reverse=True)
+
+
+def _sanitize(body: bytes, secrets: Sequence[bytes]) -> bytes:
+    for secret in secrets:
+        body = body.replace(secret, _REDACTED)
+    return body
+
+
+def _recording_from(response: requests.Response, body: bytes, secrets: Sequence[bytes]) -> Recording:
+    parsed = urlparse(response.url or "")
+    host = str(response.request.headers.get("Host") or parsed.hostname or "")
+    return Recording(
+        host=host.split(":", 1)[0].lower(),
+        path=parsed.path or "/",
+        query=_normalized_query(parsed.query),
+        status=response.status_code,
+        content_type=response.headers.get("Content-Type", "application/octet-stream"),
+        body=_sanitize(body, secrets),
+    )
+
+
+# ---- Sources -------------------------------------------------------------
+
+
+def _drive_wl(_live: bool) -> int:
+    from src.providers import wl_fetch
+
+    return len(wl_fetch.fetch_events())
+
+
+def _drive_oebb(_live: bool) -> int:
+    from src.providers import oebb
+
+    return len(oebb.fetch_events())
+
+
+def _drive_baustellen(_live: bool) -> int:
+    from scripts import update_baustellen_cache as baustellen
+
+    data_url = baustellen.resolve_data_url(os.getenv("BAUSTELLEN_DATA_URL"))
+    return len(baustellen._fetch_layers(data_url, 20) or [])
+
+
+def _drive_vao(live: bool) -> int:
+    from scripts import update_stammstrecke_hbf as hbf
+    from scripts.update_stammstrecke_status import _build_session, _charge_one_request, _now_vienna
+    from src.providers import vor as vor_provider
+    from src.utils.http import session_with_retries
+
+    when = _now_vienna()
+    with ExitStack() as stack:
+        # A live recording books its request against the VAO daily quota;
+        # replays never carry the access ID, not even to the loopback stand-in.
+        if live:
+            _charge_one_request(when)
+            session = _build_session(stack)
+        else:
+            session = stack.enter_context(session_with_retries(vor_provider.VOR_USER_AGENT))
+        departures = hbf._query_departure_board(session, when=when)
+    return len(departures)
+
+
+SOURCES: Final[Mapping[str, Callable[[bool], int]]] = {
+    "wl": _drive_wl,
+    "oebb": _drive_oebb,
+    "baustellen": _drive_baustellen,
+    "vao": _drive_vao,
+}
+
+
+def record(source: str) -> list[Recording]:
+    """Run *source*'s fetch path against the real upstream and capture its responses."""
+    captured: list[Recording] = []
+    secrets = _secret_values()
+    original = http_module.read_response_safe
+
+    def capturing(
+        response: requests.Response,
+        max_bytes: int = http_module.MAX_PAYLOAD_SIZE,
+        timeout: float | tuple[float, float] | None = None,
+        on_chunk: Callable[[bytes], None] | None = None,
+    ) -> bytes:
+        chunks: list[bytes] = []
+
+        def tee(chunk: bytes) -> None:
+            chunks.append(chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
+
+        content = original(response, max_bytes, timeout=timeout, on_chunk=tee if on_chunk else None)
+        captured.append(_recording_from(response, b"".join(chunks) if on_chunk else content, secrets))
+        return content
+
+    with mock.patch.object(http_module, "read_response_safe", capturing):
+        SOURCES[source](True)
+    return captured
+
+
+def save_recordings(directory: Path, source: str, recordings: Sequence[Recording]) -> Path:
+    """Write *recordings* to ``directory/source`` (index plus one body file each)."""
+    target = directory / source
+    target.mkdir(parents=True, exist_ok=True)
+    for stale in target.glob("*.body"):
+        stale.unlink()
+    entries = []
+    for number, recording in enumerate(recordings):
+        body_name = f"{number:03d}.body"
+        (target / body_name).write_bytes(recording.body)
+        entry = asdict(recording)
+        entry["body"] = body_name
+        entries.append(entry)
+    index = {
+        "schema": RECORDINGS_SCHEMA_VERSION,
+        "recorded_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "responses": entries,
+    }
+    index_path = target / "index.json"
+    index_path.write_text(json.dumps(index, indent=2, allow_nan=False) + "\n", encoding="utf-8")
+    return index_path
+
+
+def load_recordings(directory: Path, source: str) -> list[Recording]:
+    """Read the recordings written by :func:`save_recordings`."""
+    target = directory / source
+    index = loads_finite((target / "index.json").read_text(encoding="utf-8"))
+    if not isinstance(index, dict) or index.get("schema") != RECORDINGS_SCHEMA_VERSION:
+        raise ValueError(f"{target / 'index.json'}: unsupported recordings index")
+    recordings = []
+    for entry in index["responses"]:
+        body_path = target / Path(entry["body"]).name
+        recordings.append(Recording(**{**entry, "body": body_path.read_bytes()}))
+    return recordings
+
+
+# ---- Replay --------------------------------------------------------------
+
+
+def _longest_object_list(node: Any) -> list[Any] | None:
+    best: list[Any] | None = None
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        children = current.values() if isinstance(current, dict) else current if isinstance(current, list) else ()
+        if isinstance(current, list) and current and all(isinstance(item, dict) for item in current):
+            if best is None or len(current) > len(best):
+                best = current
+        stack.extend(child for child in children if isinstance(child, (dict, list)))
+    return best
+
+
+def scale_payload(body: bytes, content_type: str, factor: int) -> bytes:
+    """Repeat the payload's records *factor* times.
+
+    JSON bodies repeat their longest list of objects (WL ``trafficInfos``,
+    GeoJSON ``features``, VAO ``Departure``); XML bodies repeat their RSS
+    ``<item>`` elements. Anything else is returned unchanged.
+    """
+    if factor <= 1:
+        return body
+    if "json" in content_type:
+        try:
+            payload = loads_finite(body)
+        except (ValueError, RecursionError):
+            return body
+        records = _longest_object_list(payload)
+        if records is None:
+            return body
+        records[:] = records * factor
+        return json.dumps(payload, ensure_ascii=False, allow_nan=False).encode("utf-8")
+    if "xml" in content_type:
+        items = list(_RSS_ITEM_RE.finditer(body))
+        if not items:
+            return body
+        extra = b"".join(match.group(0) for match in items) * (factor - 1)
+        end = items[-1].end()
+        return body[:end] + extra + body[end:]
+    return body
+
+
+@dataclass
+class _ServerStats:
+    served: int = 0
+    injected_errors: int = 0
+    not_found: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    standin: StandinServer
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self.standin._respond(self)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        # Request lines may carry an access ID; the stand-in stays silent.
+        return
+
+
+class StandinServer:
+    """Threaded HTTP server on 127.0.0.1 replaying :class:`Recording` objects.
+
+    Requests are matched by ``Host`` header and path, then by the
+    normalized query (falling back to the first recording for the path).
+    Each response waits ``latency_ms`` plus up to ``jitter_ms``; with
+    probability ``error_rate`` a 503 is returned instead.
+    """
+
+    def __init__(self, recordings: Sequence[Recording], profile: ReplayProfile | None = None) -> None:
+        self.profile = profile or ReplayProfile()
+        self.stats = _ServerStats()
+        self._rng = random.Random(self.profile.seed)  # noqa: S311 - load simulation, not security relevant
+        self._bodies: dict[tuple[str, str, str], tuple[Recording, bytes]] = {}
+        self._by_path: dict[tuple[str, str], tuple[Recording, bytes]] = {}
+        for recording in recordings:
+            scaled = scale_payload(recording.body, recording.content_type, self.profile.scale)
+            self._bodies.setdefault((recording.host, recording.path, recording.query), (recording, scaled))
+            self._by_path.setdefault((recording.host, recording.path), (recording, scaled))
+        handler = type("_BoundReplayHandler", (_ReplayHandler,), {"standin": self})
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return int(self._httpd.server_address[1])
+
+    @property
+    def hosts(self) -> set[str]:
+        return {host for host, _path in self._by_path}
+
+    def __enter__(self) -> StandinServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="upstream-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _delay_and_fail(self) -> bool:
+        with self.stats.lock:
+            delay_ms = self.profile.latency_ms + self._rng.uniform(0, self.profile.jitter_ms)
+            fail = self._rng.random() < self.profile.error_rate
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+        return fail
+
+    def _respond(self, handler: BaseHTTPRequestHandler) -> None:
+        parsed = urlparse(handler.path)
+        host = (handler.headers.get("Host") or "").split(":", 1)[0].lower()
+        match = self._bodies.get((host, parsed.path, _normalized_query(parsed.query)))
+        match = match or self._by_path.get((host, parsed.path))
+        if match is None:
+            with self.stats.lock:
+                self.stats.not_found += 1
+            self._send(handler, 404, "text/plain", b"no recording")
+            return
+        failed = self._delay_and_fail()
+        with self.stats.lock:
+            self.stats.served += 1
+            self.stats.injected_errors += failed
+        if failed:
+            self._send(handler, 503, "text/plain", b"injected failure")
+            return
+        recording, body = match
+        self._send(handler, recording.status, recording.content_type, body)
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, content_type: str, body: bytes) -> None:
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
+@contextmanager
+def serve(recordings: Sequence[Recording], profile: ReplayProfile | None = None) -> Iterator[StandinServer]:
+    """Start a :class:`StandinServer` and route its hosts to it."""
+    with StandinServer(recordings, profile) as server, loopback_standins(dict.fromkeys(server.hosts, server.port)):
+        yield server
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty sequence."""
+    rank = max(int(round(fraction * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def bench(
+    source: str,
+    recordings: Sequence[Recording],
+    profile: ReplayProfile,
+    *,
+    runs: int,
+    concurrency: int = 1,
+) -> dict[str, Any]:
+    """Drive *source*'s fetch path *runs* times against the stand-in."""
+    driver = SOURCES[source]
+
+    def one_run(_index: int) -> tuple[float, int, bool]:
+        started = time.perf_counter()
+        try:
+            items, failed = driver(False), False
+        except Exception as exc:  # measured, not fatal
+            log.debug("Run failed: %s", type(exc).__name__)
+            items, failed = 0, True
+        return time.perf_counter() - started, items, failed
+
+    with serve(recordings, profile) as server:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(one_run, range(runs)))
+        elapsed = time.perf_counter() - started
+
+    wall = sorted(duration for duration, _items, _failed in results)
+    items = sum(count for _duration, count, _failed in results)
+    return {
+        "source": source,
+        "runs": runs,
+        "concurrency": concurrency,
+        "profile": asdict(profile),
+        "failed_runs": sum(failed for _duration, _count, failed in results),
+        "items": items,
+        "requests": server.stats.served,
+        "injected_errors": server.stats.injected_errors,
+        "unmatched_requests": server.stats.not_found,
+        "median_s": statistics.median(wall),
+        "p95_s": _percentile(wall, 0.95),
+        "p99_s": _percentile(wall, 0.99),
+        "max_s": wall[-1],
+        "runs_per_s": runs / elapsed if elapsed else None,
+        "items_per_s": items / elapsed if elapsed else None,
+    }
+
+
+# ---- CLI -----------------------------------------------------------------
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0] if __doc__ else None)
+    parser.add_argument(
+        "--recordings", type=Path, default=DEFAULT_RECORDINGS_DIR,
+        help="Recordings directory (default: benchmarks/recordings).",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_cmd = commands.add_parser("record", help="Capture sanitized responses from the real upstreams.")
+    record_cmd.add_argument("sources", nargs="+", choices=sorted(SOURCES))
+
+    bench_cmd = commands.add_parser("bench", help="Replay recordings and time the fetch path.")
+    bench_cmd.add_argument("source", choices=sorted(SOURCES))
+    bench_cmd.add_argument("--runs", type=int, default=10, help="Fetch runs (default: 10).")
+    bench_cmd.add_argument("--concurrency", type=int, default=1, help="Parallel runs (default: 1).")
+    bench_cmd.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per response.")
+    bench_cmd.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform extra latency on top.")
+    bench_cmd.add_argument("--error-rate", type=float, default=0.0, help="Share of responses replaced by 503.")
+    bench_cmd.add_argument("--scale", type=int, default=1, help="Repeat the recorded records n times.")
+    bench_cmd.add_argument("--seed", type=int, default=0, help="Seed for latency and error injection.")
+    bench_cmd.add_argument("--output", type=Path, default=None, help="Also write the report to this JSON file.")
+    bench_cmd.add_argument("--verbose", action="store_true", help="Keep provider log output.")
+
+    args = parser.parse_args(argv)
+    if args.command == "bench":
+        if args.runs < 1 or args.concurrency < 1 or args.scale < 1:
+            parser.error("--runs, --concurrency and --scale must be at least 1")
+        if not 0.0 <= args.error_rate <= 1.0:
+            parser.error("--error-rate must be between 0 and 1")
+        if args.latency_ms < 0 or args.jitter_ms < 0:
+            parser.error("--latency-ms and --jitter-ms must not be negative")
+    return args
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    verbose = getattr(args, "verbose", True)
+    logging.basicConfig(level=logging.INFO if verbose else logging.ERROR)
+
+    if args.command == "record":
+        for source in args.sources:
+            recordings = record(source)
+            if not recordings:
+                print(f"{source}: no responses captured")
+                continue
+            index = save_recordings(args.recordings, source, recordings)
+            size = sum(len(recording.body) for recording in recordings)
+            print(f"{source}: {len(recordings)} response(s), {size} bytes -> {index}")
+        return 0
+
+    profile = ReplayProfile(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, scale=args.scale, seed=args.seed,
+    )
+    report = bench(
+        args.source, load_recordings(args.recordings, args.source), profile,
+        runs=args.runs, concurrency=args.concurrency,
+    )
+    print(json.dumps(report, indent=2, allow_nan=False))
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, allow_nan=False) + "\n", encoding="utf-8")
+    return 1 if report["unmatched_requests"] else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution
+    sys.exit(main())
@@ -1,7 +1,7 @@
 /* Wien ÖPNV – Live-Dashboard
  *
  * Vanilla JS, kein Build, keine Drittabhängigkeiten. Lädt:
- *  - feed.xml (same-origin)
+ *  - feed.xml (same-origin), danach nur noch changes.json (Deltas)
  *  - data/stats/<datei>_<jahr>.csv via raw.githubusercontent.com
  * und rendert alles im Browser. Alle Fremddaten werden ausschließlich
  * über textContent in den DOM eingefügt – keine innerHTML-Pfade für
@@ -15,6 +15,8 @@
   const RAW_BASE = `https://raw.githubusercontent.com/${REPO}/main/data/stats`;
   const FEED_URL_DE = "feed.xml";
   const FEED_URL_EN = "feed.en.xml";
+  const CHANGES_URL_DE = "changes.json";
+  const CHANGES_URL_EN = "changes.en.json";
   const REFRESH_MS = 5 * 60 * 1000; // 5 Minuten
   const LANG_STORAGE_KEY = "wienoepnv:lang";
 
@@ -213,6 +215,10 @@
     return currentLang === "en" ? FEED_URL_EN : FEED_URL_DE;
   }
 
+  function currentChangesUrl() {
+    return currentLang === "en" ? CHANGES_URL_EN : CHANGES_URL_DE;
+  }
+
   function localeTag() {
     return currentLang === "en" ? "en-GB" : "de-AT";
   }
@@ -596,7 +602,73 @@
     return currentLang === "en" ? "Other" : "Andere";
   }
 
-  let feedState = { items: [], filter: "all" };
+  // ``cursor`` is the change-log position the items reflect
+  // (``{ lang, epoch, seq }``), ``null`` until a full feed was loaded.
+  let feedState = { items: [], filter: "all", cursor: null };
+
+  // ----- Incremental feed updates -----
+
+  // ``changes.json`` / ``changes.en.json`` list the feed's item changes
+  // per build under a monotonically increasing ``seq`` (written by
+  // ``src/feed/changes.py``). After one full ``feed.xml`` load a refresh
+  // only revalidates that file – a 304 while nothing changed – and
+  // applies the batches newer than the cursor. Returns ``null`` whenever
+  // the delta cannot be applied safely (other language, new epoch,
+  // cursor outside the retained window, missing entry); the caller then
+  // falls back to the full feed.
+  function applyFeedChanges(log, lang) {
+    const cursor = feedState.cursor;
+    if (!cursor || cursor.lang !== lang || cursor.epoch !== log.epoch) return null;
+    if (cursor.seq > log.seq || cursor.seq < log.oldest) return null;
+    if (cursor.seq === log.seq) return feedState.items;
+    const byGuid = new Map(feedState.items.map((it) => [it.guid, it]));
+    for (const batch of log.changes) {
+      if (batch.seq <= cursor.seq) continue;
+      for (const guid of batch.removed) byGuid.delete(guid);
+      for (const guid of [...batch.added, ...batch.updated]) {
+        const entry = log.entries[guid];
+        if (entry) byGuid.set(guid, itemFromEntry(entry));
+      }
+    }
+    const items = [];
+    for (const [guid] of log.items) {
+      const item = byGuid.get(guid);
+      if (!item) return null;
+      items.push(item);
+    }
+    return items;
+  }
+
+  // Same shape as the items built by ``parseFeed``.
+  function itemFromEntry(entry) {
+    const item = {
+      title: entry.title || "",
+      link: entry.link || "",
+      guid: entry.guid || "",
+      pubDate: entry.pubDate || "",
+      description: entry.description || "",
+      firstSeen: entry.first_seen || "",
+      startsAt: entry.starts_at || "",
+      endsAt: entry.ends_at || "",
+    };
+    item.source = detectSource(item);
+    return item;
+  }
+
+  async function fetchChangeLog(signal) {
+    try {
+      const log = JSON.parse(await fetchText(currentChangesUrl(), { signal }));
+      const valid = log && log.format === 1 && typeof log.epoch === "string"
+        && Number.isInteger(log.seq) && Number.isInteger(log.oldest)
+        && Array.isArray(log.items) && Array.isArray(log.changes)
+        && log.entries && typeof log.entries === "object";
+      return valid ? log : null;
+    } catch (err) {
+      if (err.name === "AbortError") throw err;
+      // No (valid) change log published yet – the full feed still works.
+      return null;
+    }
+  }
 
   function renderFeed() {
     const list = $("#feed-list");
@@ -1310,9 +1382,18 @@
   async function loadFeed(signal) {
     try {
       hideError("feed-error");
-      const text = await fetchText(currentFeedUrl(), { signal });
-      const feed = parseFeed(text);
-      feedState.items = feed.items;
+      const lang = currentLang;
+      const log = await fetchChangeLog(signal);
+      const items = log ? applyFeedChanges(log, lang) : null;
+      if (items) {
+        feedState.items = items;
+      } else {
+        // The change log was fetched first, so the feed is at least as
+        // new as ``log.seq``; re-applying a batch later is harmless.
+        const text = await fetchText(currentFeedUrl(), { signal });
+        feedState.items = parseFeed(text).items;
+      }
+      feedState.cursor = log ? { lang, epoch: log.epoch, seq: log.seq } : null;
       renderFeed();
     } catch (err) {
       // Ein AbortError stammt vom Race aus loadAll() (neuer Refresh hat
@@ -1,9 +1,10 @@
 /* Wien ÖPNV – Live-Dashboard | MIT License */
-"use strict";(()=>{const REPO="Origamihase/wien-oepnv";const RAW_BASE=`https://raw.githubusercontent.com/${REPO}/main/data/stats`;const FEED_URL_DE="feed.xml";const FEED_URL_EN="feed.en.xml";const REFRESH_MS=5*60*1000;const LANG_STORAGE_KEY="wienoepnv:lang";const WEATHER_API="https://api.open-meteo.com/v1";const WEATHER_MODEL="geosphere_arome_austria";const WEATHER_LAT="48.186116";const WEATHER_LON="16.374399";const I18N_EN={"doc-title":"Vienna Public Transport – Live Dashboard | Disruptions, Trunk Line & Statistics","meta-description":"Live dashboard for Wiener Linien, ÖBB and VOR: current disruptions from the RSS "+"feed, yearly statistics of disruption reports plus delay and cancellation data "+"for the S-Bahn trunk line. Proper names (stations, operators) are kept in German.","skip-link":"Skip to content","brand-aria":"Wien ÖPNV Live Dashboard – home","brand-sub":"Live dashboard","nav-main":"Main navigation","nav-feed":"Disruptions","nav-stoerungen":"Disruption statistics","nav-stammstrecke":"Trunk line","nav-ausfaelle":"Cancellations","lang-switch":"Choose language","lang-de":"Deutsch","lang-en":"English","hero-eyebrow":"Real-time · Open data · Vienna & eastern Austria","hero-title":"Disruptions, delays & cancellations at a glance","hero-lead-html":"Consolidated transit information from <strong>Wiener Linien</strong>, "+"<strong>ÖBB</strong> and <strong>VOR/VAO</strong> – live from the "+"RSS feed, augmented with the latest yearly statistics for the "+"S-Bahn trunk line.","status-loading":"Loading data …","status-ok":"Live feed updated.","status-error":"The live feed could not be loaded.","btn-refresh":"Refresh","hero-meta-stamp":"Last updated:","hero-meta-rss":"Feed (RSS)","hero-meta-source":"Source code","feed-title":"Current disruptions","feed-sub-stammstrecke-html":"Current S-Bahn observations at Wien Hauptbahnhof "+"– <code>data/stats/stammstrecke_<span data-year-label>–</span>.csv</code>.","feed-sub-live-html":"Live from <a href=\"feed.en.xml\" type=\"application/rss+xml\" "+"data-i18n-href=\"feed-href\" data-href-de=\"feed.xml\" "+"data-href-en=\"feed.en.xml\"><code>feed.en.xml</code></a> "+"· consolidated from official sources "+"· <span id=\"feed-count\" class=\"badge\" aria-live=\"polite\">–</span>","live-tile-label":"Avg. trunk-line delay","live-tile-window":"last 60 min · source VOR / VAO","live-tile-cta":" – open detail view","filters-aria":"Filter disruptions by source","filter-all":"All","filter-wl":"Wiener Linien","filter-oebb":"ÖBB","filter-baustellen":"Construction","filter-other":"Other","feed-empty":"No disruptions for the selected filter.","feed-error-prefix":"Feed could not be loaded:","stoerungen-error-prefix":"Disruption statistics unavailable:","stammstrecke-error-prefix":"Trunk-line statistics unavailable:","ausfaelle-error-prefix":"Cancellation statistics unavailable:","stoerungen-title":"Disruption statistics","stoerungen-sub-html":"Yearly ledger from "+"<code>data/stats/stoerungen_<span data-year-label>–</span>.csv</code> "+"– one row per newly recognised event identity.","aria-stoerungen-kpis":"Disruption key figures","card-by-provider":"Distribution by source","aria-stoerungen-providers":"Disruptions by source","card-by-weekday":"By weekday","aria-stoerungen-weekday":"Disruptions by weekday","card-by-hour":"By hour of day","aria-stoerungen-hour":"Disruptions by hour","stammstrecke-title":"Trunk line – delays","stammstrecke-sub-html":"S-Bahn observations at Wien Hauptbahnhof – "+"<code>data/stats/stammstrecke_<span data-year-label>–</span>.csv</code>.","aria-stammstrecke-kpis":"Trunk line key figures","card-stammstrecke-hour":"Avg. delay by hour of day","aria-stammstrecke-hour":"Avg. delay by hour","card-stammstrecke-weekday":"Avg. delay by weekday","aria-stammstrecke-weekday":"Avg. delay by weekday","card-stammstrecke-direction":"Observations by direction","aria-stammstrecke-direction":"Observations by direction","ausfaelle-title":"Trunk line – cancellations","ausfaelle-sub-html":"Cancelled S-Bahn services – deduplicated ledger "+"<code>data/stats/ausfaelle_<span data-year-label>–</span>.csv</code>.","aria-ausfaelle-kpis":"Cancellation key figures","card-by-line":"By line","aria-ausfaelle-line":"Cancellations by line","card-by-direction":"By direction","aria-ausfaelle-direction":"Cancellations by direction","aria-ausfaelle-weekday":"Cancellations by weekday","aria-ausfaelle-hour":"Cancellations by hour","footer-sources-heading":"Data sources","footer-source-wl-html":"<strong>Wiener Linien</strong> – real-time disruption reports (OGD)","footer-source-oebb-html":"<strong>ÖBB</strong> – nationwide rail alerts, filtered to Vienna","footer-source-vor-html":"<strong>VOR/VAO</strong> – trunk-line observations at Wien Hbf","footer-source-stadt-html":"<strong>City of Vienna (OGD)</strong> – construction works with district &amp; period","footer-about-heading":"About the dashboard","footer-about-html":"Open-source under the MIT licence. Feed update cadence: roughly every 30&nbsp;minutes. "+"This dashboard fetches feed and statistics CSVs <em>directly in the browser</em> – "+"no trackers, no cookies, no third-party scripts. Proper names (stations, operators) "+"are kept in German on purpose; only the surrounding text is translated.","footer-link-repo":"Repository on GitHub","footer-link-schema":"CSV schema","footer-link-rss":"RSS feed","footer-link-home":"Project home",};const STATUS_TEXT={de:{"status-loading":"Daten werden geladen …","status-ok":"Live-Feed aktualisiert.","status-error":"Live-Feed konnte nicht geladen werden.","feed-error-prefix":"Feed konnte nicht geladen werden:","stoerungen-error-prefix":"Störungs-Statistik nicht verfügbar:","stammstrecke-error-prefix":"Stammstrecke-Statistik nicht verfügbar:","ausfaelle-error-prefix":"Ausfall-Statistik nicht verfügbar:",},en:{"status-loading":I18N_EN["status-loading"],"status-ok":I18N_EN["status-ok"],"status-error":I18N_EN["status-error"],"feed-error-prefix":I18N_EN["feed-error-prefix"],"stoerungen-error-prefix":I18N_EN["stoerungen-error-prefix"],"stammstrecke-error-prefix":I18N_EN["stammstrecke-error-prefix"],"ausfaelle-error-prefix":I18N_EN["ausfaelle-error-prefix"],},};function readStoredLang(){try{const stored=localStorage.getItem(LANG_STORAGE_KEY);if(stored==="en"||stored==="de")return stored;}catch{}
+"use strict";(()=>{const REPO="Origamihase/wien-oepnv";const RAW_BASE=`https://raw.githubusercontent.com/${REPO}/main/data/stats`;const FEED_URL_DE="feed.xml";const FEED_URL_EN="feed.en.xml";const CHANGES_URL_DE="changes.json";const CHANGES_URL_EN="changes.en.json";const REFRESH_MS=5*60*1000;const LANG_STORAGE_KEY="wienoepnv:lang";const WEATHER_API="https://api.open-meteo.com/v1";const WEATHER_MODEL="geosphere_arome_austria";const WEATHER_LAT="48.186116";const WEATHER_LON="16.374399";const I18N_EN={"doc-title":"Vienna Public Transport – Live Dashboard | Disruptions, Trunk Line & Statistics","meta-description":"Live dashboard for Wiener Linien, ÖBB and VOR: current disruptions from the RSS "+"feed, yearly statistics of disruption reports plus delay and cancellation data "+"for the S-Bahn trunk line. Proper names (stations, operators) are kept in German.","skip-link":"Skip to content","brand-aria":"Wien ÖPNV Live Dashboard – home","brand-sub":"Live dashboard","nav-main":"Main navigation","nav-feed":"Disruptions","nav-stoerungen":"Disruption statistics","nav-stammstrecke":"Trunk line","nav-ausfaelle":"Cancellations","lang-switch":"Choose language","lang-de":"Deutsch","lang-en":"English","hero-eyebrow":"Real-time · Open data · Vienna & eastern Austria","hero-title":"Disruptions, delays & cancellations at a glance","hero-lead-html":"Consolidated transit information from <strong>Wiener Linien</strong>, "+"<strong>ÖBB</strong> and <strong>VOR/VAO</strong> – live from the "+"RSS feed, augmented with the latest yearly statistics for the "+"S-Bahn trunk line.","status-loading":"Loading data …","status-ok":"Live feed updated.","status-error":"The live feed could not be loaded.","btn-refresh":"Refresh","hero-meta-stamp":"Last updated:","hero-meta-rss":"Feed (RSS)","hero-meta-source":"Source code","feed-title":"Current disruptions","feed-sub-stammstrecke-html":"Current S-Bahn observations at Wien Hauptbahnhof "+"– <code>data/stats/stammstrecke_<span data-year-label>–</span>.csv</code>.","feed-sub-live-html":"Live from <a href=\"feed.en.xml\" type=\"application/rss+xml\" "+"data-i18n-href=\"feed-href\" data-href-de=\"feed.xml\" "+"data-href-en=\"feed.en.xml\"><code>feed.en.xml</code></a> "+"· consolidated from official sources "+"· <span id=\"feed-count\" class=\"badge\" aria-live=\"polite\">–</span>","live-tile-label":"Avg. trunk-line delay","live-tile-window":"last 60 min · source VOR / VAO","live-tile-cta":" – open detail view","filters-aria":"Filter disruptions by source","filter-all":"All","filter-wl":"Wiener Linien","filter-oebb":"ÖBB","filter-baustellen":"Construction","filter-other":"Other","feed-empty":"No disruptions for the selected filter.","feed-error-prefix":"Feed could not be loaded:","stoerungen-error-prefix":"Disruption statistics unavailable:","stammstrecke-error-prefix":"Trunk-line statistics unavailable:","ausfaelle-error-prefix":"Cancellation statistics unavailable:","stoerungen-title":"Disruption statistics","stoerungen-sub-html":"Yearly ledger from "+"<code>data/stats/stoerungen_<span data-year-label>–</span>.csv</code> "+"– one row per newly recognised event identity.","aria-stoerungen-kpis":"Disruption key figures","card-by-provider":"Distribution by source","aria-stoerungen-providers":"Disruptions by source","card-by-weekday":"By weekday","aria-stoerungen-weekday":"Disruptions by weekday","card-by-hour":"By hour of day","aria-stoerungen-hour":"Disruptions by hour","stammstrecke-title":"Trunk line – delays","stammstrecke-sub-html":"S-Bahn observations at Wien Hauptbahnhof – "+"<code>data/stats/stammstrecke_<span data-year-label>–</span>.csv</code>.","aria-stammstrecke-kpis":"Trunk line key figures","card-stammstrecke-hour":"Avg. delay by hour of day","aria-stammstrecke-hour":"Avg. delay by hour","card-stammstrecke-weekday":"Avg. delay by weekday","aria-stammstrecke-weekday":"Avg. delay by weekday","card-stammstrecke-direction":"Observations by direction","aria-stammstrecke-direction":"Observations by direction","ausfaelle-title":"Trunk line – cancellations","ausfaelle-sub-html":"Cancelled S-Bahn services – deduplicated ledger "+"<code>data/stats/ausfaelle_<span data-year-label>–</span>.csv</code>.","aria-ausfaelle-kpis":"Cancellation key figures","card-by-line":"By line","aria-ausfaelle-line":"Cancellations by line","card-by-direction":"By direction","aria-ausfaelle-direction":"Cancellations by direction","aria-ausfaelle-weekday":"Cancellations by weekday","aria-ausfaelle-hour":"Cancellations by hour","footer-sources-heading":"Data sources","footer-source-wl-html":"<strong>Wiener Linien</strong> – real-time disruption reports (OGD)","footer-source-oebb-html":"<strong>ÖBB</strong> – nationwide rail alerts, filtered to Vienna","footer-source-vor-html":"<strong>VOR/VAO</strong> – trunk-line observations at Wien Hbf","footer-source-stadt-html":"<strong>City of Vienna (OGD)</strong> – construction works with district &amp; period","footer-about-heading":"About the dashboard","footer-about-html":"Open-source under the MIT licence. Feed update cadence: roughly every 30&nbsp;minutes. "+"This dashboard fetches feed and statistics CSVs <em>directly in the browser</em> – "+"no trackers, no cookies, no third-party scripts. Proper names (stations, operators) "+"are kept in German on purpose; only the surrounding text is translated.","footer-link-repo":"Repository on GitHub","footer-link-schema":"CSV schema","footer-link-rss":"RSS feed","footer-link-home":"Project home",};const STATUS_TEXT={de:{"status-loading":"Daten werden geladen …","status-ok":"Live-Feed aktualisiert.","status-error":"Live-Feed konnte nicht geladen werden.","feed-error-prefix":"Feed konnte nicht geladen werden:","stoerungen-error-prefix":"Störungs-Statistik nicht verfügbar:","stammstrecke-error-prefix":"Stammstrecke-Statistik nicht verfügbar:","ausfaelle-error-prefix":"Ausfall-Statistik nicht verfügbar:",},en:{"status-loading":I18N_EN["status-loading"],"status-ok":I18N_EN["status-ok"],"status-error":I18N_EN["status-error"],"feed-error-prefix":I18N_EN["feed-error-prefix"],"stoerungen-error-prefix":I18N_EN["stoerungen-error-prefix"],"stammstrecke-error-prefix":I18N_EN["stammstrecke-error-prefix"],"ausfaelle-error-prefix":I18N_EN["ausfaelle-error-prefix"],},};function readStoredLang(){try{const stored=localStorage.getItem(LANG_STORAGE_KEY);if(stored==="en"||stored==="de")return stored;}catch{}
 return"de";}
 let currentLang=readStoredLang();function writeStoredLang(lang){try{localStorage.setItem(LANG_STORAGE_KEY,lang);}catch{}}
 function statusText(key){const dict=STATUS_TEXT[currentLang]||STATUS_TEXT.de;return dict[key]||STATUS_TEXT.de[key]||"";}
 function currentFeedUrl(){return currentLang==="en"?FEED_URL_EN:FEED_URL_DE;}
+function currentChangesUrl(){return currentLang==="en"?CHANGES_URL_EN:CHANGES_URL_DE;}
 function localeTag(){return currentLang==="en"?"en-GB":"de-AT";}
 let dtfFull=buildDtf({dateStyle:"medium",timeStyle:"short"});let dtfTime=buildDtf({timeStyle:"short"});let dtfDate=buildDtf({dateStyle:"medium"});let rtf=new Intl.RelativeTimeFormat(localeTag(),{numeric:"auto"});let nfInt=new Intl.NumberFormat(localeTag());let nf1=new Intl.NumberFormat(localeTag(),{minimumFractionDigits:1,maximumFractionDigits:1,});function buildDtf(opts){return new Intl.DateTimeFormat(localeTag(),{timeZone:"Europe/Vienna",...opts,});}
 function rebuildIntl(){dtfFull=buildDtf({dateStyle:"medium",timeStyle:"short"});dtfTime=buildDtf({timeStyle:"short"});dtfDate=buildDtf({dateStyle:"medium"});rtf=new Intl.RelativeTimeFormat(localeTag(),{numeric:"auto"});nfInt=new Intl.NumberFormat(localeTag());nf1=new Intl.NumberFormat(localeTag(),{minimumFractionDigits:1,maximumFractionDigits:1,});}
@@ -45,7 +46,12 @@ return"";}
 function firstChildTextNs(parent,ns,name){const list=parent.getElementsByTagNameNS(ns,name);if(list.length===0)return"";return list[0].textContent?list[0].textContent.trim():"";}
 function detectSource(item){const link=(item.link||"").toLowerCase();const haystack=`${item.link} ${item.title}`.toLowerCase();if(/(wienerlinien|wiener\s*linien|wl-disp|ogd_realtime)/.test(haystack))return"wienerlinien";if(/(oebb|öbb|scotty)/.test(haystack))return"oebb";if(/data\.gv\.at\/[^ ]*baustellen/.test(link))return"baustellen";if(/(vor\.at|verkehrsverbund|vao\.|anachb)/.test(haystack))return"vor";return"other";}
 function sourceLabel(key){if(key==="wienerlinien")return"Wiener Linien";if(key==="oebb")return"ÖBB";if(key==="baustellen")return currentLang==="en"?"Construction":"Baustellen";if(key==="vor")return"VOR / VAO";return currentLang==="en"?"Other":"Andere";}
-let feedState={items:[],filter:"all"};function renderFeed(){const list=$("#feed-list");const empty=$("#feed-empty");const countBadge=$("#feed-count");if(!list)return;list.setAttribute("aria-busy","false");clear(list);const filtered=feedState.filter==="all"?feedState.items:feedState.items.filter((it)=>{const src=it.source||detectSource(it);if(feedState.filter==="other"){return src!=="wienerlinien"&&src!=="oebb"&&src!=="baustellen";}
+let feedState={items:[],filter:"all",cursor:null};function applyFeedChanges(log,lang){const cursor=feedState.cursor;if(!cursor||cursor.lang!==lang||cursor.epoch!==log.epoch)return null;if(cursor.seq>log.seq||cursor.seq<log.oldest)return null;if(cursor.seq===log.seq)return feedState.items;const byGuid=new Map(feedState.items.map((it)=>[it.guid,it]));for(const batch of log.changes){if(batch.seq<=cursor.seq)continue;for(const guid of batch.removed)byGuid.delete(guid);for(const guid of[...batch.added,...batch.updated]){const entry=log.entries[guid];if(entry)byGuid.set(guid,itemFromEntry(entry));}}
+const items=[];for(const[guid]of log.items){const item=byGuid.get(guid);if(!item)return null;items.push(item);}
+return items;}
+function itemFromEntry(entry){const item={title:entry.title||"",link:entry.link||"",guid:entry.guid||"",pubDate:entry.pubDate||"",description:entry.description||"",firstSeen:entry.first_seen||"",startsAt:entry.starts_at||"",endsAt:entry.ends_at||"",};item.source=detectSource(item);return item;}
+async function fetchChangeLog(signal){try{const log=JSON.parse(await fetchText(currentChangesUrl(),{signal}));const valid=log&&log.format===1&&typeof log.epoch==="string"&&Number.isInteger(log.seq)&&Number.isInteger(log.oldest)&&Array.isArray(log.items)&&Array.isArray(log.changes)&&log.entries&&typeof log.entries==="object";return valid?log:null;}catch(err){if(err.name==="AbortError")throw err;return null;}}
+function renderFeed(){const list=$("#feed-list");const empty=$("#feed-empty");const countBadge=$("#feed-count");if(!list)return;list.setAttribute("aria-busy","false");clear(list);const filtered=feedState.filter==="all"?feedState.items:feedState.items.filter((it)=>{const src=it.source||detectSource(it);if(feedState.filter==="other"){return src!=="wienerlinien"&&src!=="oebb"&&src!=="baustellen";}
 return src===feedState.filter;});if(countBadge){const suffix=currentLang==="en"?"active":"aktiv";countBadge.textContent=`${nfInt.format(filtered.length)} ${suffix}`;}
 if(filtered.length===0){empty.hidden=false;return;}
 empty.hidden=true;const frag=document.createDocumentFragment();for(const it of filtered){frag.append(renderFeedItem(it));}
@@ -99,7 +105,8 @@ async function loadWeather(signal){const loc=`latitude=${WEATHER_LAT}&longitude=
 if(!reading)throw lastErr||new Error("weather unavailable");weatherState=reading;renderWeather();}
 let refreshTimer=null;let currentAbort=null;let sectionObserver=null;const loadedSections=new Set();async function loadAll(){if(currentAbort)currentAbort.abort();const ctrl=new AbortController();currentAbort=ctrl;setStatus("loading","status-loading");const refreshBtn=$("#refresh-btn");if(refreshBtn)refreshBtn.disabled=true;const tasks=[loadFeed(ctrl.signal).then(()=>{setStatus("ok","status-ok");setLastUpdate(new Date());},()=>{setStatus("error","status-error");},),loadStammstrecke(ctrl.signal).then(()=>setLastUpdate(new Date()),()=>{},),loadWeather(ctrl.signal).then(()=>{},()=>{}),];for(const id of loadedSections){const loader=SECTION_LOADERS[id];if(!loader)continue;tasks.push(loader(ctrl.signal).then(()=>setLastUpdate(new Date()),()=>{},));}
 await Promise.allSettled(tasks);if(refreshBtn)refreshBtn.disabled=false;}
-async function loadFeed(signal){try{hideError("feed-error");const text=await fetchText(currentFeedUrl(),{signal});const feed=parseFeed(text);feedState.items=feed.items;renderFeed();}catch(err){if(err.name==="AbortError")throw err;const list=$("#feed-list");if(list){list.setAttribute("aria-busy","false");clear(list);}
+async function loadFeed(signal){try{hideError("feed-error");const lang=currentLang;const log=await fetchChangeLog(signal);const items=log?applyFeedChanges(log,lang):null;if(items){feedState.items=items;}else{const text=await fetchText(currentFeedUrl(),{signal});feedState.items=parseFeed(text).items;}
+feedState.cursor=log?{lang,epoch:log.epoch,seq:log.seq}:null;renderFeed();}catch(err){if(err.name==="AbortError")throw err;const list=$("#feed-list");if(list){list.setAttribute("aria-busy","false");clear(list);}
 showError("feed-error","feed-error-prefix",err.message);throw err;}}
 async function loadStoerungen(signal){try{hideError("stoerungen-error");const{year,text}=await fetchCsvForYear("stoerungen",{signal});const rows=rowsToObjects(parseCSV(text));renderStoerungenStats(year,rows);}catch(err){if(err.name==="AbortError")throw err;showError("stoerungen-error","stoerungen-error-prefix",err.message);throw err;}}
 async function loadStammstrecke(signal){try{hideError("stammstrecke-error");const{year,text}=await fetchCsvForYear("stammstrecke",{signal});const rows=rowsToObjects(parseCSV(text));renderStammstreckeStats(year,rows);}catch(err){if(err.name==="AbortError")throw err;resetStammstreckeLiveTile("–");showError("stammstrecke-error","stammstrecke-error-prefix",err.message);throw err;}}
@@ -307,6 +307,80 @@ _HANDLERS = {
 }
 
 
+def load_override_list(overrides_path: Path) -> list[Any]:
+    """Return the ``overrides`` list from *overrides_path*.
+
+    Raises :class:`OverrideError` when the file is missing, unparseable or
+    does not carry the documented ``{"overrides": [...]}`` envelope.
+    """
+    if not overrides_path.exists():
+        raise OverrideError(f"Overrides file not found: {overrides_path}")
+    payload = _load_json(overrides_path, MAX_OVERRIDES_FILE_BYTES, "Overrides")
+    if not isinstance(payload, dict) or not isinstance(payload.get("overrides"), list):
+        raise OverrideError(
+            f"Overrides file must be an object with an 'overrides' list: {overrides_path}"
+        )
+    return cast(list[Any], payload["overrides"])
+
+
+def _override_ident(index: int, raw_override: dict[str, Any]) -> str:
+    """Validate the key fields of *raw_override* and return its log label."""
+    op = raw_override.get("op")
+    diva = raw_override.get("wl_diva")
+    eva = raw_override.get("eva_nr")
+    if op not in _ALLOWED_OPS:
+        raise OverrideError(
+            f"Override #{index} has unknown op {op!r} (allowed: {sorted(_ALLOWED_OPS)})"
+        )
+    has_diva = isinstance(diva, str) and bool(diva.strip())
+    bst_code = raw_override.get("bst_code")
+    has_bst_code = isinstance(bst_code, str) and bool(bst_code.strip())
+    # ``patch_coords`` may key on ``eva_nr`` (manual ÖBB stations have no
+    # ``wl_diva``); ``remove`` may key on ``bst_code`` (oebb_geonetz
+    # Betriebsstellen have no ``wl_diva``); ``restore`` still requires
+    # ``wl_diva``.
+    if op == "patch_coords":
+        has_eva = eva is not None and bool(str(eva).strip())
+        if not (has_diva or has_eva):
+            raise OverrideError(f"Override #{index} (op=patch_coords) needs a wl_diva or eva_nr")
+    elif op == "remove":
+        if not (has_diva or has_bst_code):
+            raise OverrideError(f"Override #{index} (op=remove) needs a wl_diva or bst_code")
+    elif not has_diva:
+        raise OverrideError(f"Override #{index} (op={op}) missing or invalid wl_diva")
+    if has_diva:
+        return str(diva).strip()
+    if has_bst_code:
+        return f"bst_code={str(bst_code).strip()}"
+    return f"eva_nr={str(eva).strip()}"
+
+
+def apply_override_list(stations: list[dict[str, Any]], overrides: list[Any]) -> int:
+    """Apply *overrides* to *stations* in place and return the applied count.
+
+    This is the in-memory core shared by :func:`apply_overrides` and the
+    in-process stage graph in ``scripts/update_all_stations.py``. Raises
+    :class:`OverrideError` on the first schema violation; *stations* may
+    already carry the earlier overrides at that point, so callers must
+    discard the list instead of persisting it.
+    """
+    applied = 0
+    for index, raw_override in enumerate(overrides):
+        if not isinstance(raw_override, dict):
+            raise OverrideError(f"Override #{index} is not an object: {raw_override!r}")
+        op = raw_override.get("op")
+        ident = _override_ident(index, raw_override)
+        handler = _HANDLERS[str(op)]
+        try:
+            result = handler(stations, raw_override)
+        except OverrideError as exc:
+            raise OverrideError(f"Override #{index} (op={op}, {ident}): {exc}") from exc
+        log.info("Override #%d (op=%s, %s): %s", index, op, ident, result)
+        if not result.startswith("skip"):
+            applied += 1
+    return applied
+
+
 def apply_overrides(
     stations_path: Path,
     overrides_path: Path,
@@ -319,9 +393,7 @@ def apply_overrides(
         return 2
 
     try:
-        overrides_payload = _load_json(
-            overrides_path, MAX_OVERRIDES_FILE_BYTES, "Overrides"
-        )
+        overrides = load_override_list(overrides_path)
         stations_payload = _load_json(
             stations_path, MAX_STATIONS_FILE_BYTES, "Stations"
         )
@@ -329,77 +401,17 @@ def apply_overrides(
         log.error("%s", exc)
         return 1
 
-    if not isinstance(overrides_payload, dict) or not isinstance(
-        overrides_payload.get("overrides"), list
-    ):
-        log.error(
-            "Overrides file must be an object with an 'overrides' list: %s",
-            overrides_path,
-        )
-        return 1
-
     try:
         stations = _stations_list(stations_payload)
     except OverrideError as exc:
         log.error("%s", exc)
         return 2
 
-    applied = 0
-    for index, raw_override in enumerate(overrides_payload["overrides"]):
-        if not isinstance(raw_override, dict):
-            log.error("Override #%d is not an object: %r", index, raw_override)
-            return 1
-        op = raw_override.get("op")
-        diva = raw_override.get("wl_diva")
-        eva = raw_override.get("eva_nr")
-        if op not in _ALLOWED_OPS:
-            log.error(
-                "Override #%d has unknown op %r (allowed: %s)",
-                index, op, sorted(_ALLOWED_OPS),
-            )
-            return 1
-        has_diva = isinstance(diva, str) and bool(diva.strip())
-        bst_code = raw_override.get("bst_code")
-        has_bst_code = isinstance(bst_code, str) and bool(bst_code.strip())
-        # ``patch_coords`` may key on ``eva_nr`` (manual ÖBB stations have no
-        # ``wl_diva``); ``remove`` may key on ``bst_code`` (oebb_geonetz
-        # Betriebsstellen have no ``wl_diva``); ``restore`` still requires
-        # ``wl_diva``.
-        if op == "patch_coords":
-            has_eva = eva is not None and bool(str(eva).strip())
-            if not (has_diva or has_eva):
-                log.error(
-                    "Override #%d (op=patch_coords) needs a wl_diva or eva_nr",
-                    index,
-                )
-                return 1
-        elif op == "remove":
-            if not (has_diva or has_bst_code):
-                log.error(
-                    "Override #%d (op=remove) needs a wl_diva or bst_code",
-                    index,
-                )
-                return 1
-        elif not has_diva:
-            log.error(
-                "Override #%d (op=%s) missing or invalid wl_diva", index, op
-            )
-            return 1
-        if has_diva:
-            ident = str(diva).strip()
-        elif has_bst_code:
-            ident = f"bst_code={str(bst_code).strip()}"
-        else:
-            ident = f"eva_nr={str(eva).strip()}"
-        handler = _HANDLERS[op]
-        try:
-            result = handler(stations, raw_override)
-        except OverrideError as exc:
-            log.error("Override #%d (op=%s, %s): %s", index, op, ident, exc)
-            return 1
-        log.info("Override #%d (op=%s, %s): %s", index, op, ident, result)
-        if not result.startswith("skip"):
-            applied += 1
+    try:
+        applied = apply_override_list(stations, overrides)
+    except OverrideError as exc:
+        log.error("%s", exc)
+        return 1
 
     # Persist
     # Security (Trojan-Source / BiDi-Mark Drift, ingestion-boundary
@@ -445,12 +457,12 @@ def apply_overrides(
     # and ``scripts/update_all_stations.py:_write_stations`` (2026-05-14
     # PR #1485 / #1487 / #1488 / #1491).
     text = json.dumps(serialisable, indent=2, ensure_ascii=False, allow_nan=False)
-    with atomic_write(stations_path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+    with atomic_write(stations_path, mode="w", encoding="utf-8", permissions=0o644, skip_unchanged=True) as handle:
         handle.write(text)
         handle.write("\n")
     log.info(
         "Applied %d/%d overrides → %s (%d stations)",
-        applied, len(overrides_payload["overrides"]), stations_path, len(stations),
+        applied, len(overrides), stations_path, len(stations),
     )
     return 0
 
@@ -29,8 +29,11 @@ import logging
 import re
 import sys
 from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from collections.abc import Iterable, Mapping
+from collections.abc import Container, Iterable, Iterator, Mapping, Sequence
+from typing import Any
 
 # Ensure the project root is in sys.path to allow imports from src
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -38,10 +41,10 @@ if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
 try:
-    from src.utils.files import atomic_write, read_capped_json, read_capped_text
+    from src.utils.files import atomic_write, open_capped_csv, read_capped_bytes, read_capped_json
     from src.utils.serialize import scrub_trojan_source_primitives
 except ModuleNotFoundError:
-    from utils.files import atomic_write, read_capped_json, read_capped_text  # type: ignore[no-redef]
+    from utils.files import atomic_write, open_capped_csv, read_capped_bytes, read_capped_json  # type: ignore[no-redef]
     from utils.serialize import scrub_trojan_source_primitives  # type: ignore[no-redef]
 
 DEFAULT_STATIONS = BASE_DIR / "data" / "stations.json"
@@ -62,9 +65,15 @@ MAX_JSON_FILE_BYTES = 50 * 1024 * 1024
 # CSV size-bomb axis: ``_load_vor_names`` and ``_load_gtfs_index``
 # previously fed operator-supplied CSVs into ``csv.DictReader(handle)``
 # directly, letting ``handle.readline()`` buffer GiB-sized single-line
-# payloads. Routes through ``read_capped_text`` -> ``io.StringIO`` to
-# bound the allocation. 50 MiB matches ``MAX_JSON_FILE_BYTES``.
+# payloads. Routes through ``open_capped_csv``, which streams rows under
+# the cap. 50 MiB matches ``MAX_JSON_FILE_BYTES``.
 MAX_ALIAS_CSV_BYTES = 50 * 1024 * 1024
+# Incremental mode: per-station alias results are memoised in a sidecar
+# ``<stations>.aliases.cache.json`` next to the stations file (see
+# :class:`AliasCache`). Same size-bomb cap as the stations file itself.
+MAX_ALIAS_CACHE_BYTES = 50 * 1024 * 1024
+_ALIAS_CACHE_SUFFIX = ".aliases.cache.json"
+_ALIAS_CACHE_VERSION = 2
 
 log = logging.getLogger("enrich_station_aliases")
 
@@ -93,7 +102,7 @@ def _path_fingerprint(path: Path) -> str:
     ).hexdigest()[:12]
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Merge additional aliases from local data sources into stations.json",
     )
@@ -135,8 +144,23 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print the planned changes without writing stations.json",
     )
+    parser.add_argument(
+        "--incremental",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            "Only recompute stations whose alias inputs or source records changed "
+            "since the last run (default: enabled); --no-incremental recomputes all"
+        ),
+    )
+    parser.add_argument(
+        "--alias-cache",
+        type=Path,
+        default=None,
+        help=f"Incremental-mode cache file (default: <stations>{_ALIAS_CACHE_SUFFIX})",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def configure_logging(verbose: bool) -> None:
@@ -192,6 +216,11 @@ def _strip_accents(value: str) -> str:
     return "".join(ch for ch in unicodedata.normalize("NFKD", value) if not unicodedata.combining(ch))
 
 
+# Memoised: ``_alias_candidates`` normalises every candidate several
+# times per station (textual-alias test, GTFS keys, pendler keys, the
+# collision filter) and the same names recur across stations. Pure
+# ``str -> str``, so the cache cannot change a result.
+@lru_cache(maxsize=65536)
 def _normalize_key(text: str) -> str:
     cleaned = _strip_accents(text)
     cleaned = cleaned.replace("ß", "ss")
@@ -300,20 +329,26 @@ _SHORTEN_PAIRS = [
 ]
 
 
-def _replace_variants(alias: str, pairs: list[tuple[str, str]]) -> set[str]:
+# Compiled once at import: ``re.sub`` with a pattern string pays a
+# regex-cache lookup per call, ~30 per alias.
+_ABBREV_RULES = [(re.compile(pattern, re.IGNORECASE), repl) for pattern, repl in _ABBREV_PAIRS]
+_SHORTEN_RULES = [(re.compile(pattern, re.IGNORECASE), repl) for pattern, repl in _SHORTEN_PAIRS]
+
+
+def _replace_variants(alias: str, rules: Sequence[tuple[re.Pattern[str], str]]) -> set[str]:
     variants = set()
-    for pattern, replacement in pairs:
-        # Use simple regex substitution
-        try:
-            new_val = re.sub(pattern, replacement, alias, flags=re.IGNORECASE)
-            if new_val != alias:
-                variants.add(_normalize_spaces(new_val))
-        except re.error:
-            continue
+    for pattern, replacement in rules:
+        new_val = pattern.sub(replacement, alias)
+        if new_val != alias:
+            variants.add(_normalize_spaces(new_val))
     return variants
 
 
-def _textual_variants(alias: str) -> set[str]:
+# Memoised like ``_normalize_key``: the variant expansion runs ~30
+# regex substitutions per alias and is the dominant cost of a run.
+# Returns a ``frozenset`` so a cached result cannot be mutated by a caller.
+@lru_cache(maxsize=65536)
+def _textual_variants(alias: str) -> frozenset[str]:
     alias = _normalize_spaces(alias)
     variants: set[str] = set()
 
@@ -325,8 +360,8 @@ def _textual_variants(alias: str) -> set[str]:
     variants.update(_bahnhof_variants(alias))
 
     # New abbreviation variants
-    variants.update(_replace_variants(alias, _ABBREV_PAIRS))
-    variants.update(_replace_variants(alias, _SHORTEN_PAIRS))
+    variants.update(_replace_variants(alias, _ABBREV_RULES))
+    variants.update(_replace_variants(alias, _SHORTEN_RULES))
 
     lowered = alias.casefold()
     for prefix in ("wien ", "vienna "):
@@ -336,7 +371,7 @@ def _textual_variants(alias: str) -> set[str]:
                 variants.add(without_city)
             break
 
-    return {variant for variant in variants if variant}
+    return frozenset(variant for variant in variants if variant)
 
 
 def _load_vor_names(path: Path) -> dict[str, str]:
@@ -347,34 +382,31 @@ def _load_vor_names(path: Path) -> dict[str, str]:
         )
         return {}
     # Security: see ``MAX_ALIAS_CSV_BYTES`` for the canonical CSV
-    # size-bomb defence shape (``read_capped_text`` -> ``io.StringIO``
-    # -> ``csv.DictReader``). Pre-fix a planted unbounded VOR CSV would
-    # propagate ``MemoryError`` past the caller and crash the cron
-    # pipeline.
-    import io
+    # size-bomb defence shape (``open_capped_csv``). Pre-fix a planted
+    # unbounded VOR CSV would propagate ``MemoryError`` past the caller
+    # and crash the cron pipeline.
+    #
     # ``utf-8-sig`` strips a UTF-8 BOM if upstream emits one. The VOR
     # CSV's first column is ``StopPointId`` — a BOM-prefixed file would
-    # make ``row.get("StopPointId")`` return ``None`` for the first
-    # row only (because the header reads as ``"﻿StopPointId"``),
-    # silently dropping that stop's name. Sibling ``scripts/gtfs.py``
-    # already uses ``utf-8-sig`` per the GTFS spec, which explicitly
-    # permits a BOM.
-    content = read_capped_text(
-        path, MAX_ALIAS_CSV_BYTES,
-        encoding="utf-8-sig", label="VOR stops", logger=log,
-    )
-    if content is None:
-        return {}
+    # make ``row.field("StopPointId")`` return ``None`` for every row
+    # (because the header reads as ``"\ufeffStopPointId"``), silently
+    # dropping the stop names. Sibling ``scripts/gtfs.py`` already uses
+    # ``utf-8-sig`` per the GTFS spec, which explicitly permits a BOM.
     names: dict[str, str] = {}
-    reader = csv.DictReader(io.StringIO(content), delimiter=";")
     try:
-        for row in reader:
-            vor_id = (row.get("StopPointId") or "").strip()
-            name = (row.get("StopPointName") or "").strip()
-            if vor_id and name:
-                names[vor_id] = name
+        with open_capped_csv(
+            path, MAX_ALIAS_CSV_BYTES,
+            encoding="utf-8-sig", delimiter=";", label="VOR stops", logger=log,
+        ) as reader:
+            if reader is None:
+                return {}
+            for row in reader:
+                vor_id = (row.field("StopPointId") or "").strip()
+                name = (row.field("StopPointName") or "").strip()
+                if vor_id and name:
+                    names[vor_id] = name
     except csv.Error:
-        # read_capped_text enforces only the byte cap, not CSV well-formedness.
+        # open_capped_csv enforces only the byte cap, not CSV well-formedness.
         # A single field larger than csv.field_size_limit (default 131072) —
         # still well under MAX_ALIAS_CSV_BYTES — raises csv.Error (NOT an
         # OSError) during iteration. Degrade gracefully (skip enrichment)
@@ -455,23 +487,21 @@ def _load_gtfs_index(path: Path) -> dict[str, set[str]]:
         return {}
     # Security: see ``_load_vor_names`` / ``MAX_ALIAS_CSV_BYTES`` for
     # the canonical CSV size-bomb defence shape.
-    import io
-    content = read_capped_text(
-        path, MAX_ALIAS_CSV_BYTES,
-        encoding="utf-8-sig", label="GTFS stops", logger=log,
-    )
-    if content is None:
-        return {}
     index: dict[str, set[str]] = defaultdict(set)
-    reader = csv.DictReader(io.StringIO(content))
     try:
-        for row in reader:
-            name = (row.get("stop_name") or "").strip()
-            if not name:
-                continue
-            key = _normalize_key(name)
-            if key:
-                index[key].add(name)
+        with open_capped_csv(
+            path, MAX_ALIAS_CSV_BYTES,
+            encoding="utf-8-sig", delimiter=",", label="GTFS stops", logger=log,
+        ) as reader:
+            if reader is None:
+                return {}
+            for row in reader:
+                name = (row.field("stop_name") or "").strip()
+                if not name:
+                    continue
+                key = _normalize_key(name)
+                if key:
+                    index[key].add(name)
     except csv.Error:
         # See _load_vor_names: a field larger than csv.field_size_limit
         # (default 131072, well under MAX_ALIAS_CSV_BYTES) raises csv.Error
@@ -551,7 +581,7 @@ def _alias_candidates(
     vor_names: Mapping[str, str],
     vor_mapping: Mapping[int, str],
     gtfs_index: Mapping[str, set[str]],
-    other_canonical_keys: frozenset[str] = frozenset(),
+    other_canonical_keys: Container[str] = frozenset(),
     pendler_alt_names: Mapping[str, list[str]] | None = None,
 ) -> list[str]:
     aliases: set[str] = set()
@@ -872,6 +902,341 @@ def _order_aliases(station: Mapping[str, object], aliases: Iterable[str]) -> lis
     return ordered
 
 
+@dataclass(frozen=True)
+class AliasSources:
+    """Alias inputs loaded from the local VOR / GTFS / pendler datasets."""
+
+    vor_names: dict[str, str]
+    vor_mapping: dict[int, str]
+    gtfs_index: dict[str, set[str]]
+    pendler_alt_names: dict[str, list[str]]
+
+
+def load_alias_sources(args: argparse.Namespace) -> AliasSources:
+    return AliasSources(
+        vor_names=_load_vor_names(args.vor_stops),
+        vor_mapping=_load_vor_mapping(args.vor_mapping),
+        gtfs_index=_load_gtfs_index(args.gtfs_stops),
+        pendler_alt_names=_load_pendler_alternative_names(args.pendler_candidates),
+    )
+
+
+def _alias_cache_path(stations_path: Path) -> Path:
+    """Return the incremental-mode sidecar for *stations_path*.
+
+    Convention mirrors the WL OGD ``<csv>.cache.json`` sidecars: the
+    cache sits next to the file it describes, so a run against a scratch
+    ``stations.json`` never reuses (or clobbers) the production memo.
+    """
+    return stations_path.with_name(stations_path.name + _ALIAS_CACHE_SUFFIX)
+
+
+@lru_cache(maxsize=1)
+def _alias_code_digest() -> str:
+    """Digest of this script, stored with the cache.
+
+    Any edit to the alias rules (``missing_map``, the variant tables,
+    the filters) changes the digest and discards every memoised result,
+    so a cache hit always equals what the current code would compute.
+    Empty when the script cannot be read, which disables reuse.
+    """
+    source = read_capped_bytes(Path(__file__), MAX_ALIAS_CACHE_BYTES, label="Alias rules", logger=log)
+    return "" if source is None else hashlib.sha256(source).hexdigest()
+
+
+def _station_fingerprint(station: Mapping[str, object]) -> str:
+    """Digest of the station's identity fields ``_alias_candidates`` / ``_order_aliases`` read.
+
+    ``aliases`` is left out on purpose: it is the field enrichment
+    rewrites, so including it would move every enriched station to a new
+    key on the following run. :class:`AliasCache` guards the alias input
+    separately (see :func:`_aliases_digest`).
+    """
+    payload = [station.get(key) for key in ("name", "vor_id", "bst_code", "bst_id")]
+    encoded = json.dumps(payload, sort_keys=True, default=str, allow_nan=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _aliases_digest(aliases: object) -> str:
+    """Digest of a station's ``aliases`` value as enrichment reads it."""
+    encoded = json.dumps(aliases, sort_keys=True, default=str, allow_nan=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+# Dependency key of an iteration over a whole alias source. A tuple (a
+# list once stored) can never be a real lookup key of the sources.
+_WHOLE_SOURCE = ("*",)
+
+
+def _plain(value: object) -> object:
+    return sorted(value) if isinstance(value, set | frozenset) else value
+
+
+class _RecordingLookup(Mapping[Any, Any]):
+    """Read-only view of one alias source that records every lookup.
+
+    ``_alias_candidates`` reads its sources by key (``get`` / ``in`` /
+    truthiness), so the recorded ``(label, key)`` pairs are the complete
+    set of source records a station's result depends on. ``key=None``
+    stands for the truthiness check of the whole source and
+    :data:`_WHOLE_SOURCE` for an iteration over it, which makes the
+    result depend on every record.
+    """
+
+    def __init__(self, label: str, source: Any, deps: dict[tuple[str, Any], None]) -> None:
+        self._label = label
+        self._source = source
+        self._deps = deps
+
+    def __getitem__(self, key: Any) -> Any:
+        self._deps[(self._label, key)] = None
+        return self._source[key]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._deps[(self._label, key)] = None
+        return self._source.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        self._deps[(self._label, key)] = None
+        return key in self._source
+
+    def __len__(self) -> int:
+        self._deps[(self._label, None)] = None
+        return len(self._source)
+
+    def __iter__(self) -> Iterator[Any]:
+        self._deps[(self._label, _WHOLE_SOURCE)] = None
+        return iter(self._source)
+
+
+def _recorded_aliases(station: Mapping[str, object], recorded: Mapping[str, Any]) -> list[str]:
+    aliases = _alias_candidates(
+        station,
+        recorded["vor_names"],
+        recorded["vor_mapping"],
+        recorded["gtfs_index"],
+        other_canonical_keys=recorded["canonical_keys"],
+        pendler_alt_names=recorded["pendler_alt_names"],
+    )
+    return _order_aliases(station, aliases)
+
+
+def _alias_source_views(sources: AliasSources, other_canonical_keys: frozenset[str]) -> dict[str, Any]:
+    return {
+        "vor_names": sources.vor_names,
+        "vor_mapping": sources.vor_mapping,
+        "gtfs_index": sources.gtfs_index,
+        "pendler_alt_names": sources.pendler_alt_names,
+        "canonical_keys": other_canonical_keys,
+    }
+
+
+def _dependency_digest(deps: Iterable[Sequence[Any]], views: Mapping[str, Any]) -> str:
+    """Digest the current value of every recorded ``(label, key)`` lookup."""
+    resolved: list[object] = []
+    for label, key in deps:
+        source = views[label]
+        if key is None:
+            value: object = bool(source)
+        elif isinstance(key, list | tuple):
+            if isinstance(source, Mapping):
+                value = sorted([str(item), _plain(found)] for item, found in source.items())
+            else:
+                value = sorted(str(item) for item in source)
+        elif isinstance(source, Mapping):
+            value = _plain(source.get(key))
+        else:
+            value = key in source
+        resolved.append([label, key, value])
+    encoded = json.dumps(resolved, sort_keys=True, default=str, allow_nan=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class AliasCache:
+    """Per-station memo of alias results for the incremental mode.
+
+    Keyed by :func:`_station_fingerprint`; each record stores the
+    ``(label, key)`` source lookups the computation made (see
+    :class:`_RecordingLookup`), a digest of their values, the resulting
+    alias list and the ``aliases`` inputs it is valid for. A record is
+    reused only when the station fingerprint matches, the station's
+    current ``aliases`` is one of those inputs *and* every recorded
+    lookup still yields the same value — so a hit is exactly the list a
+    full recomputation would produce, and unchanged stations stay
+    byte-identical. Besides the input it was computed from, a record
+    accepts its own result as input when recomputing from it was
+    verified to reproduce it, which is the state ``stations.json`` is in
+    on the next run. Records that were not used in a run are dropped on
+    :meth:`save`.
+    """
+
+    def __init__(self, path: Path, records: Mapping[str, Any] | None = None) -> None:
+        self.path = path
+        self._records = dict(records or {})
+        self._used: dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path) -> AliasCache:
+        """Load *path*, starting empty on a missing, foreign or corrupt cache.
+
+        Security: the sidecar lives in the same directory as
+        ``stations.json`` and is read through ``read_capped_json`` (byte
+        cap + depth-bomb catch). A planted record can at worst replay an
+        alias list, which still flows through the Trojan-Source scrub of
+        :func:`_write_stations_payload` and the downstream validator —
+        the same trust level as the ``aliases`` already in
+        ``stations.json``. Records whose shape is off are ignored.
+        """
+        if not path.exists():
+            return cls(path)
+        payload = read_capped_json(path, MAX_ALIAS_CACHE_BYTES, label="Alias cache", logger=log)
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != _ALIAS_CACHE_VERSION
+            or not _alias_code_digest()
+            or payload.get("code_sha256") != _alias_code_digest()
+            or not isinstance(payload.get("stations"), dict)
+        ):
+            log.info(
+                "Alias cache [path-sha256=%s] is stale or unreadable; recomputing all stations",
+                _path_fingerprint(path),
+            )
+            return cls(path)
+        return cls(path, payload["stations"])
+
+    def lookup(self, fingerprint: str, current: object, views: Mapping[str, Any]) -> list[str] | None:
+        """Return the memoised list for a station whose ``aliases`` is *current*."""
+        record = self._records.get(fingerprint)
+        aliases = record.get("aliases") if isinstance(record, dict) else None
+        inputs = record.get("inputs") if isinstance(record, dict) else None
+        deps = record.get("deps") if isinstance(record, dict) else None
+        if (
+            not isinstance(record, dict)
+            or not isinstance(aliases, list)
+            or not all(isinstance(alias, str) for alias in aliases)
+            or not isinstance(inputs, list)
+            or _aliases_digest(current) not in inputs
+            or not isinstance(deps, list)
+            or not all(
+                isinstance(dep, list) and len(dep) == 2 and dep[0] in views for dep in deps
+            )
+            or record.get("deps_sha256") != _dependency_digest(deps, views)
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used[fingerprint] = record
+        return list(aliases)
+
+    def store(
+        self,
+        fingerprint: str,
+        deps: Iterable[tuple[str, Any]],
+        views: Mapping[str, Any],
+        aliases: Sequence[str],
+        *,
+        inputs: Iterable[object],
+    ) -> None:
+        dep_list = [[label, key] for label, key in deps]
+        self._used[fingerprint] = {
+            "deps": dep_list,
+            "deps_sha256": _dependency_digest(dep_list, views),
+            "inputs": sorted({_aliases_digest(value) for value in inputs}),
+            "aliases": list(aliases),
+        }
+
+    def save(self) -> None:
+        """Atomically persist the records used in this run (best-effort)."""
+        payload = {
+            "version": _ALIAS_CACHE_VERSION,
+            "code_sha256": _alias_code_digest(),
+            "stations": self._used,
+        }
+        try:
+            with atomic_write(self.path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+                # ASCII-escaped on purpose: the sidecar is machine-read
+                # only, so ``\uXXXX`` escapes keep Trojan-Source
+                # primitives from alias values inert without a scrub that
+                # would alter the memoised aliases.
+                json.dump(payload, handle, sort_keys=True, allow_nan=False)
+                handle.write("\n")
+        except (OSError, TypeError, ValueError) as exc:
+            log.warning(
+                "Failed to write alias cache [path-sha256=%s] (%s)",
+                _path_fingerprint(self.path),
+                exc,
+            )
+
+
+def open_alias_cache(args: argparse.Namespace) -> AliasCache | None:
+    """Return the incremental-mode cache for *args*, or ``None`` for a full run."""
+    if not args.incremental:
+        return None
+    return AliasCache.load(args.alias_cache or _alias_cache_path(args.stations))
+
+
+def enrich_aliases(
+    stations: Iterable[object],
+    sources: AliasSources,
+    cache: AliasCache | None = None,
+) -> int:
+    """Rewrite the ``aliases`` of every station dict in place.
+
+    Returns the number of stations whose alias list changed. Shared by
+    :func:`main` and the in-process stage graph in
+    ``scripts/update_all_stations.py``. With a *cache* (incremental
+    mode) only stations whose fingerprint or recorded source lookups
+    changed are recomputed; the others reuse their memoised list.
+    """
+    entries = [entry for entry in stations if isinstance(entry, dict)]
+    canonical_keys: set[str] = set()
+    for entry in entries:
+        key = _normalize_key(str(entry.get("name") or ""))
+        if key:
+            canonical_keys.add(key)
+    other_canonical_keys = frozenset(canonical_keys)
+    views = _alias_source_views(sources, other_canonical_keys)
+
+    updated = 0
+    for entry in entries:
+        if cache is None:
+            aliases = _alias_candidates(
+                entry,
+                sources.vor_names,
+                sources.vor_mapping,
+                sources.gtfs_index,
+                other_canonical_keys=other_canonical_keys,
+                pendler_alt_names=sources.pendler_alt_names,
+            )
+            ordered = _order_aliases(entry, aliases)
+        else:
+            fingerprint = _station_fingerprint(entry)
+            current = entry.get("aliases")
+            cached = cache.lookup(fingerprint, current, views)
+            if cached is not None:
+                ordered = cached
+            else:
+                deps: dict[tuple[str, Any], None] = {}
+                recorded = {label: _RecordingLookup(label, view, deps) for label, view in views.items()}
+                ordered = _recorded_aliases(entry, recorded)
+                inputs: list[object] = [current]
+                # The next run reads this result back as the station's
+                # alias input. Recompute from it once (recording into the
+                # same dependency set) so the record can cover that input
+                # as well when the result is a fixed point.
+                if _recorded_aliases({**entry, "aliases": ordered}, recorded) == ordered:
+                    inputs.append(ordered)
+                cache.store(fingerprint, deps, views, ordered, inputs=inputs)
+        if ordered != entry.get("aliases"):
+            updated += 1
+            entry["aliases"] = ordered
+    if cache is not None:
+        log.info("Alias cache: %d stations reused, %d recomputed", cache.hits, cache.misses)
+    return updated
+
+
 def main() -> int:
     args = parse_args()
     configure_logging(args.verbose)
@@ -907,35 +1272,10 @@ def main() -> int:
         )
         return 1
 
-    vor_names = _load_vor_names(args.vor_stops)
-    vor_mapping = _load_vor_mapping(args.vor_mapping)
-    gtfs_index = _load_gtfs_index(args.gtfs_stops)
-    pendler_alt_names = _load_pendler_alternative_names(args.pendler_candidates)
-
-    canonical_keys: set[str] = set()
-    for entry in stations:
-        if isinstance(entry, dict):
-            key = _normalize_key(str(entry.get("name") or ""))
-            if key:
-                canonical_keys.add(key)
-    other_canonical_keys = frozenset(canonical_keys)
-
-    updated = 0
-    for entry in stations:
-        if not isinstance(entry, dict):
-            continue
-        aliases = _alias_candidates(
-            entry,
-            vor_names,
-            vor_mapping,
-            gtfs_index,
-            other_canonical_keys=other_canonical_keys,
-            pendler_alt_names=pendler_alt_names,
-        )
-        ordered = _order_aliases(entry, aliases)
-        if ordered != entry.get("aliases"):
-            updated += 1
-            entry["aliases"] = ordered
+    cache = open_alias_cache(args)
+    updated = enrich_aliases(stations, load_alias_sources(args), cache)
+    if cache is not None and not args.dry_run:
+        cache.save()
 
     if not updated:
         log.info("No station aliases changed")
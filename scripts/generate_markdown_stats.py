@@ -1226,7 +1226,9 @@ def write_dashboard(
     dashboard cannot replace the previous one.
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with atomic_write(output_path, mode="w", encoding="utf-8", permissions=0o644) as fh:
+    with atomic_write(
+        output_path, mode="w", encoding="utf-8", permissions=0o644, skip_unchanged=True
+    ) as fh:
         fh.write(markdown)
 
 
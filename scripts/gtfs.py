@@ -1,12 +1,10 @@
 """Utilities for reading GTFS reference data used in tests."""
 from __future__ import annotations
 
-import io
 import logging
 import math
 import sys
 from dataclasses import dataclass
-import csv
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -16,16 +14,15 @@ if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
 try:
-    from src.utils.files import read_capped_text
+    from src.utils.files import open_capped_csv
 except ModuleNotFoundError:  # pragma: no cover - fallback path
-    from utils.files import read_capped_text  # type: ignore[no-redef]
+    from utils.files import open_capped_csv  # type: ignore[no-redef]
 
 # CSV size-bomb axis: ``read_gtfs_stops`` previously fed the operator-
 # supplied ``stops.txt`` into ``csv.DictReader(handle)`` directly,
 # letting ``handle.readline()`` buffer GiB-sized single-line payloads.
-# Routes through ``read_capped_text`` -> ``io.StringIO`` to bound the
-# allocation. 50 MiB matches the canonical ``MAX_*_FILE_BYTES``
-# contract.
+# Routes through ``open_capped_csv`` to stream rows under the cap.
+# 50 MiB matches the canonical ``MAX_*_FILE_BYTES`` contract.
 MAX_GTFS_STOPS_BYTES = 50 * 1024 * 1024
 
 _log = logging.getLogger(__name__)
@@ -107,42 +104,40 @@ def read_gtfs_stops(path: Path | None = None) -> dict[str, GTFSStop]:
     stop_path = Path(path) if path is not None else DEFAULT_GTFS_STOP_PATH
 
     # Security: see ``MAX_GTFS_STOPS_BYTES`` for the canonical CSV
-    # size-bomb defence shape (``read_capped_text`` -> ``io.StringIO``
-    # -> ``csv.DictReader``). Pre-fix a planted unbounded ``stops.txt``
-    # would propagate ``MemoryError`` past ``csv.DictReader.fieldnames``
-    # and crash any caller. ``ValueError`` is raised on oversized /
-    # missing / decode-error so the existing ``with pytest.raises
-    # (ValueError)`` contract from ``test_gtfs_read_stops_requires_
-    # stop_id_column`` extends to size-bomb attacks.
-    content = read_capped_text(
-        stop_path, MAX_GTFS_STOPS_BYTES,
-        encoding="utf-8-sig", label="GTFS stops", logger=_log,
-    )
-    if content is None:
-        raise ValueError(
-            f"GTFS stops.txt file is missing or too large at {stop_path}"
-        )
-
-    reader = csv.DictReader(io.StringIO(content))
-    if reader.fieldnames is None or "stop_id" not in reader.fieldnames:
-        raise ValueError("GTFS stops.txt file is missing the 'stop_id' column")
-
+    # size-bomb defence shape (``open_capped_csv`` streams rows under
+    # the byte cap). Pre-fix a planted unbounded ``stops.txt`` would
+    # propagate ``MemoryError`` past ``csv.DictReader.fieldnames`` and
+    # crash any caller. ``ValueError`` is raised on oversized / missing
+    # / decode-error so the existing ``with pytest.raises(ValueError)``
+    # contract from ``test_gtfs_read_stops_requires_stop_id_column``
+    # extends to size-bomb attacks.
     stops: dict[str, GTFSStop] = {}
-    for row in reader:
-        stop_id = _strip(row.get("stop_id"))
-        if not stop_id:
-            continue
-        stop_name = _strip(row.get("stop_name"))
-        stops[stop_id] = GTFSStop(
-            stop_id=stop_id,
-            stop_name=stop_name,
-            stop_code=_optional(row.get("stop_code")),
-            stop_lat=_coerce_float(row.get("stop_lat")),
-            stop_lon=_coerce_float(row.get("stop_lon")),
-            location_type=_coerce_int(row.get("location_type")),
-            parent_station=_optional(row.get("parent_station")),
-            platform_code=_optional(row.get("platform_code")),
-        )
+    with open_capped_csv(
+        stop_path, MAX_GTFS_STOPS_BYTES,
+        encoding="utf-8-sig", delimiter=",", label="GTFS stops", logger=_log,
+    ) as reader:
+        if reader is None:
+            raise ValueError(
+                f"GTFS stops.txt file is missing or too large at {stop_path}"
+            )
+        if "stop_id" not in reader.header:
+            raise ValueError("GTFS stops.txt file is missing the 'stop_id' column")
+
+        for row in reader:
+            stop_id = _strip(row.field("stop_id"))
+            if not stop_id:
+                continue
+            stop_name = _strip(row.field("stop_name"))
+            stops[stop_id] = GTFSStop(
+                stop_id=stop_id,
+                stop_name=stop_name,
+                stop_code=_optional(row.field("stop_code")),
+                stop_lat=_coerce_float(row.field("stop_lat")),
+                stop_lon=_coerce_float(row.field("stop_lon")),
+                location_type=_coerce_int(row.field("location_type")),
+                parent_station=_optional(row.field("parent_station")),
+                platform_code=_optional(row.field("platform_code")),
+            )
     return stops
 
 
@@ -25,6 +25,14 @@ It runs two complementary kinds of checks:
    The updaters write into the ephemeral runner checkout's ``cache/`` dir;
    nothing is committed (the workflow has ``contents: read``).
 
+   With ``--probe`` the updaters are skipped in favour of one small request
+   per source through ``request_safe``: the WL ``trafficInfoList`` JSON, the
+   first chunk of the ÖBB RSS feed and a ``count=1`` WFS query per
+   Baustellen layer. That checks reachability and payload shape at a
+   fraction of the bandwidth; the full mode stays available for deep checks.
+   Either way the sources are checked concurrently, so the run takes about
+   one timeout instead of their sum.
+
 2. **Aktualität der Outputs (Frische).** Reads the committed artefacts and
    verifies they are still being refreshed. A dead source alone does NOT trip
    the freshness check (the build happily reuses the last cache — exactly why
@@ -46,16 +54,22 @@ two workflows' cadences.
 
 from __future__ import annotations
 
+import argparse
 import os
 import re
 import subprocess  # nosec B404
 import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import requests
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = REPO_ROOT / "src"
 # Resolve the canonical size-/depth-capped file helpers regardless of how the
@@ -97,6 +111,12 @@ STATIONS_MAX_AGE_H = _env_float("HEALTH_STATIONS_MAX_AGE_HOURS", 192.0)
 # hard wall so a hung source cannot stall the whole probe).
 FETCH_TIMEOUT_S = int(_env_float("HEALTH_FETCH_TIMEOUT_SECONDS", 120))
 
+# Per-request ceiling in ``--probe`` mode; a probe is a single small request.
+PROBE_TIMEOUT_S = int(_env_float("HEALTH_PROBE_TIMEOUT_SECONDS", 20))
+# The ÖBB feed is one large RSS document; its head is enough to tell a live
+# feed from an error page, so the probe stops reading after this many bytes.
+PROBE_RSS_BYTES = 64 * 1024
+
 # Live-canary: (display name, updater script). Order = report order.
 UPDATERS: list[tuple[str, str]] = [
     ("Wiener Linien", "update_wl_cache.py"),
@@ -249,6 +269,127 @@ def check_source(name: str, script: str) -> Check:
     )
 
 
+class _ProbeHeadRead(Exception):
+    """Raised from ``on_chunk`` once the probe has seen enough of the body."""
+
+
+def _probe_wl() -> str:
+    from src.providers.wl_fetch import WL_BASE, WL_USER_AGENT
+    from utils.files import loads_finite
+    from utils.http import fetch_content_safe, session_with_retries
+
+    with session_with_retries(WL_USER_AGENT, raise_on_status=False) as session:
+        body = fetch_content_safe(
+            session,
+            f"{WL_BASE}/trafficInfoList",
+            params=[("name", "stoerunglang")],
+            timeout=PROBE_TIMEOUT_S,
+            allowed_content_types=("application/json",),
+        )
+    payload = loads_finite(body)
+    if not isinstance(payload, dict) or not isinstance(payload.get("data"), dict):
+        raise ValueError("Antwort ist kein OGD-Objekt mit 'data'")
+    infos = payload["data"].get("trafficInfos")
+    return f"{len(infos)} Störungsmeldungen" if isinstance(infos, list) else "keine Störungsmeldungen"
+
+
+def _probe_oebb() -> str:
+    from src.providers.oebb import OEBB_URL, USER_AGENT
+    from utils.http import fetch_content_safe, session_with_retries
+
+    head = bytearray()
+
+    def collect(chunk: bytes) -> None:
+        head.extend(chunk)
+        if len(head) >= PROBE_RSS_BYTES:
+            raise _ProbeHeadRead
+
+    with session_with_retries(USER_AGENT) as session:
+        try:
+            fetch_content_safe(
+                session,
+                OEBB_URL,
+                timeout=PROBE_TIMEOUT_S,
+                allowed_content_types=("application/xml", "text/xml", "application/rss+xml"),
+                on_chunk=collect,
+            )
+        except _ProbeHeadRead:
+            pass
+    if b"<rss" not in head or b"<channel" not in head:
+        raise ValueError("Antwort ist kein RSS-Dokument")
+    return f"RSS-Kopf gelesen ({len(head) // 1024} KiB)"
+
+
+def _probe_wfs_layer(session: requests.Session, layer_url: str) -> bool:
+    """``True`` once one GeoJSON token yields a FeatureCollection."""
+    from scripts import update_baustellen_cache as baustellen
+    from utils.files import loads_finite
+    from utils.http import fetch_content_safe
+
+    # Like ``_fetch_layer`` in the updater, a rejected token (error page,
+    # XML exception report) just moves on to the next candidate.
+    for output_format in baustellen.OUTPUT_FORMAT_CANDIDATES:
+        try:
+            body = fetch_content_safe(
+                session,
+                baustellen.with_output_format(layer_url, output_format),
+                # ``count`` (WFS 2.0) and ``maxFeatures`` (1.x) cap the
+                # answer at a single feature.
+                params={"count": "1", "maxFeatures": "1"},
+                timeout=PROBE_TIMEOUT_S,
+                headers={"Accept": "application/json"},
+                allowed_content_types=("application/json", "application/geo+json", "text/json"),
+            )
+            payload = loads_finite(body)
+        except (requests.HTTPError, ValueError):
+            continue
+        if isinstance(payload, dict) and isinstance(payload.get("features"), list):
+            return True
+    return False
+
+
+def _probe_baustellen() -> str:
+    from scripts import update_baustellen_cache as baustellen
+    from utils.http import session_with_retries
+
+    data_url = baustellen.resolve_data_url(os.getenv("BAUSTELLEN_DATA_URL"))
+    with session_with_retries(baustellen.USER_AGENT, raise_on_status=False) as session:
+        for typename in baustellen.BAUSTELLEN_TYPENAMES:
+            if not _probe_wfs_layer(session, baustellen.with_typename(data_url, typename)):
+                raise ValueError(f"Layer {typename} liefert keine FeatureCollection")
+    return f"{len(baustellen.BAUSTELLEN_TYPENAMES)} Layer antworten"
+
+
+# Probe per source, keyed by the ``UPDATERS`` display name.
+PROBES: dict[str, Callable[[], str]] = {
+    "Wiener Linien": _probe_wl,
+    "ÖBB": _probe_oebb,
+    "Baustellen (OGD)": _probe_baustellen,
+}
+
+
+def probe_source(name: str) -> Check:
+    """Run the lightweight reachability + schema probe for one source."""
+    started = time.monotonic()
+    try:
+        detail = PROBES[name]()
+    except Exception as exc:
+        # Any failure — network, TLS, content type, shape — is a red check;
+        # the probe must never take the whole report down with it.
+        reason = _clean_line(f"{type(exc).__name__}: {exc}")
+        return Check(name, ok=False, summary="FEHLER — Probe fehlgeschlagen", detail=reason)
+    elapsed = time.monotonic() - started
+    return Check(name, ok=True, summary=f"OK — erreichbar in {elapsed:.1f}s, {detail}")
+
+
+def check_sources(*, probe: bool) -> list[Check]:
+    """Check every source concurrently, in ``UPDATERS`` report order."""
+    with ThreadPoolExecutor(max_workers=len(UPDATERS)) as executor:
+        if probe:
+            return list(executor.map(probe_source, [name for name, _script in UPDATERS]))
+        return list(executor.map(lambda entry: check_source(*entry), UPDATERS))
+
+
 def _fmt_age(seconds: float) -> str:
     s = max(0, int(seconds))
     days, rem = divmod(s, 86400)
@@ -340,7 +481,12 @@ def check_stations(now: datetime) -> Check:
                  summary=f"OK — {age_txt}aktualisiert, alle Teilschritte sauber")
 
 
-def _render_plain(now: datetime, sources: list[Check], outputs: list[Check]) -> str:
+def _render_plain(
+    now: datetime,
+    sources: list[Check],
+    outputs: list[Check],
+    sources_title: str = "QUELLEN (Live-Abruf)",
+) -> str:
     line = "=" * 64
     when = now.strftime("%Y-%m-%d %H:%M UTC")
     if _VIENNA is not None:
@@ -357,7 +503,7 @@ def _render_plain(now: datetime, sources: list[Check], outputs: list[Check]) ->
                 rows.append(f"      └─ {c.detail}")
         rows.append("")
 
-    block("QUELLEN (Live-Abruf)", sources)
+    block(sources_title, sources)
     block("AKTUALITÄT (committete Outputs)", outputs)
 
     failed = [c for c in sources + outputs if not c.ok]
@@ -388,15 +534,23 @@ def _render_markdown(now: datetime, sources: list[Check], outputs: list[Check])
     return "\n".join(lines) + "\n"
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Wien-ÖPNV Health-Check")
+    parser.add_argument(
+        "--probe",
+        action="store_true",
+        help="nur Erreichbarkeit und Schema je Quelle prüfen statt voller Updater-Läufe",
+    )
+    args = parser.parse_args(argv)
     now = datetime.now(UTC)
 
-    sources = [check_source(name, script) for name, script in UPDATERS]
+    sources = check_sources(probe=args.probe)
     outputs = [check_feed_freshness(now), check_stations(now)]
     all_checks = sources + outputs
     failed = [c for c in all_checks if not c.ok]
 
-    print(_render_plain(now, sources, outputs))
+    title = "QUELLEN (Probe)" if args.probe else "QUELLEN (Live-Abruf)"
+    print(_render_plain(now, sources, outputs, title))
 
     # GitHub Actions annotations — make each failure jump out in the run UI
     # (and the failure e-mail's linked summary).
@@ -2,9 +2,15 @@
 """Convenience wrapper to refresh all station datasets.
 
 Pipeline:
-  1. Copy the live ``data/stations.json`` into a temp directory so each
-     sub-script merges into the previous result without touching the repo.
-  2. Run every script in :data:`_SCRIPT_ORDER` against the temp file.
+  1. Load the live ``data/stations.json`` once; nothing under ``data/``
+     is touched until the final write in step 5.
+  2. Run every stage in :data:`_SCRIPT_ORDER` on the in-memory station
+     list (``--stage-mode in-process``, the default). The independent
+     upstream inputs — ÖBB workbook, WL CSVs, VOR CSV, GTFS stops,
+     GeoNetz stops, overrides — are loaded concurrently up front, then
+     the stages transform the list in order. ``--stage-mode subprocess``
+     keeps the historical behaviour of running each script against a
+     temp copy of the file.
   3. Validate the merged result. ``provider_issues``,
      ``cross_station_id_issues``, ``naming_issues`` and ``security_issues``
      trigger the *auto-quarantine* path: instead of aborting the run, the
@@ -15,7 +21,7 @@ Pipeline:
   4. Compute the before/after diff (added/removed/renamed/coord-shifted)
      and write ``data/stations_last_run.json`` (heartbeat) plus
      ``docs/stations_diff.md`` (human-readable diff report).
-  5. Atomically copy the merged file back into ``data/stations.json``.
+  5. Atomically write the merged list to ``data/stations.json``.
 """
 from __future__ import annotations
 
@@ -30,23 +36,27 @@ import subprocess  # nosec B404
 import sys
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, UTC
+from importlib import import_module
 from pathlib import Path
+from types import ModuleType
 from typing import Any, TypedDict
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from src.feed.logging_safe import setup_script_logging  # noqa: E402
-from src.utils.files import atomic_write, read_capped_json  # noqa: E402  (import after path setup)
+from src.utils.files import atomic_write, loads_finite, read_capped_json  # noqa: E402  (import after path setup)
 from src.utils.serialize import scrub_trojan_source_primitives  # noqa: E402
 from src.utils.stations_validation import (  # noqa: E402
     StationValidationError,
     ValidationReport,
     _format_identifier,
-    validate_stations,
+    validate_station_entries,
 )
 from src.utils.text import (  # noqa: E402
     escape_markdown,
@@ -86,6 +96,13 @@ _SCRIPT_OUTPUT_FLAG = {
     "apply_station_overrides.py": "--stations",
 }
 
+_STAGE_MODES = ("in-process", "subprocess")
+
+# Threads for the concurrent source loads of the in-process stage graph:
+# the directory loads of ``load_directory_sources`` plus the WL, alias,
+# override and provider-cache tasks submitted next to them.
+_SOURCE_LOAD_WORKERS = 12
+
 _DEFAULT_HEARTBEAT_PATH = REPO_ROOT / "data" / "stations_last_run.json"
 _DEFAULT_DIFF_REPORT_PATH = REPO_ROOT / "docs" / "stations_diff.md"
 _DEFAULT_POLYGON_PATH = REPO_ROOT / "data" / "LANDESGRENZEOGD.json"
@@ -107,7 +124,10 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--python",
         default=sys.executable,
-        help="Python interpreter used to invoke the update scripts (default: current interpreter).",
+        help=(
+            "Python interpreter used to invoke the update scripts in "
+            "--stage-mode subprocess (default: current interpreter)."
+        ),
     )
     parser.add_argument(
         "-v",
@@ -115,6 +135,17 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Enable verbose logging output for the wrapper and update scripts.",
     )
+    parser.add_argument(
+        "--stage-mode",
+        choices=_STAGE_MODES,
+        default="in-process",
+        help=(
+            "How to run the update stages: 'in-process' (default) loads the "
+            "upstream sources concurrently and passes the station list between "
+            "stages in memory; 'subprocess' runs each script against a temp "
+            "copy of stations.json as before."
+        ),
+    )
     # The three output paths used to be hardcoded module-level
     # constants. Exposing them as CLI args lets the regression test
     # suite point the wrapper at a ``tmp_path`` so an end-to-end run
@@ -189,6 +220,241 @@ def run_script(python: str, script_path: Path, verbose: bool, output_flag: str,
     subprocess.run(cmd, check=True, shell=False, timeout=600)  # nosec B603
 
 
+class StageFailed(RuntimeError):
+    """Raised when an update stage fails; carries the run's exit code."""
+
+    def __init__(self, name: str, exit_code: int) -> None:
+        super().__init__(f"Stage {name} failed with exit code {exit_code}")
+        self.name = name
+        self.exit_code = exit_code
+
+
+def _record_stage(results: list[dict[str, Any]], name: str, exit_code: int, start: float) -> None:
+    results.append({
+        "name": name,
+        "exit_code": exit_code,
+        "duration_s": round(time.monotonic() - start, 2),
+    })
+
+
+def _run_subprocess_stages(
+    args: argparse.Namespace,
+    target: Path,
+    results: list[dict[str, Any]],
+) -> list[Mapping[str, Any]]:
+    """Run every script in :data:`_SCRIPT_ORDER` against a temp copy of *target*."""
+    script_dir = Path(__file__).resolve().parent
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_stations_path = Path(tmp_dir) / "stations.json"
+        if target.exists():
+            shutil.copy2(target, tmp_stations_path)
+
+        for script_name in _SCRIPT_ORDER:
+            script_path = script_dir / script_name
+            if not script_path.exists():
+                logging.error("Script not found: %s", script_path)
+                raise StageFailed(script_name, 1)
+
+            output_flag = _SCRIPT_OUTPUT_FLAG.get(script_name)
+            if not output_flag:
+                logging.error("No output flag mapping found for %s", script_name)
+                raise StageFailed(script_name, 1)
+
+            start = time.monotonic()
+            try:
+                run_script(args.python, script_path, args.verbose, output_flag, tmp_stations_path)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:  # pragma: no cover - thin wrapper
+                # TimeoutExpired is a sibling of CalledProcessError (NOT a
+                # subclass) and carries no ``returncode``: a sub-script that
+                # actually exceeds the 600 s budget — the exact hang the
+                # timeout guards — would otherwise escape this handler and
+                # crash the orchestrator with a traceback, bypassing the
+                # structured failure record. Record it like any other failure.
+                exit_code = getattr(exc, "returncode", None) or 1
+                _record_stage(results, script_name, exit_code, start)
+                raise StageFailed(script_name, exit_code) from exc
+            _record_stage(results, script_name, 0, start)
+
+        return _load_stations(tmp_stations_path)
+
+
+def _stage_boundary(stations: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Hand *stations* to the next stage exactly as the file chain would have.
+
+    Each script used to write ``stations.json`` (Trojan-Source scrub,
+    ``allow_nan=False``) and the next one re-read it (``loads_finite``).
+    Round-tripping through the same codec in memory keeps those defences
+    at every stage boundary — a non-finite coordinate still fails the
+    stage that produced it — and gives the next stage private copies,
+    just without the disk write.
+    """
+    scrubbed = scrub_trojan_source_primitives([dict(entry) for entry in stations])
+    decoded = loads_finite(json.dumps(scrubbed, ensure_ascii=False, allow_nan=False))
+    if not isinstance(decoded, list):  # pragma: no cover - defensive
+        return []
+    return [entry for entry in decoded if isinstance(entry, dict)]
+
+
+@dataclass
+class _StageInputs:
+    """Upstream inputs of the in-process stages, loaded before the first stage runs."""
+
+    directory: Any
+    wl: Any
+    aliases: Any
+    overrides: list[Any]
+
+
+def _import_stage_module(script_name: str) -> ModuleType:
+    return import_module(f"scripts.{script_name.removesuffix('.py')}")
+
+
+def _stage_args(module: ModuleType, script_name: str, args: argparse.Namespace, target: Path) -> argparse.Namespace:
+    """Parse the script's own CLI defaults, exactly as the subprocess run would."""
+    argv = [_SCRIPT_OUTPUT_FLAG[script_name], str(target)]
+    if args.verbose:
+        argv.append("--verbose")
+    parsed: argparse.Namespace = module.parse_args(argv)
+    return parsed
+
+
+def _load_stage_inputs(
+    modules: Mapping[str, ModuleType],
+    stage_args: Mapping[str, argparse.Namespace],
+) -> _StageInputs:
+    """Load the upstream inputs, running the independent ones concurrently.
+
+    ``prepare_wl_entries`` may download the WL haltepunkte CSV that the
+    directory's coordinate lookup reads, so the directory load only
+    starts once the WL layer is in place: every run sees the fresh
+    snapshot. The provider caches, alias sources and overrides share no
+    files with either and load alongside.
+    """
+    usd = modules["update_station_directory.py"]
+    uws = modules["update_wl_stations.py"]
+    esa = modules["enrich_station_aliases.py"]
+    aso = modules["apply_station_overrides.py"]
+    with ThreadPoolExecutor(max_workers=_SOURCE_LOAD_WORKERS) as executor:
+        caches = executor.submit(usd._refresh_provider_caches)
+        aliases = executor.submit(esa.load_alias_sources, stage_args["enrich_station_aliases.py"])
+        overrides = executor.submit(aso.load_override_list, stage_args["apply_station_overrides.py"].overrides)
+        wl = uws.prepare_wl_entries(stage_args["update_wl_stations.py"])
+        directory = usd.load_directory_sources(stage_args["update_station_directory.py"], executor)
+        caches.result()
+        return _StageInputs(
+            directory=directory,
+            wl=wl,
+            aliases=aliases.result(),
+            overrides=overrides.result(),
+        )
+
+
+def _stage_transforms(
+    modules: Mapping[str, ModuleType],
+    stage_args: Mapping[str, argparse.Namespace],
+    inputs: _StageInputs,
+) -> dict[str, Callable[[list[dict[str, Any]]], list[dict[str, Any]]]]:
+    """Return the in-memory transform of every script in :data:`_SCRIPT_ORDER`."""
+    usd = modules["update_station_directory.py"]
+    uws = modules["update_wl_stations.py"]
+    esa = modules["enrich_station_aliases.py"]
+    aso = modules["apply_station_overrides.py"]
+
+    def directory(stations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        built: list[dict[str, Any]] = usd.build_station_directory(
+            stage_args["update_station_directory.py"], stations, inputs.directory
+        )
+        return built
+
+    def wl(stations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if inputs.wl is None:
+            raise StageFailed("update_wl_stations.py", 1)
+        merged: list[dict[str, Any]] | None = uws.merge_wl_entries(
+            stations, inputs.wl.entries, reconcile=inputs.wl.reconcile
+        )
+        # ``None`` is the WL data-loss floor: the script leaves the file
+        # untouched and exits 0, so keep the previous list as-is.
+        return stations if merged is None else merged
+
+    def aliases(stations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # Incremental mode (the script's default): the alias cache sits
+        # next to the target, so only stations whose alias inputs changed
+        # since the previous refresh are recomputed.
+        cache = esa.open_alias_cache(stage_args["enrich_station_aliases.py"])
+        updated = esa.enrich_aliases(stations, inputs.aliases, cache)
+        if cache is not None:
+            cache.save()
+        logging.info("Updated aliases for %d stations", updated)
+        return stations
+
+    def overrides(stations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        applied = aso.apply_override_list(stations, inputs.overrides)
+        logging.info("Applied %d/%d overrides", applied, len(inputs.overrides))
+        return stations
+
+    return {
+        "update_station_directory.py": directory,
+        "update_wl_stations.py": wl,
+        "enrich_station_aliases.py": aliases,
+        "apply_station_overrides.py": overrides,
+    }
+
+
+def _stage_exit_code(exc: BaseException) -> int:
+    if isinstance(exc, StageFailed):
+        return exc.exit_code
+    if isinstance(exc, SystemExit) and isinstance(exc.code, int):
+        return exc.code or 1
+    return 1
+
+
+def run_stage_graph(
+    args: argparse.Namespace,
+    stations: Sequence[Mapping[str, Any]],
+    results: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Run the update stages in-process on *stations* and return the merged list.
+
+    Loads the upstream inputs of all stages concurrently (recorded as the
+    ``load_sources`` step), then applies the stages of
+    :data:`_SCRIPT_ORDER` in order. Each stage is timed into *results*
+    under its script name, like the subprocess runner. Any failure —
+    including a ``SystemExit`` from a stage's data-loss floor — is
+    recorded and re-raised as :class:`StageFailed`.
+    """
+    target: Path = args.target
+    modules = {name: _import_stage_module(name) for name in _SCRIPT_ORDER}
+    stage_args = {
+        name: _stage_args(module, name, args, target) for name, module in modules.items()
+    }
+
+    start = time.monotonic()
+    try:
+        inputs = _load_stage_inputs(modules, stage_args)
+    except (Exception, SystemExit) as exc:
+        logging.error("Loading the stage inputs failed: %s", exc)
+        exit_code = _stage_exit_code(exc)
+        _record_stage(results, "load_sources", exit_code, start)
+        raise StageFailed("load_sources", exit_code) from exc
+    _record_stage(results, "load_sources", 0, start)
+
+    transforms = _stage_transforms(modules, stage_args, inputs)
+    current = _stage_boundary(stations)
+    for script_name in _SCRIPT_ORDER:
+        transform = transforms[script_name]
+        logging.info("Running stage %s", script_name)
+        start = time.monotonic()
+        try:
+            current = _stage_boundary(transform(current))
+        except (Exception, SystemExit) as exc:
+            logging.error("Stage %s failed: %s", script_name, exc)
+            exit_code = _stage_exit_code(exc)
+            _record_stage(results, script_name, exit_code, start)
+            raise StageFailed(script_name, exit_code) from exc
+        _record_stage(results, script_name, 0, start)
+    return current
+
+
 def _load_stations(path: Path) -> list[Mapping[str, Any]]:
     # Security: ``read_capped_json`` enforces both the depth-bomb catch
     # tuple and the byte-size cap (see MAX_JSON_FILE_BYTES). The
@@ -746,7 +1012,6 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
     configure_logging(args.verbose)
 
-    script_dir = Path(__file__).resolve().parent
     target_stations_json: Path = args.target.resolve()
     heartbeat_path: Path = args.heartbeat
     diff_report_path: Path = args.diff_report
@@ -755,175 +1020,143 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     sub_script_results: list[dict[str, Any]] = []
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_stations_path = Path(tmp_dir) / "stations.json"
-        before_snapshot: list[Mapping[str, Any]] = []
-
-        if target_stations_json.exists():
-            shutil.copy2(target_stations_json, tmp_stations_path)
-            before_snapshot = _load_stations(tmp_stations_path)
+    before_snapshot: list[Mapping[str, Any]] = []
+    if target_stations_json.exists():
+        before_snapshot = _load_stations(target_stations_json)
 
-        for script_name in _SCRIPT_ORDER:
-            script_path = script_dir / script_name
-            if not script_path.exists():
-                logging.error("Script not found: %s", script_path)
-                return 1
+    merged_before_validation: Sequence[Mapping[str, Any]]
+    try:
+        if args.stage_mode == "subprocess":
+            merged_before_validation = _run_subprocess_stages(
+                args, target_stations_json, sub_script_results
+            )
+        else:
+            merged_before_validation = run_stage_graph(
+                args, before_snapshot, sub_script_results
+            )
+    except StageFailed as exc:
+        logging.error("%s", exc)
+        return exc.exit_code
+
+    # Collapse byte-identical duplicate entries before validation.
+    # ``update_station_directory.py`` assembles its output as
+    # ``fresh + manual_stations`` with no dedup pass, so a station
+    # preserved through the existing-file → manual round-trip can be
+    # written twice. A duplicated record self-collides on its own
+    # ``bst_code``-as-alias and would otherwise auto-quarantine the
+    # whole station every run (see ``_dedupe_exact_duplicates``).
+    merged_stations, removed_duplicates = _dedupe_exact_duplicates(
+        merged_before_validation
+    )
+    if removed_duplicates:
+        logging.warning(
+            "Removed %d byte-identical duplicate station entr%s before validation",
+            removed_duplicates,
+            "y" if removed_duplicates == 1 else "ies",
+        )
 
-            output_flag = _SCRIPT_OUTPUT_FLAG.get(script_name)
-            if not output_flag:
-                logging.error("No output flag mapping found for %s", script_name)
-                return 1
+    # Run validation on the in-memory merge result; stations.json is
+    # written once, after validation and auto-quarantine.
+    logging.info("Validating %d merged stations", len(merged_stations))
+    try:
+        report = validate_station_entries(merged_stations)
+    except StationValidationError as exc:
+        logging.error("Validation could not be completed: %s", exc)
+        logging.error(
+            "Validation failed on the new stations data. Working tree left unmodified."
+        )
+        return 1
+    logging.info(
+        "Validation rule timings: %s",
+        ", ".join(f"{timing.rule}={timing.seconds * 1000:.1f}ms" for timing in report.rule_timings),
+    )
 
-            start = time.monotonic()
-            try:
-                run_script(args.python, script_path, args.verbose, output_flag, tmp_stations_path)
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:  # pragma: no cover - thin wrapper
-                duration = time.monotonic() - start
-                # TimeoutExpired is a sibling of CalledProcessError (NOT a
-                # subclass) and carries no ``returncode``: a sub-script that
-                # actually exceeds the 600 s budget — the exact hang the
-                # timeout guards — would otherwise escape this handler and
-                # crash the orchestrator with a traceback, bypassing the
-                # structured failure record. Record it like any other failure.
-                exit_code = getattr(exc, "returncode", None) or 1
-                sub_script_results.append({
-                    "name": script_name,
-                    "exit_code": exit_code,
-                    "duration_s": round(duration, 2),
-                })
-                logging.error(
-                    "Script %s failed with exit code %s", script_path.name, exit_code
-                )
-                return exit_code
-            duration = time.monotonic() - start
-            sub_script_results.append({
-                "name": script_name,
-                "exit_code": 0,
-                "duration_s": round(duration, 2),
-            })
-
-        # Collapse byte-identical duplicate entries before validation.
-        # ``update_station_directory.py`` assembles its output as
-        # ``fresh + manual_stations`` with no dedup pass, so a station
-        # preserved through the existing-file → manual round-trip can be
-        # written twice. A duplicated record self-collides on its own
-        # ``bst_code``-as-alias and would otherwise auto-quarantine the
-        # whole station every run (see ``_dedupe_exact_duplicates``).
-        merged_before_validation = _load_stations(tmp_stations_path)
-        deduped_stations, removed_duplicates = _dedupe_exact_duplicates(
-            merged_before_validation
+    # Auto-quarantine path (replaces the previous hard-fail return).
+    # Blocking issues no longer halt the pipeline. Instead, the
+    # offending entries are partitioned out of the merged set,
+    # persisted to data/quarantine.json for operator review, and
+    # the remainder of the run proceeds with the valid set so a
+    # partial upstream corruption does not stop the feed update.
+    blocking = _collect_blocking_issues(report)
+    timestamp = datetime.now(UTC).isoformat(timespec="seconds")
+    if blocking:
+        for category, message in blocking:
+            logging.warning("validation issue (%s): %s", category, message)
+
+        quarantine_identifiers = _collect_quarantine_identifiers(report)
+        valid_stations, quarantined_stations = _partition_stations(
+            merged_stations, quarantine_identifiers
         )
-        if removed_duplicates:
-            logging.warning(
-                "Removed %d byte-identical duplicate station entr%s before validation",
-                removed_duplicates,
-                "y" if removed_duplicates == 1 else "ies",
-            )
-            _write_stations_payload(tmp_stations_path, deduped_stations)
 
-        # Run validation
-        logging.info("Validating merged %s", tmp_stations_path)
-        try:
-            report = validate_stations(tmp_stations_path)
-        except StationValidationError as exc:
-            logging.error("Validation could not be completed: %s", exc)
-            logging.error(
-                "Validation failed on the new stations data. Working tree left unmodified."
+        if quarantined_stations:
+            merged_stations = valid_stations
+            _write_quarantine_file(
+                quarantine_path,
+                quarantined_stations,
+                _collect_quarantine_reasons(report),
+                timestamp,
             )
-            return 1
-
-        # Auto-quarantine path (replaces the previous hard-fail return).
-        # Blocking issues no longer halt the pipeline. Instead, the
-        # offending entries are partitioned out of the merged file,
-        # persisted to data/quarantine.json for operator review, and
-        # the remainder of the run proceeds with the valid set so a
-        # partial upstream corruption does not stop the feed update.
-        blocking = _collect_blocking_issues(report)
-        timestamp = datetime.now(UTC).isoformat(timespec="seconds")
-        if blocking:
-            for category, message in blocking:
-                logging.warning("validation issue (%s): %s", category, message)
-
-            quarantine_identifiers = _collect_quarantine_identifiers(report)
-            merged_stations = _load_stations(tmp_stations_path)
-            valid_stations, quarantined_stations = _partition_stations(
-                merged_stations, quarantine_identifiers
+            quarantined_names = [
+                str(entry.get("name") or "<unknown>")
+                for entry in quarantined_stations
+            ]
+            logging.warning(
+                "Auto-quarantined %d station(s) with blocking validation issues; "
+                "details written to %s. Affected: %s",
+                len(quarantined_stations),
+                quarantine_path,
+                ", ".join(quarantined_names),
+            )
+        else:
+            # Either every blocking issue was the ``<global>`` sentinel
+            # or the validator's identifiers did not match any merged
+            # entry. Without a target to remove, auto-quarantine cannot
+            # repair the directory — log the gap and proceed with the
+            # full set so the pipeline survives.
+            logging.warning(
+                "Auto-quarantine could not isolate the failing stations "
+                "(no entry matched the validator's identifiers); proceeding "
+                "with the unmodified merged set."
             )
 
-            if quarantined_stations:
-                _write_stations_payload(tmp_stations_path, valid_stations)
-                _write_quarantine_file(
-                    quarantine_path,
-                    quarantined_stations,
-                    _collect_quarantine_reasons(report),
-                    timestamp,
-                )
-                quarantined_names = [
-                    str(entry.get("name") or "<unknown>")
-                    for entry in quarantined_stations
-                ]
-                logging.warning(
-                    "Auto-quarantined %d station(s) with blocking validation issues; "
-                    "details written to %s. Affected: %s",
-                    len(quarantined_stations),
-                    quarantine_path,
-                    ", ".join(quarantined_names),
-                )
-            else:
-                # Either every blocking issue was the ``<global>`` sentinel
-                # or the validator's identifiers did not match any merged
-                # entry. Without a target to remove, auto-quarantine cannot
-                # repair the directory — log the gap and proceed with the
-                # full set so the pipeline survives.
-                logging.warning(
-                    "Auto-quarantine could not isolate the failing stations "
-                    "(no entry matched the validator's identifiers); proceeding "
-                    "with the unmodified merged set."
-                )
-
-        # Compute the diff between the pre-update snapshot and the merged file
-        # before atomic copy-back so the heartbeat reflects what is about to land.
-        after_snapshot = _load_stations(tmp_stations_path)
-        diff = _compute_diff(before_snapshot, after_snapshot)
-        polygon_vertices = _count_polygon_vertices(polygon_path)
-        heartbeat = _build_heartbeat(
-            report=report,
-            diff=diff,
-            sub_scripts=sub_script_results,
+    # Compute the diff between the pre-update snapshot and the merged set
+    # before the write so the heartbeat reflects what is about to land.
+    diff = _compute_diff(before_snapshot, merged_stations)
+    polygon_vertices = _count_polygon_vertices(polygon_path)
+    heartbeat = _build_heartbeat(
+        report=report,
+        diff=diff,
+        sub_scripts=sub_script_results,
+        before_count=len(before_snapshot),
+        after_count=len(merged_stations),
+        polygon_vertices=polygon_vertices,
+        timestamp=timestamp,
+    )
+
+    # Single atomic write: atomic_write stages a temp file inside
+    # target_stations_json.parent (same filesystem as the target), fsyncs,
+    # then os.replace's into position. No partial-file window on
+    # data/stations.json.
+    _write_stations_payload(target_stations_json, merged_stations)
+    logging.info("stations.json successfully updated and validated.")
+
+    # Persist the heartbeat and diff report next to the data they describe.
+    # Both files are atomic-written so a partial run never produces
+    # half-written observability artefacts.
+    _write_heartbeat_file(heartbeat_path, heartbeat)
+    diff_report_path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_write(diff_report_path, mode="w", encoding="utf-8") as handle:
+        handle.write(_render_diff_markdown(
+            diff,
             before_count=len(before_snapshot),
-            after_count=len(after_snapshot),
-            polygon_vertices=polygon_vertices,
+            after_count=len(merged_stations),
             timestamp=timestamp,
-        )
-
-        # Atomic copy-back: atomic_write writes a temp file inside
-        # target_stations_json.parent (same filesystem as the target —
-        # sidesteps the cross-FS issue with tempfile.TemporaryDirectory
-        # which lives on /tmp), fsyncs, then os.replace's into position.
-        # No partial-file window on data/stations.json.
-        with open(tmp_stations_path, "rb") as src, atomic_write(
-            target_stations_json, mode="wb"
-        ) as dst:
-            shutil.copyfileobj(src, dst)
-        logging.info("stations.json successfully updated and validated.")
-
-        # Persist the heartbeat and diff report next to the data they describe.
-        # Both files are atomic-written so a partial run never produces
-        # half-written observability artefacts.
-        _write_heartbeat_file(heartbeat_path, heartbeat)
-        diff_report_path.parent.mkdir(parents=True, exist_ok=True)
-        with atomic_write(diff_report_path, mode="w", encoding="utf-8") as handle:
-            handle.write(_render_diff_markdown(
-                diff,
-                before_count=len(before_snapshot),
-                after_count=len(after_snapshot),
-                timestamp=timestamp,
-            ))
-        logging.info(
-            "Wrote heartbeat (%s) and diff report (%s)",
-            heartbeat_path.name,
-            diff_report_path.name,
-        )
+        ))
+    logging.info(
+        "Wrote heartbeat (%s) and diff report (%s)",
+        heartbeat_path.name,
+        diff_report_path.name,
+    )
 
     logging.info("All station update scripts completed successfully.")
     return 0
@@ -10,6 +10,7 @@ import math
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -38,7 +39,9 @@ from utils.cache import DataDegradationError, write_cache  # noqa: E402
 from utils.files import loads_finite, read_capped_json  # noqa: E402
 from utils.http import fetch_content_safe, session_with_retries, validate_http_url  # noqa: E402
 from utils.ids import make_guid  # noqa: E402
+from utils.json_stream import JSONStreamError, StreamingArrayReader  # noqa: E402
 from utils.logging import sanitize_log_arg  # noqa: E402
+from utils.profiling import run_profiled_main  # noqa: E402
 from utils.serialize import serialize_for_cache  # noqa: E402
 
 # Security cap against wide-but-flat JSON size-bomb attacks on the
@@ -88,7 +91,7 @@ DEFAULT_DATA_URL = (
 # single ``BAUSTELLEOGD`` layer into two "verkehrswirksame Baustellen"
 # feature types — one for line segments, one for point locations. Both are
 # fetched and merged so neither geometry kind is lost.
-_BAUSTELLEN_TYPENAMES: tuple[str, ...] = (
+BAUSTELLEN_TYPENAMES: tuple[str, ...] = (
     "ogdwien:BAUSTELLENLINOGD",
     "ogdwien:BAUSTELLENPKTOGD",
 )
@@ -103,7 +106,7 @@ _BAUSTELLEN_TYPENAMES: tuple[str, ...] = (
 # across an upstream server/config change WITHOUT relaxing that pin: each
 # attempt still has to return a JSON content-type and parse as a GeoJSON
 # object, so a WAF/error page never slips through.
-_OUTPUT_FORMAT_CANDIDATES: tuple[str, ...] = (
+OUTPUT_FORMAT_CANDIDATES: tuple[str, ...] = (
     "json",
     "application/json",
     "geojson",
@@ -280,14 +283,29 @@ def _load_json_from_content(content: bytes) -> dict[str, Any]:
 
 
 def _fetch_remote(url: str, timeout: int) -> dict[str, Any] | None:
+    """Fetch one WFS layer and return its GeoJSON object.
+
+    The body is parsed while it downloads: every element of ``features``
+    is decoded on its own by :class:`StreamingArrayReader` and reduced by
+    :func:`_compact_feature` right away, so neither the raw body nor the
+    full coordinate arrays of a layer are ever held in memory at once.
+    """
     # Security: validate remote URL before fetching (SSRF/DNS rebinding protection).
     if not validate_http_url(url):
         LOGGER.warning("Baustellen: Unsichere oder ungültige URL: %s", url)
         return None
+    features: list[dict[str, Any]] = []
+
+    def keep(feature: Any) -> None:
+        compact = _compact_feature(feature)
+        if compact is not None:
+            features.append(compact)
+
+    reader = StreamingArrayReader("features", keep)
     try:
         LOGGER.info("Baustellen: Lade Daten von %s", url)
         with session_with_retries(USER_AGENT, raise_on_status=False) as session:
-            content = fetch_content_safe(
+            fetch_content_safe(
                 session,
                 url,
                 timeout=timeout,
@@ -295,7 +313,7 @@ def _fetch_remote(url: str, timeout: int) -> dict[str, Any] | None:
                 # Security: pin the response Content-Type to JSON shapes the OGD
                 # WFS endpoint actually emits. Without this, a CDN/WAF error page
                 # (text/html) or a misconfigured upstream would feed non-JSON
-                # bytes into _load_json_from_content. The other providers
+                # bytes into the streaming parser. The other providers
                 # (WL/VOR/ÖBB) already enforce this at the request layer; this
                 # closes the last gap. text/json covers older Apache mod_geowfs
                 # variants; application/geo+json is the RFC 7946 registration.
@@ -304,15 +322,19 @@ def _fetch_remote(url: str, timeout: int) -> dict[str, Any] | None:
                     "application/geo+json",
                     "text/json",
                 ),
+                on_chunk=reader.feed,
             )
+        payload: dict[str, Any] = reader.close()
+    except JSONStreamError as exc:
+        # Same depth / size / NaN guards as ``_load_json_from_content``,
+        # applied per feature instead of to the whole body.
+        LOGGER.warning("Baustellen: Ungültiges JSON vom Endpoint (%s)", exc)
+        return None
     except (RequestException, ValueError) as exc:
         LOGGER.warning("Baustellen: Abruf fehlgeschlagen (%s)", exc)
         return None
-    try:
-        payload = _load_json_from_content(content)
-    except ValueError as exc:
-        LOGGER.warning("Baustellen: Ungültiges JSON vom Endpoint (%s)", exc)
-        return None
+    if reader.streamed:
+        payload["features"] = features
     return payload
 
 
@@ -443,7 +465,14 @@ def _validated_baustellen_data_url(raw: str) -> str | None:
     return cast(str, safe)
 
 
-def _resolve_data_url(candidate: str | None) -> str:
+def resolve_data_url(candidate: str | None) -> str:
+    """Return the validated ``BAUSTELLEN_DATA_URL`` override or the default.
+
+    Public together with :func:`with_typename`, :func:`with_output_format`,
+    ``BAUSTELLEN_TYPENAMES`` and ``OUTPUT_FORMAT_CANDIDATES``: the
+    ``--probe`` mode of ``scripts/health_check.py`` builds its WFS requests
+    from them.
+    """
     text = (candidate or "").strip()
     if not text:
         return DEFAULT_DATA_URL
@@ -467,13 +496,13 @@ def _resolve_data_url(candidate: str | None) -> str:
     return validated
 
 
-def _with_output_format(url: str, output_format: str) -> str:
+def with_output_format(url: str, output_format: str) -> str:
     """Return ``url`` with its ``outputFormat`` query value set to
     ``output_format`` (appended if absent).
 
     Only the ``outputFormat`` token is rewritten — every other byte of the
     URL (scheme, host, ``typeName``/``srsName`` colons, …) is left
-    untouched, so the host pin already applied by :func:`_resolve_data_url`
+    untouched, so the host pin already applied by :func:`resolve_data_url`
     still holds and ``_fetch_remote`` re-validates the result anyway. The
     value is percent-encoded (``/`` kept readable, as WFS endpoints expect
     for ``application/json``).
@@ -485,12 +514,12 @@ def _with_output_format(url: str, output_format: str) -> str:
     return f"{url}{sep}outputFormat={encoded}"
 
 
-def _with_typename(url: str, typename: str) -> str:
+def with_typename(url: str, typename: str) -> str:
     """Return ``url`` with its ``typeName``/``typeNames`` query value set to
     ``typename`` (appended if absent).
 
     Only the type-name token is rewritten — scheme/host/path and the other
-    parameters are preserved, so the host pin from :func:`_resolve_data_url`
+    parameters are preserved, so the host pin from :func:`resolve_data_url`
     still holds (``_fetch_remote`` re-validates regardless). The ``ogdwien:``
     workspace colon is kept readable.
     """
@@ -692,6 +721,22 @@ def _first_lonlat(coordinates: Any, _depth: int = 0) -> tuple[float, float] | No
     return _first_lonlat(first, _depth + 1)
 
 
+def _compact_feature(feature: Any) -> dict[str, Any] | None:
+    """Reduce a streamed *feature* to the fields :func:`_feature_to_event` reads.
+
+    Only the first vertex of the geometry is used for the location, so the
+    coordinate arrays are dropped as soon as the feature is decoded.
+    """
+    if not isinstance(feature, dict):
+        return None
+    compact: dict[str, Any] = {"properties": feature.get("properties")}
+    geometry = feature.get("geometry")
+    if isinstance(geometry, dict):
+        point = _first_lonlat(geometry.get("coordinates"))
+        compact["geometry"] = {"type": "Point", "coordinates": list(point)} if point else {}
+    return compact
+
+
 def _build_location(properties: dict[str, Any], geometry: dict[str, Any]) -> dict[str, Any]:
     location: dict[str, Any] = {}
     address_parts: list[str] = []
@@ -814,25 +859,35 @@ def _collect_events(payload: dict[str, Any]) -> list[dict[str, Any]]:
     return events
 
 
+def _fetch_layer(data_url: str, typename: str, timeout: int) -> dict[str, Any] | None:
+    """Fetch one feature type, negotiating the GeoJSON ``outputFormat``.
+
+    The configured token is tried first, then the common server-specific
+    variants, stopping at the first that returns a parseable GeoJSON object.
+    """
+    layer_url = with_typename(data_url, typename)
+    for output_format in OUTPUT_FORMAT_CANDIDATES:
+        payload = _fetch_remote(with_output_format(layer_url, output_format), timeout)
+        if payload is not None:
+            return payload
+    return None
+
+
 def _fetch_layers(data_url: str, timeout: int) -> list[dict[str, Any]] | None:
     """Fetch every Baustellen feature type and return the merged events.
 
-    For each type name the GeoJSON ``outputFormat`` is negotiated (the
-    configured token first, then the common server-specific variants),
-    stopping at the first that returns a parseable GeoJSON object. Returns
-    ``None`` only when NO layer could be fetched (the caller then falls
-    back to the bundled sample); a partial success (one of two layers)
-    still returns the events it got.
+    The layers are fetched concurrently (see :func:`_fetch_layer`) and merged
+    in ``BAUSTELLEN_TYPENAMES`` order. Returns ``None`` only when NO layer
+    could be fetched (the caller then falls back to the bundled sample); a
+    partial success (one of two layers) still returns the events it got.
     """
+    with ThreadPoolExecutor(max_workers=len(BAUSTELLEN_TYPENAMES)) as executor:
+        payloads = list(
+            executor.map(lambda typename: _fetch_layer(data_url, typename, timeout), BAUSTELLEN_TYPENAMES)
+        )
     merged: list[dict[str, Any]] = []
     any_success = False
-    for typename in _BAUSTELLEN_TYPENAMES:
-        layer_url = _with_typename(data_url, typename)
-        payload = None
-        for output_format in _OUTPUT_FORMAT_CANDIDATES:
-            payload = _fetch_remote(_with_output_format(layer_url, output_format), timeout)
-            if payload is not None:
-                break
+    for typename, payload in zip(BAUSTELLEN_TYPENAMES, payloads, strict=True):
         if payload is None:
             LOGGER.warning("Baustellen: Layer %s nicht abrufbar.", typename)
             continue
@@ -843,7 +898,7 @@ def _fetch_layers(data_url: str, timeout: int) -> list[dict[str, Any]] | None:
 
 def main() -> int:
     configure_logging()
-    data_url = _resolve_data_url(os.getenv("BAUSTELLEN_DATA_URL"))
+    data_url = resolve_data_url(os.getenv("BAUSTELLEN_DATA_URL"))
     fallback_path = _resolve_fallback_path(os.getenv("BAUSTELLEN_FALLBACK_PATH"))
     timeout_raw = os.getenv("BAUSTELLEN_TIMEOUT", "")
     timeout = DEFAULT_BAUSTELLEN_TIMEOUT
@@ -856,7 +911,7 @@ def main() -> int:
             timeout = min(max(int(timeout_raw), 1), MAX_BAUSTELLEN_TIMEOUT)
         except ValueError:
             # Security (Path-Log Sibling Drift Round 4, env-repr closure):
-            # see ``_resolve_data_url`` — same env-repr drift shape on the
+            # see ``resolve_data_url`` — same env-repr drift shape on the
             # operator-controlled ``BAUSTELLEN_TIMEOUT`` value.
             LOGGER.warning(
                 "Baustellen: Ungültiger Timeout-Wert %s – verwende Standard",
@@ -870,7 +925,7 @@ def main() -> int:
         # before falling back, so the operator log can pinpoint a renamed
         # typeName / unsupported version.
         _log_endpoint_diagnostic(
-            _with_typename(data_url, _BAUSTELLEN_TYPENAMES[0]), timeout
+            with_typename(data_url, BAUSTELLEN_TYPENAMES[0]), timeout
         )
         payload = _load_fallback(fallback_path)
         if payload is None:
@@ -904,7 +959,7 @@ def main() -> int:
         )
         return 1
     try:
-        write_cache("baustellen", relevant)
+        changed = write_cache("baustellen", relevant)
     except DataDegradationError:
         # ``write_cache`` refuses not only *empty* but also *drastically
         # smaller* payloads (< 20 % of the existing cache). The bundled
@@ -931,9 +986,12 @@ def main() -> int:
             len(relevant),
         )
         return 2
+    if not changed:
+        LOGGER.info("Baustellen: Cache mit %d Einträgen unverändert – kein Schreibvorgang.", len(relevant))
+        return 0
     LOGGER.info("Baustellen: Cache mit %d Einträgen aktualisiert.", len(relevant))
     return 0
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
-    raise SystemExit(main())
+    raise SystemExit(run_profiled_main("update_baustellen_cache", main))
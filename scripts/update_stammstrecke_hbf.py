@@ -151,13 +151,15 @@ of mixed-shape CSV rows during the one-shot transition window; the
 
 from __future__ import annotations
 
+import json
 import logging
+import math
 import re
 import statistics
 import sys
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, MutableMapping
 from contextlib import ExitStack
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Final
@@ -174,7 +176,7 @@ from src.utils.circuit_breaker import (  # noqa: E402
     CircuitBreaker,
     CircuitBreakerOpen,
 )
-from src.utils.files import loads_finite  # noqa: E402
+from src.utils.files import atomic_write, loads_finite, read_capped_text  # noqa: E402
 from src.utils.http import request_safe  # noqa: E402
 from src.utils import logging as utils_logging  # noqa: E402
 from src.utils.stations import station_info  # noqa: E402
@@ -976,15 +978,221 @@ def _log_track_drops(
     )
 
 
+# ---- Quota-aware poll plan -------------------------------------------------
+#
+# One ``/departureBoard`` call per update-cycle tick is 48 of the 100
+# daily VAO requests on a healthy day. Backup-cron ticks, manual
+# ``workflow_dispatch`` runs and smoke tests eat into the same budget,
+# and once the day's quota runs short the in-script guard used to spend
+# the remainder first-come-first-served — a quiet late-evening tick cost
+# as much as a rush-hour one and the ticks after it found the cap hit.
+#
+# The poll plan spends a short budget where the boards are dense: every
+# successful board folds its Stammstrecke departure count into a per-hour
+# density profile (separately for weekdays and weekends), and each tick
+# ranks the ticks still left today by that density. When the remaining
+# quota (minus a reserve held back for the rest of the day) covers every
+# remaining tick, nothing changes; otherwise only the densest ticks poll
+# and the rest skip without touching the API. The plan is persisted next
+# to the pending-trip ledger so operators can see what the next ticks
+# will do.
+#
+# Durations stay at :data:`DEPARTURE_BOARD_DURATION_MIN`: only departures
+# inside the ~24-min ``rtTime`` horizon yield an observation, so a longer
+# window does not recover trains a skipped tick misses. Other stations
+# are not added either — Hbf already sees both Stammstrecke directions,
+# and a second board would re-observe the same trips.
+
+POLL_PLAN_PATH: Final = REPO_ROOT / "cache" / "stammstrecke" / "poll_plan.json"
+POLL_PLAN_MAX_BYTES: Final = 64 * 1024
+
+# Nominal update-cycle cadence (IFTTT at :00 / :30).
+POLL_CADENCE: Final = timedelta(minutes=30)
+
+# Requests held back for operator runs and backup ticks. Scaled by the
+# share of the day's ticks still ahead, so the reserve is released
+# towards midnight instead of expiring unused.
+POLL_QUOTA_RESERVE: Final = 6
+
+# EWMA weight of the newest board in the per-hour density profile.
+POLL_DENSITY_ALPHA: Final = 0.3
+
+_TICKS_PER_DAY: Final = int(timedelta(days=1) / POLL_CADENCE)
+_DAY_KINDS: Final[tuple[str, ...]] = ("werktag", "wochenende")
+
+
+@dataclass(slots=True)
+class _PollPlan:
+    """Persisted density profile plus today's chosen poll ticks."""
+
+    density: dict[str, list[float | None]]
+    date: str | None = None
+    ticks: list[str] = field(default_factory=list)
+    remaining_quota: int | None = None
+    reserve: int = 0
+
+    @classmethod
+    def empty(cls) -> _PollPlan:
+        return cls(density={kind: [None] * 24 for kind in _DAY_KINDS})
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "density": self.density,
+            "plan": {
+                "date": self.date,
+                "ticks": self.ticks,
+                "remaining_quota": self.remaining_quota,
+                "reserve": self.reserve,
+            },
+        }
+
+
+def _day_kind(when: datetime) -> str:
+    return "werktag" if when.weekday() < 5 else "wochenende"
+
+
+def _parse_density(raw: Any) -> list[float | None] | None:
+    if not isinstance(raw, list) or len(raw) != 24:
+        return None
+    profile: list[float | None] = []
+    for value in raw:
+        if value is None:
+            profile.append(None)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+            profile.append(float(value))
+        else:
+            return None
+    return profile
+
+
+def _load_poll_plan(path: Path) -> _PollPlan:
+    """Read the poll plan from *path*; missing or malformed input starts empty.
+
+    Only the density profile is carried over — today's tick selection is
+    recomputed on every run by :func:`_plan_polls`.
+    """
+
+    plan = _PollPlan.empty()
+    raw = read_capped_text(
+        path, max_bytes=POLL_PLAN_MAX_BYTES, label="poll plan", logger=LOGGER
+    )
+    if raw is None or not raw.strip():
+        return plan
+    try:
+        payload = loads_finite(raw)
+    except (ValueError, RecursionError) as exc:
+        LOGGER.warning(
+            "Stammstrecke (Hbf): Poll-Plan korrupt (%s) — starte ohne Dichteprofil.",
+            utils_logging.sanitize_log_arg(str(exc)),
+        )
+        return plan
+    density = payload.get("density") if isinstance(payload, Mapping) else None
+    if not isinstance(density, Mapping):
+        return plan
+    for kind in _DAY_KINDS:
+        profile = _parse_density(density.get(kind))
+        if profile is not None:
+            plan.density[kind] = profile
+    return plan
+
+
+def _save_poll_plan(path: Path, plan: _PollPlan) -> bool:
+    """Persist *plan* atomically; unchanged content skips the rewrite."""
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(
+            path,
+            mode="w",
+            encoding="utf-8",
+            permissions=0o644,
+            skip_unchanged=True,
+        ) as fh:
+            json.dump(plan.to_json(), fh, ensure_ascii=True, allow_nan=False, indent=2)
+            fh.write("\n")
+    except OSError as exc:
+        LOGGER.warning(
+            "Stammstrecke (Hbf): Poll-Plan konnte nicht gespeichert werden: %s.",
+            type(exc).__name__,
+        )
+        return False
+    return True
+
+
+def _record_board_density(plan: _PollPlan, when: datetime, observed: int) -> None:
+    """Fold one board's Stammstrecke departure count into the hourly profile."""
+
+    profile = plan.density[_day_kind(when)]
+    previous = profile[when.hour]
+    if previous is None:
+        profile[when.hour] = float(observed)
+    else:
+        profile[when.hour] = round(
+            previous + POLL_DENSITY_ALPHA * (observed - previous), 3
+        )
+
+
+def _slot_density(plan: _PollPlan, tick: datetime) -> float:
+    """Expected departures for *tick*; unseen hours count as the profile mean."""
+
+    profile = plan.density[_day_kind(tick)]
+    value = profile[tick.hour]
+    if value is not None:
+        return value
+    known = [v for v in profile if v is not None]
+    return statistics.fmean(known) if known else 1.0
+
+
+def _remaining_ticks(when: datetime) -> list[datetime]:
+    """Cadence ticks from *when* (inclusive) up to the end of its calendar day."""
+
+    ticks: list[datetime] = []
+    tick = when
+    while tick.date() == when.date():
+        ticks.append(tick)
+        tick += POLL_CADENCE
+    return ticks
+
+
+def _plan_polls(plan: _PollPlan, when: datetime, *, used: int) -> bool:
+    """Choose today's remaining poll ticks and return whether *when* polls.
+
+    With *used* of :data:`vor_provider.MAX_REQUESTS_PER_DAY` requests spent,
+    the spendable budget is the remaining quota minus the pro-rated
+    :data:`POLL_QUOTA_RESERVE`. If it covers every remaining tick, all of
+    them poll; otherwise the densest ticks win (earlier ones on ties). The
+    selection is stored on *plan* for :func:`_save_poll_plan`.
+    """
+
+    ticks = _remaining_ticks(when)
+    remaining = max(vor_provider.MAX_REQUESTS_PER_DAY - used, 0)
+    reserve = math.ceil(POLL_QUOTA_RESERVE * len(ticks) / _TICKS_PER_DAY)
+    budget = remaining - reserve
+    if budget >= len(ticks):
+        chosen = ticks
+    else:
+        ranked = sorted(
+            range(len(ticks)), key=lambda index: (-_slot_density(plan, ticks[index]), index)
+        )
+        chosen = [ticks[index] for index in sorted(ranked[: max(budget, 0)])]
+
+    plan.date = when.date().isoformat()
+    plan.ticks = [tick.strftime("%H:%M") for tick in chosen]
+    plan.remaining_quota = remaining
+    plan.reserve = reserve
+    return bool(chosen) and chosen[0] == when
+
+
 # ---- Main flow ------------------------------------------------------------
 
 
 def _process_tick(
     session: requests.Session,
-    state: dict[Any, Any],
+    state: MutableMapping[Any, Any],
     *,
     when: datetime,
     recently_finalised: Mapping[str, datetime] | None = None,
+    plan: _PollPlan | None = None,
 ) -> str:
     """Single ``/departureBoard`` poll, classify, and observe.
 
@@ -996,7 +1204,8 @@ def _process_tick(
     * ``"quota_exceeded"`` — daily quota cap hit before the call.
 
     ``CircuitBreakerOpen`` is re-raised so :func:`main` can short-
-    circuit the rest of the tick.
+    circuit the rest of the tick. A successful board's Stammstrecke
+    departure count is folded into *plan*'s density profile.
     """
 
     LOGGER.info(
@@ -1046,6 +1255,10 @@ def _process_tick(
         diagnostics.dropped_no_track,
         diagnostics.dropped_non_stammstrecke_track,
     )
+    if plan is not None:
+        _record_board_density(
+            plan, when, sum(len(obs) for obs in by_direction.values())
+        )
 
     written_per_dir: dict[str, int] = {}
     for direction in DIRECTION_LABELS:
@@ -1111,35 +1324,49 @@ def main() -> int:
         successes = 0
         errors = 0
 
-        with ExitStack() as stack:
-            try:
-                session = _build_session(stack)
-            except Exception as exc:  # pragma: no cover - defensive
-                LOGGER.error(
-                    "Stammstrecke (Hbf): VOR-Session konnte nicht erstellt werden: %s.",
-                    type(exc).__name__,
-                )
-                return 1
-
-            try:
-                status = _process_tick(
-                    session,
-                    state,
-                    when=when,
-                    recently_finalised=recently_finalised,
-                )
-            except CircuitBreakerOpen:
-                LOGGER.warning(
-                    "Stammstrecke (Hbf): Circuit breaker offen (%d "
-                    "aufeinanderfolgende Fehler) — Tick übersprungen.",
-                    _BREAKER.consecutive_failures,
-                )
-                status = "error"
+        plan = _load_poll_plan(POLL_PLAN_PATH)
+        _, used = vor_provider.load_request_count()
+        if not _plan_polls(plan, when, used=used):
+            # A planned skip is neither success nor failure: the quota is
+            # being saved for denser ticks later today.
+            LOGGER.info(
+                "Stammstrecke (Hbf): Poll-Plan überspringt diesen Tick "
+                "(Restkontingent %d, Reserve %d, geplante Abfragen: %s).",
+                plan.remaining_quota,
+                plan.reserve,
+                ", ".join(plan.ticks) or "keine",
+            )
+        else:
+            with ExitStack() as stack:
+                try:
+                    session = _build_session(stack)
+                except Exception as exc:  # pragma: no cover - defensive
+                    LOGGER.error(
+                        "Stammstrecke (Hbf): VOR-Session konnte nicht erstellt werden: %s.",
+                        type(exc).__name__,
+                    )
+                    return 1
+
+                try:
+                    status = _process_tick(
+                        session,
+                        state,
+                        when=when,
+                        recently_finalised=recently_finalised,
+                        plan=plan,
+                    )
+                except CircuitBreakerOpen:
+                    LOGGER.warning(
+                        "Stammstrecke (Hbf): Circuit breaker offen (%d "
+                        "aufeinanderfolgende Fehler) — Tick übersprungen.",
+                        _BREAKER.consecutive_failures,
+                    )
+                    status = "error"
 
-            if status in ("error", "quota_exceeded"):
-                errors += 1
-            else:
-                successes += 1
+                if status in ("error", "quota_exceeded"):
+                    errors += 1
+                else:
+                    successes += 1
 
         # Finalisation pass per direction. Trains scheduled <= now are
         # popped from the pending state, their latest observation is
@@ -1249,12 +1476,13 @@ def main() -> int:
         # finalised.
         _save_recently_finalised(RECENTLY_FINALISED_PATH, recently_finalised)
         _save_pending_trips(PENDING_TRIPS_PATH, state)
+        _save_poll_plan(POLL_PLAN_PATH, plan)
 
     LOGGER.info(
         "Stammstrecke (Hbf): %d Beobachtungs-Tick(s), %d Delay-CSV-Zeile(n) "
         "+ %d Ausfall-CSV-Zeile(n) geschrieben (Erfolg=%d, Fehler=%d, "
         "Pending=%d offen, Finalisiert=%d).",
-        1,
+        successes + errors,
         csv_rows_written,
         ausfaelle_rows_written,
         successes,
@@ -1280,6 +1508,7 @@ __all__ = [
     "HAUPTBAHNHOF_VOR_ID",
     "HBF_REFERENCE_LATITUDE",
     "LEGACY_DIRECTION_LABEL_NORTHBOUND",
+    "POLL_PLAN_PATH",
     "STAMMSTRECKE_HBF_TRACK_TRUNKS",
     "main",
 ]
@@ -98,12 +98,14 @@ Design contract
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import json as _json_lib
 import logging
 import re
 import statistics
 import sys
-from collections.abc import Iterable, Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -227,7 +229,7 @@ PENDING_TRIPS_LOCK_PATH: Final = (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _PendingTrip:
     """One observed but not-yet-finalised S-Bahn trip.
 
@@ -257,6 +259,111 @@ class _PendingTrip:
     cancelled: bool = False
 
 
+class _PendingLedger(MutableMapping[str, _PendingTrip]):
+    """Pending-trip mapping with a scheduled-departure index.
+
+    Behaves like the plain ``{identity_key: _PendingTrip}`` dict the
+    ledger is persisted as, and additionally keeps one min-heap of
+    ``(scheduled, seq, key)`` per direction plus a ``(last_seen_at, seq,
+    key)`` heap. :func:`_finalize_departed` and
+    :func:`_purge_stale_entries` therefore pop only the departed / expired
+    trips instead of scanning the whole ledger every tick. ``seq`` keeps
+    ties in insertion order, matching the stable sort of the plain-dict
+    path.
+
+    Heap entries are invalidated lazily: an entry is live only while its
+    key still maps to a trip with the same timestamp. The heaps are
+    rebuilt once dead entries outnumber the live ones.
+    """
+
+    __slots__ = ("_due", "_seen", "_seq", "_trips")
+
+    def __init__(self, trips: Mapping[str, _PendingTrip] | None = None) -> None:
+        self._trips: dict[str, _PendingTrip] = {}
+        self._due: dict[str, list[tuple[datetime, int, str]]] = {}
+        self._seen: list[tuple[datetime, int, str]] = []
+        self._seq = itertools.count()
+        if trips:
+            self.update(trips)
+
+    def __getitem__(self, key: str) -> _PendingTrip:
+        return self._trips[key]
+
+    def __setitem__(self, key: str, trip: _PendingTrip) -> None:
+        previous = self._trips.get(key)
+        self._trips[key] = trip
+        if previous is None or previous.direction != trip.direction or previous.scheduled != trip.scheduled:
+            heapq.heappush(self._due.setdefault(trip.direction, []), (trip.scheduled, next(self._seq), key))
+        if previous is None or previous.last_seen_at != trip.last_seen_at:
+            heapq.heappush(self._seen, (trip.last_seen_at, next(self._seq), key))
+        if len(self._seen) > 2 * len(self._trips) + 32:
+            self._rebuild_index()
+
+    def __delitem__(self, key: str) -> None:
+        del self._trips[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._trips)
+
+    def __len__(self) -> int:
+        return len(self._trips)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._trips!r})"
+
+    def _rebuild_index(self) -> None:
+        self._due = {}
+        self._seen = []
+        self._seq = itertools.count()
+        for key, trip in self._trips.items():
+            self._due.setdefault(trip.direction, []).append((trip.scheduled, next(self._seq), key))
+            self._seen.append((trip.last_seen_at, next(self._seq), key))
+        for heap in self._due.values():
+            heapq.heapify(heap)
+        heapq.heapify(self._seen)
+
+    def pop_departed(
+        self, direction: str, now: datetime, *, keep: Mapping[str, object]
+    ) -> list[tuple[str, _PendingTrip]]:
+        """Remove and return ``(key, trip)`` for *direction* with ``scheduled <= now``.
+
+        Ascending by scheduled time. Keys present in *keep* stay in the
+        ledger (and in the index) untouched.
+        """
+
+        heap = self._due.get(direction)
+        if not heap:
+            return []
+        departed: list[tuple[str, _PendingTrip]] = []
+        kept: list[tuple[datetime, int, str]] = []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            scheduled, _seq, key = entry
+            trip = self._trips.get(key)
+            if trip is None or trip.direction != direction or trip.scheduled != scheduled:
+                continue
+            if key in keep:
+                kept.append(entry)
+                continue
+            departed.append((key, trip))
+            del self._trips[key]
+        for entry in kept:
+            heapq.heappush(heap, entry)
+        return departed
+
+    def purge_before(self, cutoff: datetime) -> int:
+        """Drop trips last seen strictly before *cutoff*; return how many."""
+
+        removed = 0
+        while self._seen and self._seen[0][0] < cutoff:
+            seen_at, _seq, key = heapq.heappop(self._seen)
+            trip = self._trips.get(key)
+            if trip is not None and trip.last_seen_at == seen_at:
+                del self._trips[key]
+                removed += 1
+        return removed
+
+
 # Per-call HTTP budget (seconds). Enforced at the ``fetch_content_safe``
 # layer (``src/utils/http.py``) which forwards the kwarg verbatim to
 # ``requests.Session.get``. Bound between 1 and ``MAX_QUERY_TIMEOUT`` so
@@ -545,10 +652,11 @@ def _trip_from_json(data: Mapping[str, Any]) -> _PendingTrip | None:
     )
 
 
-def _load_pending_trips(path: Path) -> dict[str, _PendingTrip]:
+def _load_pending_trips(path: Path) -> _PendingLedger:
     """Read the pending-trip ledger from *path*; corruption-tolerant.
 
-    Returns an empty dict on missing / oversize / unparseable input;
+    Returns an indexed :class:`_PendingLedger`, empty on missing /
+    oversize / unparseable input;
     each diagnostic is logged at WARNING so an operator can spot the
     fresh-start fallback without the script ever blocking the cron
     pipeline.
@@ -561,9 +669,9 @@ def _load_pending_trips(path: Path) -> dict[str, _PendingTrip]:
         logger=LOGGER,
     )
     if raw is None:
-        return {}
+        return _PendingLedger()
     if not raw.strip():
-        return {}
+        return _PendingLedger()
     try:
         # Security: ``loads_finite`` pins parse_constant + parse_float
         # hooks (Round 1503 sibling) that reject NaN / Infinity / 1e1000
@@ -581,14 +689,14 @@ def _load_pending_trips(path: Path) -> dict[str, _PendingTrip]:
             "Pending-Trips-State korrupt (%s) — starte mit leerem Ledger.",
             sanitize_log_arg(str(exc)),
         )
-        return {}
+        return _PendingLedger()
     if not isinstance(payload, Mapping):
         LOGGER.warning(
             "Pending-Trips-State hat unerwartetes Top-Level-Format — "
             "starte mit leerem Ledger."
         )
-        return {}
-    state: dict[str, _PendingTrip] = {}
+        return _PendingLedger()
+    state = _PendingLedger()
     for value in payload.values():
         if not isinstance(value, Mapping):
             continue
@@ -603,6 +711,9 @@ def _load_pending_trips(path: Path) -> dict[str, _PendingTrip]:
 def _save_pending_trips(path: Path, state: Mapping[str, _PendingTrip]) -> bool:
     """Persist *state* atomically; best-effort.
 
+    A tick that leaves the ledger as it was (no new observations, nothing
+    departed) skips the rewrite via ``skip_unchanged``.
+
     Returns ``True`` on success, ``False`` if the write failed (and
     was logged at WARNING). The caller is free to ignore the return
     value — losing one tick's state update means the affected trips
@@ -660,6 +771,7 @@ def _save_pending_trips(path: Path, state: Mapping[str, _PendingTrip]) -> bool:
             mode="w",
             encoding="utf-8",
             permissions=0o644,
+            skip_unchanged=True,
         ) as fh:
             _json_lib.dump(
                 payload,
@@ -680,15 +792,18 @@ def _save_pending_trips(path: Path, state: Mapping[str, _PendingTrip]) -> bool:
 
 
 def _purge_stale_entries(
-    state: dict[str, _PendingTrip],
+    state: MutableMapping[str, _PendingTrip],
     *,
     cutoff: datetime,
 ) -> int:
     """Drop entries whose ``last_seen_at`` is strictly before *cutoff*.
 
-    Returns the number of entries removed. Mutates *state* in place.
+    Returns the number of entries removed. Mutates *state* in place; a
+    :class:`_PendingLedger` pops the expired entries off its index.
     """
 
+    if isinstance(state, _PendingLedger):
+        return state.purge_before(cutoff)
     stale = [key for key, trip in state.items() if trip.last_seen_at < cutoff]
     for key in stale:
         del state[key]
@@ -753,6 +868,9 @@ def _save_recently_finalised(
 ) -> bool:
     """Persist the recently-finalised companion ledger atomically.
 
+    Unchanged content skips the rewrite (``skip_unchanged``), as for
+    :func:`_save_pending_trips`.
+
     Security: same Trojan-Source / BiDi-Mark threat model as
     :func:`_save_pending_trips` — the keys are built via
     :func:`_identity_key` which interpolates a VAO-upstream-controlled
@@ -783,6 +901,7 @@ def _save_recently_finalised(
             mode="w",
             encoding="utf-8",
             permissions=0o644,
+            skip_unchanged=True,
         ) as fh:
             _json_lib.dump(
                 payload,
@@ -1400,7 +1519,7 @@ def _collect_sbahn_delays_minutes(
 
 
 def _observe_legs(
-    state: dict[str, _PendingTrip],
+    state: MutableMapping[str, _PendingTrip],
     observations: Iterable[_SbahnLegObservation],
     *,
     direction: str,
@@ -1454,7 +1573,7 @@ def _observe_legs(
 
 
 def _finalize_departed(
-    state: dict[str, _PendingTrip],
+    state: MutableMapping[str, _PendingTrip],
     *,
     direction: str,
     now: datetime,
@@ -1480,6 +1599,9 @@ def _finalize_departed(
     finalisation timestamp so a future re-observation can be
     suppressed by :func:`_observe_legs`.
 
+    A :class:`_PendingLedger` (the production path) pops the departed
+    trips off its scheduled-time index; a plain mapping is scanned.
+
     Mutates *state* (and, when supplied, *recently_finalised*) in place.
     """
 
@@ -1496,20 +1618,20 @@ def _finalize_departed(
     # between the two ``atomic_write`` calls. Skipping here is the
     # complete fix and matches the spirit of the docstring's "exactly
     # once per trip" contract.
-    finalize_keys = [
-        key
-        for key, trip in state.items()
-        if (
-            trip.direction == direction
-            and trip.scheduled <= now
-            and (recently_finalised is None or key not in recently_finalised)
-        )
-    ]
-    finalize_keys.sort(key=lambda k: state[k].scheduled)
+    already_finalised: Mapping[str, datetime] = recently_finalised or {}
+    if isinstance(state, _PendingLedger):
+        departed = state.pop_departed(direction, now, keep=already_finalised)
+    else:
+        finalize_keys = [
+            key
+            for key, trip in state.items()
+            if trip.direction == direction and trip.scheduled <= now and key not in already_finalised
+        ]
+        finalize_keys.sort(key=lambda k: state[k].scheduled)
+        departed = [(key, state.pop(key)) for key in finalize_keys]
     finalised: list[_PendingTrip] = []
-    for key in finalize_keys:
-        finalised.append(state[key])
-        del state[key]
+    for key, trip in departed:
+        finalised.append(trip)
         if recently_finalised is not None:
             recently_finalised[key] = now
     return finalised
@@ -1877,7 +1999,7 @@ def _extract_vao_request_id(exc: requests.HTTPError) -> str:
 def _process_direction(
     session: requests.Session,
     direction: _Direction,
-    state: dict[str, _PendingTrip],
+    state: MutableMapping[str, _PendingTrip],
     *,
     when: datetime,
     recently_finalised: Mapping[str, datetime] | None = None,
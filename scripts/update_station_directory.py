@@ -13,7 +13,6 @@ from __future__ import annotations
 import argparse
 import csv
 import hashlib
-import io
 import json
 import logging
 import math
@@ -25,15 +24,14 @@ import re
 import subprocess  # nosec B404
 import sys
 import unicodedata
+from concurrent.futures import Executor, ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass, field
 import zipfile
 from io import BytesIO
 from pathlib import Path
 from typing import cast
-from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
-
-import openpyxl
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence
 
 # ``subprocess`` is re-exported on purpose (NOT a public API of this script):
 # ``tests/test_update_station_directory_cache_refresh.py`` patches
@@ -48,11 +46,12 @@ if str(_ROOT) not in sys.path:
 
 try:  # pragma: no cover - convenience for module execution
     from src.utils.files import (
+        CsvRow,
         atomic_write,
         loads_finite,
         read_capped_bytes,
+        open_capped_csv,
         read_capped_json,
-        read_capped_text,
         validate_zip_archive_safe,
     )
     from src.utils.geo import (
@@ -65,11 +64,12 @@ try:  # pragma: no cover - convenience for module execution
     from src.utils.stations_validation import is_synthetic_vor_id
 except ModuleNotFoundError:  # pragma: no cover - fallback when installed as package
     from utils.files import (  # type: ignore[no-redef]
+        CsvRow,
         atomic_write,
         loads_finite,
         read_capped_bytes,
+        open_capped_csv,
         read_capped_json,
-        read_capped_text,
         validate_zip_archive_safe,
     )
     from utils.geo import (  # type: ignore[no-redef]
@@ -93,8 +93,8 @@ MAX_JSON_FILE_BYTES = 50 * 1024 * 1024
 
 # Security cap against wide-but-flat CSV size-bomb attacks. Routes every
 # operator-controlled CSV file (GTFS stops, WL haltepunkte, VOR
-# haltestellen) through ``read_capped_text`` -> ``io.StringIO`` ->
-# ``csv.DictReader`` so a planted unbounded CSV (single huge line, no
+# haltestellen) through ``open_capped_csv``, which streams rows while
+# enforcing the cap incrementally, so a planted unbounded CSV (single huge line, no
 # newlines) cannot buffer GiB of payload via ``handle.readline()`` and
 # propagate ``MemoryError`` (``BaseException`` subclass NOT caught by
 # ``except (OSError, csv.Error)``) past the cron orchestrator.
@@ -511,39 +511,39 @@ def _load_gtfs_locations(path: Path) -> dict[str, LocationInfo]:
             _path_fingerprint(path),
         )
         return locations
-    # Security: route through ``read_capped_text`` to bound the
-    # ``csv.DictReader`` -> ``readline()`` allocation against planted
-    # unbounded CSVs. See ``MAX_CSV_LOCATIONS_BYTES`` for the threat
-    # model. ``read_capped_text`` returns ``None`` on missing /
-    # oversized / decode-error so subsequent code receives an empty
-    # mapping rather than crashing the cron pipeline.
-    content = read_capped_text(
-        path,
-        MAX_CSV_LOCATIONS_BYTES,
-        encoding="utf-8",
-        label="GTFS stops",
-        logger=logger,
-    )
-    if content is None:
-        return locations
+    # Security: route through ``open_capped_csv`` to bound the
+    # ``readline()`` allocation against planted unbounded CSVs. See
+    # ``MAX_CSV_LOCATIONS_BYTES`` for the threat model.
+    # ``open_capped_csv`` yields ``None`` on missing / oversized /
+    # decode-error so subsequent code receives an empty mapping rather
+    # than crashing the cron pipeline.
     try:
-        reader = csv.DictReader(io.StringIO(content))
-        for row in reader:
-            stop_name = row.get("stop_name")
-            if not stop_name:
-                continue
-            stop_name = _harmonize_station_name(stop_name)
-            lat = _coerce_float_value(row.get("stop_lat"))
-            lon = _coerce_float_value(row.get("stop_lon"))
-            if lat is None or lon is None:
-                continue
-            location_type = (row.get("location_type") or "").strip()
-            is_station = location_type == "1"
-            for key in _normalize_location_keys(stop_name):
-                if not key:
+        with open_capped_csv(
+            path,
+            MAX_CSV_LOCATIONS_BYTES,
+            encoding="utf-8",
+            delimiter=",",
+            label="GTFS stops",
+            logger=logger,
+        ) as reader:
+            if reader is None:
+                return locations
+            for row in reader:
+                stop_name = row.field("stop_name")
+                if not stop_name:
+                    continue
+                stop_name = _harmonize_station_name(stop_name)
+                lat = _coerce_float_value(row.field("stop_lat"))
+                lon = _coerce_float_value(row.field("stop_lon"))
+                if lat is None or lon is None:
                     continue
-                if is_station or key not in locations:
-                    _store_location(locations, key, lat, lon, source="gtfs")
+                location_type = (row.field("location_type") or "").strip()
+                is_station = location_type == "1"
+                for key in _normalize_location_keys(stop_name):
+                    if not key:
+                        continue
+                    if is_station or key not in locations:
+                        _store_location(locations, key, lat, lon, source="gtfs")
     except csv.Error as exc:
         logger.warning(
             "Could not parse GTFS stops file [path-sha256=%s]: %s",
@@ -581,43 +581,43 @@ def _load_wienerlinien_locations(path: Path) -> dict[str, LocationInfo]:
         )
         return locations
     # Security: see _load_gtfs_locations for the canonical CSV
-    # size-bomb defence shape (read_capped_text + io.StringIO).
-    content = read_capped_text(
-        path,
-        MAX_CSV_LOCATIONS_BYTES,
-        encoding="utf-8",
-        label="WL haltepunkte",
-        logger=logger,
-    )
-    if content is None:
-        return locations
+    # size-bomb defence shape (open_capped_csv).
     try:
-        reader = csv.DictReader(io.StringIO(content), delimiter=";")
-        for row in reader:
-            # The Wiener Linien OGD CSV schema migrated (PR #1442): the
-            # legacy data.wien.gv.at proxy export keyed on NAME /
-            # WGS84_LAT / WGS84_LON; the canonical wienerlinien.at
-            # OGD-Echtzeit export that replaced it renames those to
-            # StopText / Latitude / Longitude and exposes the DIVA. Read
-            # the new names first and fall back to the legacy ones so the
-            # loader survives either upstream shape (mirrors the fuzzy-key
-            # resilience in scripts/update_wl_stations.py).
-            name = row.get("StopText") or row.get("NAME")
-            if name:
-                name = _harmonize_station_name(name)
-            lat = _coerce_float_value(row.get("Latitude") or row.get("WGS84_LAT"))
-            lon = _coerce_float_value(row.get("Longitude") or row.get("WGS84_LON"))
-            if lat is None or lon is None:
-                continue
-            diva = (row.get("DIVA") or "").strip()
-            if diva:
-                _store_location(locations, _wl_diva_key(diva), lat, lon, source="wl")
-            if not name:
-                continue
-            for key in _normalize_location_keys(name):
-                if not key:
+        with open_capped_csv(
+            path,
+            MAX_CSV_LOCATIONS_BYTES,
+            encoding="utf-8",
+            delimiter=";",
+            label="WL haltepunkte",
+            logger=logger,
+        ) as reader:
+            if reader is None:
+                return locations
+            for row in reader:
+                # The Wiener Linien OGD CSV schema migrated (PR #1442): the
+                # legacy data.wien.gv.at proxy export keyed on NAME /
+                # WGS84_LAT / WGS84_LON; the canonical wienerlinien.at
+                # OGD-Echtzeit export that replaced it renames those to
+                # StopText / Latitude / Longitude and exposes the DIVA. Read
+                # the new names first and fall back to the legacy ones so the
+                # loader survives either upstream shape (mirrors the fuzzy-key
+                # resilience in scripts/update_wl_stations.py).
+                name = row.field("StopText") or row.field("NAME")
+                if name:
+                    name = _harmonize_station_name(name)
+                lat = _coerce_float_value(row.field("Latitude") or row.field("WGS84_LAT"))
+                lon = _coerce_float_value(row.field("Longitude") or row.field("WGS84_LON"))
+                if lat is None or lon is None:
+                    continue
+                diva = (row.field("DIVA") or "").strip()
+                if diva:
+                    _store_location(locations, _wl_diva_key(diva), lat, lon, source="wl")
+                if not name:
                     continue
-                _store_location(locations, key, lat, lon, source="wl")
+                for key in _normalize_location_keys(name):
+                    if not key:
+                        continue
+                    _store_location(locations, key, lat, lon, source="wl")
     except csv.Error as exc:
         logger.warning(
             "Could not parse Wiener Linien haltepunkte file [path-sha256=%s]: %s",
@@ -644,32 +644,30 @@ def _load_vor_locations(path: Path) -> dict[str, LocationInfo]:
         )
         return locations
     # Security: see _load_gtfs_locations for the canonical CSV
-    # size-bomb defence shape (read_capped_text + io.StringIO).
-    content = read_capped_text(
-        path,
-        MAX_CSV_LOCATIONS_BYTES,
-        encoding="utf-8-sig",
-        label="VOR stops",
-        logger=logger,
-    )
-    if content is None:
-        return locations
+    # size-bomb defence shape (open_capped_csv). The delimiter is
+    # sniffed once from the leading sample.
     try:
-        sample = content[:4096]
-        delimiter = _detect_csv_delimiter(sample)
-        reader = csv.DictReader(io.StringIO(content), delimiter=delimiter)
-        for row in reader:
-            name = row.get("StopPointName") or row.get("Name") or row.get("StopName")
-            if name:
-                name = _harmonize_station_name(name)
-            lat = _coerce_float_value(row.get("Latitude") or row.get("WGS84_LAT"))
-            lon = _coerce_float_value(row.get("Longitude") or row.get("WGS84_LON"))
-            if not name or lat is None or lon is None:
-                continue
-            for key in _normalize_location_keys(name):
-                if not key:
+        with open_capped_csv(
+            path,
+            MAX_CSV_LOCATIONS_BYTES,
+            encoding="utf-8-sig",
+            label="VOR stops",
+            logger=logger,
+        ) as reader:
+            if reader is None:
+                return locations
+            for row in reader:
+                name = row.field("StopPointName") or row.field("Name") or row.field("StopName")
+                if name:
+                    name = _harmonize_station_name(name)
+                lat = _coerce_float_value(row.field("Latitude") or row.field("WGS84_LAT"))
+                lon = _coerce_float_value(row.field("Longitude") or row.field("WGS84_LON"))
+                if not name or lat is None or lon is None:
                     continue
-                _store_location(locations, key, lat, lon, source="vor")
+                for key in _normalize_location_keys(name):
+                    if not key:
+                        continue
+                    _store_location(locations, key, lat, lon, source="vor")
     except csv.Error as exc:
         logger.warning(
             "Could not parse VOR stops file [path-sha256=%s]: %s",
@@ -687,46 +685,69 @@ def _build_location_index(
     wl_path: Path | None,
     vor_path: Path | None = None,
 ) -> dict[str, LocationInfo]:
-    locations: dict[str, LocationInfo] = {}
-    if gtfs_path:
-        locations.update(_load_gtfs_locations(gtfs_path))
-    if wl_path:
-        wl_locations = _load_wienerlinien_locations(wl_path)
-        for key, value in wl_locations.items():
-            _store_location(locations, key, value.latitude, value.longitude, source="wl")
-    if vor_path:
-        vor_locations = _load_vor_locations(vor_path)
-        for key, value in vor_locations.items():
-            # GTFS/WL already populated entries take precedence (more authoritative
-            # for transit-platform coords); VOR fills gaps for stations that are
-            # neither in the local GTFS snapshot nor in the WL haltepunkte CSV.
-            if key not in locations:
-                _store_location(locations, key, value.latitude, value.longitude, source="vor")
+    return _merge_location_index(
+        _load_gtfs_locations(gtfs_path) if gtfs_path else {},
+        _load_wienerlinien_locations(wl_path) if wl_path else {},
+        _load_vor_locations(vor_path) if vor_path else {},
+    )
+
+
+def _merge_location_index(
+    gtfs_locations: Mapping[str, LocationInfo],
+    wl_locations: Mapping[str, LocationInfo],
+    vor_locations: Mapping[str, LocationInfo],
+) -> dict[str, LocationInfo]:
+    """Combine the per-source lookups in GTFS → WL → VOR precedence order.
+
+    Split from :func:`_build_location_index` so the three CSV loads can run
+    concurrently (see :func:`load_directory_sources`) while the merge
+    order — and therefore the resulting index — stays deterministic.
+    """
+    locations: dict[str, LocationInfo] = dict(gtfs_locations)
+    for key, value in wl_locations.items():
+        _store_location(locations, key, value.latitude, value.longitude, source="wl")
+    for key, value in vor_locations.items():
+        # GTFS/WL already populated entries take precedence (more authoritative
+        # for transit-platform coords); VOR fills gaps for stations that are
+        # neither in the local GTFS snapshot nor in the WL haltepunkte CSV.
+        if key not in locations:
+            _store_location(locations, key, value.latitude, value.longitude, source="vor")
     return locations
 
 
-def _load_existing_station_entries(
-    path: Path,
-) -> tuple[dict[str, dict[str, object]], list[dict[str, object]]]:
+def _read_existing_payload(path: Path) -> object:
+    """Return the raw previous directory payload, or ``None`` when unusable."""
     if not path.exists():
-        return {}, []
+        return None
     # Security: ``read_capped_json`` enforces both the depth-bomb catch
     # tuple and the byte-size cap (see MAX_JSON_FILE_BYTES). Without
     # the cap a wide-but-flat planted file would propagate
     # ``MemoryError`` past the loader and crash the cron pipeline.
-    payload = read_capped_json(
-        path,
-        MAX_JSON_FILE_BYTES,
-        label="Existing station directory",
-    )
+    payload = read_capped_json(path, MAX_JSON_FILE_BYTES, label="Existing station directory")
     if payload is None:
         logger.warning(
             "Could not parse existing station directory "
             "[path-sha256=%s] (missing/invalid/oversized)",
             _path_fingerprint(path),
         )
-        return {}, []
+    return payload
+
+
+def _load_existing_station_entries(
+    path: Path,
+) -> tuple[dict[str, dict[str, object]], list[dict[str, object]]]:
+    return _split_existing_station_entries(_read_existing_payload(path))
 
+
+def _split_existing_station_entries(
+    payload: object,
+) -> tuple[dict[str, dict[str, object]], list[dict[str, object]]]:
+    """Split an existing directory payload into ÖBB-workbook and manual entries.
+
+    Returns ``(mapping, manual_stations)``: *mapping* keys the entries the
+    next workbook pull merges into by normalised ``bst_id``; every other
+    entry is preserved verbatim in *manual_stations*.
+    """
     if isinstance(payload, dict):
         payload = payload.get("stations", [])
 
@@ -866,22 +887,6 @@ def _looks_like_vienna(text: str | None) -> bool:
     return not normalized[4].isalpha()
 
 
-def _detect_csv_delimiter(sample: str) -> str:
-    semicolons = sample.count(";")
-    commas = sample.count(",")
-    if semicolons >= commas and semicolons:
-        return ";"
-    if commas:
-        return ","
-    return ";"
-
-
-def _normalize_csv_key(value: str | None) -> str:
-    if value is None:
-        return ""
-    return re.sub(r"[^a-z0-9]+", "", value.casefold())
-
-
 def _parse_included_types(raw: str | None) -> list[str]:
     if raw is None:
         return list(DEFAULT_INCLUDED_TYPES)
@@ -1425,51 +1430,49 @@ def _enrich_with_google_places(
     )
 
 
-class _NormalizedCSVRow:
-    def __init__(self, row: Mapping[str, str | None]):
-        self._row = row
-        self._map = {_normalize_csv_key(key): key for key in row if key}
-
-    def get(self, *candidates: str) -> str:
-        for candidate in candidates:
-            key = self._map.get(_normalize_csv_key(candidate))
-            if key is None:
-                continue
-            value = self._row.get(key)
-            if value is None:
-                continue
-            text = str(value).strip()
-            if text:
-                return text
-        return ""
-
-
-def _iter_vor_rows(path: Path) -> Iterable[_NormalizedCSVRow]:
+def _iter_vor_rows(path: Path) -> Iterator[CsvRow]:
     # Security: see _load_gtfs_locations / MAX_CSV_LOCATIONS_BYTES for
-    # the canonical CSV size-bomb defence shape (read_capped_text +
-    # io.StringIO). FileNotFoundError is propagated so the caller's
-    # legacy "file not found" log path remains intact.
+    # the canonical CSV size-bomb defence shape (open_capped_csv).
+    # FileNotFoundError is propagated so the caller's legacy "file not
+    # found" log path remains intact.
     if not path.exists():
         raise FileNotFoundError(str(path))
-    content = read_capped_text(
+    with open_capped_csv(
         path,
         MAX_CSV_LOCATIONS_BYTES,
         encoding="utf-8-sig",
         label="VOR stops",
         logger=logger,
-    )
-    if content is None:
-        return
-    sample = content[:4096]
-    delimiter = _detect_csv_delimiter(sample)
-    reader = csv.DictReader(io.StringIO(content), delimiter=delimiter)
-    for row in reader:
-        yield _NormalizedCSVRow({key or "": value for key, value in row.items()})
+    ) as reader:
+        if reader is None:
+            return
+        yield from reader
 
 
 def load_vor_stops(path: Path) -> list[VORStop]:
+    stops: dict[str, VORStop] = {}
     try:
-        rows = list(_iter_vor_rows(path))
+        for row in _iter_vor_rows(path):
+            vor_id = row.get(
+                "StopPointId",
+                "StopID",
+                "Stop_Id",
+                "StopPoint",
+                "ID",
+            )
+            if not vor_id:
+                continue
+            name = row.get("StopPointName", "Name", "StopName", "Bezeichnung")
+            if not name:
+                continue
+            municipality = row.get("Municipality", "Gemeinde", "City", "Ort") or None
+            short_name = row.get("StopPointShortName", "ShortName", "Kurzname") or None
+            stops[vor_id] = VORStop(
+                vor_id=vor_id,
+                name=name,
+                municipality=municipality,
+                short_name=short_name,
+            )
     except FileNotFoundError:
         logger.info(
             "VOR stops file not found: [path-sha256=%s]",
@@ -1484,29 +1487,6 @@ def load_vor_stops(path: Path) -> list[VORStop]:
         )
         return []
 
-    stops: dict[str, VORStop] = {}
-    for row in rows:
-        vor_id = row.get(
-            "StopPointId",
-            "StopID",
-            "Stop_Id",
-            "StopPoint",
-            "ID",
-        )
-        if not vor_id:
-            continue
-        name = row.get("StopPointName", "Name", "StopName", "Bezeichnung")
-        if not name:
-            continue
-        municipality = row.get("Municipality", "Gemeinde", "City", "Ort") or None
-        short_name = row.get("StopPointShortName", "ShortName", "Kurzname") or None
-        stops[vor_id] = VORStop(
-            vor_id=vor_id,
-            name=name,
-            municipality=municipality,
-            short_name=short_name,
-        )
-
     if not stops:
         logger.info(
             "No VOR stops extracted from [path-sha256=%s]",
@@ -1713,7 +1693,7 @@ def _harmonize_station_names(
         station.name = _harmonize_station_name(station.name)
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Download the ÖBB station directory and export a JSON mapping",
     )
@@ -1805,7 +1785,7 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print progress information during the update run",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def configure_logging(verbose: bool) -> None:
@@ -2002,6 +1982,11 @@ def extract_stations(workbook_stream: BytesIO) -> list[Station]:
         raise ValueError("Invalid workbook file") from exc
 
     workbook_stream.seek(0)
+    # Imported here: openpyxl (+ its lxml/et_xmlfile stack) is only needed
+    # when a fresh workbook is parsed, not for ``--help`` or the
+    # cached-snapshot paths of the station stage graph.
+    import openpyxl
+
     workbook = openpyxl.load_workbook(workbook_stream, data_only=True, read_only=True)
     try:
         worksheet = workbook.active
@@ -2504,7 +2489,7 @@ def write_json(stations_list: list[dict[str, object]], output_path: Path) -> Non
     serialisable = scrubbed if isinstance(scrubbed, list) else stations_list
     payload = {"stations": serialisable}
     # Use atomic_write to prevent partial writes and reduce race conditions.
-    with atomic_write(output_path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+    with atomic_write(output_path, mode="w", encoding="utf-8", permissions=0o644, skip_unchanged=True) as handle:
         json.dump(payload, handle, ensure_ascii=False, indent=2, allow_nan=False)
         handle.write("\n")
     logger.info("Wrote [path-sha256=%s]", _path_fingerprint(output_path))
@@ -2538,39 +2523,92 @@ def _station_directory_floor_violation(*, new_oebb: int, existing_oebb: int) ->
     return None
 
 
-def main() -> None:
-    args = parse_args()
-    configure_logging(args.verbose)
-    _refresh_provider_caches()
-    existing_entries, manual_stations = _load_existing_station_entries(args.output)
-    workbook_stream = download_workbook(args.source_url)
-    stations = extract_stations(workbook_stream)
+# Upper bound for the concurrent source loads in :func:`load_directory_sources`.
+# The work is I/O-bound (one HTTPS download plus local CSV/JSON parsing), so
+# one thread per independent input is enough.
+SOURCE_LOAD_WORKERS = 8
+
+
+@dataclass
+class DirectorySources:
+    """Upstream inputs of the directory build, loaded independently of each other."""
+
+    workbook_stations: list[Station]
+    location_index: dict[str, LocationInfo]
+    pendler_ids: set[str]
+    pendler_name_candidates: set[str]
+    vor_stops: list[VORStop]
+    vor_name_map: dict[str, str]
+    geonetz_lookup: dict[str, dict[str, object]]
+
+
+def load_directory_sources(args: argparse.Namespace, executor: Executor) -> DirectorySources:
+    """Load every directory input concurrently on *executor*.
+
+    The workbook download, the GTFS / WL / VOR coordinate CSVs, the VOR stop
+    list, the pendler lists and the GeoNetz stops do not depend on each
+    other, so they are submitted together and joined here. The location
+    index is merged afterwards in the fixed GTFS → WL → VOR order. Must be
+    called from outside *executor*'s worker threads: it blocks on the
+    futures it submits.
+    """
+    vor_path: Path | None = args.vor_stops
+    workbook = executor.submit(lambda: extract_stations(download_workbook(args.source_url)))
+    gtfs = executor.submit(_load_gtfs_locations, args.gtfs_stops) if args.gtfs_stops else None
+    wl = executor.submit(_load_wienerlinien_locations, args.wl_haltepunkte) if args.wl_haltepunkte else None
+    vor_locations = executor.submit(_load_vor_locations, vor_path) if vor_path else None
+    vor_stops = executor.submit(load_vor_stops, vor_path) if vor_path else None
+    # vor-haltestellen.mapping.json sits next to the .csv (same stem,
+    # ``.mapping.json`` suffix) and is produced by fetch_vor_haltestellen.
+    vor_name_map = executor.submit(_load_vor_name_to_id_map, vor_path.with_suffix(".mapping.json")) if vor_path else None
+    pendler_ids = executor.submit(load_pendler_station_ids, args.pendler)
+    pendler_names = executor.submit(load_pendler_name_candidates, args.pendler_candidates)
+    geonetz = executor.submit(_load_geonetz_stops, args.geonetz_stops)
+    return DirectorySources(
+        workbook_stations=workbook.result(),
+        location_index=_merge_location_index(
+            gtfs.result() if gtfs else {},
+            wl.result() if wl else {},
+            vor_locations.result() if vor_locations else {},
+        ),
+        pendler_ids=pendler_ids.result(),
+        pendler_name_candidates=pendler_names.result(),
+        vor_stops=vor_stops.result() if vor_stops else [],
+        vor_name_map=vor_name_map.result() if vor_name_map else {},
+        geonetz_lookup=geonetz.result(),
+    )
+
+
+def build_station_directory(
+    args: argparse.Namespace,
+    existing_payload: object,
+    sources: DirectorySources,
+) -> list[dict[str, object]]:
+    """Build the station directory from preloaded *sources*.
+
+    *existing_payload* is the previous directory (wrapped or bare list, as
+    read from ``stations.json``); its manual entries are carried over and
+    its ÖBB entries seed the name harmonisation. Both the payload's entries
+    and the workbook ``Station`` objects in *sources* are enriched in place.
+    Raises ``SystemExit`` when the result would trip the data-loss floor.
+    Shared by :func:`main` and the in-process stage graph in
+    ``scripts/update_all_stations.py``.
+    """
+    existing_entries, manual_stations = _split_existing_station_entries(existing_payload)
+    stations = list(sources.workbook_stations)
     _harmonize_station_names(stations, existing_entries)
     _restore_existing_metadata(stations, existing_entries)
-    pendler_ids = load_pendler_station_ids(path=args.pendler)
-    pendler_name_candidates = load_pendler_name_candidates(path=args.pendler_candidates)
-    location_index = _build_location_index(
-        args.gtfs_stops,
-        args.wl_haltepunkte,
-        vor_path=args.vor_stops,
-    )
+    location_index = sources.location_index
     if not location_index:
         logger.warning("No coordinate data available; falling back to name heuristic")
     _annotate_station_flags(
         stations,
-        pendler_ids,
+        sources.pendler_ids,
         location_index,
-        pendler_name_candidates=pendler_name_candidates,
+        pendler_name_candidates=sources.pendler_name_candidates,
     )
-    vor_stops = load_vor_stops(args.vor_stops) if args.vor_stops else []
-    vor_name_map: dict[str, str] = {}
-    if args.vor_stops:
-        # vor-haltestellen.mapping.json sits next to the .csv (same stem,
-        # ``.mapping.json`` suffix) and is produced by fetch_vor_haltestellen.
-        mapping_candidate = args.vor_stops.with_suffix(".mapping.json")
-        vor_name_map = _load_vor_name_to_id_map(mapping_candidate)
-    if vor_stops or vor_name_map:
-        _assign_vor_ids(stations, vor_stops, name_to_vor_id=vor_name_map)
+    if sources.vor_stops or sources.vor_name_map:
+        _assign_vor_ids(stations, sources.vor_stops, name_to_vor_id=sources.vor_name_map)
     stations = _filter_relevant_stations(stations)
 
     # GeoNetz metadata enrichment (PR β). Runs after the filter so it
@@ -2578,9 +2616,8 @@ def main() -> None:
     # Google so downstream enrichment tiers see the eva_nr that PR γ
     # (planned: HAFAS-drift-detection) needs as the join key. Idempotent
     # — re-runs leave previously-set values alone.
-    geonetz_lookup = _load_geonetz_stops(args.geonetz_stops)
-    if geonetz_lookup:
-        _enrich_with_geonetz(stations, geonetz_lookup)
+    if sources.geonetz_lookup:
+        _enrich_with_geonetz(stations, sources.geonetz_lookup)
 
     # OSM is now the primary directory enrichment source. Google Places
     # only runs as a *fallback* when at least one station is still
@@ -2698,7 +2735,17 @@ def main() -> None:
             f"[path-sha256={_path_fingerprint(args.output)}]: {floor_violation}"
         )
 
-    write_json(final_stations, args.output)
+    return final_stations
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    configure_logging(args.verbose)
+    _refresh_provider_caches()
+    existing_payload = _read_existing_payload(args.output)
+    with ThreadPoolExecutor(max_workers=SOURCE_LOAD_WORKERS) as executor:
+        sources = load_directory_sources(args, executor)
+    write_json(build_station_directory(args, existing_payload, sources), args.output)
 
 
 if __name__ == "__main__":
@@ -15,6 +15,7 @@ if str(REPO_ROOT) not in sys.path:
 from src.feed.logging_safe import setup_script_logging  # noqa: E402
 from src.providers.wiener_linien import fetch_events  # noqa: E402  (import after path setup)
 from src.utils.cache import DataDegradationError, write_cache  # noqa: E402
+from src.utils.profiling import run_profiled_main  # noqa: E402
 from src.utils.serialize import serialize_for_cache  # noqa: E402
 
 
@@ -60,7 +61,7 @@ def main() -> int:
 
     serialized_items = [serialize_for_cache(item) for item in items]
     try:
-        write_cache("wl", serialized_items)
+        changed = write_cache("wl", serialized_items)
     except DataDegradationError:
         # ``write_cache`` refuses not only an empty payload but also a
         # drastically smaller one (< 20 % of the existing cache) to avoid
@@ -72,9 +73,12 @@ def main() -> int:
             len(serialized_items),
         )
         return 1
+    if not changed:
+        logger.info("Wiener Linien cache with %d events unchanged; file left as is.", len(serialized_items))
+        return 0
     logger.info("Updated Wiener Linien cache with %d events.", len(serialized_items))
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(run_profiled_main("update_wl_cache", main))
@@ -12,7 +12,6 @@ replaced on subsequent runs.
 from __future__ import annotations
 
 import argparse
-import csv
 import hashlib
 import json
 import logging
@@ -23,9 +22,12 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from importlib import import_module
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 
+if TYPE_CHECKING:
+    from src.utils.files import CsvRow
+
 
 def _path_fingerprint(path: Path) -> str:
     """Return a one-way SHA-256 fingerprint of ``str(path)`` (12 hex chars).
@@ -76,12 +78,12 @@ def _load_read_capped_json() -> Callable[..., Any]:
     return cast(Callable[..., Any], module.read_capped_json)
 
 
-def _load_read_capped_text() -> Callable[..., Any]:
+def _load_open_capped_csv() -> Callable[..., Any]:
     base_dir = _project_root()
     if str(base_dir) not in sys.path:
         sys.path.insert(0, str(base_dir))
     module = import_module("src.utils.files")
-    return cast(Callable[..., Any], module.read_capped_text)
+    return cast(Callable[..., Any], module.open_capped_csv)
 
 
 def _load_scrub_trojan_source_primitives() -> Callable[..., Any]:
@@ -147,7 +149,7 @@ BASE_DIR = _project_root()
 is_in_vienna = _load_is_in_vienna()
 atomic_write = _load_atomic_write()
 read_capped_json = _load_read_capped_json()
-read_capped_text = _load_read_capped_text()
+open_capped_csv = _load_open_capped_csv()
 scrub_trojan_source_primitives = _load_scrub_trojan_source_primitives()
 get_bool_env = _load_get_bool_env()
 sanitize_log_arg = _load_sanitize_log_arg()
@@ -166,8 +168,8 @@ MAX_JSON_FILE_BYTES = 50 * 1024 * 1024
 # CSV size-bomb axis: ``_dict_reader`` previously fed the operator-
 # supplied haltestellen / haltepunkte CSVs into ``csv.DictReader(handle)``
 # directly, letting ``handle.readline()`` buffer GiB-sized single-line
-# payloads. Routes through ``read_capped_text`` -> ``io.StringIO`` to
-# bound the allocation.
+# payloads. Routes through ``open_capped_csv``, which enforces the cap
+# incrementally while streaming rows.
 MAX_WL_CSV_BYTES = 50 * 1024 * 1024
 DEFAULT_HALTEPUNKTE = BASE_DIR / "data" / "wienerlinien-ogd-haltepunkte.csv"
 DEFAULT_HALTESTELLEN = BASE_DIR / "data" / "wienerlinien-ogd-haltestellen.csv"
@@ -444,27 +446,6 @@ def _normalize_key(value: str | None) -> str:
     return re.sub(r"[^a-z0-9]+", "", value.casefold())
 
 
-class NormalizedRow:
-    """Wrapper around a CSV row that allows fuzzy column access."""
-
-    def __init__(self, row: dict[str, str | None]):
-        self._row = row
-        self._map = {_normalize_key(key): key for key in row if key}
-
-    def get(self, *candidates: str) -> str:
-        for candidate in candidates:
-            key = self._map.get(_normalize_key(candidate))
-            if key is None:
-                continue
-            value = self._row.get(key)
-            if value is None:
-                continue
-            text = str(value).strip()
-            if text:
-                return text
-        return ""
-
-
 def _coerce_float(value: str) -> float | None:
     if not value:
         return None
@@ -499,25 +480,22 @@ class Haltepunkt:
     longitude: float | None
 
 
-def _dict_reader(path: Path) -> Iterator[NormalizedRow]:
+def _dict_reader(path: Path) -> Iterator[CsvRow]:
     # Security: see ``MAX_WL_CSV_BYTES`` for the canonical CSV size-
-    # bomb defence shape (``read_capped_text`` -> ``io.StringIO`` ->
-    # ``csv.DictReader``). FileNotFoundError is raised explicitly so
-    # downstream callers can keep their existing ``except
-    # FileNotFoundError`` branches; oversized files are silently
-    # treated as missing (read_capped_text logs a warning).
-    import io
+    # bomb defence shape (``open_capped_csv`` streams rows under the
+    # byte cap). FileNotFoundError is raised explicitly so downstream
+    # callers can keep their existing ``except FileNotFoundError``
+    # branches; oversized files are silently treated as missing
+    # (open_capped_csv logs a warning).
     if not path.exists():
         raise FileNotFoundError(str(path))
-    content = read_capped_text(
+    with open_capped_csv(
         path, MAX_WL_CSV_BYTES,
-        encoding="utf-8-sig", label="WL CSV", logger=log,
-    )
-    if content is None:
-        return
-    reader = csv.DictReader(io.StringIO(content), delimiter=";")
-    for row in reader:
-        yield NormalizedRow({key or "": value for key, value in row.items()})
+        encoding="utf-8-sig", delimiter=";", label="WL CSV", logger=log,
+    ) as reader:
+        if reader is None:
+            return
+        yield from reader
 
 
 def load_haltestellen(path: Path) -> dict[str, Haltestelle]:
@@ -1613,53 +1591,20 @@ def _reconcile_at_overlap(
         )
 
 
-def merge_into_stations(
-    stations_path: Path,
+def merge_wl_entries(
+    existing: list[dict[str, object]],
     wl_entries: list[dict[str, Any]],
     *,
     reconcile: Callable[[list[dict[str, object]]], None] | None = None,
-) -> None:
-    # Security: ``read_capped_json`` enforces both the depth-bomb catch
-    # tuple and the byte-size cap (see MAX_JSON_FILE_BYTES). The
-    # depth-bomb-only catch missed ``MemoryError`` (a ``BaseException``
-    # subclass) — a planted-huge stations.json would propagate past
-    # the loader and crash the WL merge. On miss we start fresh and
-    # let the merge restore the canonical schema for the next run.
-    raw_data: object
-    if stations_path.exists():
-        loaded = read_capped_json(
-            stations_path, MAX_JSON_FILE_BYTES, label="Stations", logger=log,
-        )
-        if loaded is None:
-            log.warning(
-                "stations.json could not be parsed (missing/invalid/oversized)"
-                " – starting WL merge from empty state",
-            )
-            raw_data = []
-        else:
-            raw_data = loaded
-    else:
-        raw_data = []
-
-    existing: list[dict[str, object]] = []
-
-    if isinstance(raw_data, list):
-        existing = raw_data
-    elif isinstance(raw_data, dict) and isinstance(raw_data.get("stations"), list):
-        existing = raw_data["stations"]
-    else:
-        raise ValueError("stations.json must contain a JSON array or a dict with a 'stations' array")
-
-    # Drop non-dict elements before the merge loop below calls ``entry.get(...)``.
-    # read_capped_json validates only the TOP-LEVEL type, so a structurally
-    # valid but malformed file (``[1, 2, "x"]`` / ``{"stations": ["foo"]}`` — a
-    # corrupted previous run or a parallel atomic state swap, the documented
-    # threat model) would otherwise raise an uncaught AttributeError and abort
-    # the cron pipeline (the orchestrator runs this via ``subprocess(check=True)``).
-    # Mirrors update_all_stations._load_stations and the sibling NaN/size/depth
-    # defences in this file, which degrade gracefully instead of crashing.
-    existing = [entry for entry in existing if isinstance(entry, dict)]
-
+) -> list[dict[str, object]] | None:
+    """Merge *wl_entries* into the *existing* station list.
+
+    Returns the merged list, or ``None`` when the merge would drop every
+    existing WL station without replacement (the data-loss floor below).
+    Entries of *existing* may be updated in place. Shared by
+    :func:`merge_into_stations` and the in-process stage graph in
+    ``scripts/update_all_stations.py``.
+    """
     filtered: list[dict[str, object]] = []
     vor_index: dict[str, dict[str, object]] = {}
     bst_index: dict[str, dict[str, object]] = {}
@@ -1715,12 +1660,10 @@ def merge_into_stations(
     # so the depth-bomb / fresh-start path still writes through.
     if not wl_entries and len(filtered) < len(existing):
         log.error(
-            "No WL entries to merge but %d existing WL station(s) would be "
-            "deleted — refusing to overwrite stations [path-sha256=%s].",
+            "No WL entries to merge but %d existing WL station(s) would be deleted.",
             len(existing) - len(filtered),
-            _path_fingerprint(stations_path),
         )
-        return
+        return None
 
     unmatched: list[dict[str, object]] = []
     for payload in wl_entries:
@@ -1765,6 +1708,63 @@ def merge_into_stations(
     # network-backed pass behind the ``WIEN_OEPNV_AT_RECONCILE`` gate.
     if reconcile is not None:
         reconcile(filtered)
+    return filtered
+
+
+def merge_into_stations(
+    stations_path: Path,
+    wl_entries: list[dict[str, Any]],
+    *,
+    reconcile: Callable[[list[dict[str, object]]], None] | None = None,
+) -> None:
+    # Security: ``read_capped_json`` enforces both the depth-bomb catch
+    # tuple and the byte-size cap (see MAX_JSON_FILE_BYTES). The
+    # depth-bomb-only catch missed ``MemoryError`` (a ``BaseException``
+    # subclass) — a planted-huge stations.json would propagate past
+    # the loader and crash the WL merge. On miss we start fresh and
+    # let the merge restore the canonical schema for the next run.
+    raw_data: object
+    if stations_path.exists():
+        loaded = read_capped_json(
+            stations_path, MAX_JSON_FILE_BYTES, label="Stations", logger=log,
+        )
+        if loaded is None:
+            log.warning(
+                "stations.json could not be parsed (missing/invalid/oversized)"
+                " – starting WL merge from empty state",
+            )
+            raw_data = []
+        else:
+            raw_data = loaded
+    else:
+        raw_data = []
+
+    existing: list[dict[str, object]] = []
+
+    if isinstance(raw_data, list):
+        existing = raw_data
+    elif isinstance(raw_data, dict) and isinstance(raw_data.get("stations"), list):
+        existing = raw_data["stations"]
+    else:
+        raise ValueError("stations.json must contain a JSON array or a dict with a 'stations' array")
+
+    # Drop non-dict elements before the merge loop below calls ``entry.get(...)``.
+    # read_capped_json validates only the TOP-LEVEL type, so a structurally
+    # valid but malformed file (``[1, 2, "x"]`` / ``{"stations": ["foo"]}`` — a
+    # corrupted previous run or a parallel atomic state swap, the documented
+    # threat model) would otherwise raise an uncaught AttributeError and abort
+    # the cron pipeline (the orchestrator runs this via ``subprocess(check=True)``).
+    # Mirrors update_all_stations._load_stations and the sibling NaN/size/depth
+    # defences in this file, which degrade gracefully instead of crashing.
+    existing = [entry for entry in existing if isinstance(entry, dict)]
+
+    merged = merge_wl_entries(existing, wl_entries, reconcile=reconcile)
+    if merged is None:
+        log.error(
+            "Refusing to overwrite stations [path-sha256=%s].",
+            _path_fingerprint(stations_path),
+        )
+        return
 
     # Security (Trojan-Source / BiDi-Mark Drift Round 14, ingestion-boundary
     # defence): strip the canonical CVE-2021-42574 attack-byte union from
@@ -1789,9 +1789,9 @@ def merge_into_stations(
     # RFC 8259). The pin surfaces such a bypass as a loud
     # ``ValueError`` rather than silently corrupting the committed
     # artefact.
-    scrubbed = scrub_trojan_source_primitives(filtered)
-    serialisable = scrubbed if isinstance(scrubbed, list) else filtered
-    with atomic_write(stations_path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+    scrubbed = scrub_trojan_source_primitives(merged)
+    serialisable = scrubbed if isinstance(scrubbed, list) else merged
+    with atomic_write(stations_path, mode="w", encoding="utf-8", permissions=0o644, skip_unchanged=True) as handle:
         json.dump(
             {"stations": serialisable},
             handle,
@@ -1800,13 +1800,26 @@ def merge_into_stations(
             allow_nan=False,
         )
         handle.write("\n")
-    log.info("Wrote %d total stations", len(filtered))
+    log.info("Wrote %d total stations", len(merged))
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    args = parse_args(argv)
-    configure_logging(args.verbose)
+@dataclass(frozen=True)
+class PreparedWLEntries:
+    """WL station payloads plus the optional coordinate-reconcile pass."""
+
+    entries: list[dict[str, Any]]
+    reconcile: Callable[[list[dict[str, object]]], None] | None
+
+
+def prepare_wl_entries(args: argparse.Namespace) -> PreparedWLEntries | None:
+    """Load the WL OGD CSVs and build the WL station payloads.
 
+    Returns ``None`` (after logging why) when the CSVs are missing or
+    produce no entries, so the caller must leave ``stations.json``
+    untouched. Runs before any ``stations.json`` access, which lets the
+    in-process stage graph in ``scripts/update_all_stations.py`` load
+    the WL layer concurrently with the other upstream sources.
+    """
     if args.download:
         _download_ogd_csv(OGD_HALTESTELLEN_URL, args.haltestellen)
         _download_ogd_csv(OGD_HALTEPUNKTE_URL, args.haltepunkte)
@@ -1835,7 +1848,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         log.error(
             "A required Wiener-Linien OGD CSV is missing; aborting (return 1)."
         )
-        return 1
+        return None
 
     vor_mapping = load_vor_mapping(args.vor_mapping)
     if vor_mapping:
@@ -1853,7 +1866,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             len(haltestellen),
             len(haltepunkte),
         )
-        return 1
+        return None
 
     # Drop mislabelled stop names that resolve to a far-away station (an
     # upstream WL DIVA-grouping artefact). Without this a stop sitting at
@@ -1890,7 +1903,17 @@ def main(argv: Sequence[str] | None = None) -> int:
             "Skipping AT coordinate reconciliation (WIEN_OEPNV_AT_RECONCILE=0)"
         )
 
-    merge_into_stations(args.stations, wl_entries, reconcile=reconcile)
+    return PreparedWLEntries(entries=wl_entries, reconcile=reconcile)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    configure_logging(args.verbose)
+
+    prepared = prepare_wl_entries(args)
+    if prepared is None:
+        return 1
+    merge_into_stations(args.stations, prepared.entries, reconcile=prepared.reconcile)
     return 0
 
 
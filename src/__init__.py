@@ -2,8 +2,25 @@
 wien-oepnv main package.
 """
 
-__version__ = "0.1.0"
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
-from .build_feed import main
+__version__ = "0.1.0"
 
 __all__ = ["main"]
+
+if TYPE_CHECKING:
+    from .build_feed import main
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: ``src.main`` is resolved on first access. Importing the
+    # feed builder here eagerly made every ``src.*`` import (``src.cli``,
+    # ``src.utils.stations_validation``, the station scripts) pay for the
+    # whole feed pipeline, its HTTP stack and the provider regex sets.
+    if name == "main":
+        from .build_feed import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import html
 import inspect
@@ -11,7 +12,7 @@ import secrets
 import sys
 import xml.etree.ElementTree as ET  # nosec B405
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from concurrent.futures import (
     FIRST_COMPLETED,
     CancelledError,
@@ -21,7 +22,7 @@ from concurrent.futures import (
 )
 from datetime import datetime, timedelta, UTC
 from email.utils import format_datetime
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
 from threading import BoundedSemaphore, Lock
 from time import perf_counter
@@ -32,8 +33,9 @@ from zoneinfo import ZoneInfo
 import requests
 from dateutil import parser
 
-from .feed_types import FeedItem
+from .feed_types import FeedItem, FeedRecord, as_record
 from .feed import config as feed_config
+from .feed import changes, latency, render_cache, shards, tracing, translation_model
 from .feed.merge import deduplicate_fuzzy
 from .feed.logging import configure_logging
 from .feed.providers import (
@@ -52,6 +54,7 @@ from .feed.reporting import (
     write_feed_health_json,
 )
 
+from .utils.cancellation import CancelToken, run_with_token, token_scope
 from .utils.cache import (
     cache_modified_at,
     read_cache as _core_read_cache,
@@ -1787,6 +1790,80 @@ def _unmask_entities(text: str, mapping: dict[str, str]) -> str:
     return _UNMASK_PLACEHOLDER_RE.sub(_restore, text)
 
 
+def _load_float_translation_pipeline() -> Any:
+    """Load the float32 translation pipeline from the Hugging Face cache."""
+    from transformers import pipeline
+    # ``translation_de_to_en`` is Hugging Face's runtime shorthand
+    # for ``task="translation"`` with the language pair encoded in
+    # the task name. The transformers package enumerates the
+    # canonical tasks via ``Literal[...]`` ``@overload``\s, so the
+    # shorthand does not match any overload under mypy strict.
+    # The runtime accepts it (the docstring of ``pipeline`` lists
+    # the shorthand explicitly); keeping the literal string for
+    # spec parity and silencing the call-overload locally — the
+    # ``unused-ignore`` companion handles environments where the
+    # transformers package is loaded without overload metadata
+    # (the import-untyped branch via ``ignore_missing_imports``).
+    return pipeline(  # type: ignore[call-overload, unused-ignore]
+        "translation_de_to_en", model=_TRANSLATION_MODEL_NAME,
+    )
+
+
+def _load_quantized_translation_pipeline() -> Any:
+    """Return the int8 pipeline for ``TRANSLATION_QUANTIZE=int8``.
+
+    A verified cache (:class:`translation_model.QuantizedModelCache`) is
+    loaded directly. Otherwise the float32 model is quantized and scored
+    against the golden corpus built from the last feed and the cached EN
+    translations; it is cached when it reaches
+    :data:`translation_model.MIN_CORPUS_CHRF` and recorded as rejected
+    otherwise. Returns ``None`` whenever the build should use float32.
+    """
+    cache = translation_model.QuantizedModelCache.for_model(_TRANSLATION_MODEL_NAME)
+    try:
+        status = cache.status()
+        if status == "rejected":
+            log.info("int8-Übersetzungsmodell wurde verworfen – nutze float32.")
+            return None
+        if status == "accepted":
+            return cache.load_pipeline()
+        corpus = translation_model.golden_corpus(
+            feed_config.OUT_PATH, _load_state(), epoch=_TRANSLATION_CACHE_EPOCH
+        )
+        if len(corpus) < translation_model.MIN_CORPUS_PAIRS:
+            log.info(
+                "int8-Übersetzungsmodell: nur %d Referenzpaare – nutze float32.",
+                len(corpus),
+            )
+            return None
+        pipe = _load_float_translation_pipeline()
+        translation_model.quantize_int8(pipe.model)
+        with tracing.span("translation.verify"):
+            score = translation_model.corpus_score(
+                corpus, partial(_translate_text_attempt, pipe=pipe)
+            )
+        if score < translation_model.MIN_CORPUS_CHRF:
+            cache.reject(score=score, pairs=len(corpus))
+            log.warning(
+                "int8-Übersetzungsmodell verworfen (chrF %.3f < %.2f auf %d Paaren) – nutze float32.",
+                score, translation_model.MIN_CORPUS_CHRF, len(corpus),
+            )
+            return None
+        cache.save(pipe.model, score=score, pairs=len(corpus))
+        log.info(
+            "int8-Übersetzungsmodell verifiziert (chrF %.3f auf %d Paaren) und gespeichert.",
+            score, len(corpus),
+        )
+        return pipe
+    except Exception as exc:
+        # Security (Clear-Text-Logging Drift): broad catch — sanitise.
+        log.warning(
+            "int8-Übersetzungsmodell nicht verfügbar (%s) – nutze float32.",
+            sanitize_log_arg(str(exc)),
+        )
+        return None
+
+
 def _get_translation_pipeline() -> Any:
     """Lazily instantiate the German → English translation pipeline.
 
@@ -1795,29 +1872,26 @@ def _get_translation_pipeline() -> Any:
     original rather than crashing the build). State is held in a
     module-level dict to avoid the ``global`` declaration pattern
     CodeQL misclassifies as an unused-global write.
+
+    ``TRANSLATION_THREADS`` pins torch's thread pool first; with
+    ``TRANSLATION_QUANTIZE=int8`` the verified int8 model is preferred
+    (:func:`_load_quantized_translation_pipeline`).
     """
     if _TRANSLATION_STATE["pipeline"] is not None:
         return _TRANSLATION_STATE["pipeline"]
     if _TRANSLATION_STATE["load_failed"]:
         return None
     try:
-        from transformers import pipeline
-        # ``translation_de_to_en`` is Hugging Face's runtime shorthand
-        # for ``task="translation"`` with the language pair encoded in
-        # the task name. The transformers package enumerates the
-        # canonical tasks via ``Literal[...]`` ``@overload``\s, so the
-        # shorthand does not match any overload under mypy strict.
-        # The runtime accepts it (the docstring of ``pipeline`` lists
-        # the shorthand explicitly); keeping the literal string for
-        # spec parity and silencing the call-overload locally — the
-        # ``unused-ignore`` companion handles environments where the
-        # transformers package is loaded without overload metadata
-        # (the import-untyped branch via ``ignore_missing_imports``).
-        _TRANSLATION_STATE["pipeline"] = pipeline(  # type: ignore[call-overload, unused-ignore]
-            "translation_de_to_en", model=_TRANSLATION_MODEL_NAME,
-        )
+        translation_model.set_num_threads(feed_config.TRANSLATION_THREADS)
+        pipe = None
+        if feed_config.TRANSLATION_QUANTIZE == "int8":
+            pipe = _load_quantized_translation_pipeline()
+        variant = "int8" if pipe is not None else "float32"
+        if pipe is None:
+            pipe = _load_float_translation_pipeline()
+        _TRANSLATION_STATE["pipeline"] = pipe
         log.info(
-            "Übersetzungs-Pipeline %s geladen.", _TRANSLATION_MODEL_NAME
+            "Übersetzungs-Pipeline %s (%s) geladen.", _TRANSLATION_MODEL_NAME, variant
         )
     except Exception as exc:
         _TRANSLATION_STATE["load_failed"] = True
@@ -1862,6 +1936,7 @@ def _translate_text_attempt(
     *,
     source: str | None = None,
     category: str | None = None,
+    pipe: Any = None,
 ) -> str | None:
     """Translate ``text`` from German to English with entity preservation.
 
@@ -1891,10 +1966,14 @@ def _translate_text_attempt(
     matching ``FeedItem`` fields) drive the metadata-aware glossary
     layering in :func:`_apply_domain_glossary`: operator-specific
     vocabulary activates only when the item came from that operator.
+
+    ``pipe`` overrides the shared pipeline; the int8 verification scores
+    a candidate model through exactly this path.
     """
     if not text or not text.strip():
         return None
-    pipe = _get_translation_pipeline()
+    if pipe is None:
+        pipe = _get_translation_pipeline()
     if pipe is None:
         return None
     # Compose two mask passes:
@@ -1927,7 +2006,11 @@ def _translate_text_attempt(
         # for opus-mt-de-en) BEFORE Marian asserts and crashes the
         # whole feed build. Without it, a single long disruption text
         # would abort the EN-feed pass for every item that follows.
-        result = pipe(masked_text, max_length=512, truncation=True)
+        with tracing.span("translation.model"):
+            result = pipe(
+                masked_text, max_length=512, truncation=True,
+                **translation_model.generation_kwargs(feed_config.TRANSLATION_NUM_BEAMS),
+            )
     except Exception as exc:
         log.warning(
             "Translation failed for identity %s — pipeline raised %s: %s",
@@ -2078,6 +2161,7 @@ def _cached_translation(
     cached = en_raw.get(field)
     if isinstance(cached, str) and cached and cached != text:
         if not _RESIDUAL_PLACEHOLDER_RE.search(cached):
+            tracing.count("translation.cache_hit")
             return cached, True
         # Self-heal: a value persisted by an earlier build carries a residual
         # placeholder (the NMT model mangled it, defeating the exact-nonce
@@ -2097,6 +2181,7 @@ def _cached_translation(
             sanitize_log_arg(ident),
             sanitize_log_arg(field),
         )
+    tracing.count("translation.cache_miss")
     attempt = _translate_text_attempt(
         text, ident=ident, source=source, category=category,
     )
@@ -2220,6 +2305,7 @@ def _normalize_item_datetimes(
 MAX_STATE_FILE_BYTES = 50 * 1024 * 1024
 
 
+@tracing.traced("state.load")
 def _load_state() -> dict[str, dict[str, Any]]:
     path = validate_path(feed_config.STATE_FILE, "STATE_PATH")
     try:
@@ -2481,6 +2567,7 @@ def _write_merged_state(
         json.dump(merged_state, f, ensure_ascii=True, indent=2, sort_keys=True, allow_nan=False)
 
 
+@tracing.traced("state.save")
 def _save_state(state: dict[str, dict[str, Any]], deletions: set[str] | None = None) -> None:
     path = validate_path(feed_config.STATE_FILE, "STATE_PATH")
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -2522,6 +2609,7 @@ def _save_state(state: dict[str, dict[str, Any]], deletions: set[str] | None = N
         )
 
 
+@tracing.traced("identity")
 def _identity_for_item(item: FeedItem) -> str:
     """
     Stabile Identität unabhängig von Titel-Kosmetik.
@@ -2532,9 +2620,15 @@ def _identity_for_item(item: FeedItem) -> str:
     if item.get("_identity"):
         return str(item["_identity"])
 
-    if "_calculated_identity" in item:
-        return item["_calculated_identity"]
+    record = as_record(item)
+    if record is None:
+        return _compute_identity(item)
+    if record.identity is None:
+        record.identity = _compute_identity(item)
+    return record.identity
 
+
+def _compute_identity(item: FeedItem) -> str:
     title = item.get("title") or ""
     sa = item.get("starts_at")
     ea = item.get("ends_at")
@@ -2584,7 +2678,6 @@ def _identity_for_item(item: FeedItem) -> str:
             hashed = hashlib.sha256(raw.encode("utf-8", "surrogatepass")).hexdigest()
             result = f"{base}|H={hashed}|F={fuzzy_hash}"
 
-    item["_calculated_identity"] = result
     return result
 
 # ---------------- Pipeline ----------------
@@ -2595,15 +2688,29 @@ class _ProviderBuckets(NamedTuple):
     network_fetchers: list[Any]
     provider_names: dict[Any, str]
     provider_envs: dict[Any, str | None]
+    async_fetchers: list[Any]
+
+
+def _is_async_fetcher(fetch: Any) -> bool:
+    """``async def`` loaders (or callables with an ``async def __call__``)."""
+    if inspect.iscoroutinefunction(fetch):
+        return True
+    return callable(fetch) and not inspect.isroutine(fetch) and inspect.iscoroutinefunction(type(fetch).__call__)
 
 
 def _categorize_providers(report: RunReport) -> _ProviderBuckets:
     """Walk PROVIDERS + plugin entrypoints and split enabled fetchers into
-    cache-backed (sync) and network-backed (async) buckets, registering each
-    with the report so disabled providers still appear in the health output.
+    cache-backed (sync), network-backed (thread pool) and ``async def``
+    (event loop) buckets, registering each with the report so disabled
+    providers still appear in the health output.
+
+    Coroutine loaders always land in the async bucket, even though
+    :func:`register_provider` marks every registered loader with
+    ``_provider_cache_name``.
     """
     cache_fetchers: list[Any] = []
     network_fetchers: list[Any] = []
+    async_fetchers: list[Any] = []
     provider_names: dict[Any, str] = {}
     provider_envs: dict[Any, str | None] = {}
 
@@ -2621,18 +2728,20 @@ def _categorize_providers(report: RunReport) -> _ProviderBuckets:
     for env, fetch in provider_entries:
         provider_name = _provider_display_name(fetch, env)
         enabled = bool(feed_config.get_bool_env(env, True))
-        fetch_type = "cache" if getattr(fetch, "_provider_cache_name", None) else "network"
+        if _is_async_fetcher(fetch):
+            fetch_type, bucket = "async", async_fetchers
+        elif getattr(fetch, "_provider_cache_name", None):
+            fetch_type, bucket = "cache", cache_fetchers
+        else:
+            fetch_type, bucket = "network", network_fetchers
         report.register_provider(provider_name, enabled, fetch_type)
         if not enabled:
             continue
         provider_names[fetch] = provider_name
         provider_envs[fetch] = env
-        if getattr(fetch, "_provider_cache_name", None):
-            cache_fetchers.append(fetch)
-        else:
-            network_fetchers.append(fetch)
+        bucket.append(fetch)
 
-    return _ProviderBuckets(cache_fetchers, network_fetchers, provider_names, provider_envs)
+    return _ProviderBuckets(cache_fetchers, network_fetchers, provider_names, provider_envs, async_fetchers)
 
 
 def _run_cache_fetchers(
@@ -2651,7 +2760,8 @@ def _run_cache_fetchers(
         report.provider_started(provider_name)
         result: list[FeedItem] | None = None
         try:
-            result = fetch()
+            with tracing.span(f"provider.fetch:{provider_name}"):
+                result = fetch()
         except Exception as exc:
             log.exception("%s fetch fehlgeschlagen: %s", name, exc)
             report.provider_error(provider_name, f"Fetch fehlgeschlagen: {exc}")
@@ -2705,7 +2815,95 @@ def _build_run_fetch(
         finally:
             semaphore.release()
 
-    return _run_fetch
+    def _traced_run_fetch() -> Any:
+        # Runs in the executor thread, so the span lands on that thread.
+        started = perf_counter()
+        with tracing.span(f"provider.fetch:{provider_name}"):
+            result = _run_fetch()
+        # Only completed fetches feed the latency history; a fast failure
+        # would drag the percentiles below what a healthy fetch needs.
+        latency.observe(provider_name, perf_counter() - started, effective_timeout)
+        return result
+
+    return _traced_run_fetch
+
+
+def _adaptive_timeout(provider_name: str, static_timeout: int, report: RunReport) -> int:
+    """Tighten *static_timeout* to the provider's p99-derived deadline.
+
+    Only applies with ``PROVIDER_ADAPTIVE_TIMEOUTS`` enabled and a positive
+    static timeout; the static value stays the upper bound.
+    """
+    history = latency.active_history()
+    if history is None or not feed_config.PROVIDER_ADAPTIVE_TIMEOUTS or static_timeout <= 0:
+        return static_timeout
+    adaptive = history.adaptive_deadline(provider_name, static_timeout)
+    if adaptive is None:
+        return static_timeout
+    deadline, p99 = adaptive
+    log.debug("Provider %s nutzt adaptives Timeout von %ss (p99 %.2fs)", provider_name, deadline, p99)
+    report.record_latency_decision(provider_name, f"Timeout {deadline}s statt {static_timeout}s (p99 {p99:.2f}s)")
+    return deadline
+
+
+def _adaptive_worker_limit(provider_name: str, report: RunReport) -> int | None:
+    """Serialise a provider group whose member is on a timeout streak."""
+    history = latency.active_history()
+    if history is None or not feed_config.PROVIDER_ADAPTIVE_TIMEOUTS:
+        return None
+    limit = history.worker_limit(provider_name)
+    if limit is not None:
+        report.record_latency_decision(provider_name, f"Worker auf {limit} begrenzt (Timeout-Serie)")
+    return limit
+
+
+def _group_worker_limits(
+    fetchers: list[Any],
+    provider_names: dict[Any, str],
+    provider_envs: dict[Any, str | None],
+    report: RunReport,
+) -> dict[str, int]:
+    """Positive worker limit per concurrency group, shared by all members.
+
+    Computed across ALL fetchers before anything is submitted. Pre-fix the
+    submit loop only registered a semaphore when the CURRENT fetcher's own
+    per-provider env-limit was set, so a sibling provider in the same
+    ``concurrency_key`` group without its own env override ran unbounded —
+    silently defeating the operator-intended shared cap. If two group
+    members set different positive limits, the tighter one (``min``) wins
+    so the group respects every member's stated upper bound.
+    """
+    group_limits: dict[str, int] = {}
+    for fetch in fetchers:
+        provider_name = provider_names.get(fetch, _provider_display_name(fetch))
+        env_name = provider_envs.get(fetch)
+        concurrency_key = _provider_concurrency_key(fetch, provider_name)
+        worker_limit = _provider_worker_limit(
+            fetch, env_name, provider_name, concurrency_key
+        )
+        if worker_limit is None:
+            worker_limit = _adaptive_worker_limit(provider_name, report)
+        if worker_limit is not None and worker_limit > 0:
+            current = group_limits.get(concurrency_key)
+            group_limits[concurrency_key] = (
+                min(current, worker_limit) if current is not None else worker_limit
+            )
+    return group_limits
+
+
+def _effective_provider_timeout(
+    fetch: Any, env_name: str | None, provider_name: str, report: RunReport
+) -> int:
+    """Explicit per-provider override, else the (adaptive) global timeout."""
+    timeout_override = _provider_timeout_override(fetch, env_name, provider_name)
+    if timeout_override is None:
+        return _adaptive_timeout(provider_name, feed_config.PROVIDER_TIMEOUT, report)
+    log.debug(
+        "Provider %s nutzt Timeout-Override von %ss",
+        provider_name,
+        timeout_override,
+    )
+    return timeout_override
 
 
 def _submit_network_fetches(
@@ -2718,45 +2916,29 @@ def _submit_network_fetches(
     dict[Any, tuple[Any, str, int]],
     dict[Any, float | None],
     set[Any],
+    dict[Any, CancelToken],
 ]:
     """Submit each network fetcher to the executor with its timeout/semaphore
-    config, returning (futures-meta, deadlines, pending-set)."""
+    config, returning (futures-meta, deadlines, pending-set, cancel-tokens).
+
+    Every fetch runs with a :class:`CancelToken` carrying its deadline, so
+    ``request_safe`` inside the provider stops once the orchestrator gives
+    up on it (``src/utils/cancellation.py``).
+    """
     futures: dict[Any, tuple[Any, str, int]] = {}
     deadlines: dict[Any, float | None] = {}
     pending: set[Any] = set()
+    tokens: dict[Any, CancelToken] = {}
 
-    # Pre-compute the per-group worker limit across ALL fetchers BEFORE
-    # the main submit loop. Pre-fix the loop only registered a
-    # semaphore when the CURRENT fetcher's own per-provider env-limit
-    # was set, so a sibling provider in the same ``concurrency_key``
-    # group without its own env override ran unbounded — silently
-    # defeating the operator-intended shared cap. If two group members
-    # set different positive limits, the tighter one (``min``) wins so
-    # the group respects every member's stated upper bound.
-    group_limits: dict[str, int] = {}
-    for fetch in network_fetchers:
-        provider_name = provider_names.get(fetch, _provider_display_name(fetch))
-        env_name = provider_envs.get(fetch)
-        concurrency_key = _provider_concurrency_key(fetch, provider_name)
-        worker_limit = _provider_worker_limit(
-            fetch, env_name, provider_name, concurrency_key
-        )
-        if worker_limit is not None and worker_limit > 0:
-            current = group_limits.get(concurrency_key)
-            group_limits[concurrency_key] = (
-                min(current, worker_limit) if current is not None else worker_limit
-            )
     semaphores: dict[str, BoundedSemaphore] = {
-        key: BoundedSemaphore(limit) for key, limit in group_limits.items()
+        key: BoundedSemaphore(limit)
+        for key, limit in _group_worker_limits(network_fetchers, provider_names, provider_envs, report).items()
     }
 
     for fetch in network_fetchers:
         provider_name = provider_names.get(fetch, _provider_display_name(fetch))
         env_name = provider_envs.get(fetch)
-        timeout_override = _provider_timeout_override(fetch, env_name, provider_name)
-        effective_timeout = (
-            timeout_override if timeout_override is not None else feed_config.PROVIDER_TIMEOUT
-        )
+        effective_timeout = _effective_provider_timeout(fetch, env_name, provider_name, report)
         concurrency_key = _provider_concurrency_key(fetch, provider_name)
         worker_limit = _provider_worker_limit(
             fetch, env_name, provider_name, concurrency_key
@@ -2765,12 +2947,6 @@ def _submit_network_fetches(
         # pre-computed shared semaphore — including members whose OWN
         # ``worker_limit`` resolved to ``None``.
         semaphore: BoundedSemaphore | None = semaphores.get(concurrency_key)
-        if timeout_override is not None:
-            log.debug(
-                "Provider %s nutzt Timeout-Override von %ss",
-                provider_name,
-                timeout_override,
-            )
         if worker_limit is not None and worker_limit > 0:
             log.debug(
                 "Provider %s begrenzt Worker auf %s (Schlüssel %s)",
@@ -2792,8 +2968,10 @@ def _submit_network_fetches(
         )
 
         report.provider_started(provider_name)
-        future = executor.submit(run_fetch)
+        token = CancelToken.with_timeout(effective_timeout)
+        future = executor.submit(partial(run_with_token, token, run_fetch))
         futures[future] = (fetch, provider_name, effective_timeout)
+        tokens[future] = token
         pending.add(future)
         start_time = perf_counter()
         if effective_timeout > 0:
@@ -2801,7 +2979,7 @@ def _submit_network_fetches(
         else:
             deadlines[future] = None
 
-    return futures, deadlines, pending
+    return futures, deadlines, pending, tokens
 
 
 def _evict_expired_futures(
@@ -2811,10 +2989,12 @@ def _evict_expired_futures(
     cancelled_futures: set[Any],
     report: RunReport,
     now: float,
+    tokens: dict[Any, CancelToken] | None = None,
 ) -> None:
     """Per Apex Phase 1: poll deadlines on every loop turn so the busy-spin
     against real-time `perf_counter()` is bounded by the smallest remaining
-    timeout. Mutates ``pending`` and ``cancelled_futures`` in place.
+    timeout. Mutates ``pending`` and ``cancelled_futures`` in place and
+    cancels the evicted fetch's token so a running fetch stops as well.
     """
     expired = [
         future for future in list(pending)
@@ -2825,11 +3005,14 @@ def _evict_expired_futures(
         fetch, provider_name, timeout_value = futures[future]
         name = getattr(fetch, "__name__", str(fetch))
         log.error("%s fetch Timeout nach %ss", name, timeout_value)
+        latency.observe_timeout(provider_name)
         report.provider_error(
             provider_name,
             f"Timeout nach {timeout_value}s",
         )
         future.cancel()
+        if tokens is not None and (token := tokens.get(future)) is not None:
+            token.cancel("Timeout")
         cancelled_futures.add(future)
 
 
@@ -2839,6 +3022,7 @@ def _drain_completed_futures(
     pending: set[Any],
     report: RunReport,
     merge_result: Any,
+    tokens: dict[Any, CancelToken] | None = None,
 ) -> None:
     """Apex-Phase-1 deadline-eviction loop: alternate eviction sweep + bounded
     `wait()` until ``pending`` drains. Result handling distinguishes Timeout,
@@ -2848,7 +3032,7 @@ def _drain_completed_futures(
     cancelled_futures: set[Any] = set()
     while pending:
         now = perf_counter()
-        _evict_expired_futures(pending, futures, deadlines, cancelled_futures, report, now)
+        _evict_expired_futures(pending, futures, deadlines, cancelled_futures, report, now, tokens)
 
         if not pending:
             break
@@ -2924,6 +3108,13 @@ def _run_network_fetchers(
     """Run all network fetchers concurrently in a ThreadPoolExecutor with
     deadline-eviction-style timeout enforcement (Apex Phase 1). Pending
     futures are cancelled on early exit to free worker threads immediately.
+
+    The executor is shut down without joining: a fetch evicted at its
+    deadline may still occupy its worker until it reaches the next
+    cancellation checkpoint, but the build never waits for it. Interpreter
+    exit still does — ``concurrent.futures`` joins all worker threads at
+    shutdown — so a fetch blocked outside the checkpoints delays the end
+    of the process, not the feed.
     """
     desired_workers = len(network_fetchers)
     if feed_config.PROVIDER_MAX_WORKERS > 0:
@@ -2936,21 +3127,215 @@ def _run_network_fetchers(
         desired_workers = min(desired_workers, feed_config.PROVIDER_MAX_WORKERS)
 
     pending: set[Any] = set()
-    with ThreadPoolExecutor(max_workers=max(1, desired_workers)) as executor:
-        try:
-            futures, deadlines, pending = _submit_network_fetches(
-                executor, network_fetchers, provider_names, provider_envs, report
+    tokens: dict[Any, CancelToken] = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, desired_workers))
+    try:
+        futures, deadlines, pending, tokens = _submit_network_fetches(
+            executor, network_fetchers, provider_names, provider_envs, report
+        )
+        _drain_completed_futures(futures, deadlines, pending, report, merge_result, tokens)
+    finally:
+        # Cancel remaining futures if we exit early or with exceptions,
+        # and signal every fetch still running (evicted or abandoned).
+        for future in pending:
+            future.cancel()
+        for token in tokens.values():
+            token.cancel("Collect-Phase beendet")
+        # ``with ThreadPoolExecutor`` would ``shutdown(wait=True)`` here and
+        # block the build until a stuck fetch returned on its own.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _call_async_fetch(
+    fetch: Any, deadline: float | None, supports_timeout: bool, token: CancelToken
+) -> Any:
+    """Await *fetch* with the time left until *deadline* as its ``timeout``.
+
+    The :class:`CancelToken` is installed for the provider task, so sync
+    HTTP calls it hands to ``asyncio.to_thread`` (which copies the context)
+    are bounded by the same deadline.
+    """
+    with token_scope(token):
+        if not supports_timeout:
+            return await fetch()
+        remaining = None if deadline is None else max(deadline - asyncio.get_running_loop().time(), 0.0)
+        return await fetch(timeout=remaining)
+
+
+async def _await_async_fetch(
+    fetch: Any,
+    provider_name: str,
+    effective_timeout: int,
+    semaphore: asyncio.Semaphore | None,
+    token: CancelToken,
+) -> Any:
+    """Run one ``async def`` provider under ``asyncio.timeout``.
+
+    The wait for the group semaphore counts against the deadline, as the
+    semaphore wait does in :func:`_build_run_fetch`. A deadline hit is
+    re-raised as :class:`TimeoutError` after cancelling *token*.
+    """
+    supports_timeout = _fetch_supports_timeout(fetch)
+    deadline = asyncio.get_running_loop().time() + effective_timeout if effective_timeout > 0 else None
+    scope = asyncio.timeout_at(deadline)
+    try:
+        async with scope:
+            with tracing.span(f"provider.fetch:{provider_name}"):
+                if semaphore is None:
+                    return await _call_async_fetch(fetch, deadline, supports_timeout, token)
+                async with semaphore:
+                    return await _call_async_fetch(fetch, deadline, supports_timeout, token)
+    except TimeoutError:
+        if scope.expired():
+            token.cancel("Timeout")
+        raise
+
+
+async def _run_async_fetch(
+    fetch: Any,
+    provider_name: str,
+    effective_timeout: int,
+    semaphore: asyncio.Semaphore | None,
+    report: RunReport,
+    merge_result: Any,
+) -> None:
+    """Fetch, account and merge one ``async def`` provider.
+
+    Mirrors the result handling of :func:`_drain_completed_futures`; a
+    deadline hit is reported like a deadline eviction, whether
+    ``asyncio.timeout`` fired or a sync call in ``asyncio.to_thread``
+    raised :class:`FetchCancelled` at the token deadline first.
+    """
+    name = getattr(fetch, "__name__", str(fetch))
+    token = CancelToken.with_timeout(effective_timeout)
+    report.provider_started(provider_name)
+    started = perf_counter()
+    try:
+        result = await _await_async_fetch(fetch, provider_name, effective_timeout, semaphore, token)
+    except (TimeoutError, requests.exceptions.Timeout) as exc:
+        if token.reason == "Timeout":
+            log.error("%s fetch Timeout nach %ss", name, effective_timeout)
+            latency.observe_timeout(provider_name)
+            report.provider_error(provider_name, f"Timeout nach {effective_timeout}s")
+            return
+        sanitised = sanitize_log_arg(str(exc))
+        log.error("%s fetch Timeout: %s", name, sanitised)
+        report.provider_error(provider_name, f"Timeout: {sanitised}")
+        return
+    except Exception as exc:
+        # Security (Clear-Text-Logging Drift): see _drain_completed_futures.
+        sanitised = sanitize_log_arg(str(exc))
+        log.exception("%s fetch fehlgeschlagen: %s", name, sanitised)
+        report.provider_error(provider_name, f"Fetch fehlgeschlagen: {sanitised}")
+        return
+    latency.observe(provider_name, perf_counter() - started, effective_timeout)
+    try:
+        merge_result(fetch, result, provider_name)
+    except Exception as exc:
+        sanitised = sanitize_log_arg(str(exc))
+        log.exception("%s merge fehlgeschlagen: %s", name, sanitised)
+        report.provider_error(provider_name, f"Merge fehlgeschlagen: {sanitised}")
+
+
+async def _run_async_fetchers(
+    async_fetchers: list[Any],
+    provider_names: dict[Any, str],
+    provider_envs: dict[Any, str | None],
+    report: RunReport,
+    merge_result: Any,
+) -> None:
+    """Run all ``async def`` providers as tasks on the current event loop.
+
+    Deadlines, timeout overrides and concurrency groups resolve exactly as
+    for the thread pool (:func:`_submit_network_fetches`); a group limit
+    becomes an :class:`asyncio.Semaphore` shared by the group's tasks.
+    """
+    semaphores = {
+        key: asyncio.Semaphore(limit)
+        for key, limit in _group_worker_limits(async_fetchers, provider_names, provider_envs, report).items()
+    }
+    tasks = []
+    for fetch in async_fetchers:
+        provider_name = provider_names.get(fetch, _provider_display_name(fetch))
+        effective_timeout = _effective_provider_timeout(fetch, provider_envs.get(fetch), provider_name, report)
+        if effective_timeout == 0:
+            report.provider_started(provider_name)
+            log.error("%s fetch Timeout nach 0s", getattr(fetch, "__name__", str(fetch)))
+            report.provider_error(provider_name, "Timeout nach 0s")
+            continue
+        semaphore = semaphores.get(_provider_concurrency_key(fetch, provider_name))
+        tasks.append(
+            _run_async_fetch(fetch, provider_name, effective_timeout, semaphore, report, merge_result)
+        )
+    await asyncio.gather(*tasks)
+
+
+async def _run_async_and_network_fetchers(
+    buckets: _ProviderBuckets, report: RunReport, merge_result: Any
+) -> None:
+    """Run the async providers and, via ``asyncio.to_thread``, the thread-pool
+    path for sync network providers side by side."""
+    jobs = [
+        _run_async_fetchers(
+            buckets.async_fetchers, buckets.provider_names, buckets.provider_envs, report, merge_result
+        )
+    ]
+    if buckets.network_fetchers:
+        jobs.append(
+            asyncio.to_thread(
+                _run_network_fetchers,
+                buckets.network_fetchers,
+                buckets.provider_names,
+                buckets.provider_envs,
+                report,
+                merge_result,
             )
-            _drain_completed_futures(futures, deadlines, pending, report, merge_result)
-        finally:
-            # Cancel remaining futures if we exit early or with exceptions.
-            # executor.shutdown(wait=False, cancel_futures=True) is automatically called
-            # by the context manager's __exit__, but we explicitly cancel pending futures
-            # to free resources immediately.
-            for future in pending:
-                future.cancel()
+        )
+    await asyncio.gather(*jobs)
+
 
+def _run_provider_event_loop(buckets: _ProviderBuckets, report: RunReport, merge_result: Any) -> None:
+    """Drive :func:`_run_async_and_network_fetchers` on a private event loop.
 
+    ``merge_result`` is serialised with a lock because the thread-pool path
+    merges from its own thread. Unlike ``asyncio.run`` the loop's default
+    executor is not joined on exit (``loop.close`` shuts it down without
+    waiting), so a sync call stuck past its deadline cannot hold up the
+    build.
+    """
+    merge_lock = Lock()
+
+    def _locked_merge(fetch: Any, result: Any, provider_name: str) -> None:
+        with merge_lock:
+            merge_result(fetch, result, provider_name)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_run_async_and_network_fetchers(buckets, report, _locked_merge))
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _run_remote_fetchers(buckets: _ProviderBuckets, report: RunReport, merge_result: Any) -> None:
+    """Run the network and async providers.
+
+    Without async providers the thread pool runs on its own as before;
+    otherwise both share :func:`_run_provider_event_loop`.
+    """
+    if buckets.async_fetchers:
+        _run_provider_event_loop(buckets, report, merge_result)
+    elif buckets.network_fetchers:
+        _run_network_fetchers(
+            buckets.network_fetchers,
+            buckets.provider_names,
+            buckets.provider_envs,
+            report,
+            merge_result,
+        )
+
+
+@tracing.traced("collect")
 def _collect_items(report: RunReport | None = None) -> list[FeedItem]:
     """Run all enabled providers and merge their items into a single list.
 
@@ -2963,6 +3348,9 @@ def _collect_items(report: RunReport | None = None) -> list[FeedItem]:
          run sequentially since the bottleneck is disk I/O, not network.
        - **network fetchers** — real upstream HTTP fetches; run
          concurrently in a :class:`ThreadPoolExecutor`.
+       - **async fetchers** — ``async def`` loaders; run as tasks on one
+         event loop (:func:`_run_provider_event_loop`), next to the
+         thread pool, which then runs via ``asyncio.to_thread``.
     3. Wires up a :func:`register_cache_alert_hook` so that warnings
        emitted by the cache layer (e.g. "cache for VOR is 6h stale")
        attach to the run report instead of just logging.
@@ -3024,7 +3412,7 @@ def _collect_items(report: RunReport | None = None) -> list[FeedItem]:
     try:
         buckets = _categorize_providers(report)
 
-        if not buckets.cache_fetchers and not buckets.network_fetchers:
+        if not buckets.cache_fetchers and not buckets.network_fetchers and not buckets.async_fetchers:
             return []
 
         def _merge_result(fetch: Any, result: Any, provider_name: str) -> None:
@@ -3033,10 +3421,11 @@ def _collect_items(report: RunReport | None = None) -> list[FeedItem]:
                 log.error("%s fetch gab keine Liste zurück: %r", name, result)
                 report.provider_error(provider_name, "Ungültige Antwort (keine Liste)")
                 return
-            # Cast raw dicts to FeedItem for typing compliance after normalization
+            # Normalise the datetimes once, then wrap each item in a
+            # FeedRecord so derived values (identity, dedupe key, recency)
+            # are memoised in slots for the rest of the build.
             _normalize_item_datetimes(result)
-            typed_result = result
-            items.extend(typed_result)
+            items.extend(FeedRecord.adopt_all(result))
             count = len(result)
             if count == 0:
                 log.warning(
@@ -3061,18 +3450,15 @@ def _collect_items(report: RunReport | None = None) -> list[FeedItem]:
             else:
                 report.provider_success(provider_name, items=count)
 
+        def _traced_merge_result(fetch: Any, result: Any, provider_name: str) -> None:
+            with tracing.span(f"provider.postprocess:{provider_name}"):
+                _merge_result(fetch, result, provider_name)
+
         _run_cache_fetchers(
-            buckets.cache_fetchers, buckets.provider_names, items, report, _merge_result
+            buckets.cache_fetchers, buckets.provider_names, items, report, _traced_merge_result
         )
 
-        if buckets.network_fetchers:
-            _run_network_fetchers(
-                buckets.network_fetchers,
-                buckets.provider_names,
-                buckets.provider_envs,
-                report,
-                _merge_result,
-            )
+        _run_remote_fetchers(buckets, report, _traced_merge_result)
 
         return items
     finally:
@@ -3083,6 +3469,7 @@ def _invoke_collect_items(report: RunReport) -> list[FeedItem]:
     return _collect_items(report=report)
 
 
+@tracing.traced("age_filter")
 def _drop_old_items(
     items: list[FeedItem],
     now: datetime,
@@ -3159,6 +3546,23 @@ def _dedupe_key_for_item(
     it: FeedItem, *, warn_on_missing: bool = True
 ) -> tuple[str, bool]:
     """Return the deduplication key used for ``it`` and indicate fallback usage."""
+    record = as_record(it)
+    if record is None:
+        key, fallback = _compute_dedupe_key(it)
+    else:
+        if record.dedupe_key is None:
+            record.dedupe_key = _compute_dedupe_key(it)
+        key, fallback = record.dedupe_key
+
+    if fallback and warn_on_missing:
+        log.warning(
+            "Item ohne guid/_identity – Fallback-Schlüssel (_identity_for_item) %s",
+            key,
+        )
+    return key, fallback
+
+
+def _compute_dedupe_key(it: FeedItem) -> tuple[str, bool]:
     # Use explicit _identity if present
     if it.get("_identity"):
         return str(it.get("_identity")), False
@@ -3174,14 +3578,7 @@ def _dedupe_key_for_item(
     if guid:
         return str(guid), False
 
-    key = _identity_for_item(it)
-
-    if warn_on_missing:
-        log.warning(
-            "Item ohne guid/_identity – Fallback-Schlüssel (_identity_for_item) %s",
-            key,
-        )
-    return key, True
+    return _identity_for_item(it), True
 
 
 def _state_key_for_item(it: FeedItem) -> str:
@@ -3304,6 +3701,42 @@ def _count_new_items(
     return count
 
 
+def _dedupe_recency(it: FeedItem) -> datetime:
+    """Return a comparable timestamp describing how recent ``it`` is (memoised on records)."""
+    record = as_record(it)
+    if record is not None and record.recency is not None:
+        return record.recency
+
+    candidates: list[datetime] = []
+    for field_name in ("pubDate", "first_seen", "starts_at"):
+        value = it.get(field_name)
+        if isinstance(value, datetime):
+            candidates.append(_to_utc(value))
+        else:
+            parsed = _parse_datetime(value)
+            if isinstance(parsed, datetime):
+                candidates.append(_to_utc(parsed))
+
+    res = max(candidates) if candidates else datetime.min.replace(tzinfo=UTC)
+    if record is not None:
+        record.recency = res
+    return res
+
+
+def _dedupe_end(it: FeedItem) -> datetime:
+    """Return ``it``'s end date for the dedupe tie-break (memoised on records)."""
+    record = as_record(it)
+    if record is not None and record.end is not None:
+        return record.end
+
+    ends = it.get("ends_at")
+    res = _to_utc(ends) if isinstance(ends, datetime) else datetime.min.replace(tzinfo=UTC)
+    if record is not None:
+        record.end = res
+    return res
+
+
+@tracing.traced("dedupe.strict")
 def _dedupe_items(items: list[FeedItem]) -> list[FeedItem]:
     """
     Deduplicate items by identity/guid.
@@ -3321,56 +3754,20 @@ def _dedupe_items(items: list[FeedItem]) -> list[FeedItem]:
         A list of unique item dictionaries.
     """
 
-    def _recency_value(it: FeedItem) -> datetime:
-        """Return a comparable timestamp describing how recent ``it`` is."""
-        if "_calculated_recency" in it:
-            return it["_calculated_recency"]
-
-        candidates: list[datetime] = []
-        for field_name in ("pubDate", "first_seen", "starts_at"):
-            value = it.get(field_name)
-            if isinstance(value, datetime):
-                candidates.append(_to_utc(value))
-            else:
-                parsed = _parse_datetime(value)
-                if isinstance(parsed, datetime):
-                    candidates.append(_to_utc(parsed))
-
-        if candidates:
-            res = max(candidates)
-        else:
-            res = datetime.min.replace(tzinfo=UTC)
-
-        it["_calculated_recency"] = res
-        return res
-
-    def _end_value(it: FeedItem) -> datetime:
-        if "_calculated_end" in it:
-            return it["_calculated_end"]
-
-        ends = it.get("ends_at")
-        if isinstance(ends, datetime):
-            res = _to_utc(ends)
-        else:
-            res = datetime.min.replace(tzinfo=UTC)
-
-        it["_calculated_end"] = res
-        return res
-
     def _better(a: FeedItem, b: FeedItem) -> bool:
         """Return True if ``a`` is better than ``b`` according to recency and content."""
 
-        a_end = _end_value(a)
-        b_end = _end_value(b)
+        a_end = _dedupe_end(a)
+        b_end = _dedupe_end(b)
         if a_end > b_end:
             return True
         if a_end < b_end:
             return False
 
         # Bei gleichem Enddatum: Zuerst Aktualität, dann Länge
-        if _recency_value(a) > _recency_value(b):
+        if _dedupe_recency(a) > _dedupe_recency(b):
             return True
-        if _recency_value(a) < _recency_value(b):
+        if _dedupe_recency(a) < _dedupe_recency(b):
             return False
 
         a_len = len(a.get("description") or "")
@@ -3572,6 +3969,14 @@ def _placeholder_collides_with_formatted(
     return any(ph_content in field or ph_title in field for field in text_fields)
 
 
+# Version of the formatter output held in the persisted render cache
+# (:mod:`src.feed.render_cache`). Bump this integer whenever a change to
+# :func:`_format_item_base`, :func:`_apply_lang_overlay` or one of their
+# helpers would alter the rendered title, link, guid or description of an
+# unchanged item; every cached rendering then misses once and is rebuilt.
+_RENDER_CACHE_VERSION = 2
+
+
 class FormattedContent(NamedTuple):
     guid: str
     link: str
@@ -4003,6 +4408,63 @@ def _apply_lang_overlay(
     )
 
 
+def _render_cache_path() -> Path:
+    """The render cache lives next to the state file (``data/first_seen.render.json``)."""
+    state_path = validate_path(feed_config.STATE_FILE, "STATE_PATH")
+    return state_path.with_name(f"{state_path.stem}.render.json")
+
+
+def _save_render_cache() -> None:
+    """Persist the active render cache; a failure only costs a re-render."""
+    cache = render_cache.active_cache()
+    if cache is None:
+        return
+    log.info(
+        "Render-Cache: %d Items wiederverwendet, %d neu formatiert.",
+        cache.hits,
+        cache.misses,
+    )
+    try:
+        with tracing.span("render_cache.save"):
+            cache.save(_render_cache_path())
+    except Exception as exc:
+        # Security (Clear-Text-Logging Drift): broad catch — sanitise.
+        log.warning(
+            "Render-Cache konnte nicht gespeichert werden (%s) – nächster Lauf formatiert neu.",
+            sanitize_log_arg(str(exc)),
+        )
+
+
+def _render_inputs(
+    it: FeedItem,
+    ident: str,
+    starts_at: datetime | None,
+    ends_at: datetime | None,
+    lang: str,
+) -> list[object]:
+    """Everything :func:`_format_item_content` reads, as a render-cache key."""
+    # ``format_local_times`` renders a start date as "Ab …" while it is
+    # in the future and as "Seit …" from that day on.
+    upcoming = (
+        starts_at is not None
+        and _to_utc(starts_at).astimezone(_VIENNA_TZ).date() > datetime.now(_VIENNA_TZ).date()
+    )
+    return [
+        _RENDER_CACHE_VERSION,
+        lang,
+        _TRANSLATION_CACHE_EPOCH if lang == "en" else None,
+        ident,
+        *(it.get(field) for field in ("title", "description", "link", "guid", "source", "category")),
+        _to_utc(starts_at).isoformat() if starts_at is not None else None,
+        _to_utc(ends_at).isoformat() if ends_at is not None else None,
+        upcoming,
+        feed_config.TITLE_CHAR_LIMIT,
+        feed_config.DESCRIPTION_CHAR_LIMIT,
+        feed_config.ABSOLUTE_MAX_AGE_DAYS,
+        feed_config.FEED_LINK,
+    ]
+
+
 def _format_item_content(
     it: FeedItem,
     ident: str,
@@ -4012,6 +4474,90 @@ def _format_item_content(
     lang: str = "de",
     state: dict[str, dict[str, Any]] | None = None,
 ) -> FormattedContent:
+    """Format *it* for ``lang``, served from the active render cache when possible.
+
+    An EN entry also holds the title / summary translations the overlay
+    stored in *state*; a hit replays them (see
+    :func:`_replay_translation_record`) so the state file keeps the same
+    translation cache it would have after a fresh render.
+    """
+    cache = render_cache.active_cache()
+    key = ""
+    width = len(FormattedContent._fields)
+    if cache is not None:
+        key = render_cache.render_key(_render_inputs(it, ident, starts_at, ends_at, lang))
+        cached = cache.get(key, width + 2 if lang == "en" else width)
+        if cached is not None:
+            if lang == "en":
+                _replay_translation_record(ident, state, cached[width], cached[width + 1])
+            return FormattedContent._make(cached[:width])
+
+    base, summary, time_line = _format_item_base(it, ident, starts_at, ends_at)
+    # Extract the per-item metadata that drives glossary layering in
+    # the EN translation cascade. Both fields are normalised to
+    # ``None`` for empty / non-string values so the downstream
+    # ``_resolve_glossary`` cache key is stable across the
+    # ``None``/``""``/``"  "`` edge cases.
+    source_meta = _norm_metadata(it.get("source"))
+    category_meta = _norm_metadata(it.get("category"))
+    formatted = _apply_lang_overlay(
+        base, summary, time_line, ident, lang, state,
+        source=source_meta, category=category_meta,
+    )
+    # An EN item that fell back to the German source is retried next
+    # build instead of being pinned in the cache.
+    if cache is not None and (lang != "en" or formatted is not base):
+        record = _translation_record(ident, state) if lang == "en" else ()
+        cache.put(key, (*formatted, *record))
+    return formatted
+
+
+def _translation_record(ident: str, state: dict[str, dict[str, Any]] | None) -> tuple[str, str]:
+    """The EN ``(title, summary)`` translations :func:`_apply_lang_overlay` left in *state*."""
+    entry = state.get(ident) if state is not None and ident else None
+    translations = entry.get("translations") if isinstance(entry, dict) else None
+    en = translations.get("en") if isinstance(translations, dict) else None
+    if not isinstance(en, dict):
+        return "", ""
+    title, summary = en.get("title"), en.get("summary")
+    return (
+        title if isinstance(title, str) else "",
+        summary if isinstance(summary, str) else "",
+    )
+
+
+def _replay_translation_record(
+    ident: str, state: dict[str, dict[str, Any]] | None, title: str, summary: str
+) -> None:
+    """Apply the state writes of a successful :func:`_apply_lang_overlay` run.
+
+    Same sequence as the overlay: evict a stale epoch, store the field
+    translations where :func:`_cached_translation` keeps them, re-stamp
+    the epoch.
+    """
+    if state is None or not ident:
+        return
+    _evict_stale_translations(ident, state)
+    entry = state.setdefault(ident, {})
+    translations = entry.get("translations")
+    if not isinstance(translations, dict):
+        translations = entry["translations"] = {}
+    en = translations.get("en")
+    if not isinstance(en, dict):
+        en = translations["en"] = {}
+    for field, value in (("title", title), ("summary", summary)):
+        if value:
+            en[field] = value
+    _stamp_translation_epoch(ident, state)
+
+
+def _format_item_base(
+    it: FeedItem,
+    ident: str,
+    starts_at: datetime | None,
+    ends_at: datetime | None,
+) -> tuple[FormattedContent, str, str]:
+    """German formatting of *it*: ``(content, summary, time_line)``."""
     raw_title = it.get("title") or "Mitteilung"
     raw_desc  = it.get("description") or ""
     link = _resolve_item_link(it.get("link"), ident)
@@ -4145,17 +4691,7 @@ def _format_item_content(
         guid, link, title_cdata, desc_text_truncated, desc_cdata,
         raw_desc, title_out, desc_html,
     )
-    # Extract the per-item metadata that drives glossary layering in
-    # the EN translation cascade. Both fields are normalised to
-    # ``None`` for empty / non-string values so the downstream
-    # ``_resolve_glossary`` cache key is stable across the
-    # ``None``/``""``/``"  "`` edge cases.
-    source_meta = _norm_metadata(it.get("source"))
-    category_meta = _norm_metadata(it.get("category"))
-    return _apply_lang_overlay(
-        base, summary, time_line, ident, lang, state,
-        source=source_meta, category=category_meta,
-    )
+    return base, summary, time_line
 
 
 def _emit_item(
@@ -4309,34 +4845,17 @@ def _channel_metadata(lang: str) -> dict[str, str]:
     }
 
 
-def _make_rss(
-    items: list[FeedItem],
-    now: datetime,
-    state: dict[str, dict[str, Any]],
-    *,
-    lang: str = "de",
-) -> str:
-    """
-    Generate the full RSS XML document from a list of items using ElementTree.
-
-    Args:
-        items: List of item dictionaries.
-        now: Current timestamp.
-        state: State dictionary for tracking items.
-        lang: Target language for the output (``"de"`` or ``"en"``).
-            Drives channel metadata, ``<language>``, the atom self
-            ``href`` (``feed.xml`` vs ``feed.en.xml``) and the per-item
-            translation overlay forwarded to :func:`_emit_item`.
+def _rss_channel(
+    metadata: Mapping[str, str], feed_filename: str, last_build: str
+) -> tuple[ET.Element, ET.Element]:
+    """Build the ``<rss>`` root and its ``<channel>`` header without items.
 
-    Returns:
-        The generated RSS XML string with CDATA sections.
+    *feed_filename* is the document's path below ``PAGES_BASE_URL`` (atom
+    self link); *last_build* the pre-formatted ``lastBuildDate``.
     """
     rss = ET.Element("rss", version="2.0")
     channel = ET.SubElement(rss, "channel")
 
-    metadata = _channel_metadata(lang)
-    feed_filename = "feed.en.xml" if lang == "en" else "feed.xml"
-
     # Security: route the env-controlled FEED_TITLE / FEED_DESC through
     # the canonical ``_sanitize_text`` (``_CONTROL_RE`` strip — C0/C1
     # controls + DEL + BiDi format controls + zero-width chars + line
@@ -4375,19 +4894,13 @@ def _make_rss(
     atom_self.set("href", f"{pages_base}/{feed_filename}")
     ET.SubElement(channel, "language").text = metadata["language"]
 
-    ET.SubElement(channel, "lastBuildDate").text = _fmt_rfc2822(now)
+    ET.SubElement(channel, "lastBuildDate").text = last_build
     ET.SubElement(channel, "ttl").text = str(feed_config.FEED_TTL)
+    return rss, channel
 
-    item_replacements: dict[str, str] = {}
-    emitted = 0
-    for it in items:
-        if emitted >= feed_config.MAX_ITEMS:
-            break
-        _ident, elem, repl = _emit_item(it, now, state, lang=lang)
-        channel.append(elem)
-        item_replacements.update(repl)
-        emitted += 1
 
+def _serialize_rss(rss: ET.Element, replacements: Mapping[str, str]) -> str:
+    """Serialise the *rss* tree and inject the items' CDATA *replacements*."""
     # Pretty print the tree
     if hasattr(ET, "indent"):
         ET.indent(rss, space="  ", level=0)
@@ -4397,12 +4910,63 @@ def _make_rss(
     xml_str = xml_bytes.decode("utf-8")
 
     # Inject CDATA
-    for placeholder, cdata in item_replacements.items():
+    for placeholder, cdata in replacements.items():
         xml_str = xml_str.replace(placeholder, cdata)
-
     return cast(str, xml_str)
 
 
+def _make_rss(
+    items: list[FeedItem],
+    now: datetime,
+    state: dict[str, dict[str, Any]],
+    *,
+    lang: str = "de",
+    shard_index: shards.ShardIndex | None = None,
+) -> str:
+    """
+    Generate the full RSS XML document from a list of items using ElementTree.
+
+    Args:
+        items: List of item dictionaries.
+        now: Current timestamp.
+        state: State dictionary for tracking items.
+        lang: Target language for the output (``"de"`` or ``"en"``).
+            Drives channel metadata, ``<language>``, the atom self
+            ``href`` (``feed.xml`` vs ``feed.en.xml``) and the per-item
+            translation overlay forwarded to :func:`_emit_item`.
+        shard_index: Collects every emitted ``<item>`` under its line
+            tokens and category for :func:`_write_feed_shards`.
+
+    Returns:
+        The generated RSS XML string with CDATA sections.
+    """
+    feed_filename = "feed.en.xml" if lang == "en" else "feed.xml"
+    rss, channel = _rss_channel(_channel_metadata(lang), feed_filename, _fmt_rfc2822(now))
+
+    item_replacements: dict[str, str] = {}
+    emitted = 0
+    with tracing.span(f"render:{lang}"):
+        for it in items:
+            if emitted >= feed_config.MAX_ITEMS:
+                break
+            _ident, elem, repl = _emit_item(it, now, state, lang=lang)
+            channel.append(elem)
+            item_replacements.update(repl)
+            if shard_index is not None:
+                shard_index.add(
+                    elem,
+                    repl,
+                    lines=_parse_lines_from_title(str(it.get("title") or "")),
+                    category=it.get("category"),
+                )
+            emitted += 1
+
+    with tracing.span(f"serialize:{lang}"):
+        xml_str = _serialize_rss(rss, item_replacements)
+
+    return xml_str
+
+
 def lint() -> int:
     """Run structural checks on the aggregated feed items without writing RSS."""
     init_providers()
@@ -4524,12 +5088,138 @@ def lint() -> int:
         report.log_results()
 
 
+def _latency_history_path() -> Path:
+    """Fetch latencies persist next to the state file (``data/first_seen.latency.json``)."""
+    state_path = validate_path(feed_config.STATE_FILE, "STATE_PATH")
+    return state_path.with_name(f"{state_path.stem}.latency.json")
+
+
+def _save_latency_history() -> None:
+    """Persist the active latency history; a failure only shortens the window."""
+    history = latency.active_history()
+    if history is None:
+        return
+    try:
+        history.save(_latency_history_path())
+    except Exception as exc:
+        # Security (Clear-Text-Logging Drift): broad catch — sanitise.
+        log.warning(
+            "Latenz-Historie konnte nicht gespeichert werden (%s).",
+            sanitize_log_arg(str(exc)),
+        )
+
+
+def _save_change_log(feed_path: Path, rss: str, *, lang: str = "de") -> None:
+    """Advance the change log next to *feed_path*; a failure only costs clients a full reload."""
+    try:
+        path = validate_path(changes.change_log_path(feed_path, lang), "OUT_PATH")
+        change_log = changes.ChangeLog.load(path)
+        with tracing.span(f"changes:{lang}"):
+            batch = change_log.advance(changes.feed_entries(rss))
+            change_log.save(path)
+        if batch is not None:
+            log.info(
+                "Change-Log %s: seq %d (+%d ~%d -%d)",
+                path.name,
+                batch.seq,
+                len(batch.added),
+                len(batch.updated),
+                len(batch.removed),
+            )
+    except Exception as exc:
+        # Security (Clear-Text-Logging Drift): broad catch — sanitise.
+        log.warning(
+            "Change-Log (%s) konnte nicht geschrieben werden (%s).",
+            lang,
+            sanitize_log_arg(str(exc)),
+        )
+
+
+# Stands in for a shard's ``lastBuildDate`` while its content is digested;
+# replaced by the time that content last changed.
+_SHARD_BUILD_PLACEHOLDER = "___SHARD_LAST_BUILD___"
+
+
+def _make_shard_rss(
+    key: str, title: str, members: Sequence[tuple[ET.Element, Mapping[str, str]]]
+) -> str:
+    """Serialise the shard feed *key* from already rendered ``<item>`` elements."""
+    metadata = {**_channel_metadata("de"), "title": f"{feed_config.FEED_TITLE} – {title}"}
+    rss, channel = _rss_channel(
+        metadata, f"{shards.SHARD_DIR_NAME}/{key}.xml", _SHARD_BUILD_PLACEHOLDER
+    )
+    replacements: dict[str, str] = {}
+    for element, repl in members:
+        channel.append(element)
+        replacements.update(repl)
+    return _serialize_rss(rss, replacements)
+
+
+def _write_feed_shards(out_path: Path, index: shards.ShardIndex, now: datetime) -> None:
+    """Publish ``feeds/<key>.xml`` for every shard of *index* plus ``feeds/index.json``.
+
+    Shards known from the manifest but absent from this build are written
+    as empty feeds until the manifest retires them. A failure leaves the
+    previous shards in place.
+    """
+    try:
+        shard_dir = validate_path(out_path.parent / shards.SHARD_DIR_NAME, "OUT_PATH")
+        manifest_path = shard_dir / shards.MANIFEST_NAME
+        manifest = shards.ShardManifest.load(manifest_path)
+        current = {shard.key: shard for shard in index.shards()}
+        if not current and not manifest.entries:
+            return
+        for key in manifest.retired(now):
+            if key not in current:
+                (shard_dir / f"{key}.xml").unlink(missing_ok=True)
+        written = 0
+        with tracing.span("shards"):
+            for key in sorted(current.keys() | manifest.entries.keys()):
+                shard = current.get(key) or manifest.empty_shard(key)
+                members = [index.item(position) for position in shard.positions]
+                title = f"Linie {shard.label}" if shard.kind == "line" else shard.label
+                template = _make_shard_rss(key, title, members)
+                digest = hashlib.sha256(template.encode("utf-8", errors="surrogatepass")).hexdigest()[:16]
+                updated = manifest.record(
+                    key, kind=shard.kind, label=shard.label, items=len(members), digest=digest, now=now
+                )
+                document = template.replace(_SHARD_BUILD_PLACEHOLDER, _fmt_rfc2822(updated), 1)
+                written += shards.write_shard(shard_dir / f"{key}.xml", document)
+            manifest.save(manifest_path)
+        log.info("Shard-Feeds: %d Feeds, %d neu geschrieben", len(manifest.entries), written)
+    except Exception as exc:
+        # Security (Clear-Text-Logging Drift): broad catch — sanitise.
+        log.warning(
+            "Shard-Feeds konnten nicht geschrieben werden (%s).",
+            sanitize_log_arg(str(exc)),
+        )
+
+
 def main() -> int:
     """Execute the full feed generation pipeline (collect, dedupe, generate RSS)."""
     init_providers()
     refresh_from_env()
     configure_logging()
 
+    # Per-stage spans for ``feed-health.json`` (plus a Chrome-trace export
+    # when FEED_TRACE_PATH is set). Activated process-wide so provider
+    # threads report into the same run; the previous tracer is restored.
+    tracer = tracing.Tracer(record_events=feed_config.FEED_TRACE_PATH is not None)
+    previous_tracer = tracing.activate(tracer)
+    # ``_run_build`` installs the persisted render cache; restore whatever
+    # was active before so library callers never see this run's cache.
+    previous_renders = render_cache.active_cache()
+    previous_latency = latency.active_history()
+    try:
+        return _run_build(tracer)
+    finally:
+        latency.activate(previous_latency)
+        render_cache.activate(previous_renders)
+        tracing.activate(previous_tracer)
+
+
+def _run_build(tracer: tracing.Tracer) -> int:
+    """Body of :func:`main`, run with configuration loaded and *tracer* active."""
     statuses = provider_statuses()
     report = RunReport(statuses)
     report.prune_logs()
@@ -4540,6 +5230,8 @@ def main() -> int:
     job_start = perf_counter()
     now = datetime.now(UTC)
     state = _load_state()
+    render_cache.activate(render_cache.RenderCache.load(_render_cache_path()))
+    latency.activate(latency.LatencyHistory.load(_latency_history_path()))
     stale_cache_messages = _detect_stale_caches(report, now)
     if stale_cache_messages:
         log.warning("Veraltete Caches erkannt: %s", "; ".join(stale_cache_messages))
@@ -4558,6 +5250,7 @@ def main() -> int:
     )
 
     def _write_health_outputs(active_metrics: FeedHealthMetrics) -> None:
+        report.trace = tracer.summary()
         try:
             write_feed_health_report(
                 report, active_metrics, output_path=health_path
@@ -4578,6 +5271,16 @@ def main() -> int:
                 "Feed-Health-JSON konnte nicht geschrieben werden: %s",
                 sanitize_log_arg(str(exc)),
             )
+        if feed_config.FEED_TRACE_PATH is not None:
+            try:
+                tracer.write_chrome_trace(
+                    validate_path(Path(feed_config.FEED_TRACE_PATH), "FEED_TRACE_PATH")
+                )
+            except Exception as exc:  # pragma: no cover - defensive
+                log.warning(
+                    "Trace-Export konnte nicht geschrieben werden: %s",
+                    sanitize_log_arg(str(exc)),
+                )
 
     try:
         collect_start = perf_counter()
@@ -4607,9 +5310,9 @@ def main() -> int:
         # ~200 items per typical run it costs ~MBs of RAM and ~100ms of
         # CPU; at 100x scale (a stress-day with thousands of items) it
         # would dominate the build. ``_summarize_duplicates`` only reads
-        # from the items (the only mutation it can trigger is a benign
-        # ``_calculated_identity`` cache key on the dict, which doesn't
-        # affect the summary's output); ``_dedupe_items`` runs strictly
+        # from the items (the only side effect is filling the records'
+        # memo slots, which doesn't affect the summary's output);
+        # ``_dedupe_items`` runs strictly
         # after both observers have seen the pre-dedupe state, so the
         # snapshot copy was redundant.
         pre_dedupe_count = len(items)
@@ -4626,10 +5329,11 @@ def main() -> int:
         )
 
         fuzzy_start = perf_counter()
-        fuzzy_deduped = cast(
-            list[FeedItem],
-            deduplicate_fuzzy(cast(list[dict[str, Any]], deduped)),
-        )
+        with tracing.span("dedupe.fuzzy"):
+            fuzzy_deduped = cast(
+                list[FeedItem],
+                deduplicate_fuzzy(cast(list[dict[str, Any]], deduped)),
+            )
         fuzzy_duration = perf_counter() - fuzzy_start
         if len(fuzzy_deduped) < len(deduped):
             log.info(
@@ -4639,7 +5343,9 @@ def main() -> int:
                 len(deduped),
             )
 
-        items = fuzzy_deduped
+        # Fuzzy merges return fresh plain-dict copies; re-wrap those so the
+        # sort and render stages keep hitting the memoised identity.
+        items = FeedRecord.adopt_all(fuzzy_deduped)
         deduped_count = len(items)
         duplicates_removed = sum(summary.count - 1 for summary in duplicate_summaries)
         if not items:
@@ -4665,14 +5371,18 @@ def main() -> int:
         # is always refreshed regardless of any translation-pipeline
         # issues encountered for the EN variant.
         rss_start = perf_counter()
-        rss_de = _make_rss(items, now, state, lang="de")
+        shard_index = shards.ShardIndex() if feed_config.FEED_SHARDS else None
+        rss_de = _make_rss(items, now, state, lang="de", shard_index=shard_index)
         rss_duration = perf_counter() - rss_start
 
         out_path = validate_path(Path(feed_config.OUT_PATH), "OUT_PATH")
-        with atomic_write(
+        with tracing.span("write:de"), atomic_write(
             out_path, mode="w", encoding="utf-8", permissions=0o644
         ) as f:
             f.write(rss_de)
+        _save_change_log(out_path, rss_de)
+        if shard_index is not None:
+            _write_feed_shards(out_path, shard_index, now)
 
         # English mirror — written next to ``feed.xml`` as ``feed.en.xml``.
         # Failures during translation degrade gracefully to the German
@@ -4685,10 +5395,11 @@ def main() -> int:
             rss_en = _make_rss(
                 items, now, state, lang="en"
             )
-            with atomic_write(
+            with tracing.span("write:en"), atomic_write(
                 en_out_path, mode="w", encoding="utf-8", permissions=0o644
             ) as f:
                 f.write(rss_en)
+            _save_change_log(en_out_path, rss_en, lang="en")
         except Exception as exc:
             log.warning(
                 "EN-Feed konnte nicht geschrieben werden (%s) – "
@@ -4714,6 +5425,8 @@ def main() -> int:
                 f"State save failed: {sanitize_log_arg(type(e).__name__)} — "
                 "first_seen / translations / stats may drift on the next run."
             )
+        _save_render_cache()
+        _save_latency_history()
 
         total_duration = perf_counter() - job_start
         log.info(
@@ -2,27 +2,67 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import os
 import runpy
 import sys
 from collections.abc import Mapping, Sequence, Iterator
 from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from . import build_feed as build_feed_module
-    from .feed.config import InvalidPathError, validate_path
-    from .utils.files import atomic_write
-    from .utils.stations_validation import validate_stations
-else:
-    from . import build_feed as build_feed_module
-    from .feed.config import InvalidPathError, validate_path
-    from .utils.files import atomic_write
-    from .utils.stations_validation import validate_stations
+    from .feed.config import InvalidPathError as InvalidPathError
+    from .feed.config import validate_path as validate_path
+    from .utils import profiling as profiling
+    from .utils.files import atomic_write as atomic_write
+    from .utils.stations_validation import ValidationReport
+    from .utils.stations_validation import validate_stations as validate_stations
 
 __all__ = ["build_feed_module"]
 
+# Handler dependencies resolved on first use (PEP 562). Every subcommand
+# except ``feed`` and ``stations validate`` only dispatches to a script via
+# ``runpy``, yet importing ``build_feed`` eagerly made each of them pay for
+# the feed pipeline, ``requests``/``urllib3`` and the provider modules
+# before argparse had even seen ``--help``. ``tests/test_import_time_budget.py``
+# pins which modules each subcommand may import.
+#
+# Name -> (module relative to this package, attribute or ``None`` for the
+# module itself). Resolved values are cached in the module globals, so a
+# test's ``monkeypatch.setattr(cli, "validate_stations", ...)`` still
+# replaces what the handlers call.
+_LAZY_ATTRS: dict[str, tuple[str, str | None]] = {
+    "build_feed_module": (".build_feed", None),
+    "InvalidPathError": (".feed.config", "InvalidPathError"),
+    "validate_path": (".feed.config", "validate_path"),
+    "feed_logging": (".feed.logging", None),
+    "atomic_write": (".utils.files", "atomic_write"),
+    "profiling": (".utils.profiling", None),
+    "validate_stations": (".utils.stations_validation", "validate_stations"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __package__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily imported handler dependency (honours monkeypatching)."""
+    namespace = globals()
+    if name in namespace:
+        return namespace[name]
+    return __getattr__(name)
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 DATA_DIR = PROJECT_ROOT / "data"
@@ -153,6 +193,20 @@ def _clean_remainder(values: list[str] | None) -> list[str]:
     return cleaned
 
 
+def _add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="all",
+        default=None,
+        choices=("cprofile", "sample", "all"),
+        help=(
+            "Profiliert den Lauf (cprofile, sample oder all; Default: all) und legt "
+            "die Artefakte unter log/profiles/ ab. Überschreibt WIEN_OEPNV_PROFILE."
+        ),
+    )
+
+
 def _configure_cache_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
     cache_parser = subparsers.add_parser("cache", help="Cache maintenance commands")
     cache_subparsers = cache_parser.add_subparsers(dest="cache_command", required=True)
@@ -174,6 +228,7 @@ def _configure_cache_commands(subparsers: argparse._SubParsersAction[argparse.Ar
         action="store_true",
         help="Bricht nach dem ersten fehlgeschlagenen Lauf ab (Default: führt alle Läufe aus).",
     )
+    _add_profile_argument(update_parser)
     update_parser.set_defaults(func=_handle_cache_update, parser=update_parser)
 
 
@@ -219,6 +274,11 @@ def _configure_stations_commands(subparsers: argparse._SubParsersAction[argparse
         action="store_true",
         help="Exit with a non-zero status code when any issues are found.",
     )
+    validate_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print the per-rule validation timings to stderr.",
+    )
     validate_parser.set_defaults(func=_handle_stations_validate)
 
 
@@ -227,6 +287,7 @@ def _configure_feed_commands(subparsers: argparse._SubParsersAction[argparse.Arg
     feed_subparsers = feed_parser.add_subparsers(dest="feed_command", required=True)
 
     build_parser = feed_subparsers.add_parser("build", help="Run the feed builder")
+    _add_profile_argument(build_parser)
     build_parser.set_defaults(func=_handle_feed_build)
 
     lint_parser = feed_subparsers.add_parser(
@@ -234,6 +295,23 @@ def _configure_feed_commands(subparsers: argparse._SubParsersAction[argparse.Arg
     )
     lint_parser.set_defaults(func=_handle_feed_lint)
 
+    logs_parser = feed_subparsers.add_parser(
+        "logs", help="Gibt die Log-Segmente der letzten Tage zusammengefügt aus"
+    )
+    logs_parser.add_argument(
+        "--errors",
+        action="store_true",
+        help="Fehlerlog statt Diagnoselog ausgeben.",
+    )
+    logs_parser.add_argument(
+        "--days",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Nur die Segmente der letzten N Tage (inklusive heute); Standard: alle vorhandenen.",
+    )
+    logs_parser.set_defaults(func=_handle_feed_logs)
+
 
 def _configure_token_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
     token_parser = subparsers.add_parser("tokens", help="Credential diagnostics")
@@ -307,10 +385,13 @@ def _handle_cache_update(args: argparse.Namespace) -> int:
         subject="Provider",
     )
 
+    # The updater scripts profile themselves (``run_profiled_main``), so the
+    # flag is forwarded instead of profiling the ``runpy`` dispatch here.
+    extra = [f"--profile={args.profile}"] if args.profile is not None else []
     exit_code = 0
     for provider in providers:
         script_name = _PROVIDER_CACHE_SCRIPTS[provider]
-        result = _run_script(script_name)
+        result = _run_script(script_name, extra_args=extra)
         if result != 0:
             if args.stop_on_error:
                 return result
@@ -330,7 +411,7 @@ def _handle_stations_update(args: argparse.Namespace) -> int:
 
 def _handle_stations_validate(args: argparse.Namespace) -> int:
     """Performs integrity checks on the station registry and generates a quality report."""
-    report = validate_stations(
+    report: ValidationReport = _lazy("validate_stations")(
         args.stations,
         gtfs_stops_path=args.gtfs,
         decimal_places=args.decimal_places,
@@ -358,14 +439,20 @@ def _handle_stations_validate(args: argparse.Namespace) -> int:
         f"{len(report.cross_name_alias_issues)} cross-name alias collisions, "
         f"{len(report.security_issues)} security warnings.\n"
     )
+    if args.timings:
+        for timing in report.rule_timings:
+            sys.stderr.write(
+                f"  {timing.rule}: {timing.seconds * 1000:.1f} ms ({timing.issues} issues)\n"
+            )
 
     if args.output:
         # CI lockdown: the validation-report path is restricted to the repo's
         # allowed roots (docs/data/log). A path that resolves outside the
         # repository fails loudly instead of writing an arbitrary file.
+        invalid_path_error: type[Exception] = _lazy("InvalidPathError")
         try:
-            output_path: Path = validate_path(args.output, "--output")
-        except InvalidPathError as exc:
+            output_path: Path = _lazy("validate_path")(args.output, "--output")
+        except invalid_path_error as exc:
             raise CLIError(str(exc)) from exc
         output_path.parent.mkdir(parents=True, exist_ok=True)
         # ``atomic_write`` (tempfile + ``os.replace``) so a SIGINT
@@ -376,7 +463,7 @@ def _handle_stations_validate(args: argparse.Namespace) -> int:
         # would surface as a silent truncation downstream. Mirrors
         # the canonical writer pattern established for every other
         # operator-facing sink in the repository.
-        with atomic_write(output_path, mode="w", encoding="utf-8") as handle:
+        with _lazy("atomic_write")(output_path, mode="w", encoding="utf-8") as handle:
             handle.write(markdown)
         print(f"Report written to {output_path}")
 
@@ -387,12 +474,26 @@ def _handle_stations_validate(args: argparse.Namespace) -> int:
 
 def _handle_feed_build(args: argparse.Namespace) -> int:
     """Executes the main feed generation logic."""
-    return int(build_feed_module.main())
+    profiling = _lazy("profiling")
+    with profiling.profiled("feed-build", profiling.profile_modes(args.profile)):
+        return int(_lazy("build_feed_module").main())
 
 
 def _handle_feed_lint(_args: argparse.Namespace) -> int:
     """Scans the feed content for structural issues without generating an output file."""
-    return int(build_feed_module.lint())
+    return int(_lazy("build_feed_module").lint())
+
+
+def _handle_feed_logs(args: argparse.Namespace) -> int:
+    """Prints the retained day segments of the diagnostics or error log."""
+    feed_logging = _lazy("feed_logging")
+    base_path = feed_logging.error_log_path if args.errors else feed_logging.diagnostics_log_path
+    since = None
+    if args.days is not None:
+        today = datetime.now(feed_logging.LOG_TIMEZONE).date()
+        since = today - timedelta(days=min(max(args.days, 1), feed_logging.MAX_LOG_PRUNE_KEEP_DAYS) - 1)
+    sys.stdout.write(feed_logging.read_log_segments(base_path, since=since))
+    return 0
 
 
 def _handle_token_verify(args: argparse.Namespace) -> int:
@@ -8,6 +8,7 @@ __all__ = [
     "DEFAULT_OUT_PATH",
     "DEFAULT_FEED_HEALTH_PATH",
     "DEFAULT_FEED_HEALTH_JSON_PATH",
+    "DEFAULT_FEED_TRACE_PATH",
     "DEFAULT_FEED_TITLE",
     "DEFAULT_FEED_DESCRIPTION",
     "DEFAULT_FEED_LINK",
@@ -31,6 +32,10 @@ __all__ = [
 DEFAULT_OUT_PATH = Path("docs/feed.xml")
 DEFAULT_FEED_HEALTH_PATH = Path("docs/feed-health.md")
 DEFAULT_FEED_HEALTH_JSON_PATH = Path("docs/feed-health.json")
+# Chrome-trace export of the per-stage spans; only written when the
+# FEED_TRACE_PATH env var is set (any value outside the allowed roots falls
+# back to this path).
+DEFAULT_FEED_TRACE_PATH = Path("log/feed-trace.json")
 DEFAULT_FEED_TITLE = "ÖPNV Störungen Wien & Pendler"
 DEFAULT_FEED_DESCRIPTION = "Aktive Störungen/Baustellen/Einschränkungen aus offiziellen Quellen"
 DEFAULT_FEED_LINK = "https://github.com/Origamihase/wien-oepnv"
@@ -0,0 +1,254 @@
+"""Cursor-based change log for polling clients (``docs/changes.json``).
+
+Every build rewrites ``feed.xml`` (``lastBuildDate`` alone changes the
+bytes), so a client that revalidates the feed downloads it in full each
+time. The change log next to each feed lets it fetch only the delta:
+
+* ``seq`` – monotonically increasing sequence, bumped once per build in
+  which the published items changed;
+* ``items`` – the current feed order as ``[guid, digest]`` pairs (the
+  manifest);
+* ``changes`` – the last :data:`MAX_BATCHES` batches of ``added`` /
+  ``updated`` / ``removed`` guids, each stamped with its ``seq``;
+* ``entries`` – the rendered fields of every current item added or
+  updated within the retained batches.
+
+A client holding cursor ``c`` applies every batch with ``seq > c`` as long
+as ``c >= oldest``; an older or missing cursor reloads the full feed.
+Digests are taken over the fields a reader sees, so re-emitting an
+unchanged item never produces a batch, and a build without changes
+leaves the file byte-identical (an HTTP revalidation then answers
+``304``). A missing, oversized or corrupt file starts a fresh log under
+a new random ``epoch``; clients store the epoch with their cursor and
+reload the full feed once when it changes.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import secrets
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
+
+from defusedxml import ElementTree as ET
+
+from ..utils.files import atomic_write, read_capped_json
+
+__all__ = [
+    "CHANGE_LOG_FORMAT",
+    "ChangeBatch",
+    "ChangeLog",
+    "change_log_path",
+    "feed_entries",
+]
+
+log = logging.getLogger(__name__)
+
+CHANGE_LOG_FORMAT: Final = 1
+# One day of builds at the 30-minute cadence; a client that has been away
+# longer reloads the full feed instead.
+MAX_BATCHES: Final = 48
+# Two ``MAX_ITEMS`` feeds stay far below this; the cap only guards the
+# loader against a planted or corrupted file.
+MAX_CHANGE_LOG_BYTES: Final = 4 * 1024 * 1024
+
+_EXT_NS: Final = "https://wien-oepnv.example/schema"
+# The ``<item>`` children a polling client renders, in output order.
+# ``content:encoded`` only repeats the description as HTML and is left out.
+_ENTRY_FIELDS: Final = (
+    ("title", "title"),
+    ("link", "link"),
+    ("guid", "guid"),
+    ("pubDate", "pubDate"),
+    ("description", "description"),
+    (f"{{{_EXT_NS}}}first_seen", "first_seen"),
+    (f"{{{_EXT_NS}}}starts_at", "starts_at"),
+    (f"{{{_EXT_NS}}}ends_at", "ends_at"),
+)
+
+
+def change_log_path(feed_path: Path, lang: str = "de") -> Path:
+    """``changes.json`` (``changes.en.json`` for *lang* ``"en"``) next to *feed_path*."""
+    suffix = ".en" if lang == "en" else ""
+    return feed_path.with_name(f"changes{suffix}.json")
+
+
+def feed_entries(rss: str) -> list[dict[str, str]]:
+    """Extract the rendered fields of every ``<item>`` in the RSS document *rss*.
+
+    Items without a ``<guid>`` and repeated guids are skipped, since the
+    guid is the client-side identity.
+    """
+    root = ET.fromstring(rss)
+    entries: list[dict[str, str]] = []
+    seen: set[str] = set()
+    for item in root.iter("item"):
+        entry: dict[str, str] = {}
+        for tag, name in _ENTRY_FIELDS:
+            text = item.findtext(tag)
+            if text:
+                entry[name] = text.strip()
+        guid = entry.get("guid")
+        if not guid or guid in seen:
+            continue
+        seen.add(guid)
+        entries.append(entry)
+    return entries
+
+
+def _digest(entry: Mapping[str, str]) -> str:
+    payload = json.dumps(entry, ensure_ascii=True, allow_nan=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8", errors="surrogatepass")).hexdigest()[:16]
+
+
+def _guid_list(raw: object) -> tuple[str, ...] | None:
+    if not isinstance(raw, list) or not all(isinstance(value, str) for value in raw):
+        return None
+    return tuple(raw)
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeBatch:
+    """The item changes published by one build."""
+
+    seq: int
+    added: tuple[str, ...] = ()
+    updated: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "added": list(self.added),
+            "updated": list(self.updated),
+            "removed": list(self.removed),
+        }
+
+    @classmethod
+    def from_json(cls, raw: object) -> ChangeBatch | None:
+        if not isinstance(raw, dict):
+            return None
+        seq = raw.get("seq")
+        lists = [_guid_list(raw.get(key, [])) for key in ("added", "updated", "removed")]
+        if not isinstance(seq, int) or isinstance(seq, bool) or seq < 1:
+            return None
+        added, updated, removed = lists
+        if added is None or updated is None or removed is None:
+            return None
+        return cls(seq, added, updated, removed)
+
+
+class ChangeLog:
+    """Sequence, manifest, retained batches and entries of one feed."""
+
+    __slots__ = ("_dirty", "batches", "entries", "epoch", "items", "seq")
+
+    def __init__(
+        self,
+        epoch: str | None = None,
+        seq: int = 0,
+        items: Sequence[tuple[str, str]] = (),
+        batches: Sequence[ChangeBatch] = (),
+        entries: Mapping[str, Mapping[str, str]] | None = None,
+    ) -> None:
+        self.epoch = epoch or secrets.token_hex(4)
+        self.seq = seq
+        self.items: list[tuple[str, str]] = list(items)
+        self.batches: list[ChangeBatch] = list(batches)
+        self.entries: dict[str, dict[str, str]] = {key: dict(value) for key, value in (entries or {}).items()}
+        self._dirty = False
+
+    @property
+    def oldest(self) -> int:
+        """Lowest cursor from which the retained batches still lead to :attr:`seq`."""
+        return self.batches[0].seq - 1 if self.batches else self.seq
+
+    @classmethod
+    def load(cls, path: Path) -> ChangeLog:
+        """Read the log at *path*; any unusable file yields a fresh log."""
+        payload = read_capped_json(path, MAX_CHANGE_LOG_BYTES, label="Change-Log", logger=log)
+        if not isinstance(payload, dict) or payload.get("format") != CHANGE_LOG_FORMAT:
+            return cls()
+        epoch = payload.get("epoch")
+        seq = payload.get("seq")
+        raw_items = payload.get("items")
+        raw_batches = payload.get("changes")
+        raw_entries = payload.get("entries")
+        if not (
+            isinstance(epoch, str)
+            and epoch
+            and isinstance(seq, int)
+            and not isinstance(seq, bool)
+            and isinstance(raw_items, list)
+            and isinstance(raw_batches, list)
+            and isinstance(raw_entries, dict)
+        ):
+            return cls()
+        items = [
+            (pair[0], pair[1])
+            for pair in raw_items
+            if isinstance(pair, list) and len(pair) == 2 and all(isinstance(value, str) for value in pair)
+        ]
+        batches = [batch for batch in map(ChangeBatch.from_json, raw_batches) if batch is not None]
+        entries = {
+            str(key): {str(name): value for name, value in entry.items() if isinstance(value, str)}
+            for key, entry in raw_entries.items()
+            if isinstance(entry, dict)
+        }
+        return cls(epoch, seq, items, batches, entries)
+
+    def advance(self, entries: Sequence[Mapping[str, str]]) -> ChangeBatch | None:
+        """Diff the feed's current *entries* against the manifest.
+
+        Appends and returns a new batch when an item was added, changed or
+        removed; a mere reordering only refreshes the manifest. Returns
+        ``None`` if nothing changed.
+        """
+        previous = dict(self.items)
+        current = [(entry["guid"], _digest(entry)) for entry in entries]
+        digests = dict(current)
+        added = tuple(guid for guid, _ in current if guid not in previous)
+        updated = tuple(guid for guid, digest in current if previous.get(guid, digest) != digest)
+        removed = tuple(guid for guid, _ in self.items if guid not in digests)
+        if current != self.items:
+            self.items = current
+            self._dirty = True
+        if not (added or updated or removed):
+            return None
+
+        self.seq += 1
+        batch = ChangeBatch(self.seq, added, updated, removed)
+        self.batches = [*self.batches, batch][-MAX_BATCHES:]
+        by_guid = {entry["guid"]: entry for entry in entries}
+        for guid in (*added, *updated):
+            self.entries[guid] = dict(by_guid[guid])
+        retained = {guid for kept in self.batches for guid in (*kept.added, *kept.updated)}
+        self.entries = {guid: entry for guid, entry in self.entries.items() if guid in retained and guid in digests}
+        self._dirty = True
+        return batch
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "format": CHANGE_LOG_FORMAT,
+            "epoch": self.epoch,
+            "seq": self.seq,
+            "oldest": self.oldest,
+            "items": [list(pair) for pair in self.items],
+            "changes": [batch.to_json() for batch in self.batches],
+            "entries": self.entries,
+        }
+
+    def save(self, path: Path) -> bool:
+        """Write the log to *path*; ``False`` if nothing changed since :meth:`load`."""
+        if not self._dirty:
+            return False
+        with atomic_write(path, mode="w", encoding="utf-8", permissions=0o644, skip_unchanged=True) as handle:
+            # Compact on purpose: the file is downloaded by every polling
+            # client. ASCII escapes keep upstream BiDi / zero-width
+            # characters out of the published file verbatim.
+            json.dump(self.to_json(), handle, ensure_ascii=True, allow_nan=False, separators=(",", ":"))
+        self._dirty = False
+        return True
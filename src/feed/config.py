@@ -16,6 +16,7 @@ from ..config.defaults import (
     DEFAULT_FEED_LINK,
     DEFAULT_FEED_HEALTH_PATH,
     DEFAULT_FEED_HEALTH_JSON_PATH,
+    DEFAULT_FEED_TRACE_PATH,
     DEFAULT_FEED_TITLE,
     DEFAULT_FEED_TTL_MINUTES,
     DEFAULT_TITLE_CHAR_LIMIT,
@@ -58,8 +59,9 @@ MAX_PROVIDER_TIMEOUT = DEFAULT_PROVIDER_TIMEOUT
 
 # Security: ``MAX_LOG_BYTES`` is the disk-exhaustion-defence ceiling for the
 # rotating-log size. ``LOG_MAX_BYTES`` is consumed by the two
-# ``RotatingFileHandler`` instances in ``src/feed/logging.py`` (``errors.log``
-# and ``diagnostics.log``) as the size threshold that triggers rotation;
+# ``DailySegmentHandler`` instances in ``src/feed/logging.py`` (``errors.log``
+# and ``diagnostics.log``) as the size threshold that triggers rotation
+# within one day's segment;
 # ``get_int_env`` only enforced a non-negative lower bound, so a benign-
 # looking env override such as ``LOG_MAX_BYTES=999999999999`` (intentional
 # misconfig, leaked CI env, compromised secret store) would prevent
@@ -116,6 +118,12 @@ MAX_LOG_BACKUP_COUNT = 500
 # ``MAX_LOG_BYTES`` and ``MAX_LOG_BACKUP_COUNT`` above.
 MAX_STATE_RETENTION_DAYS = 3650
 
+# Upper bounds for the translation runtime knobs. More intra-op threads than
+# a runner has cores only add contention, and every extra beam multiplies
+# the decoder work per item; both caps only TIGHTEN an env override.
+MAX_TRANSLATION_THREADS = 16
+MAX_TRANSLATION_NUM_BEAMS = 8
+
 # Security: ``MAX_ENDS_AT_GRACE_MINUTES`` is the grace-window ceiling for the
 # "drop expired item" filter. ``ENDS_AT_GRACE_MINUTES`` is consumed by
 # ``build_feed._drop_old_items`` as ``now_utc - timedelta(minutes=N)`` (line
@@ -339,6 +347,7 @@ LOG_BACKUP_COUNT: int = DEFAULT_LOG_BACKUP_COUNT
 OUT_PATH: Path = DEFAULT_OUT_PATH
 FEED_HEALTH_PATH: Path = DEFAULT_FEED_HEALTH_PATH
 FEED_HEALTH_JSON_PATH: Path = DEFAULT_FEED_HEALTH_JSON_PATH
+FEED_TRACE_PATH: Path | None = None
 FEED_TITLE: str = DEFAULT_FEED_TITLE
 FEED_LINK: str = DEFAULT_FEED_LINK
 PAGES_BASE_URL: str = DEFAULT_PAGES_BASE_URL
@@ -354,17 +363,23 @@ ENDS_AT_GRACE_MINUTES: int = DEFAULT_ENDS_AT_GRACE_MINUTES
 CACHE_MAX_AGE_HOURS: int = DEFAULT_CACHE_MAX_AGE_HOURS
 PROVIDER_TIMEOUT: int = DEFAULT_PROVIDER_TIMEOUT
 PROVIDER_MAX_WORKERS: int = DEFAULT_PROVIDER_MAX_WORKERS
+PROVIDER_ADAPTIVE_TIMEOUTS: bool = False
+FEED_SHARDS: bool = True
+TRANSLATION_QUANTIZE: str = ""
+TRANSLATION_THREADS: int = 0
+TRANSLATION_NUM_BEAMS: int = 0
 STATE_FILE: Path = DEFAULT_STATE_PATH
 STATE_RETENTION_DAYS: int = DEFAULT_STATE_RETENTION_DAYS
 
 
 def _load_from_env() -> None:
     global LOG_LEVEL, LOG_FORMAT, LOG_DIR_PATH, LOG_MAX_BYTES, LOG_BACKUP_COUNT
-    global OUT_PATH, FEED_HEALTH_PATH, FEED_HEALTH_JSON_PATH, FEED_TITLE, FEED_LINK, PAGES_BASE_URL, FEED_DESC, FEED_TTL
+    global OUT_PATH, FEED_HEALTH_PATH, FEED_HEALTH_JSON_PATH, FEED_TRACE_PATH, FEED_TITLE, FEED_LINK, PAGES_BASE_URL, FEED_DESC, FEED_TTL
     global TITLE_CHAR_LIMIT, DESCRIPTION_CHAR_LIMIT, FRESH_PUBDATE_WINDOW_MIN, MAX_ITEMS
     global MAX_ITEM_AGE_DAYS, ABSOLUTE_MAX_AGE_DAYS, ENDS_AT_GRACE_MINUTES
-    global PROVIDER_TIMEOUT, PROVIDER_MAX_WORKERS, STATE_FILE, STATE_RETENTION_DAYS
-    global CACHE_MAX_AGE_HOURS
+    global PROVIDER_TIMEOUT, PROVIDER_MAX_WORKERS, PROVIDER_ADAPTIVE_TIMEOUTS, STATE_FILE, STATE_RETENTION_DAYS
+    global CACHE_MAX_AGE_HOURS, FEED_SHARDS
+    global TRANSLATION_QUANTIZE, TRANSLATION_THREADS, TRANSLATION_NUM_BEAMS
 
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").strip().upper()
     LOG_FORMAT = os.getenv("LOG_FORMAT", "plain").strip().lower()
@@ -392,6 +407,13 @@ def _load_from_env() -> None:
     FEED_HEALTH_JSON_PATH = resolve_env_path(
         "FEED_HEALTH_JSON_PATH", DEFAULT_FEED_HEALTH_JSON_PATH, allow_fallback=True
     )
+    # Opt-in: the span aggregates always land in the health JSON; the
+    # per-event Chrome trace is only recorded and written when requested.
+    FEED_TRACE_PATH = (
+        resolve_env_path("FEED_TRACE_PATH", DEFAULT_FEED_TRACE_PATH, allow_fallback=True)
+        if os.getenv("FEED_TRACE_PATH", "").strip()
+        else None
+    )
     FEED_TITLE = os.getenv("FEED_TITLE", DEFAULT_FEED_TITLE)
     raw_feed_link = os.getenv("FEED_LINK", DEFAULT_FEED_LINK)
     # Security: pin to GitHub-hosted domains (see ``_validated_feed_public_url``)
@@ -479,6 +501,23 @@ def _load_from_env() -> None:
     PROVIDER_MAX_WORKERS = max(
         get_int_env("PROVIDER_MAX_WORKERS", DEFAULT_PROVIDER_MAX_WORKERS), 0
     )
+    # Opt-in: derive network-provider deadlines from the latency history
+    # (``src/feed/latency.py``); ``PROVIDER_TIMEOUT`` stays the upper bound.
+    PROVIDER_ADAPTIVE_TIMEOUTS = get_bool_env("PROVIDER_ADAPTIVE_TIMEOUTS", False)
+    # Per-line / per-category shard feeds next to ``OUT_PATH`` (``feeds/``).
+    FEED_SHARDS = get_bool_env("FEED_SHARDS", True)
+    # Opt-in int8 translation model (``src/feed/translation_model.py``);
+    # every other value keeps float32. ``0`` threads / beams keep the
+    # torch and model defaults.
+    TRANSLATION_QUANTIZE = (
+        "int8" if (os.getenv("TRANSLATION_QUANTIZE") or "").strip().casefold() == "int8" else ""
+    )
+    TRANSLATION_THREADS = min(
+        max(get_int_env("TRANSLATION_THREADS", 0), 0), MAX_TRANSLATION_THREADS
+    )
+    TRANSLATION_NUM_BEAMS = min(
+        max(get_int_env("TRANSLATION_NUM_BEAMS", 0), 0), MAX_TRANSLATION_NUM_BEAMS
+    )
     STATE_FILE = resolve_env_path("STATE_PATH", DEFAULT_STATE_PATH)
     # Security: clamp the env override to ``MAX_STATE_RETENTION_DAYS`` to defeat
     # the OverflowError / disk-exhaustion vector documented at the constant
@@ -542,6 +581,8 @@ __all__ = [
     "FEED_HEALTH_PATH",
     "FEED_HEALTH_JSON_PATH",
     "FEED_LINK",
+    "FEED_SHARDS",
+    "FEED_TRACE_PATH",
     "FEED_TITLE",
     "FEED_TTL",
     "FeedPaths",
@@ -562,14 +603,20 @@ __all__ = [
     "MAX_LOG_BYTES",
     "MAX_PROVIDER_TIMEOUT",
     "MAX_STATE_RETENTION_DAYS",
+    "MAX_TRANSLATION_NUM_BEAMS",
+    "MAX_TRANSLATION_THREADS",
     "OUT_PATH",
     "PAGES_BASE_URL",
+    "PROVIDER_ADAPTIVE_TIMEOUTS",
     "PROVIDER_MAX_WORKERS",
     "PROVIDER_TIMEOUT",
     "RFC",
     "STATE_FILE",
     "STATE_RETENTION_DAYS",
     "TITLE_CHAR_LIMIT",
+    "TRANSLATION_NUM_BEAMS",
+    "TRANSLATION_QUANTIZE",
+    "TRANSLATION_THREADS",
     "build_paths",
     "build_settings",
     "get_bool_env",
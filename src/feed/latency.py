@@ -0,0 +1,229 @@
+"""Rolling per-provider fetch latency and the adaptive deadline policy.
+
+Every network fetcher run by ``build_feed._run_network_fetchers`` reports
+its wall time to the active :class:`LatencyHistory`; deadline evictions
+count as timeouts. ``build_feed.main`` persists the history next to the
+state file (``data/first_seen.latency.json``), so the percentiles cover
+the last :data:`MAX_SAMPLES` runs rather than a single build.
+
+With ``PROVIDER_ADAPTIVE_TIMEOUTS`` enabled the orchestrator asks
+:meth:`LatencyHistory.adaptive_deadline` for each provider's deadline:
+the observed p99 times :data:`SAFETY_FACTOR` plus :data:`SAFETY_MARGIN_S`,
+never above the static timeout (which stays the hard cap) and never
+below :data:`MIN_ADAPTIVE_TIMEOUT`. A provider on a timeout streak falls
+back to the static timeout and is limited to one worker
+(:meth:`LatencyHistory.worker_limit`). Explicit per-provider env
+overrides always win over the policy.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any, Final
+
+from ..utils.files import atomic_write, read_capped_json
+
+__all__ = [
+    "LatencyHistory",
+    "activate",
+    "active_history",
+    "observe",
+    "observe_timeout",
+    "percentile",
+]
+
+log = logging.getLogger(__name__)
+
+LATENCY_FORMAT: Final = 1
+MAX_SAMPLES: Final = 50
+# Fewer samples than this leave the static timeout in place.
+MIN_SAMPLES: Final = 5
+SAFETY_FACTOR: Final = 1.5
+SAFETY_MARGIN_S: Final = 2.0
+MIN_ADAPTIVE_TIMEOUT: Final = 5
+# Consecutive timeouts after which the static deadline is restored and the
+# provider's concurrency group is serialised.
+TIMEOUT_STREAK_LIMIT: Final = 3
+# A few dozen providers with ``MAX_SAMPLES`` floats each; the cap only
+# guards the loader against a planted or corrupted file.
+MAX_LATENCY_FILE_BYTES: Final = 1024 * 1024
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (``0 < q <= 1``) of non-empty *samples*."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(q * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _finite_samples(raw: object) -> list[float]:
+    if not isinstance(raw, list):
+        return []
+    return [
+        float(value)
+        for value in raw
+        if isinstance(value, int | float) and not isinstance(value, bool) and math.isfinite(value) and value >= 0
+    ][-MAX_SAMPLES:]
+
+
+class LatencyHistory:
+    """Last :data:`MAX_SAMPLES` fetch durations and the timeout streak per provider."""
+
+    __slots__ = ("_dirty", "_lock", "_samples", "_streaks")
+
+    def __init__(
+        self,
+        samples: Mapping[str, Iterable[float]] | None = None,
+        streaks: Mapping[str, int] | None = None,
+    ) -> None:
+        self._samples: dict[str, deque[float]] = {
+            name: deque(values, maxlen=MAX_SAMPLES) for name, values in (samples or {}).items()
+        }
+        self._streaks: dict[str, int] = dict(streaks or {})
+        self._dirty = False
+        # Fetchers report from executor threads.
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path) -> LatencyHistory:
+        """Read the history at *path*; any unusable file starts an empty one."""
+        payload = read_capped_json(path, MAX_LATENCY_FILE_BYTES, label="Latenz-Historie", logger=log)
+        if not isinstance(payload, dict) or payload.get("format") != LATENCY_FORMAT:
+            return cls()
+        providers = payload.get("providers")
+        if not isinstance(providers, dict):
+            return cls()
+        samples: dict[str, list[float]] = {}
+        streaks: dict[str, int] = {}
+        for name, entry in providers.items():
+            if not isinstance(entry, dict):
+                continue
+            samples[str(name)] = _finite_samples(entry.get("samples"))
+            streak = entry.get("timeout_streak")
+            if isinstance(streak, int) and not isinstance(streak, bool) and streak > 0:
+                streaks[str(name)] = streak
+        return cls(samples, streaks)
+
+    def observe(self, name: str, seconds: float, deadline: float | None = None) -> None:
+        """Record one completed fetch; finishing within *deadline* ends a timeout streak."""
+        if not math.isfinite(seconds) or seconds < 0:
+            return
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=MAX_SAMPLES)).append(round(seconds, 3))
+            if deadline is None or deadline <= 0 or seconds < deadline:
+                self._streaks.pop(name, None)
+            self._dirty = True
+
+    def observe_timeout(self, name: str) -> None:
+        """Record that the orchestrator evicted *name* at its deadline."""
+        with self._lock:
+            self._streaks[name] = self._streaks.get(name, 0) + 1
+            self._dirty = True
+
+    def summary(self, name: str) -> dict[str, Any]:
+        """Sample count, timeout streak and p50/p95/p99 (``None`` without samples)."""
+        with self._lock:
+            samples = list(self._samples.get(name, ()))
+            streak = self._streaks.get(name, 0)
+        return {
+            "count": len(samples),
+            "timeout_streak": streak,
+            **{
+                key: (percentile(samples, q) if samples else None)
+                for key, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+            },
+        }
+
+    def adaptive_deadline(self, name: str, cap: float) -> tuple[int, float] | None:
+        """Return ``(deadline, p99)`` for *name*, or ``None`` to keep *cap*.
+
+        ``None`` when there are too few samples, during a timeout streak, or
+        when the derived deadline would not be below *cap*.
+        """
+        summary = self.summary(name)
+        if summary["count"] < MIN_SAMPLES or summary["timeout_streak"] >= TIMEOUT_STREAK_LIMIT:
+            return None
+        p99 = float(summary["p99"])
+        deadline = max(math.ceil(p99 * SAFETY_FACTOR + SAFETY_MARGIN_S), MIN_ADAPTIVE_TIMEOUT)
+        if deadline >= cap:
+            return None
+        return deadline, p99
+
+    def worker_limit(self, name: str) -> int | None:
+        """Return ``1`` while *name* is on a timeout streak, else ``None``."""
+        with self._lock:
+            streak = self._streaks.get(name, 0)
+        return 1 if streak >= TIMEOUT_STREAK_LIMIT else None
+
+    def save(self, path: Path) -> bool:
+        """Write the history to *path*; ``False`` when nothing was observed."""
+        # Fetcher threads abandoned at their deadline may still report
+        # while the history is written; snapshot everything under the lock
+        # so no deque is iterated while it is appended to.
+        with self._lock:
+            if not self._dirty:
+                return False
+            samples = {name: list(values) for name, values in self._samples.items()}
+            streaks = dict(self._streaks)
+            self._dirty = False
+        providers = {}
+        for name in sorted(samples.keys() | streaks.keys()):
+            values = samples.get(name, [])
+            providers[name] = {
+                "samples": values,
+                "timeout_streak": streaks.get(name, 0),
+                # Informational; recomputed from ``samples`` on load.
+                "p50": percentile(values, 0.5) if values else None,
+                "p95": percentile(values, 0.95) if values else None,
+            }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+                json.dump(
+                    {"format": LATENCY_FORMAT, "providers": providers},
+                    handle,
+                    ensure_ascii=True,
+                    allow_nan=False,
+                    indent=1,
+                    sort_keys=True,
+                )
+        except BaseException:
+            with self._lock:
+                self._dirty = True
+            raise
+        return True
+
+
+_ACTIVE: LatencyHistory | None = None
+
+
+def activate(history: LatencyHistory | None) -> LatencyHistory | None:
+    """Install *history* process-wide and return the previously active one."""
+    global _ACTIVE
+    previous = _ACTIVE
+    _ACTIVE = history
+    return previous
+
+
+def active_history() -> LatencyHistory | None:
+    """Return the history installed by :func:`activate`, if any."""
+    return _ACTIVE
+
+
+def observe(name: str, seconds: float, deadline: float | None = None) -> None:
+    """Record a fetch duration in the active history (no-op without one)."""
+    history = _ACTIVE
+    if history is not None:
+        history.observe(name, seconds, deadline)
+
+
+def observe_timeout(name: str) -> None:
+    """Record a deadline eviction in the active history (no-op without one)."""
+    history = _ACTIVE
+    if history is not None:
+        history.observe_timeout(name)
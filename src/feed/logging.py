@@ -1,10 +1,19 @@
-"""Logging utilities for the feed builder."""
+"""Logging utilities for the feed builder.
+
+The file handlers write into one segment per local day
+(``log/errors.2026-03-01.log``, ``log/diagnostics.2026-03-01.log``);
+``errors.log`` / ``diagnostics.log`` only name the series. Retention is
+enforced by :func:`prune_log_segments`, which deletes whole expired
+segments without reading them, and :func:`read_log_segments` stitches the
+retained segments back together for diagnostics.
+"""
 from __future__ import annotations
 
 import logging
 import os
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -38,6 +47,58 @@ class MaxLevelFilter(logging.Filter):
         return record.levelno <= self._max_level
 
 
+def _local_day(timestamp: float) -> date:
+    return datetime.fromtimestamp(timestamp, LOG_TIMEZONE).date()
+
+
+def log_segment_path(base_path: Path, day: date) -> Path:
+    """Return the segment of the series *base_path* for *day*.
+
+    ``log/errors.log`` and 2026-03-01 give ``log/errors.2026-03-01.log``.
+    """
+    return base_path.with_name(f"{base_path.stem}.{day.isoformat()}{base_path.suffix}")
+
+
+class DailySegmentHandler(RotatingFileHandler):
+    """``RotatingFileHandler`` that starts a new segment file every local day.
+
+    Each record goes to the segment of the day it was created on, so a
+    segment only ever holds one day and expires as a whole. ``maxBytes`` /
+    ``backupCount`` still bound a single day (``errors.2026-03-01.log.1``
+    …). Files are created lazily on the first record.
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        *,
+        maxBytes: int = 0,  # noqa: N803 - mirrors RotatingFileHandler
+        backupCount: int = 0,  # noqa: N803 - mirrors RotatingFileHandler
+        encoding: str | None = None,
+    ) -> None:
+        self.base_path = Path(base_path)
+        self._day = _local_day(time.time())
+        super().__init__(
+            log_segment_path(self.base_path, self._day),
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=True,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # ``Handler.handle`` holds the handler lock, so switching segments
+        # cannot interleave with another thread's write.
+        day = _local_day(record.created)
+        if day != self._day:
+            self._day = day
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None  # type: ignore[assignment]
+            self.baseFilename = os.path.abspath(log_segment_path(self.base_path, day))
+        super().emit(record)
+
+
 def configure_logging() -> None:
     """Configure the default logging handlers for the feed builder."""
 
@@ -68,8 +129,7 @@ def configure_logging() -> None:
         if isinstance(handler, logging.StreamHandler):
             handler.setLevel(level)
 
-    error_log_path.touch(exist_ok=True)
-    error_handler = RotatingFileHandler(
+    error_handler = DailySegmentHandler(
         error_log_path,
         maxBytes=LOG_MAX_BYTES,
         backupCount=LOG_BACKUP_COUNT,
@@ -79,8 +139,7 @@ def configure_logging() -> None:
     error_handler.setFormatter(safe_formatter)
     root_logger.addHandler(error_handler)
 
-    diagnostics_log_path.touch(exist_ok=True)
-    diagnostics_handler = RotatingFileHandler(
+    diagnostics_handler = DailySegmentHandler(
         diagnostics_log_path,
         maxBytes=LOG_MAX_BYTES,
         backupCount=LOG_BACKUP_COUNT,
@@ -179,7 +238,11 @@ MAX_LOG_PRUNE_FILE_BYTES = 2 * MAX_LOG_BYTES
 
 
 def prune_log_file(path: Path, *, now: datetime, keep_days: int = 7) -> None:
-    """Remove log records older than ``keep_days`` from ``path``."""
+    """Remove log records older than ``keep_days`` from ``path``.
+
+    Rewrites a single, unsegmented log file in place. The feed builder's
+    own logs are day segments pruned by :func:`prune_log_segments`.
+    """
 
     if keep_days <= 0:
         return
@@ -260,14 +323,113 @@ def prune_log_file(path: Path, *, now: datetime, keep_days: int = 7) -> None:
         return
 
 
+def _segment_name_re(base_path: Path) -> re.Pattern[str]:
+    return re.compile(
+        rf"{re.escape(base_path.stem)}\.(\d{{4}}-\d{{2}}-\d{{2}}){re.escape(base_path.suffix)}(?:\.(\d+))?"
+    )
+
+
+def log_segments(base_path: Path) -> list[tuple[date, Path]]:
+    """Return the segments of *base_path* with their day, oldest first.
+
+    Size-rotated backups of a day (``.2``, ``.1``) precede the day's live
+    segment, matching the order in which they were written.
+    """
+    pattern = _segment_name_re(base_path)
+    found: list[tuple[date, int, Path]] = []
+    try:
+        candidates = list(base_path.parent.glob(f"{base_path.stem}.*"))
+    except OSError:
+        return []
+    for candidate in candidates:
+        match = pattern.fullmatch(candidate.name)
+        if match is None:
+            continue
+        try:
+            day = date.fromisoformat(match.group(1))
+        except ValueError:
+            continue
+        found.append((day, -int(match.group(2) or 0), candidate))
+    found.sort()
+    return [(day, path) for day, _backup, path in found]
+
+
+def prune_log_segments(base_path: Path, *, now: datetime, keep_days: int = 7) -> int:
+    """Delete segments of *base_path* older than ``keep_days``; return the count.
+
+    A segment is kept while its day is within the window, so retention is
+    day-granular. Nothing is read or rewritten: the cost depends on the
+    number of segments, not on the retained log volume. A pre-segment
+    ``errors.log`` (and its ``.1`` … backups) expires as a whole by mtime.
+    """
+    if keep_days <= 0:
+        return 0
+    keep_days = min(keep_days, MAX_LOG_PRUNE_KEEP_DAYS)
+    now = now.replace(tzinfo=LOG_TIMEZONE) if now.tzinfo is None else now.astimezone(LOG_TIMEZONE)
+    cutoff = now - timedelta(days=keep_days)
+    expired = [path for day, path in log_segments(base_path) if day < cutoff.date()]
+    legacy = [base_path, *base_path.parent.glob(f"{base_path.name}.[0-9]*")]
+    for path in legacy:
+        try:
+            if path.stat().st_mtime < cutoff.timestamp():
+                expired.append(path)
+        except OSError:
+            continue
+    removed = 0
+    for path in expired:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        removed += 1
+    return removed
+
+
+def read_log_segments(
+    base_path: Path,
+    *,
+    since: date | None = None,
+    max_bytes: int = MAX_LOG_PRUNE_FILE_BYTES,
+) -> str:
+    """Concatenate the segments of *base_path* (from *since* on), oldest first.
+
+    At most ``max_bytes`` are returned: segments are taken newest first
+    until the budget is spent, so an oversized history yields its most
+    recent part. Unreadable segments are skipped.
+    """
+    logger = logging.getLogger(__name__)
+    parts: list[str] = []
+    remaining = max_bytes
+    for day, path in reversed(log_segments(base_path)):
+        if since is not None and day < since:
+            break
+        try:
+            size = path.stat().st_size
+        except OSError:
+            continue
+        if size > remaining:
+            break
+        text = read_capped_text(path, remaining, errors="replace", label="log", logger=logger)
+        if text is None:
+            continue
+        parts.append(text)
+        remaining -= size
+    return "".join(reversed(parts))
+
+
 __all__ = [
     "MAX_LOG_PRUNE_FILE_BYTES",
     "MAX_LOG_PRUNE_KEEP_DAYS",
+    "DailySegmentHandler",
     "MaxLevelFilter",
     "SafeFormatter",
     "SafeJSONFormatter",
     "configure_logging",
     "diagnostics_log_path",
     "error_log_path",
+    "log_segment_path",
+    "log_segments",
     "prune_log_file",
+    "prune_log_segments",
+    "read_log_segments",
 ]
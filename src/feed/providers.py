@@ -8,7 +8,7 @@ import os
 from dataclasses import dataclass
 from types import ModuleType
 from typing import Any, cast
-from collections.abc import Callable, Iterable
+from collections.abc import Awaitable, Callable, Iterable
 
 from ..utils.cache import read_cache
 from ..utils.logging import sanitize_log_arg
@@ -17,7 +17,9 @@ from ..feed_types import FeedItem
 
 log = logging.getLogger(__name__)
 
-ProviderLoader = Callable[..., list[FeedItem]]
+# ``async def`` loaders are accepted as well; ``build_feed`` runs them on an
+# event loop instead of the thread pool.
+ProviderLoader = Callable[..., list[FeedItem]] | Callable[..., Awaitable[list[FeedItem]]]
 
 _PLUGINS_ENV_VAR = "WIEN_OEPNV_PROVIDER_PLUGINS"
 
@@ -42,7 +44,7 @@ _LOADED_PLUGINS: set[str] = set()
 
 
 def register_provider(env_var: str, loader: ProviderLoader, *, cache_key: str) -> None:
-    """Register ``loader`` as disruption provider controlled via ``env_var``."""
+    """Register ``loader`` (sync or ``async def``) as disruption provider controlled via ``env_var``."""
 
     spec = ProviderSpec(env_var=env_var, loader=loader, cache_key=cache_key)
     _REGISTRY[env_var] = spec
@@ -51,7 +53,7 @@ def register_provider(env_var: str, loader: ProviderLoader, *, cache_key: str) -
     except (AttributeError, TypeError):  # pragma: no cover - defensive only
         pass
     try:
-        loader._provider_cache_name = cache_key  # type: ignore[attr-defined]
+        loader._provider_cache_name = cache_key  # type: ignore[union-attr]
     except (AttributeError, TypeError):  # pragma: no cover - defensive only
         pass
 
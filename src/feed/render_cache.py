@@ -0,0 +1,142 @@
+"""Persistent cache of formatted feed-item content across builds.
+
+Most items are unchanged between two consecutive builds, yet formatting
+one (HTML-to-text, summary composition and truncation, link validation,
+the EN translation overlay) is the bulk of the render stage. A
+:class:`RenderCache` maps a digest of everything the formatter reads
+(:func:`render_key`) to its finished output, so an unchanged item is
+formatted once per content version instead of once per build.
+
+``build_feed.main`` loads the cache from the file next to the state file,
+installs it with :func:`activate` for the duration of the run and saves
+it afterwards. Without an active cache (tests, library use, the
+benchmark harness) the formatter runs unconditionally.
+
+Only entries used by the current build are written back, so the file
+never holds more than the rendered feeds; an unchanged cache is not
+rewritten at all. A missing, oversized, corrupt or version-mismatched
+file simply starts an empty cache.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Final
+
+from ..utils.files import atomic_write, read_capped_json
+from . import tracing
+
+__all__ = [
+    "RENDER_CACHE_FORMAT",
+    "RenderCache",
+    "activate",
+    "active_cache",
+    "render_key",
+]
+
+log = logging.getLogger(__name__)
+
+# Layout of the cache file itself; entries written under another format
+# are discarded on load. Formatter changes are versioned by the caller
+# through the key (see ``build_feed._RENDER_CACHE_VERSION``).
+RENDER_CACHE_FORMAT: Final = 1
+# Two feeds of ``MAX_ITEMS`` entries stay far below this; the cap only
+# guards the loader against a planted or corrupted file.
+MAX_RENDER_CACHE_BYTES: Final = 8 * 1024 * 1024
+
+
+def render_key(inputs: Sequence[object]) -> str:
+    """Digest of the formatter *inputs* (JSON-serialisable, ``str`` fallback)."""
+    payload = json.dumps(list(inputs), ensure_ascii=True, allow_nan=False, default=str)
+    # ``surrogatepass``: a lone surrogate from an upstream ``\\uD800``
+    # escape must not crash the build before ``_sanitize_text`` strips it.
+    return hashlib.sha256(payload.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+class RenderCache:
+    """Digest → formatted field values, with per-build usage tracking."""
+
+    __slots__ = ("_entries", "_used", "_dirty", "hits", "misses")
+
+    def __init__(self, entries: dict[str, tuple[str, ...]] | None = None) -> None:
+        self._entries: dict[str, tuple[str, ...]] = dict(entries or {})
+        self._used: set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def load(cls, path: Path) -> RenderCache:
+        """Read the cache at *path*; any unusable file yields an empty cache."""
+        payload = read_capped_json(path, MAX_RENDER_CACHE_BYTES, label="Render-Cache", logger=log)
+        if not isinstance(payload, dict) or payload.get("format") != RENDER_CACHE_FORMAT:
+            return cls()
+        raw_entries = payload.get("entries")
+        if not isinstance(raw_entries, dict):
+            return cls()
+        entries: dict[str, tuple[str, ...]] = {}
+        for key, values in raw_entries.items():
+            if isinstance(values, list) and all(isinstance(value, str) for value in values):
+                entries[str(key)] = tuple(values)
+        return cls(entries)
+
+    def get(self, key: str, width: int) -> tuple[str, ...] | None:
+        """Return the *width* cached values for *key*, or ``None`` on a miss."""
+        values = self._entries.get(key)
+        if values is None or len(values) != width:
+            self.misses += 1
+            tracing.count("render_cache.miss")
+            return None
+        self._used.add(key)
+        self.hits += 1
+        tracing.count("render_cache.hit")
+        return values
+
+    def put(self, key: str, values: Sequence[str]) -> None:
+        self._entries[key] = tuple(values)
+        self._used.add(key)
+        self._dirty = True
+
+    def save(self, path: Path) -> bool:
+        """Write the entries used by this build to *path*; ``False`` if unchanged."""
+        stale = self._entries.keys() - self._used
+        if not self._dirty and not stale:
+            return False
+        for key in stale:
+            del self._entries[key]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+            # ASCII escapes keep upstream BiDi / zero-width characters out of
+            # the committed file verbatim; ``json.loads`` restores them.
+            json.dump(
+                {"format": RENDER_CACHE_FORMAT, "entries": {key: list(v) for key, v in self._entries.items()}},
+                handle,
+                ensure_ascii=True,
+                allow_nan=False,
+                indent=1,
+                sort_keys=True,
+            )
+        self._dirty = False
+        return True
+
+
+_ACTIVE: RenderCache | None = None
+
+
+def activate(cache: RenderCache | None) -> RenderCache | None:
+    """Install *cache* process-wide and return the previously active one."""
+    global _ACTIVE
+    previous = _ACTIVE
+    _ACTIVE = cache
+    return previous
+
+
+def active_cache() -> RenderCache | None:
+    """Return the cache installed by :func:`activate`, if any."""
+    return _ACTIVE
@@ -17,7 +17,7 @@ from urllib.parse import urlparse
 import requests
 
 from .config import LOG_TIMEZONE
-from .logging import diagnostics_log_path, error_log_path, prune_log_file
+from .logging import diagnostics_log_path, error_log_path, log_segment_path, prune_log_segments
 
 from ..utils.env import get_bool_env, read_secret
 from ..utils.files import (
@@ -245,6 +245,11 @@ class RunReport:
     raw_item_count: int | None = None
     final_item_count: int | None = None
     durations: dict[str, float] = field(default_factory=dict)
+    # Aggregated tracing spans/counters (:meth:`src.feed.tracing.Tracer.summary`);
+    # ``None`` when the run was not traced.
+    trace: dict[str, Any] | None = None
+    # Adaptive deadline / worker decisions per provider (``src/feed/latency.py``).
+    latency_decisions: dict[str, str] = field(default_factory=dict)
     feed_path: str | None = None
     build_successful: bool = False
     exception_message: str | None = None
@@ -342,6 +347,12 @@ class RunReport:
                 self.providers[name] = entry
             entry.finish("disabled", detail=clean_message(message))
 
+    def record_latency_decision(self, name: str, decision: str) -> None:
+        """Note an adaptive timeout or concurrency decision for provider *name*."""
+        with self._lock:
+            previous = self.latency_decisions.get(name)
+            self.latency_decisions[name] = f"{previous}; {decision}" if previous else decision
+
     def add_warning(self, message: str) -> None:
         """Add a global warning to the report."""
         cleaned = _bounded_message(clean_message(message))
@@ -428,8 +439,12 @@ class RunReport:
 
     def prune_logs(self) -> None:
         now = self.started_at
-        prune_log_file(diagnostics_log_path, now=now)
-        prune_log_file(error_log_path, now=now)
+        prune_log_segments(diagnostics_log_path, now=now)
+        prune_log_segments(error_log_path, now=now)
+
+    def error_log_segment(self) -> Path:
+        """The error-log segment this run writes to (``log/errors.<Tag>.log``)."""
+        return log_segment_path(error_log_path, self.started_at.astimezone(LOG_TIMEZONE).date())
 
     def _provider_summary(self) -> str:
         summaries: list[str] = []
@@ -517,7 +532,7 @@ class RunReport:
                 # ``SafeFormatter`` log handler that consumes the record.
                 log.info(
                     "Hinweis: Fehler während des Feed-Laufs – Details siehe %s",
-                    sanitize_log_arg(str(error_log_path)),
+                    sanitize_log_arg(str(self.error_log_segment())),
                 )
                 with self._lock:
                     if not self._issue_submitted:
@@ -572,6 +587,17 @@ def _format_timestamp_iso(dt: datetime | None) -> str | None:
     return localized.isoformat()
 
 
+def _render_latency_decisions(decisions: dict[str, str]) -> list[str]:
+    """Markdown table of the adaptive deadline / worker decisions (empty if none)."""
+    if not decisions:
+        return []
+    lines = ["### Adaptive Provider-Deadlines", "", "| Provider | Entscheidung |", "| --- | --- |"]
+    for name, decision in sorted(decisions.items()):
+        lines.append(f"| {escape_markdown_cell(name)} | {escape_markdown_cell(decision)} |")
+    lines.append("")
+    return lines
+
+
 def render_feed_health_markdown(
     report: RunReport,
     metrics: FeedHealthMetrics,
@@ -623,6 +649,25 @@ def render_feed_health_markdown(
             lines.append(f"| {key} | {value:.2f} |")
         lines.append("")
 
+    trace_spans = (report.trace or {}).get("spans") or {}
+    if trace_spans:
+        lines.append("### Stufen-Spans")
+        lines.append("")
+        lines.append("| Span | Anzahl | Gesamt (s) | Max (s) |")
+        lines.append("| --- | ---: | ---: | ---: |")
+        for name, stats in sorted(
+            trace_spans.items(), key=lambda entry: entry[1]["total_s"], reverse=True
+        ):
+            # Span names embed provider display names; escape like the
+            # provider table below.
+            lines.append(
+                f"| {escape_markdown_cell(name)} | {stats['count']} | "
+                f"{stats['total_s']:.3f} | {stats['max_s']:.3f} |"
+            )
+        lines.append("")
+
+    lines.extend(_render_latency_decisions(report.latency_decisions))
+
     lines.append("## Providerübersicht")
     lines.append("")
     lines.append("| Provider | Status | Items | Dauer (s) | Details |")
@@ -780,6 +825,18 @@ def build_feed_health_payload(
     if report.feed_path is not None:
         feed_path_value = _CONTROL_CHARS_RE.sub("", report.feed_path)
 
+    # Span names embed provider display names (plugins included), so they
+    # get the same canonical-floor scrub as the other upstream-influenced
+    # strings in this payload.
+    trace = report.trace or {}
+    trace_entry = {
+        section: {
+            _CONTROL_CHARS_RE.sub("", str(name)): value
+            for name, value in (trace.get(section) or {}).items()
+        }
+        for section in ("spans", "counters")
+    }
+
     return {
         "run": {
             "id": report.run_id,
@@ -801,6 +858,11 @@ def build_feed_health_payload(
         "durations": {
             key: value for key, value in sorted(report.durations.items())
         },
+        "trace": trace_entry,
+        "latency_decisions": {
+            _CONTROL_CHARS_RE.sub("", name): decision
+            for name, decision in sorted(report.latency_decisions.items())
+        },
         "providers": provider_entries,
         "warnings": warnings,
         "errors": errors,
@@ -1292,9 +1354,9 @@ class _GithubIssueReporter:
         # span and lets attacker-controlled Markdown render in the public
         # GitHub Issue body. ``safe_markdown_codespan`` neutralises every
         # backtick / control byte / BiDi mark.
+        safe_log_path = safe_markdown_codespan(str(report.error_log_segment()))
         lines.append(
-            "Weitere Details finden sich in der Logdatei "
-            f"`{safe_markdown_codespan(str(error_log_path))}`."
+            f"Weitere Details finden sich in der Logdatei `{safe_log_path}`."
         )
 
         return "\n".join(lines).strip() + "\n"
@@ -0,0 +1,226 @@
+"""Per-line and per-category shard feeds (``docs/feeds/``).
+
+Subscribers who only follow one line (``U6``) or one category
+(``Baustelle``) would otherwise download and filter the full ``feed.xml``.
+While ``build_feed._make_rss`` emits the German feed it records every
+``<item>`` element in a :class:`ShardIndex`, an inverted index from the
+line tokens of the title prefix and the category slug to the rendered
+items. ``build_feed._write_feed_shards`` then serialises one small feed
+per key from those elements; nothing is formatted twice.
+
+``feeds/index.json`` (:class:`ShardManifest`) lists the shards for
+discovery with item count, content digest and the time the content last
+changed. That time is the shard's ``lastBuildDate``, so an unchanged
+shard is byte-identical and its write is skipped. A shard whose line or
+category disappeared stays published as an empty feed (subscribers see
+the disruption end instead of a 404) until it has been empty for
+:data:`RETIRE_AFTER`.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from ..utils.files import WriteOutcome, atomic_write, read_capped_json
+
+if TYPE_CHECKING:
+    import xml.etree.ElementTree as ET  # nosec B405 - element type only
+
+__all__ = [
+    "MANIFEST_NAME",
+    "SHARD_DIR_NAME",
+    "Shard",
+    "ShardEntry",
+    "ShardIndex",
+    "ShardManifest",
+    "category_slug",
+    "write_shard",
+]
+
+log = logging.getLogger(__name__)
+
+SHARD_DIR_NAME: Final = "feeds"
+MANIFEST_NAME: Final = "index.json"
+SHARD_MANIFEST_FORMAT: Final = 1
+RETIRE_AFTER: Final = timedelta(days=30)
+# A few hundred lines and categories stay far below this; the cap only
+# guards the loader against a planted or corrupted file.
+MAX_MANIFEST_BYTES: Final = 1024 * 1024
+
+_TRANSLITERATION: Final = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_SLUG_STRIP_RE: Final = re.compile(r"[^a-z0-9]+")
+_KEY_RE: Final = re.compile(r"^(?:line|category)-[A-Za-z0-9-]{1,40}$")
+
+
+def category_slug(category: str) -> str:
+    """ASCII slug of *category* (``"Störung"`` → ``"stoerung"``)."""
+    return _SLUG_STRIP_RE.sub("-", category.casefold().translate(_TRANSLITERATION)).strip("-")[:40]
+
+
+def write_shard(path: Path, document: str) -> bool:
+    """Write the shard feed *document* to *path*; ``False`` if it was unchanged."""
+    outcome = WriteOutcome()
+    with atomic_write(
+        path, mode="w", encoding="utf-8", permissions=0o644, skip_unchanged=True, outcome=outcome
+    ) as handle:
+        handle.write(document)
+    return outcome.changed
+
+
+@dataclass(slots=True)
+class Shard:
+    """One shard feed: its key, what it filters on and the indexed items."""
+
+    key: str
+    kind: str
+    label: str
+    positions: list[int] = field(default_factory=list)
+
+
+class ShardIndex:
+    """Rendered ``<item>`` elements of one feed plus the key → items index."""
+
+    __slots__ = ("_items", "_shards")
+
+    def __init__(self) -> None:
+        self._items: list[tuple[ET.Element, dict[str, str]]] = []
+        self._shards: dict[str, Shard] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(
+        self,
+        element: ET.Element,
+        replacements: Mapping[str, str],
+        *,
+        lines: Iterable[str],
+        category: object,
+    ) -> None:
+        """Index *element* (with its CDATA *replacements*) under its lines and category."""
+        position = len(self._items)
+        self._items.append((element, dict(replacements)))
+        keys: list[tuple[str, str, str]] = [(f"line-{line}", "line", line) for line in lines]
+        if isinstance(category, str) and category.strip():
+            slug = category_slug(category)
+            if slug:
+                keys.append((f"category-{slug}", "category", category.strip()))
+        for key, kind, label in keys:
+            if not _KEY_RE.match(key):
+                continue
+            shard = self._shards.setdefault(key, Shard(key, kind, label))
+            if not shard.positions or shard.positions[-1] != position:
+                shard.positions.append(position)
+
+    def shards(self) -> list[Shard]:
+        return [self._shards[key] for key in sorted(self._shards)]
+
+    def item(self, position: int) -> tuple[ET.Element, dict[str, str]]:
+        return self._items[position]
+
+
+@dataclass(frozen=True, slots=True)
+class ShardEntry:
+    """Manifest record of one published shard."""
+
+    kind: str
+    label: str
+    items: int
+    digest: str
+    updated: datetime
+
+    def to_json(self, key: str) -> dict[str, Any]:
+        return {
+            "path": f"{key}.xml",
+            "kind": self.kind,
+            "label": self.label,
+            "items": self.items,
+            "digest": self.digest,
+            "updated": self.updated.isoformat(),
+        }
+
+    @classmethod
+    def from_json(cls, raw: object) -> ShardEntry | None:
+        if not isinstance(raw, dict):
+            return None
+        kind, label, items, digest = raw.get("kind"), raw.get("label"), raw.get("items"), raw.get("digest")
+        if not (
+            isinstance(kind, str)
+            and isinstance(label, str)
+            and isinstance(items, int)
+            and not isinstance(items, bool)
+            and isinstance(digest, str)
+        ):
+            return None
+        try:
+            updated = datetime.fromisoformat(str(raw.get("updated")))
+        except ValueError:
+            return None
+        if updated.tzinfo is None:
+            return None
+        return cls(kind, label, items, digest, updated)
+
+
+class ShardManifest:
+    """``feeds/index.json``: every published shard and when its content changed."""
+
+    __slots__ = ("entries",)
+
+    def __init__(self, entries: Mapping[str, ShardEntry] | None = None) -> None:
+        self.entries: dict[str, ShardEntry] = dict(entries or {})
+
+    @classmethod
+    def load(cls, path: Path) -> ShardManifest:
+        """Read the manifest at *path*; any unusable file yields an empty one."""
+        payload = read_capped_json(path, MAX_MANIFEST_BYTES, label="Shard-Manifest", logger=log)
+        if not isinstance(payload, dict) or payload.get("format") != SHARD_MANIFEST_FORMAT:
+            return cls()
+        raw_shards = payload.get("shards")
+        if not isinstance(raw_shards, dict):
+            return cls()
+        entries: dict[str, ShardEntry] = {}
+        for key, raw in raw_shards.items():
+            entry = ShardEntry.from_json(raw)
+            if entry is not None and _KEY_RE.match(str(key)):
+                entries[str(key)] = entry
+        return cls(entries)
+
+    def empty_shard(self, key: str) -> Shard:
+        """The manifest's shard *key* without items (its line or category vanished)."""
+        entry = self.entries[key]
+        return Shard(key, entry.kind, entry.label)
+
+    def record(self, key: str, *, kind: str, label: str, items: int, digest: str, now: datetime) -> datetime:
+        """Store the shard's current content; return the time it last changed."""
+        previous = self.entries.get(key)
+        updated = previous.updated if previous is not None and previous.digest == digest else now
+        self.entries[key] = ShardEntry(kind, label, items, digest, updated)
+        return updated
+
+    def retired(self, now: datetime) -> list[str]:
+        """Drop and return the keys of shards that have been empty for :data:`RETIRE_AFTER`."""
+        keys = [key for key, entry in self.entries.items() if entry.items == 0 and now - entry.updated >= RETIRE_AFTER]
+        for key in keys:
+            del self.entries[key]
+        return keys
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "format": SHARD_MANIFEST_FORMAT,
+            "shards": {key: self.entries[key].to_json(key) for key in sorted(self.entries)},
+        }
+
+    def save(self, path: Path) -> bool:
+        """Write the manifest to *path*; ``False`` if the file already held it."""
+        outcome = WriteOutcome()
+        with atomic_write(
+            path, mode="w", encoding="utf-8", permissions=0o644, skip_unchanged=True, outcome=outcome
+        ) as handle:
+            json.dump(self.to_json(), handle, ensure_ascii=True, allow_nan=False, indent=1)
+        return outcome.changed
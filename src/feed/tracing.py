@@ -0,0 +1,248 @@
+"""Lightweight per-stage tracing spans for the feed build.
+
+``build_feed.main`` activates a :class:`Tracer` for the duration of a run;
+instrumented code opens spans through the module-level :func:`span`
+context manager or the :func:`traced` decorator and bumps counters via
+:func:`count`. Without an active tracer (tests, library use, the
+benchmark harness) every entry point is a single global lookup that
+returns a shared no-op — no clock read, no lock, no allocation.
+
+Spans are aggregated per name (count, total, max) into the ``trace``
+section of ``docs/feed-health.json``. Individual events are only kept
+when the tracer is created with ``record_events=True`` (``FEED_TRACE_PATH``
+set); :meth:`Tracer.write_chrome_trace` then exports them in the Chrome
+Trace Event format, which ``chrome://tracing`` and https://ui.perfetto.dev
+open directly.
+
+Spans opened in executor threads (network providers) are attributed to
+that thread; nesting is implied by time containment per thread, so no
+parent bookkeeping is needed.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import math
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from types import TracebackType
+from typing import Any, ParamSpec, TypeVar
+
+from ..utils.files import atomic_write
+
+__all__ = [
+    "SpanStats",
+    "Tracer",
+    "activate",
+    "active_tracer",
+    "count",
+    "span",
+    "traced",
+]
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+# Upper bound for retained events so a pathological run (an identity span
+# per item at 100× volume) cannot grow the export without limit. Aggregates
+# are unaffected; dropped events are counted under ``tracing.dropped_events``.
+DEFAULT_MAX_EVENTS = 200_000
+
+
+@dataclass(slots=True)
+class SpanStats:
+    """Aggregate of every finished span sharing one name."""
+
+    count: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"count": self.count, "total_s": self.total_s, "max_s": self.max_s}
+
+
+class _NullSpan:
+    """Shared stand-in returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_attrs", "_start")
+
+    def __init__(self, tracer: Tracer, name: str, attrs: dict[str, Any] | None) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._attrs = attrs
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        end = perf_counter()
+        attrs = self._attrs
+        if exc_type is not None:
+            attrs = {**(attrs or {}), "error": exc_type.__name__}
+        self._tracer._finish(self._name, self._start, end, attrs)
+
+
+class Tracer:
+    """Thread-safe span and counter sink for one feed-build run."""
+
+    def __init__(self, *, record_events: bool = False, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        self.record_events = record_events
+        self.max_events = max_events
+        self._origin = perf_counter()
+        self._lock = threading.Lock()
+        self._spans: dict[str, SpanStats] = {}
+        self._counters: dict[str, int] = {}
+        # (name, start offset µs, duration µs, thread id, attrs)
+        self._events: list[tuple[str, float, float, int, dict[str, Any] | None]] = []
+        self._thread_names: dict[int, str] = {}
+
+    def span(self, name: str, **attrs: Any) -> _Span:
+        """Return a context manager timing the enclosed block as *name*."""
+        return _Span(self, name, attrs or None)
+
+    def count(self, name: str, delta: int = 1) -> None:
+        """Add *delta* to the counter *name*."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + delta
+
+    def _finish(self, name: str, start: float, end: float, attrs: dict[str, Any] | None) -> None:
+        duration = end - start
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = SpanStats()
+            stats.count += 1
+            stats.total_s += duration
+            if duration > stats.max_s:
+                stats.max_s = duration
+            if not self.record_events:
+                return
+            if len(self._events) >= self.max_events:
+                self._counters["tracing.dropped_events"] = self._counters.get("tracing.dropped_events", 0) + 1
+                return
+            thread = threading.current_thread()
+            tid = thread.ident or 0
+            self._thread_names.setdefault(tid, thread.name)
+            self._events.append((name, (start - self._origin) * 1e6, duration * 1e6, tid, attrs))
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregated spans and counters, as embedded in ``feed-health.json``."""
+        with self._lock:
+            return {
+                "spans": {name: stats.as_dict() for name, stats in sorted(self._spans.items())},
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Recorded events in the Chrome Trace Event format (``X`` complete events)."""
+        pid = os.getpid()
+        with self._lock:
+            events: list[dict[str, Any]] = [
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+                for tid, thread_name in sorted(self._thread_names.items())
+            ]
+            for name, ts, dur, tid, attrs in self._events:
+                event: dict[str, Any] = {"name": name, "ph": "X", "ts": ts, "dur": dur, "pid": pid, "tid": tid}
+                if attrs:
+                    event["args"] = {key: _json_safe(value) for key, value in attrs.items()}
+                events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Persist :meth:`chrome_trace` to *path* atomically."""
+        payload = self.chrome_trace()
+        with atomic_write(path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+            # Span names and attributes are code-defined identifiers plus
+            # provider display names; ASCII escapes keep the artefact free of
+            # raw control or BiDi bytes regardless.
+            json.dump(payload, handle, allow_nan=False)
+            handle.write("\n")
+
+
+def _json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, bool | int | str):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    return str(value)
+
+
+_ACTIVE: Tracer | None = None
+
+
+def activate(tracer: Tracer | None) -> Tracer | None:
+    """Install *tracer* process-wide and return the previously active one.
+
+    Process-wide rather than per-thread on purpose: provider fetches run
+    in executor threads and must report into the run's tracer. Pass the
+    returned value back to :func:`activate` to restore it.
+    """
+    global _ACTIVE
+    previous = _ACTIVE
+    _ACTIVE = tracer
+    return previous
+
+
+def active_tracer() -> Tracer | None:
+    """Return the tracer installed by :func:`activate`, if any."""
+    return _ACTIVE
+
+
+def span(name: str, **attrs: Any) -> _Span | _NullSpan:
+    """Time the enclosed block as *name* on the active tracer (no-op without one)."""
+    tracer = _ACTIVE
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, attrs or None)
+
+
+def count(name: str, delta: int = 1) -> None:
+    """Bump counter *name* on the active tracer (no-op without one)."""
+    tracer = _ACTIVE
+    if tracer is not None:
+        tracer.count(name, delta)
+
+
+def traced(name: str) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Decorator form of :func:`span` for whole functions."""
+
+    def decorator(func: Callable[_P, _R]) -> Callable[_P, _R]:
+        @functools.wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            tracer = _ACTIVE
+            if tracer is None:
+                return func(*args, **kwargs)
+            with _Span(tracer, name, None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
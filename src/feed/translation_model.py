@@ -0,0 +1,378 @@
+"""Runtime settings and optional int8 quantization of the DE→EN model.
+
+``build_feed._get_translation_pipeline`` loads ``Helsinki-NLP/opus-mt-de-en``
+in float32. With ``TRANSLATION_QUANTIZE=int8`` the ``nn.Linear`` layers of
+the Marian model are dynamically quantized to int8 instead (weights stored
+as int8, activations quantized per batch), which cuts the CPU time per
+translation and the resident size of the model.
+
+A quantized model is only used once it passed a quality check against a
+golden corpus (:func:`golden_corpus`): German titles and summaries of the
+last published feed paired with the English translations the float32
+model produced for them, as persisted in ``first_seen.json``. The corpus
+score is the mean chrF of the quantized pipeline's output against those
+references. The outcome is recorded in :class:`QuantizedModelCache` next
+to the Hugging Face cache:
+
+* accepted – the int8 weights are stored as safetensors (integer weights
+  plus scale / zero point, no pickle) and later builds load them directly;
+* rejected – later builds use float32 without retrying.
+
+Either record is tied to the installed ``torch`` / ``transformers``
+versions, so an upgrade quantizes and verifies again. ``torch`` and
+``transformers`` are imported lazily; nothing here is loaded unless the EN
+feed is built.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
+
+from defusedxml import ElementTree as ET
+
+from ..utils.files import atomic_write, read_capped_json
+
+__all__ = [
+    "MIN_CORPUS_CHRF",
+    "MIN_CORPUS_PAIRS",
+    "QuantizedModelCache",
+    "chrf",
+    "corpus_score",
+    "generation_kwargs",
+    "golden_corpus",
+    "quantize_int8",
+    "set_num_threads",
+]
+
+log = logging.getLogger(__name__)
+
+CACHE_FORMAT: Final = 1
+SCHEME: Final = "int8-dynamic"
+WEIGHTS_NAME: Final = "model.int8.safetensors"
+METADATA_NAME: Final = "quantization.json"
+# The references are the float32 model's own output, so a faithful int8
+# model reproduces most of them verbatim; the threshold tolerates wording
+# drift but rejects a model that degraded into different sentences.
+MIN_CORPUS_CHRF: Final = 0.85
+# Fewer reference pairs than this are no verdict; the build stays on
+# float32 and tries again next time.
+MIN_CORPUS_PAIRS: Final = 10
+# Bounds the verification to a few seconds of int8 inference.
+MAX_CORPUS_PAIRS: Final = 40
+MAX_FEED_BYTES: Final = 10 * 1024 * 1024
+MAX_METADATA_BYTES: Final = 64 * 1024
+
+# ``format_local_times`` appends the time line as `` [<range>]`` to the
+# German description; the summary is everything before it.
+_TIME_LINE_SUFFIX_RE: Final = re.compile(r"\s*\[[^\[\]]*\]\s*$")
+# ``build_feed._compose_description`` cuts over-long descriptions and
+# appends this marker; the German text then no longer matches the full
+# English summary.
+_TRUNCATED_SUFFIX: Final = "[TRUNCATED]"
+
+
+def set_num_threads(threads: int) -> None:
+    """Pin torch's intra-op thread pool to *threads* (``0`` keeps torch's default)."""
+    if threads <= 0:
+        return
+    import torch
+
+    torch.set_num_threads(threads)
+
+
+def generation_kwargs(num_beams: int) -> dict[str, int]:
+    """Extra pipeline arguments for *num_beams* (``0`` keeps the model's default)."""
+    return {"num_beams": num_beams} if num_beams > 0 else {}
+
+
+def quantize_int8(model: Any) -> Any:
+    """Dynamically quantize the ``nn.Linear`` layers of *model* to int8, in place."""
+    import torch
+
+    model.eval()
+    return torch.ao.quantization.quantize_dynamic(  # type: ignore[no-untyped-call, unused-ignore]
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
+def chrf(hypothesis: str, reference: str, *, max_order: int = 6, beta: float = 2.0) -> float:
+    """Character n-gram F-score (chrF, whitespace ignored) between 0 and 1."""
+    hyp = "".join(hypothesis.split())
+    ref = "".join(reference.split())
+    precisions: list[float] = []
+    recalls: list[float] = []
+    for order in range(1, max_order + 1):
+        hyp_grams = Counter(hyp[i : i + order] for i in range(len(hyp) - order + 1))
+        ref_grams = Counter(ref[i : i + order] for i in range(len(ref) - order + 1))
+        if not hyp_grams or not ref_grams:
+            continue
+        overlap = sum((hyp_grams & ref_grams).values())
+        precisions.append(overlap / sum(hyp_grams.values()))
+        recalls.append(overlap / sum(ref_grams.values()))
+    if not precisions:
+        return 1.0 if hyp == ref else 0.0
+    precision = sum(precisions) / len(precisions)
+    recall = sum(recalls) / len(recalls)
+    if precision + recall == 0:
+        return 0.0
+    weight = beta * beta
+    return (1 + weight) * precision * recall / (weight * precision + recall)
+
+
+def corpus_score(pairs: Sequence[tuple[str, str]], translate: Callable[[str], str | None]) -> float:
+    """Mean :func:`chrf` of ``translate(de)`` against ``en`` over *pairs*; failures score 0."""
+    if not pairs:
+        return 0.0
+    total = 0.0
+    for german, english in pairs:
+        candidate = translate(german)
+        total += chrf(candidate, english) if candidate else 0.0
+    return total / len(pairs)
+
+
+def _feed_texts(feed_path: Path) -> list[tuple[str, str, str]]:
+    """``(guid, title, summary)`` of every item in the German feed at *feed_path*.
+
+    The summary of a truncated description is left empty: only its title
+    can be paired with a reference.
+    """
+    try:
+        if feed_path.stat().st_size > MAX_FEED_BYTES:
+            return []
+        root = ET.parse(feed_path).getroot()
+    except (OSError, ET.ParseError):
+        return []
+    texts: list[tuple[str, str, str]] = []
+    for item in root.iter("item"):
+        guid = (item.findtext("guid") or "").strip()
+        if guid:
+            title = (item.findtext("title") or "").strip()
+            description = (item.findtext("description") or "").strip()
+            if description.endswith(_TRUNCATED_SUFFIX):
+                summary = ""
+            else:
+                summary = _TIME_LINE_SUFFIX_RE.sub("", description).strip()
+            texts.append((guid, title, summary))
+    return texts
+
+
+def golden_corpus(
+    feed_path: Path,
+    state: Mapping[str, Any],
+    *,
+    epoch: int,
+    limit: int = MAX_CORPUS_PAIRS,
+) -> list[tuple[str, str]]:
+    """German → English reference pairs from the published feed and *state*.
+
+    The German side comes from the feed at *feed_path*, the English side
+    from the cached translations of the same item in *state* (keyed by
+    guid). Only translations stamped with the current cache *epoch* are
+    used — older ones went through different masking — and pairs whose
+    English equals the German (no model output) are skipped.
+    """
+    pairs: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for guid, title, summary in _feed_texts(feed_path):
+        entry = state.get(guid)
+        translations = entry.get("translations") if isinstance(entry, dict) else None
+        if not isinstance(translations, dict) or translations.get("epoch") != epoch:
+            continue
+        english = translations.get("en")
+        if not isinstance(english, dict):
+            continue
+        for german, field in ((title, "title"), (summary, "summary")):
+            reference = english.get(field)
+            if german and isinstance(reference, str) and reference and reference != german and german not in seen:
+                seen.add(german)
+                pairs.append((german, reference))
+                if len(pairs) >= limit:
+                    return pairs
+    return pairs
+
+
+def _versions() -> dict[str, str]:
+    import torch
+    import transformers
+
+    return {"torch": str(torch.__version__), "transformers": str(transformers.__version__)}
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class QuantizedModelCache:
+    """Verified int8 weights of one model plus the verification record."""
+
+    model_name: str
+    directory: Path
+
+    @classmethod
+    def for_model(cls, model_name: str, root: Path | None = None) -> QuantizedModelCache:
+        """The cache of *model_name* below *root* (default: the Hugging Face cache)."""
+        if root is None:
+            root = Path(os.environ.get("HF_HOME") or Path.home() / ".cache" / "huggingface")
+        return cls(model_name, root / "wien-oepnv-quantized" / model_name.replace("/", "--"))
+
+    @property
+    def weights_path(self) -> Path:
+        return self.directory / WEIGHTS_NAME
+
+    @property
+    def metadata_path(self) -> Path:
+        return self.directory / METADATA_NAME
+
+    def status(self) -> str | None:
+        """``"accepted"`` or ``"rejected"`` for the installed versions, else ``None``."""
+        metadata = read_capped_json(self.metadata_path, MAX_METADATA_BYTES, label="Quantisierungs-Cache", logger=log)
+        if not isinstance(metadata, dict):
+            return None
+        if (
+            metadata.get("format") != CACHE_FORMAT
+            or metadata.get("model") != self.model_name
+            or metadata.get("scheme") != SCHEME
+            or metadata.get("versions") != _versions()
+        ):
+            return None
+        status = metadata.get("status")
+        if status == "rejected":
+            return "rejected"
+        if status != "accepted" or not self.weights_path.is_file():
+            return None
+        return "accepted" if metadata.get("sha256") == _file_digest(self.weights_path) else None
+
+    def _record(self, status: str, *, score: float, pairs: int, sha256: str | None = None) -> None:
+        metadata: dict[str, Any] = {
+            "format": CACHE_FORMAT,
+            "model": self.model_name,
+            "scheme": SCHEME,
+            "versions": _versions(),
+            "status": status,
+            "chrf": round(score, 4),
+            "min_chrf": MIN_CORPUS_CHRF,
+            "pairs": pairs,
+        }
+        if sha256 is not None:
+            metadata["sha256"] = sha256
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.metadata_path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+            json.dump(metadata, handle, ensure_ascii=True, allow_nan=False, indent=2, sort_keys=True)
+
+    def reject(self, *, score: float, pairs: int) -> None:
+        """Record that quantization failed verification with *score*."""
+        self.weights_path.unlink(missing_ok=True)
+        self._record("rejected", score=score, pairs=pairs)
+
+    def save(self, model: Any, *, score: float, pairs: int) -> None:
+        """Store the quantized *model* and record it as verified with *score*."""
+        import torch
+        from safetensors.torch import save
+
+        quantized = _quantized_linears(model)
+        tensors: dict[str, Any] = {}
+        for name, module in quantized.items():
+            weight, bias = module.weight(), module.bias()
+            if weight.qscheme() != torch.per_tensor_affine:
+                raise ValueError(f"Unsupported quantization scheme {weight.qscheme()} in {name}")
+            tensors[f"{name}.weight.int8"] = weight.int_repr().contiguous()
+            tensors[f"{name}.weight.scale"] = torch.tensor([weight.q_scale()], dtype=torch.float64)
+            tensors[f"{name}.weight.zero_point"] = torch.tensor([weight.q_zero_point()], dtype=torch.int64)
+            if bias is not None:
+                tensors[f"{name}.bias"] = bias.detach().contiguous()
+        # Everything else is stored as is. The quantized layers' own state
+        # (packed params, output scale) is covered above, and tied parameters
+        # (the shared Marian embeddings) share storage and are stored once;
+        # loading the first name fills every alias.
+        storages: set[int] = set()
+        for key, value in model.state_dict().items():
+            if (
+                key.rpartition(".")[0] in quantized
+                or not isinstance(value, torch.Tensor)
+                or value.data_ptr() in storages
+            ):
+                continue
+            storages.add(value.data_ptr())
+            tensors[key] = value.detach().contiguous()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.weights_path, mode="wb", permissions=0o644) as handle:
+            handle.write(save(tensors))
+        self._record("accepted", score=score, pairs=pairs, sha256=_file_digest(self.weights_path))
+
+    def load_pipeline(self) -> Any:
+        """Build the translation pipeline from the cached int8 weights.
+
+        The float parameters are loaded into a freshly configured model
+        first, so tied embeddings are filled through the model's own
+        tying; :func:`quantize_int8` then swaps in the dynamic int8 layers,
+        whose weights are replaced by the stored ones.
+        """
+        import torch
+        from safetensors.torch import load_file
+        from transformers import AutoConfig, AutoModelForSeq2SeqLM, AutoTokenizer, GenerationConfig, pipeline
+
+        config = AutoConfig.from_pretrained(self.model_name)
+        model = AutoModelForSeq2SeqLM.from_config(config)  # type: ignore[no-untyped-call, unused-ignore]
+        tensors = load_file(str(self.weights_path))
+        linears = [name for name, module in model.named_modules() if isinstance(module, torch.nn.Linear)]
+        stored = {name: _pop_int8_weight(tensors, name) for name in linears}
+        missing, unexpected = model.load_state_dict(tensors, strict=False)
+        linear_keys = {f"{name}.{param}" for name in linears for param in ("weight", "bias")}
+        missing = [key for key in missing if key not in linear_keys]
+        if unexpected:
+            raise ValueError(f"Unexpected tensors in {WEIGHTS_NAME}: {len(unexpected)}")
+        if missing and not _all_tied(model, missing):
+            raise ValueError(f"Missing tensors in {WEIGHTS_NAME}: {len(missing)}")
+        quantize_int8(model)
+        for name, module in _quantized_linears(model).items():
+            module.set_weight_bias(*stored[name])
+        model.generation_config = GenerationConfig.from_pretrained(self.model_name)
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)  # type: ignore[no-untyped-call, unused-ignore]
+        # Same task shorthand as the float32 loader in ``build_feed``.
+        return pipeline("translation_de_to_en", model=model, tokenizer=tokenizer)  # type: ignore[call-overload, unused-ignore]
+
+
+def _quantized_linears(model: Any) -> dict[str, Any]:
+    """The dynamically quantized ``Linear`` modules of *model* by name."""
+    import torch
+
+    return {
+        name: module
+        for name, module in model.named_modules()
+        if isinstance(module, torch.ao.nn.quantized.dynamic.Linear)
+    }
+
+
+def _pop_int8_weight(tensors: dict[str, Any], name: str) -> tuple[Any, Any]:
+    """Remove layer *name* from *tensors* as ``(quantized weight, bias)``."""
+    import torch
+
+    try:
+        values = tensors.pop(f"{name}.weight.int8")
+        scale = float(tensors.pop(f"{name}.weight.scale").item())
+        zero_point = int(tensors.pop(f"{name}.weight.zero_point").item())
+    except KeyError:
+        raise ValueError(f"Missing int8 weights for {name} in {WEIGHTS_NAME}") from None
+    # ``(q - zero_point) * scale`` re-quantizes to exactly ``q``.
+    weight = torch.quantize_per_tensor((values.float() - zero_point) * scale, scale, zero_point, torch.qint8)
+    return weight, tensors.pop(f"{name}.bias", None)
+
+
+def _all_tied(model: Any, keys: Sequence[str]) -> bool:
+    """True when every parameter in *keys* shares storage with a loaded one."""
+    state = model.state_dict()
+    loaded = {value.data_ptr() for key, value in state.items() if key not in keys and hasattr(value, "data_ptr")}
+    return all(key in state and state[key].data_ptr() in loaded for key in keys)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
 from datetime import datetime
 from typing import Any, NotRequired, Protocol, TypedDict, runtime_checkable
 
@@ -26,10 +27,132 @@ class FeedItem(TypedDict):
 
     # Internal processing fields
     _identity: NotRequired[str]
+    # Legacy derived-value cache key written by older plugins; dropped by
+    # :meth:`FeedRecord.adopt` (derived values live in the record's slots).
     _calculated_identity: NotRequired[str]
-    _calculated_dedupe_key: NotRequired[str]
-    _calculated_recency: NotRequired[datetime]
-    _calculated_end: NotRequired[datetime]
+
+
+# Keys older builds stored derived values under. Never trusted as input:
+# a value computed before a mutation (or by a plugin) may be stale.
+_LEGACY_DERIVED_KEYS = (
+    "_calculated_identity",
+    "_calculated_dedupe_key",
+    "_calculated_recency",
+    "_calculated_end",
+)
+
+_MISSING: Any = object()
+
+
+class FeedRecord(dict[str, Any]):
+    """``FeedItem`` as used inside the feed build: a dict plus memo slots.
+
+    Derived values (identity, dedupe key, recency and end timestamps) are
+    computed once per build and kept in ``__slots__``
+    instead of ad-hoc ``_calculated_*`` dict keys, so they never leak into
+    ``json.dumps(item)`` (the no-title identity hash), ``write_cache`` or a
+    plugin's view of the item, and the dict itself does not grow per stage.
+
+    Being a real ``dict`` subclass is the plugin adapter: providers,
+    plugins and ``serialize_for_cache`` keep seeing a plain mapping, and
+    ``isinstance(item, dict)`` guards still hold. Every mutating dict
+    method clears the memos, so a memo can never outlive the fields it was
+    computed from; re-assigning a field to the very same object (the
+    datetime coercion in ``_emit_item``) keeps them.
+    """
+
+    __slots__ = ("identity", "dedupe_key", "recency", "end")
+
+    identity: str | None
+    dedupe_key: tuple[str, bool] | None
+    recency: datetime | None
+    end: datetime | None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._invalidate()
+
+    @classmethod
+    def adopt(cls, item: Mapping[str, Any]) -> FeedRecord:
+        """Return *item* as a record (itself if it already is one).
+
+        Legacy ``_calculated_*`` keys are dropped rather than trusted.
+        """
+        if isinstance(item, cls):
+            return item
+        record = cls(item)
+        for key in _LEGACY_DERIVED_KEYS:
+            dict.pop(record, key, None)
+        return record
+
+    @classmethod
+    def adopt_all(cls, items: Iterable[Any]) -> list[Any]:
+        """Adopt every mapping in *items*; anything else passes through unchanged."""
+        return [cls.adopt(item) if isinstance(item, Mapping) else item for item in items]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Plain ``dict`` copy for consumers that must not receive a subclass."""
+        return dict(self)
+
+    def _invalidate(self) -> None:
+        self.identity = None
+        self.dedupe_key = None
+        self.recency = None
+        self.end = None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if dict.get(self, key, _MISSING) is value:
+            return
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._invalidate()
+
+    def __ior__(self, other: Any) -> FeedRecord:  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._invalidate()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self._invalidate()
+        return super().setdefault(key, default)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            self._invalidate()
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        self._invalidate()
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    def copy(self) -> FeedRecord:
+        """Copy the fields; memos start empty on the copy."""
+        return type(self)(self)
+
+    def __reduce__(self) -> tuple[type[FeedRecord], tuple[dict[str, Any]]]:
+        # ``copy.copy`` / ``pickle`` rebuild from the fields alone, like
+        # :meth:`copy`; memos are never carried across.
+        return (type(self), (dict(self),))
+
+
+def as_record(item: object) -> FeedRecord | None:
+    """Return *item* if it is a :class:`FeedRecord`, else ``None``.
+
+    ``isinstance`` cannot narrow the ``FeedItem`` TypedDict to a dict
+    subclass for the type checker; callers go through this helper instead.
+    """
+    return item if isinstance(item, FeedRecord) else None
 
 
 @runtime_checkable
@@ -37,3 +160,14 @@ class Provider(Protocol):
     """Protocol for disruption providers."""
     def fetch_events(self, *args: Any, **kwargs: Any) -> list[FeedItem]:
         ...
+
+
+@runtime_checkable
+class AsyncProvider(Protocol):
+    """Protocol for providers with a native ``async def fetch_events``.
+
+    ``build_feed`` runs such loaders on one event loop instead of the
+    thread pool.
+    """
+    async def fetch_events(self, *args: Any, **kwargs: Any) -> list[FeedItem]:
+        ...
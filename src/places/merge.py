@@ -195,7 +195,7 @@ def write_stations(path: Path, stations: Sequence[StationEntry]) -> None:
         allow_nan=False,
     )
     # Security: use atomic_write to avoid partial writes on crashes/power loss.
-    with atomic_write(path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+    with atomic_write(path, mode="w", encoding="utf-8", permissions=0o644, skip_unchanged=True) as handle:
         handle.write(payload + "\n")
 
 
@@ -20,7 +20,7 @@ import html
 import logging
 import os
 import re
-import time
+from collections.abc import Callable
 from datetime import datetime, UTC
 from email.utils import parsedate_to_datetime
 from itertools import pairwise
@@ -29,6 +29,7 @@ from urllib.parse import urlparse
 import requests
 
 from ..feed_types import FeedItem
+from ..utils import cancellation
 from ..utils.env import get_bool_env
 from ..utils.ids import make_guid
 from ..utils.stations import (
@@ -39,6 +40,7 @@ from ..utils.stations import (
     station_by_oebb_id,
     station_info,
     text_has_vienna_connection,
+    text_may_reference_region,
 )
 from ..utils.http import (
     fetch_content_safe,
@@ -49,6 +51,8 @@ from ..utils.http import (
 from ..utils.logging import sanitize_log_arg
 
 from defusedxml import ElementTree as ET # XXE Mitigation applied
+# Only the tree builder; all parsing goes through the defusedxml parser.
+from xml.etree.ElementTree import TreeBuilder  # nosec B405
 
 log = logging.getLogger(__name__)
 
@@ -1377,11 +1381,85 @@ def _find_stations_in_text(blob: str) -> list[str]:
     return sorted(filtered)
 
 # ---------------- Fetch/Parse ----------------
-def _fetch_xml(url: str, timeout: int = 25) -> ET.Element | None:
+class _ItemCollector:
+    """Turns streamed ``<item>`` elements into feed items during the download."""
+
+    __slots__ = ("items", "seen")
+
+    def __init__(self) -> None:
+        self.items: list[FeedItem] = []
+        self.seen = 0
+
+    def reset(self) -> None:
+        self.items.clear()
+        self.seen = 0
+
+    def __call__(self, item: ET.Element) -> None:
+        self.seen += 1
+        try:
+            feed_item = _build_item_from_xml(item)
+        except Exception as e:
+            # Runs inside ``parser.feed``: an escaping error would abort the
+            # whole document (and with it every other item) in
+            # ``_fetch_xml``'s parse-error handler. One malformed item is
+            # skipped instead.
+            log.warning(
+                "ÖBB RSS: Item %d übersprungen (%s: %s)",
+                self.seen, type(e).__name__, sanitize_log_arg(e),
+            )
+            return
+        if feed_item is not None:
+            self.items.append(feed_item)
+
+
+class _ChannelItemStream(TreeBuilder):
+    """Tree builder that hands each finished ``<channel><item>`` to a callback.
+
+    The item is detached from the channel first, so the tree only ever
+    holds the channel header plus the item currently being parsed.
+    """
+
+    def __init__(self, on_item: Callable[[ET.Element], None] | None) -> None:
+        super().__init__()
+        self._on_item = on_item
+        self._open: list[ET.Element] = []
+        self._channel: ET.Element | None = None
+
+    def start(self, tag: str, attrs: dict[str, str]) -> ET.Element:
+        elem = super().start(tag, attrs)
+        # Same channel as ``root.find("channel")``: the first one below the root.
+        if self._channel is None and tag == "channel" and len(self._open) == 1:
+            self._channel = elem
+        self._open.append(elem)
+        return elem
+
+    def end(self, tag: str) -> ET.Element:
+        elem = super().end(tag)
+        self._open.pop()
+        if self._on_item is not None and tag == "item" and self._open and self._open[-1] is self._channel:
+            self._open[-1].remove(elem)
+            self._on_item(elem)
+        return elem
+
+
+def _fetch_xml(url: str, timeout: int = 25, collector: _ItemCollector | None = None) -> ET.Element | None:
+    """Download and parse the RSS document at *url* incrementally.
+
+    The body is fed into the defusedxml parser chunk by chunk while it
+    arrives (same size cap and entity/DTD protections as before). With a
+    *collector*, every ``<channel><item>`` is processed as soon as it is
+    complete and dropped from the tree, so memory stays flat and the
+    relevance filter overlaps with the download; the returned root then
+    only carries the channel header. A retry restarts the document, so
+    the collector is reset at the start of every attempt.
+    """
     with session_with_retries(USER_AGENT) as s:
         for attempt in range(2):
+            if collector is not None:
+                collector.reset()
+            parser = ET.XMLParser(target=_ChannelItemStream(collector))
             try:
-                content = fetch_content_safe(
+                fetch_content_safe(
                     s,
                     url,
                     timeout=timeout,
@@ -1390,8 +1468,10 @@ def _fetch_xml(url: str, timeout: int = 25) -> ET.Element | None:
                         "text/xml",
                         "application/rss+xml",
                     ),
+                    on_chunk=parser.feed,
                 )
-                return ET.fromstring(content)
+                root: ET.Element = parser.close()
+                return root
             except (ValueError, ET.ParseError, RecursionError) as e:
                 # Resilience: defusedxml defuses XXE / billion-laughs /
                 # quadratic blowup, but a deeply-nested (legitimate-looking)
@@ -1424,7 +1504,7 @@ def _fetch_xml(url: str, timeout: int = 25) -> ET.Element | None:
                              log.warning("ÖBB RSS Rate-Limit überschreitet Maximum (%.1fs). Überspringe (Fail-Fast).", wait_seconds)
                              break
                          log.warning("ÖBB RSS Rate-Limit erreicht. Warte %.1fs (Retry-After).", wait_seconds)
-                         time.sleep(wait_seconds)
+                         cancellation.sleep(wait_seconds)
                      continue
                 raise
 
@@ -1795,6 +1875,15 @@ def _build_item_from_xml(item: ET.Element) -> FeedItem | None:
     # mismatch the cache's old entry). The raw upstream signal is the
     # stable anchor.
     guid = _derive_guid(raw_guid, raw_title, link)
+
+    # Early rejection before the route/station passes below: every path of
+    # ``_is_relevant`` needs a Wien/Pendler station, "Wien"/"Vienna" or a
+    # U-Bahn line in the text, which the anchor-word check rules out
+    # cheaply. Poor titles are exempt — their replacement can come from
+    # the station ID in the link.
+    if not _is_poor_title(title) and not text_may_reference_region(f"{title} {desc}"):
+        return None
+
     title = _apply_route_title(title, desc)
     title = _resolve_poor_title(title, link, guid, desc)
 
@@ -1826,7 +1915,8 @@ def fetch_events(timeout: int = 25) -> list[FeedItem]:
     # attacker-controlled upstream peer stall the cron for ~28 hours per fetch.
     if timeout > MAX_OEBB_FETCH_TIMEOUT:
         timeout = MAX_OEBB_FETCH_TIMEOUT
-    root = _fetch_xml(OEBB_URL, timeout=timeout)
+    collector = _ItemCollector()
+    root = _fetch_xml(OEBB_URL, timeout=timeout, collector=collector)
 
     if root is None:
         return []
@@ -1835,13 +1925,13 @@ def fetch_events(timeout: int = 25) -> list[FeedItem]:
     if channel is None:
         return []
 
-    out: list[FeedItem] = []
+    # Items still attached to the channel were not streamed through the
+    # collector (e.g. a document parsed in one go).
     for item in channel.findall("item"):
-        feed_item = _build_item_from_xml(item)
-        if feed_item is not None:
-            out.append(feed_item)
+        collector(item)
 
-    log.info("ÖBB: %d Items nach Region/Titel-Kosmetik", len(out))
+    out = collector.items
+    log.info("ÖBB: %d von %d Items nach Region/Titel-Kosmetik", len(out), collector.seen)
     return out
 
 
@@ -8,7 +8,6 @@ import json
 import logging
 import os
 import re
-import time
 from datetime import datetime, timedelta, UTC
 from typing import Any, cast
 from collections.abc import Iterable, Sequence
@@ -17,6 +16,7 @@ from urllib.parse import urlparse
 import requests
 from dateutil import parser as dtparser
 
+from ..utils import cancellation
 from ..utils.files import loads_finite
 from ..utils.http import session_with_retries, validate_http_url, fetch_content_safe
 from ..utils.ids import make_guid
@@ -544,7 +544,7 @@ def _get_json(
                         max_retries,
                         sanitize_log_arg(exc),
                     )
-                    time.sleep(2)
+                    cancellation.sleep(2)
                     continue
                 else:
                     log.error(
@@ -0,0 +1,180 @@
+"""File-backed state shared by circuit breakers across processes.
+
+Every cron step runs in a fresh process, so an in-memory
+:class:`~src.utils.circuit_breaker.CircuitBreaker` forgets a known-down
+upstream and pays its full timeout again on the next tick. A
+:class:`BreakerStore` keeps one record per breaker name in a small JSON
+file::
+
+    {"format": 1, "breakers": {"places.osm.overpass": {
+        "state": "open", "failures": 5,
+        "opened_at": 1767225600.0, "probe_until": null}}}
+
+``opened_at`` and ``probe_until`` are wall-clock timestamps, since
+monotonic clocks are not comparable between processes. ``probe_until``
+is the HALF_OPEN probe lease: the process that admits the recovery probe
+claims it, every other process refuses calls until the probe resolves or
+the lease expires (a crashed prober cannot wedge the breaker).
+
+Each update is a read-modify-write under an exclusive
+:func:`~src.utils.locking.file_lock` on a sidecar ``.lock`` file; the
+JSON itself is replaced via :func:`~src.utils.files.atomic_write` and only
+when a record changed, so a healthy upstream never touches the file.
+
+The store is opt-in: :func:`default_store` returns one only when
+``CIRCUIT_BREAKER_STATE_PATH`` names a file below ``cache/``.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Final
+
+from .files import atomic_write, read_capped_json
+from .locking import file_lock
+from .logging import sanitize_log_arg
+
+__all__ = [
+    "BREAKER_STATE_ENV",
+    "BreakerRecord",
+    "BreakerStore",
+    "default_store",
+]
+
+log = logging.getLogger(__name__)
+
+BreakerRecord = dict[str, Any]
+
+BREAKER_STATE_ENV: Final = "CIRCUIT_BREAKER_STATE_PATH"
+BREAKER_STORE_FORMAT: Final = 1
+# A probe is a single upstream call, bounded by the provider timeouts
+# (``MAX_PROVIDER_TIMEOUT`` and friends stay well below this).
+DEFAULT_PROBE_LEASE: Final = 120.0
+# A handful of breakers with four fields each; the cap only guards the
+# loader against a planted or corrupted file.
+MAX_BREAKER_STORE_BYTES: Final = 64 * 1024
+_LOCK_TIMEOUT: Final = 5.0
+_REPO_ROOT: Final = Path(__file__).resolve().parents[2]
+_STATES: Final = frozenset({"closed", "open", "half_open"})
+# A breaker without a record is CLOSED with a clean streak.
+_CLOSED_RECORD: Final[BreakerRecord] = {"state": "closed", "failures": 0, "opened_at": None, "probe_until": None}
+
+
+def _timestamp(value: object) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return float(value) if math.isfinite(value) else None
+
+
+def _valid_record(raw: object) -> BreakerRecord | None:
+    """Return *raw* normalised, or ``None`` if it is not a usable record."""
+    if not isinstance(raw, dict) or raw.get("state") not in _STATES:
+        return None
+    failures = raw.get("failures")
+    if isinstance(failures, bool) or not isinstance(failures, int) or failures < 0:
+        return None
+    return {
+        "state": raw["state"],
+        "failures": failures,
+        "opened_at": _timestamp(raw.get("opened_at")),
+        "probe_until": _timestamp(raw.get("probe_until")),
+    }
+
+
+class BreakerStore:
+    """Breaker records in one JSON file, updated under a cross-process lock."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        probe_lease: float = DEFAULT_PROBE_LEASE,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if probe_lease <= 0:
+            raise ValueError("probe_lease must be positive")
+        self.path = path
+        self.probe_lease = probe_lease
+        self.clock = clock or time.time
+
+    def read(self, name: str) -> BreakerRecord | None:
+        """Return the stored record for *name* without taking the lock."""
+        return self._load().get(name)
+
+    def update(self, name: str, apply: Callable[[BreakerRecord | None], BreakerRecord]) -> None:
+        """Replace the record for *name* with ``apply(current)`` atomically.
+
+        ``apply`` runs while the exclusive lock is held, so the decision it
+        makes (admit a probe, trip the breaker) cannot interleave with
+        another process. An exception from ``apply`` leaves the file as is.
+        Raises ``OSError`` / ``TimeoutError`` when the lock or file is
+        unavailable.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_suffix(".lock")
+        with (
+            lock_path.open("a+", encoding="utf-8") as lock_file,
+            file_lock(lock_file, exclusive=True, timeout=_LOCK_TIMEOUT),
+        ):
+            records = self._load()
+            current = records.get(name)
+            updated = apply(current)
+            if updated == (current or _CLOSED_RECORD):
+                return
+            records[name] = updated
+            with atomic_write(self.path, mode="w", encoding="utf-8", permissions=0o644) as handle:
+                json.dump(
+                    {"format": BREAKER_STORE_FORMAT, "breakers": records},
+                    handle,
+                    ensure_ascii=True,
+                    allow_nan=False,
+                    indent=1,
+                    sort_keys=True,
+                )
+
+    def _load(self) -> dict[str, BreakerRecord]:
+        payload = read_capped_json(self.path, MAX_BREAKER_STORE_BYTES, label="Circuit-Breaker-State", logger=log)
+        if not isinstance(payload, dict) or payload.get("format") != BREAKER_STORE_FORMAT:
+            return {}
+        raw_records = payload.get("breakers")
+        if not isinstance(raw_records, dict):
+            return {}
+        records: dict[str, BreakerRecord] = {}
+        for name, raw in raw_records.items():
+            record = _valid_record(raw)
+            if record is not None:
+                records[str(name)] = record
+        return records
+
+
+@lru_cache(maxsize=1)
+def default_store() -> BreakerStore | None:
+    """Return the store named by ``CIRCUIT_BREAKER_STATE_PATH``, if any.
+
+    Relative paths are resolved against the repository root; anything that
+    does not end up below ``cache/`` is refused with a warning so the env
+    var cannot point the lock-and-rewrite cycle at an arbitrary file.
+    """
+    raw = os.getenv(BREAKER_STATE_ENV, "").strip()
+    if not raw:
+        return None
+    path = Path(raw)
+    if not path.is_absolute():
+        path = _REPO_ROOT / path
+    try:
+        resolved = path.resolve()
+        resolved.relative_to(_REPO_ROOT / "cache")
+    except (OSError, ValueError):
+        log.warning(
+            "%s=%s liegt nicht unter cache/ – Circuit-Breaker-Zustand bleibt prozesslokal.",
+            BREAKER_STATE_ENV,
+            sanitize_log_arg(raw),
+        )
+        return None
+    return BreakerStore(resolved)
@@ -14,6 +14,7 @@ from collections.abc import Callable
 
 from .env import get_bool_env
 from .files import (
+    WriteOutcome,
     _reject_non_finite_constant,
     _reject_non_finite_float,
     atomic_write,
@@ -408,12 +409,16 @@ def _stable_sort_key(item: Any) -> tuple[str, str, str, str]:
     )
 
 
-def write_cache(provider: str, items: list[Any], *, pretty: bool | None = None) -> None:
+def write_cache(provider: str, items: list[Any], *, pretty: bool | None = None) -> bool:
     """Write *items* to the cache for *provider* atomically.
 
     Pretty printing is enabled by default to keep JSON files human readable. To
     reduce cache size for large datasets set ``pretty`` to ``False`` or define
     the environment variable ``WIEN_OEPNV_CACHE_PRETTY=0``.
+
+    Returns ``False`` when the cache file already held the identical payload;
+    the file is then left in place (only its mtime is refreshed) instead of
+    being rewritten.
     """
 
     # Security (Trojan-Source / BiDi-Mark Drift Round 12, ingestion-boundary
@@ -493,10 +498,12 @@ def write_cache(provider: str, items: list[Any], *, pretty: bool | None = None)
 
     # atomic_write creates parents if needed
 
+    outcome = WriteOutcome()
     try:
         # Explicitly set 0600 permissions for defense in depth
         with atomic_write(
-            cache_file, mode="w", encoding="utf-8", permissions=0o600
+            cache_file, mode="w", encoding="utf-8", permissions=0o600,
+            skip_unchanged=True, outcome=outcome,
         ) as fh:
             pretty_print = _pretty_print_enabled(pretty)
             separators: tuple[str, str] | None = None
@@ -540,22 +547,29 @@ def write_cache(provider: str, items: list[Any], *, pretty: bool | None = None)
         )
         raise
 
+    if not outcome.changed:
+        log.debug("Cache for provider '%s' unchanged, skipped rewrite", provider)
+
     # Per-provider stale-entry cleanup. Scoped to ``provider`` so this write
     # cannot prune a sibling provider's still-protected cache (see the NOTE
     # at the top of this function). For the file we just wrote this is a
-    # no-op since its mtime is current; the call is a documented hook for
+    # no-op since its mtime is current (an unchanged payload gets its mtime
+    # refreshed by ``atomic_write``); the call is a documented hook for
     # the original "prevent repo bloat" intent without the cross-provider
     # data-destruction side-effect the unscoped form caused.
     prune_cache(provider=provider)
+    return outcome.changed
 
 
-def write_status(provider: str, status: dict[str, Any]) -> None:
+def write_status(provider: str, status: dict[str, Any]) -> bool:
     """Persist a heartbeat record for ``provider`` next to its events cache.
 
     The status file lives at ``cache/<sanitized provider>/last_run.json`` and
     is intended to make workflow runs visible in git even when the events
     payload is unchanged (e.g. an empty provider response collapsing into the
     same ``[]`` cache file commit after commit).
+
+    Returns ``False`` when an identical record was already on disk.
     """
 
     if not isinstance(status, dict):
@@ -596,8 +610,10 @@ def write_status(provider: str, status: dict[str, Any]) -> None:
         # error_rate, …) inherits the missing pin and could land
         # non-standard ``NaN`` / ``Infinity`` literals in the
         # committed ``cache/<provider>/last_run.json`` heartbeat.
+        outcome = WriteOutcome()
         with atomic_write(
-            status_file, mode="w", encoding="utf-8", permissions=0o600
+            status_file, mode="w", encoding="utf-8", permissions=0o600,
+            skip_unchanged=True, outcome=outcome,
         ) as fh:
             json.dump(status, fh, ensure_ascii=True, indent=2, sort_keys=True, allow_nan=False)
             fh.write("\n")
@@ -608,6 +624,7 @@ def write_status(provider: str, status: dict[str, Any]) -> None:
             status_file,
         )
         raise
+    return outcome.changed
 
 
 def read_status(provider: str) -> dict[str, Any] | None:
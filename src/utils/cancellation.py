@@ -0,0 +1,162 @@
+"""Cooperative cancellation for network fetches.
+
+A worker thread cannot be killed, so ``build_feed._run_network_fetchers``
+hands every provider fetch a :class:`CancelToken` carrying the fetch's
+deadline and cancels it when the orchestrator gives up on the provider.
+The token is installed in a :class:`~contextvars.ContextVar` for the
+worker thread (:func:`run_with_token`) or the provider task
+(:func:`token_scope`); :func:`src.utils.http.request_safe`
+and :func:`~src.utils.http.read_response_safe` consult it through
+:func:`bound_timeout` / :func:`raise_if_cancelled`, so socket timeouts
+never outlast the deadline and a cancelled fetch stops at its next
+request or body chunk with :class:`FetchCancelled`. Provider back-off
+waits use :func:`sleep`, which returns early on cancellation.
+
+Code that never reaches these checkpoints (a plugin stuck in pure
+Python, or blocking I/O outside ``request_safe``) keeps its thread. The
+orchestrator no longer joins it, so it cannot hold up the feed build,
+but it can still delay process exit: ``concurrent.futures`` joins every
+worker thread at interpreter shutdown.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+__all__ = [
+    "CancelToken",
+    "FetchCancelled",
+    "bound_timeout",
+    "current_token",
+    "raise_if_cancelled",
+    "run_with_token",
+    "sleep",
+    "token_scope",
+]
+
+_T = TypeVar("_T")
+TimeoutValue = int | float | tuple[float, float] | None
+
+_CURRENT: ContextVar[CancelToken | None] = ContextVar("fetch_cancel_token", default=None)
+
+
+class FetchCancelled(TimeoutError):
+    """The fetch was cancelled or ran past its deadline."""
+
+
+class CancelToken:
+    """Cancellation flag plus optional ``time.monotonic`` deadline."""
+
+    __slots__ = ("_event", "deadline", "reason")
+
+    def __init__(self, deadline: float | None = None) -> None:
+        self._event = threading.Event()
+        self.deadline = deadline
+        self.reason = ""
+
+    @classmethod
+    def with_timeout(cls, timeout: float | None) -> CancelToken:
+        """Token expiring *timeout* seconds from now (``None``/``<= 0``: never)."""
+        if timeout is None or timeout <= 0:
+            return cls()
+        return cls(time.monotonic() + timeout)
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> float | None:
+        """Seconds until the deadline (``0.0`` once cancelled), ``None`` without one."""
+        if self._event.is_set():
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def raise_if_cancelled(self) -> None:
+        if not self.cancelled:
+            return
+        if self._event.is_set():
+            raise FetchCancelled(f"Fetch abgebrochen ({self.reason})")
+        # Latch the passed deadline as a "Timeout" cancel, the reason the
+        # orchestrator uses for an evicted fetch.
+        self.cancel("Timeout")
+        raise FetchCancelled("Fetch abgebrochen (Deadline überschritten)")
+
+    def wait(self, seconds: float) -> bool:
+        """Block up to *seconds* (capped at the deadline); ``True`` if cancelled."""
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, remaining)
+        self._event.wait(max(seconds, 0.0))
+        return self.cancelled
+
+
+def current_token() -> CancelToken | None:
+    """Return the token installed for the running fetch, if any."""
+    return _CURRENT.get()
+
+
+@contextmanager
+def token_scope(token: CancelToken) -> Iterator[CancelToken]:
+    """Install *token* for the current context (thread or asyncio task)."""
+    reset = _CURRENT.set(token)
+    try:
+        yield token
+    finally:
+        _CURRENT.reset(reset)
+
+
+def run_with_token(token: CancelToken, func: Callable[[], _T]) -> _T:
+    """Call *func* with *token* installed for the current context."""
+    with token_scope(token):
+        return func()
+
+
+def raise_if_cancelled() -> None:
+    """Raise :class:`FetchCancelled` if the current fetch was cancelled."""
+    token = _CURRENT.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def bound_timeout(timeout: TimeoutValue) -> TimeoutValue:
+    """Cap *timeout* at the current fetch's remaining time.
+
+    Raises :class:`FetchCancelled` when the fetch is already cancelled.
+    Tuples keep their ``(connect, read)`` shape; ``None`` becomes the
+    remaining time. Without a token or deadline *timeout* is returned as is.
+    """
+    token = _CURRENT.get()
+    if token is None:
+        return timeout
+    token.raise_if_cancelled()
+    remaining = token.remaining()
+    if remaining is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return (min(timeout[0], remaining), min(timeout[1], remaining))
+    return min(timeout, remaining)
+
+
+def sleep(seconds: float) -> None:
+    """``time.sleep`` that wakes up and raises when the current fetch is cancelled."""
+    token = _CURRENT.get()
+    if token is None:
+        time.sleep(seconds)
+        return
+    if token.wait(seconds):
+        token.raise_if_cancelled()
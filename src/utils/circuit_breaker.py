@@ -30,7 +30,14 @@ Why a project-local primitive instead of a third-party library:
   larger surface than we need and don't compose cleanly with our
   existing ``session_with_retries`` plumbing.
 * This implementation is ~150 lines, thread-safe, fully typed, and
-  has no dependencies outside the stdlib.
+  has no third-party dependencies.
+
+Cross-process state: with a :class:`~src.utils.breaker_store.BreakerStore`
+(explicit ``store=`` or ``CIRCUIT_BREAKER_STATE_PATH``, see
+:func:`~src.utils.breaker_store.default_store`) every state change is a
+locked read-modify-write of a shared JSON record, so an OPEN breaker stays
+open for the next cron step and only one process probes in HALF_OPEN.
+Without a store the breaker is purely in-memory as before.
 
 Thread-safety: all state transitions occur under a per-breaker
 ``threading.RLock``. The breaker itself is reentrant — a callable
@@ -47,6 +54,9 @@ from collections.abc import Callable
 from enum import Enum
 from typing import Any, ClassVar, TypeVar
 
+from .breaker_store import BreakerRecord, BreakerStore, default_store
+from .logging import sanitize_log_arg
+
 log = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -144,6 +154,9 @@ class CircuitBreaker:
         clock: Override the monotonic time source. Used by tests to
             drive the recovery-timeout transition deterministically.
             Defaults to :func:`time.monotonic`.
+        store: Shared state for this breaker's ``name`` across
+            processes. Defaults to :func:`default_store` (``None``
+            unless ``CIRCUIT_BREAKER_STATE_PATH`` is set).
 
     Raises:
         ValueError: If ``failure_threshold`` is non-positive or
@@ -186,6 +199,7 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: float = 60.0,
         clock: Callable[[], float] | None = None,
+        store: BreakerStore | None = None,
     ) -> None:
         if failure_threshold <= 0:
             raise ValueError("failure_threshold must be positive")
@@ -196,10 +210,15 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self._clock = clock or time.monotonic
+        self._store = store if store is not None else default_store()
 
         self._state: CircuitState = CircuitState.CLOSED
         self._consecutive_failures = 0
         self._opened_at: float | None = None
+        # Wall-clock twins of ``_opened_at`` and of the shared HALF_OPEN
+        # probe lease; only meaningful with a store.
+        self._opened_wall: float | None = None
+        self._probe_until: float | None = None
         self._lock = threading.RLock()
         # ``_probe_in_flight`` enforces the docstring's "exactly one
         # probe is admitted" contract for HALF_OPEN. Without this flag
@@ -237,14 +256,84 @@ class CircuitBreaker:
         the OPEN→HALF_OPEN transition if the recovery timeout has elapsed.
         """
         with self._lock:
+            self._pull()
             self._maybe_transition_to_half_open()
             return self._state
 
     @property
     def consecutive_failures(self) -> int:
         with self._lock:
+            self._pull()
             return self._consecutive_failures
 
+    # -- shared state -----------------------------------------------------
+
+    def _wall(self) -> float:
+        return self._store.clock() if self._store is not None else time.time()
+
+    def _mark_opened(self) -> None:
+        self._opened_at = self._clock()
+        self._opened_wall = self._wall()
+
+    def _adopt(self, record: BreakerRecord | None) -> None:
+        """Mirror the shared *record* into the in-process state."""
+        if record is None:
+            return
+        self._state = CircuitState(record["state"])
+        self._consecutive_failures = record["failures"]
+        self._opened_wall = record["opened_at"]
+        self._probe_until = record["probe_until"]
+        if self._opened_wall is None:
+            self._opened_at = None
+        else:
+            # Translate the wall-clock age into this process's clock.
+            self._opened_at = self._clock() - max(0.0, self._wall() - self._opened_wall)
+
+    def _export(self) -> BreakerRecord:
+        return {
+            "state": self._state.value,
+            "failures": self._consecutive_failures,
+            "opened_at": self._opened_wall,
+            "probe_until": self._probe_until,
+        }
+
+    def _pull(self) -> None:
+        if self._store is not None:
+            self._adopt(self._store.read(self.name))
+
+    def _shared(self, action: Callable[[], T]) -> T:
+        """Run *action* on the shared record when a store is configured.
+
+        Caller holds ``self._lock``. A store that cannot be locked or
+        written degrades to the process-local state machine with a warning
+        instead of failing the protected call.
+        """
+        store = self._store
+        if store is None:
+            return action()
+        outcome: list[T] = []
+
+        def apply(record: BreakerRecord | None) -> BreakerRecord:
+            self._adopt(record)
+            outcome.append(action())
+            return self._export()
+
+        try:
+            store.update(self.name, apply)
+        except (OSError, TimeoutError) as exc:
+            if outcome:
+                return outcome[0]
+            log.warning(
+                "CircuitBreaker[%s]: shared state unavailable (%s); using process-local state",
+                self.name,
+                sanitize_log_arg(str(exc)),
+            )
+            return action()
+        return outcome[0]
+
+    def _probe_leased_elsewhere(self) -> bool:
+        return self._probe_until is not None and self._wall() < self._probe_until
+
     def _maybe_transition_to_half_open(self) -> None:
         """If we're OPEN and the recovery timeout has elapsed, move to
         HALF_OPEN so the next call gets to probe the upstream."""
@@ -264,45 +353,56 @@ class CircuitBreaker:
         """Mark a successful call. Resets the failure counter; if the
         breaker was HALF_OPEN, this closes it (full recovery)."""
         with self._lock:
-            if self._state is CircuitState.HALF_OPEN:
-                log.info(
-                    "CircuitBreaker[%s]: HALF_OPEN → CLOSED (probe succeeded)",
-                    self.name,
-                )
-            self._state = CircuitState.CLOSED
-            self._consecutive_failures = 0
-            self._opened_at = None
-            # Probe resolved → release the HALF_OPEN single-flight slot.
-            self._probe_in_flight = False
+            self._shared(self._apply_success)
+
+    def _apply_success(self) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            log.info(
+                "CircuitBreaker[%s]: HALF_OPEN → CLOSED (probe succeeded)",
+                self.name,
+            )
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._opened_wall = None
+        # Probe resolved → release the HALF_OPEN single-flight slot.
+        if self._probe_in_flight:
+            self._probe_until = None
+        self._probe_in_flight = False
 
     def record_failure(self) -> None:
         """Mark a failed call. In CLOSED, increments the counter and may
         trip to OPEN. In HALF_OPEN, immediately re-opens with a fresh
         timer (the probe failed, so the upstream is still unhealthy)."""
         with self._lock:
-            if self._state is CircuitState.HALF_OPEN:
-                log.warning(
-                    "CircuitBreaker[%s]: HALF_OPEN → OPEN (probe failed)",
-                    self.name,
-                )
-                self._state = CircuitState.OPEN
-                self._opened_at = self._clock()
-                # Probe resolved → release the HALF_OPEN single-flight slot.
-                self._probe_in_flight = False
-                return
-
-            self._consecutive_failures += 1
-            if (
-                self._state is CircuitState.CLOSED
-                and self._consecutive_failures >= self.failure_threshold
-            ):
-                log.warning(
-                    "CircuitBreaker[%s]: CLOSED → OPEN after %d consecutive failures",
-                    self.name,
-                    self._consecutive_failures,
-                )
-                self._state = CircuitState.OPEN
-                self._opened_at = self._clock()
+            self._shared(self._apply_failure)
+
+    def _apply_failure(self) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            log.warning(
+                "CircuitBreaker[%s]: HALF_OPEN → OPEN (probe failed)",
+                self.name,
+            )
+            self._state = CircuitState.OPEN
+            self._mark_opened()
+            # Probe resolved → release the HALF_OPEN single-flight slot.
+            if self._probe_in_flight:
+                self._probe_until = None
+            self._probe_in_flight = False
+            return
+
+        self._consecutive_failures += 1
+        if (
+            self._state is CircuitState.CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            log.warning(
+                "CircuitBreaker[%s]: CLOSED → OPEN after %d consecutive failures",
+                self.name,
+                self._consecutive_failures,
+            )
+            self._state = CircuitState.OPEN
+            self._mark_opened()
 
     def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """Invoke ``func(*args, **kwargs)`` under the breaker's protection.
@@ -313,24 +413,7 @@ class CircuitBreaker:
         breaker is OPEN and the recovery timeout has not yet elapsed.
         """
         with self._lock:
-            self._maybe_transition_to_half_open()
-            if self._state is CircuitState.OPEN:
-                raise CircuitBreakerOpen(
-                    f"CircuitBreaker[{self.name}] is OPEN; refusing call"
-                )
-            # HALF_OPEN admit gate: exactly one probe is allowed in
-            # flight at a time (per the class docstring). Subsequent
-            # threads observing HALF_OPEN with a probe already running
-            # are refused — same surface as the OPEN branch above —
-            # so the recovering upstream isn't pile-driven by N
-            # concurrent probes the moment the recovery timer expires.
-            if self._state is CircuitState.HALF_OPEN:
-                if self._probe_in_flight:
-                    raise CircuitBreakerOpen(
-                        f"CircuitBreaker[{self.name}] is HALF_OPEN with a "
-                        f"probe in flight; refusing call"
-                    )
-                self._probe_in_flight = True
+            self._shared(self._admit)
 
         try:
             result = func(*args, **kwargs)
@@ -351,17 +434,45 @@ class CircuitBreaker:
             self.record_success()
             return result
 
+    def _admit(self) -> None:
+        self._maybe_transition_to_half_open()
+        if self._state is CircuitState.OPEN:
+            raise CircuitBreakerOpen(
+                f"CircuitBreaker[{self.name}] is OPEN; refusing call"
+            )
+        # HALF_OPEN admit gate: exactly one probe is allowed in
+        # flight at a time (per the class docstring). Subsequent
+        # threads observing HALF_OPEN with a probe already running
+        # are refused — same surface as the OPEN branch above —
+        # so the recovering upstream isn't pile-driven by N
+        # concurrent probes the moment the recovery timer expires.
+        # With a store the lease extends this to other processes.
+        if self._state is CircuitState.HALF_OPEN:
+            if self._probe_in_flight or self._probe_leased_elsewhere():
+                raise CircuitBreakerOpen(
+                    f"CircuitBreaker[{self.name}] is HALF_OPEN with a "
+                    f"probe in flight; refusing call"
+                )
+            self._probe_in_flight = True
+            if self._store is not None:
+                self._probe_until = self._wall() + self._store.probe_lease
+
     def reset(self) -> None:
         """Force the breaker back to CLOSED with a clean failure counter.
         Intended for administrative use (e.g. test setup, post-incident
         manual reset). Not part of the normal state machine.
         """
         with self._lock:
-            self._state = CircuitState.CLOSED
-            self._consecutive_failures = 0
-            self._opened_at = None
-            self._probe_in_flight = False
+            self._shared(self._apply_reset)
             log.info("CircuitBreaker[%s]: reset to CLOSED", self.name)
 
+    def _apply_reset(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._opened_wall = None
+        self._probe_until = None
+        self._probe_in_flight = False
+
 
 __all__ = ["CircuitBreaker", "CircuitBreakerOpen", "CircuitState"]
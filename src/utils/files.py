@@ -1,18 +1,22 @@
 """File utility helpers."""
 from __future__ import annotations
 
+import csv
 import hashlib
+import io
+import itertools
 import json
 import logging
 import math
 import os
 import re
 import secrets
+import stat
 import zipfile
 from contextlib import contextmanager
 from pathlib import Path
 from typing import IO, Any
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 
 # Default per-loader byte cap for on-disk JSON files. Sized at ~100x the
 # largest legitimately-written stations.json (~175 KiB) and polygon
@@ -100,6 +104,77 @@ def _close_and_cleanup_failed_write(
             log.warning("Failed to remove temporary file", exc_info=unlink_exc)
 
 
+class WriteOutcome:
+    """Result slot for :func:`atomic_write` with ``skip_unchanged=True``.
+
+    ``changed`` is ``False`` when the target already held the written bytes
+    and the rename was skipped.
+    """
+
+    __slots__ = ("changed",)
+
+    def __init__(self) -> None:
+        self.changed = True
+
+
+class _DigestingFileIO(io.FileIO):
+    """Raw file layer that feeds every written byte into a SHA-256 hasher."""
+
+    def __init__(self, fd: int) -> None:
+        super().__init__(fd, "wb", closefd=True)
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    def write(self, b: Any, /) -> int:
+        written = super().write(b)
+        if written:
+            self.hasher.update(memoryview(b).cast("B")[:written])
+            self.size += written
+        return written
+
+
+def _open_digesting(fd: int, mode: str, encoding: str | None, newline: str | None) -> tuple[IO[Any], _DigestingFileIO]:
+    """Build the ``open(fd, mode)`` layer stack on top of :class:`_DigestingFileIO`.
+
+    Takes ownership of *fd*: it is closed here if building the stack fails.
+    """
+    raw = _DigestingFileIO(fd)
+    try:
+        buffered = io.BufferedWriter(raw)
+        if "b" in mode:
+            return buffered, raw
+        return io.TextIOWrapper(buffered, encoding=encoding, newline=newline), raw
+    except BaseException:
+        raw.close()
+        raise
+
+
+def _holds_same_bytes(target: Path, size: int, digest: str, permissions: int) -> bool:
+    """Return ``True`` if *target* already has *size* bytes hashing to *digest*.
+
+    The size (and mode) check runs first so the digest is only computed for
+    candidates that can match.
+    """
+    try:
+        info = os.stat(target)
+        if not stat.S_ISREG(info.st_mode) or info.st_size != size or stat.S_IMODE(info.st_mode) != permissions:
+            return False
+        return get_file_hash(target, chunk_size=64 * 1024) == digest
+    except OSError:
+        return False
+
+
+def _drop_identical_write(tmp_path: Path, target: Path, outcome: WriteOutcome | None) -> None:
+    """Discard the temporary file of a write whose bytes *target* already holds."""
+    os.unlink(tmp_path)
+    try:
+        os.utime(target)
+    except OSError:
+        pass
+    if outcome is not None:
+        outcome.changed = False
+
+
 @contextmanager
 def atomic_write(
     path: str | Path,
@@ -108,6 +183,9 @@ def atomic_write(
     permissions: int = 0o644,
     newline: str | None = None,
     overwrite: bool = True,
+    *,
+    skip_unchanged: bool = False,
+    outcome: WriteOutcome | None = None,
 ) -> Iterator[IO[Any]]:
     """Safe atomic file write using a temporary file.
 
@@ -119,7 +197,17 @@ def atomic_write(
                      Use 0o600 for secrets/internal caches.
         newline: Newline control (passed to open).
         overwrite: If False, raises FileExistsError if target exists.
+        skip_unchanged: Hash the bytes while they are written and, if the
+                        target already holds exactly these bytes (size first,
+                        then SHA-256) with the requested permissions, drop the
+                        temporary file instead of fsyncing and renaming it.
+                        The target's mtime is refreshed so age checks still
+                        see it as current. Only for plain ``"w"``/``"wb"``.
+        outcome: Receives whether the target was replaced
+                 (``outcome.changed``); only meaningful with ``skip_unchanged``.
     """
+    if skip_unchanged and mode not in ("w", "wb"):
+        raise ValueError(f"skip_unchanged requires mode 'w' or 'wb', got {mode!r}")
     target = Path(path).resolve()
     target.parent.mkdir(parents=True, exist_ok=True)
 
@@ -138,6 +226,7 @@ def atomic_write(
 
     fd: int | None = None
     f: IO[Any] | None = None
+    digesting: _DigestingFileIO | None = None
     try:
         flags = os.O_CREAT | os.O_EXCL
         if "a" in mode:
@@ -156,13 +245,29 @@ def atomic_write(
         except OSError:
             pass
 
-        f = open(fd, mode, encoding=encoding, newline=newline)
+        if skip_unchanged:
+            # ``_open_digesting`` owns the descriptor from here on (and closes
+            # it itself if building the stack fails).
+            owned_fd, fd = fd, None
+            f, digesting = _open_digesting(owned_fd, mode, encoding, newline)
+        else:
+            f = open(fd, mode, encoding=encoding, newline=newline)
         # The file object now owns the descriptor — closing ``f`` closes
         # ``fd``. Null the raw handle so the failure path never double-closes
         # it (a re-used fd could by then belong to an unrelated file).
         fd = None
         yield f
         f.flush()
+
+        if digesting is not None and _holds_same_bytes(
+            target, digesting.size, digesting.hasher.hexdigest(), permissions
+        ):
+            # Identical payload: no fsync, no rename, no directory fsync.
+            f.close()
+            f = None
+            _drop_identical_write(tmp_path, target, outcome)
+            return
+
         os.fsync(f.fileno())
 
         # Set permissions before moving into place and closing
@@ -596,6 +701,307 @@ def read_capped_bytes(
         return None
 
 
+# Number of characters :func:`open_capped_csv` inspects to auto-detect the
+# delimiter. Matches the ``content[:4096]`` sample the per-script loaders
+# used before the streaming reader replaced them, so the detected
+# delimiter is identical for every file that parsed before.
+_CSV_DELIMITER_SAMPLE_CHARS = 4096
+
+
+class CappedCsvError(csv.Error):
+    """Raised while iterating a capped CSV stream that turned out unusable.
+
+    Covers the two failures that can only be detected mid-stream: the
+    byte cap being exceeded by a file whose ``st_size`` under-reported its
+    length (FIFO, character device, file growing during the read) and a
+    decode error past the first sample. Subclasses :class:`csv.Error` so
+    the loaders' existing ``except csv.Error`` handlers catch it without
+    widening.
+    """
+
+
+def normalize_csv_column(value: str | None) -> str:
+    """Return the fuzzy lookup key for a CSV column name.
+
+    Casefolds and strips everything except ``[a-z0-9]`` so ``WGS84_LAT``,
+    ``wgs84 lat`` and ``Wgs84Lat`` resolve to the same column.
+    """
+    if value is None:
+        return ""
+    return re.sub(r"[^a-z0-9]+", "", value.casefold())
+
+
+def detect_csv_delimiter(sample: str) -> str:
+    """Pick ``;`` or ``,`` for *sample*, preferring ``;`` on ties (OGD default)."""
+    semicolons = sample.count(";")
+    commas = sample.count(",")
+    if semicolons >= commas and semicolons:
+        return ";"
+    if commas:
+        return ","
+    return ";"
+
+
+class CsvHeader:
+    """Column index shared by every :class:`CsvRow` of one CSV file.
+
+    Exact and fuzzy (:func:`normalize_csv_column`) lookups are resolved
+    once per candidate name and memoised, so per-row access is a dict hit
+    plus a list index instead of a regex per row and candidate. Duplicate
+    column names resolve to the last occurrence, matching
+    :class:`csv.DictReader`.
+    """
+
+    __slots__ = ("fieldnames", "_exact", "_fuzzy", "_resolved")
+
+    def __init__(self, fieldnames: Sequence[str]) -> None:
+        self.fieldnames: tuple[str, ...] = tuple(fieldnames)
+        self._exact: dict[str, int] = {}
+        self._fuzzy: dict[str, int] = {}
+        for index, name in enumerate(self.fieldnames):
+            if not name:
+                continue
+            self._exact[name] = index
+            self._fuzzy[normalize_csv_column(name)] = index
+        self._resolved: dict[str, int | None] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._exact
+
+    def index(self, name: str) -> int | None:
+        """Return the position of the column named exactly *name*."""
+        return self._exact.get(name)
+
+    def fuzzy_index(self, candidate: str) -> int | None:
+        """Return the position of the column matching *candidate* fuzzily."""
+        try:
+            return self._resolved[candidate]
+        except KeyError:
+            resolved = self._fuzzy.get(normalize_csv_column(candidate))
+            self._resolved[candidate] = resolved
+            return resolved
+
+
+class CsvRow:
+    """Compact CSV record: the raw field list plus a shared :class:`CsvHeader`.
+
+    Replaces the per-row ``dict`` built by :class:`csv.DictReader` and the
+    per-row key map the station scripts used to wrap around it.
+    """
+
+    __slots__ = ("_header", "_values")
+
+    def __init__(self, header: CsvHeader, values: list[str]) -> None:
+        self._header = header
+        self._values = values
+
+    def field(self, name: str) -> str | None:
+        """Return the raw value of column *name* (``None`` if absent).
+
+        Mirrors ``DictReader`` row semantics: an unknown column and a
+        short row both yield ``None``.
+        """
+        index = self._header.index(name)
+        if index is None or index >= len(self._values):
+            return None
+        return self._values[index]
+
+    def get(self, *candidates: str) -> str:
+        """Return the first non-empty, stripped value among *candidates*.
+
+        Column names are matched fuzzily so the loaders survive upstream
+        header renames (``WGS84_LAT`` vs ``wgs84 lat``). Returns ``""``
+        when no candidate column carries a value.
+        """
+        values = self._values
+        for candidate in candidates:
+            index = self._header.fuzzy_index(candidate)
+            if index is None or index >= len(values):
+                continue
+            text = values[index].strip()
+            if text:
+                return text
+        return ""
+
+
+class _CappedByteStream(io.RawIOBase):
+    """Raw byte stream that raises :class:`CappedCsvError` past *max_bytes*.
+
+    The counterpart of the ``read(max_bytes + 1)`` guard in
+    :func:`read_capped_text`, enforced incrementally so the cap holds for
+    special files even though nothing is buffered up front.
+    """
+
+    def __init__(
+        self,
+        raw: io.FileIO,
+        max_bytes: int,
+        *,
+        label: str,
+        path_fingerprint: str,
+        log: logging.Logger,
+    ) -> None:
+        super().__init__()
+        self._raw = raw
+        self._max_bytes = max_bytes
+        self._label = label
+        self._path_fingerprint = path_fingerprint
+        self._log = log
+        self._consumed = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        count = self._raw.readinto(buffer) or 0
+        self._consumed += count
+        if self._consumed > self._max_bytes:
+            self._log.warning(
+                "%s file [path-sha256=%s] exceeded %d bytes during read; aborting.",
+                self._label, self._path_fingerprint, self._max_bytes,
+            )
+            raise CappedCsvError(
+                f"{self._label} file exceeded {self._max_bytes} bytes during read"
+            )
+        return count
+
+    def close(self) -> None:
+        try:
+            self._raw.close()
+        finally:
+            super().close()
+
+
+class CappedCsvReader:
+    """Iterator over the :class:`CsvRow` records of one capped CSV stream.
+
+    Produced by :func:`open_capped_csv`; only valid inside its ``with``
+    block. Blank lines are skipped like :class:`csv.DictReader` does.
+    """
+
+    __slots__ = ("header", "delimiter", "_rows", "_label", "_path_fingerprint", "_log")
+
+    def __init__(
+        self,
+        header: CsvHeader,
+        delimiter: str,
+        rows: Iterator[list[str]],
+        *,
+        label: str,
+        path_fingerprint: str,
+        log: logging.Logger,
+    ) -> None:
+        self.header = header
+        self.delimiter = delimiter
+        self._rows = rows
+        self._label = label
+        self._path_fingerprint = path_fingerprint
+        self._log = log
+
+    @property
+    def fieldnames(self) -> tuple[str, ...]:
+        return self.header.fieldnames
+
+    def __iter__(self) -> Iterator[CsvRow]:
+        header = self.header
+        try:
+            for values in self._rows:
+                if values:
+                    yield CsvRow(header, values)
+        except UnicodeDecodeError as exc:
+            self._log.warning(
+                "%s file [path-sha256=%s] is not valid text; aborting.",
+                self._label, self._path_fingerprint,
+            )
+            raise CappedCsvError(f"{self._label} file is not valid text") from exc
+
+
+@contextmanager
+def open_capped_csv(
+    path: Path,
+    max_bytes: int = DEFAULT_MAX_TEXT_FILE_BYTES,
+    *,
+    encoding: str = "utf-8",
+    delimiter: str | None = None,
+    label: str = "CSV",
+    logger: logging.Logger | None = None,
+) -> Iterator[CappedCsvReader | None]:
+    """Stream the CSV at *path* row by row under a byte cap.
+
+    Streaming counterpart of the ``read_capped_text`` -> ``io.StringIO``
+    -> ``csv.DictReader`` shape: the file is never buffered as a whole and
+    rows arrive as slotted :class:`CsvRow` records sharing one
+    :class:`CsvHeader`, so peak memory is bounded by whatever the caller
+    keeps rather than by the file size.
+
+    Yields ``None`` (after logging, like :func:`read_capped_text`) when
+    the file is missing, its ``fstat`` size exceeds *max_bytes*, or its
+    first sample cannot be decoded — the caller treats it as missing.
+    The cap is additionally enforced incrementally on every read, so a
+    special file that under-reports its size raises
+    :class:`CappedCsvError` mid-iteration instead of exhausting memory.
+
+    When *delimiter* is ``None`` it is detected once from the first
+    :data:`_CSV_DELIMITER_SAMPLE_CHARS` characters via
+    :func:`detect_csv_delimiter`.
+    """
+    log = logger if logger is not None else logging.getLogger(__name__)
+    # Security: see ``read_capped_json`` for the rationale of fingerprinting
+    # ``path`` instead of interpolating it.
+    path_fingerprint = hashlib.sha256(
+        str(path).encode("utf-8", errors="replace")
+    ).hexdigest()[:12]
+    try:
+        # Open first so the size check is on the actual inode that the
+        # stream will consume — closes the stat/open TOCTOU.
+        raw = io.FileIO(path, "rb")
+    except OSError:
+        yield None
+        return
+    stream = io.TextIOWrapper(
+        io.BufferedReader(
+            _CappedByteStream(
+                raw, max_bytes,
+                label=label, path_fingerprint=path_fingerprint, log=log,
+            )
+        ),
+        encoding=encoding,
+        newline="",
+    )
+    try:
+        reader: CappedCsvReader | None = None
+        if os.fstat(raw.fileno()).st_size > max_bytes:
+            log.warning(
+                "%s file [path-sha256=%s] is too large (> %d bytes); treating as missing.",
+                label, path_fingerprint, max_bytes,
+            )
+        else:
+            try:
+                # Complete the sample's last line so the hand-over to the
+                # live stream never splits a record.
+                head = stream.read(_CSV_DELIMITER_SAMPLE_CHARS)
+                head += stream.readline()
+            except (CappedCsvError, UnicodeDecodeError, OSError):
+                head = None
+            if head is not None:
+                chosen = delimiter or detect_csv_delimiter(head[:_CSV_DELIMITER_SAMPLE_CHARS])
+                rows = csv.reader(
+                    itertools.chain(io.StringIO(head, newline=""), stream),
+                    delimiter=chosen,
+                )
+                reader = CappedCsvReader(
+                    CsvHeader(next(rows, [])),
+                    chosen,
+                    rows,
+                    label=label,
+                    path_fingerprint=path_fingerprint,
+                    log=log,
+                )
+        yield reader
+    finally:
+        stream.close()
+
+
 def validate_zip_archive_safe(
     archive: zipfile.ZipFile,
     *,
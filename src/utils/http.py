@@ -12,8 +12,6 @@ import os
 import re
 import socket
 import threading
-import dns.resolver
-import dns.exception
 import time
 import types
 import unicodedata
@@ -22,8 +20,9 @@ import queue
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 from typing import Any, TypeGuard, cast
-from collections.abc import Container, Mapping, MutableMapping
-from urllib.parse import ParseResult, parse_qsl, urlencode, urljoin, urlparse
+from collections.abc import Callable, Container, Iterator, Mapping, MutableMapping
+from contextlib import contextmanager
+from urllib.parse import ParseResult, parse_qsl, urlencode, urljoin, urlparse, urlunparse
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -34,6 +33,7 @@ from urllib3.connectionpool import HTTPSConnectionPool, HTTPConnectionPool
 from urllib3.poolmanager import PoolManager
 from urllib3.util.retry import Retry
 
+from . import cancellation
 from .logging import sanitize_log_arg, sanitize_log_message
 
 _RETRY_AFTER_NUMERIC_RE = re.compile(r"\d+(?:\.\d+)?")
@@ -249,8 +249,27 @@ def _cleanup_evicted_sessions_thread() -> None:
                 sanitize_log_arg(str(exc)),
             )
 
-_cleanup_thread = threading.Thread(target=_cleanup_evicted_sessions_thread, daemon=True)
-_cleanup_thread.start()
+# The reaper thread is started on the first eviction rather than at import
+# time: most processes importing this module (the CLI, the station scripts,
+# the test suite) never cache more than ``_HTTP_SESSION_CACHE_MAX_SIZE``
+# sessions, and an import must not spawn threads as a side effect (forking
+# CLI wrappers and ``-X importtime`` budgets would otherwise inherit it).
+_cleanup_thread: threading.Thread | None = None
+_cleanup_thread_lock = threading.Lock()
+
+
+def _ensure_cleanup_thread() -> None:
+    """Start the evicted-session reaper once, on first use."""
+    global _cleanup_thread
+    with _cleanup_thread_lock:
+        if _cleanup_thread is None or not _cleanup_thread.is_alive():
+            _cleanup_thread = threading.Thread(
+                target=_cleanup_evicted_sessions_thread,
+                name="http-session-reaper",
+                daemon=True,
+            )
+            _cleanup_thread.start()
+
 
 def _normalize_key(key: str) -> str:
     """Normalize key for loose matching (lowercase, no hyphens/underscores)."""
@@ -873,6 +892,7 @@ def _get_pinned_session(target_ip: str, timeout: int | float | tuple[float, floa
             # Push it to the cleanup queue to be closed after a grace period.
             _, evicted_session = _HTTP_SESSION_CACHE.popitem(last=False)
             _EVICTED_SESSIONS_QUEUE.put((evicted_session, time.time()))
+            _ensure_cleanup_thread()
 
         return session
 
@@ -1182,6 +1202,47 @@ _SHARED_ADDRESS_SPACE = ipaddress.IPv4Network("100.64.0.0/10")
 # These addresses translate to IPv4 and can bypass IPv4 filters if the environment supports NAT64.
 _NAT64_PREFIX = ipaddress.IPv6Network("64:ff9b::/96")
 
+# Test-only loopback stand-ins (``benchmarks.upstream``): upstream hostname ->
+# port of a replay server on 127.0.0.1. Only :func:`loopback_standins` fills
+# the map — deliberately there is no environment switch — so outside a
+# load test every request takes the pinned public-IP path below.
+_LOOPBACK_STANDINS: dict[str, int] = {}
+_STANDIN_HOST = "127.0.0.1"
+
+
+@contextmanager
+def loopback_standins(ports: Mapping[str, int]) -> Iterator[None]:
+    """Route :func:`request_safe` calls for *ports*' hosts to local stand-ins.
+
+    Test-only: inside the block a request for ``https://<host>/<path>`` is
+    sent as plain HTTP to ``127.0.0.1:<port>`` with the original ``Host``
+    header, and :func:`verify_response_ip` accepts that loopback peer. Every
+    other host keeps the SSRF and DNS-rebinding guards; the previous mapping
+    is restored on exit.
+    """
+    for host, port in ports.items():
+        if not host or not 0 < port < 65536:
+            raise ValueError(f"Invalid stand-in mapping {host!r} -> {port!r}")
+    previous = dict(_LOOPBACK_STANDINS)
+    _LOOPBACK_STANDINS.update({host.lower(): port for host, port in ports.items()})
+    try:
+        yield
+    finally:
+        _LOOPBACK_STANDINS.clear()
+        _LOOPBACK_STANDINS.update(previous)
+
+
+def _is_standin_response(response: requests.Response) -> bool:
+    """Whether *response* came from a registered loopback stand-in."""
+    if not _LOOPBACK_STANDINS:
+        return False
+    parsed = urlparse(getattr(response.request, "url", "") or "")
+    if parsed.hostname != _STANDIN_HOST or parsed.port not in _LOOPBACK_STANDINS.values():
+        return False
+    conn = getattr(response.raw, "_connection", getattr(response.raw, "connection", None))
+    sock = getattr(conn, "sock", None)
+    return sock is None or ipaddress.ip_address(sock.getpeername()[0]).is_loopback
+
 
 def is_ip_safe(
     ip_addr: Any
@@ -1256,6 +1317,12 @@ def _resolve_hostname_safe(hostname: str) -> list[tuple[Any, ...]]:
         str(hostname).encode("utf-8", "replace")
     ).hexdigest()[:12]
 
+    # dnspython is imported on first resolution (~50 ms of resolver,
+    # DoH/DoQ and rdata modules) so importing this module stays cheap for
+    # callers that never open a connection.
+    import dns.exception
+    import dns.resolver
+
     resolver = dns.resolver.Resolver()
     resolver.timeout = DNS_TIMEOUT
     resolver.lifetime = DNS_TIMEOUT
@@ -1639,6 +1706,9 @@ def verify_response_ip(response: requests.Response) -> None:
             "Validation of mock connection skipped: %s", sanitize_log_arg(str(exc))
         )
 
+    if _is_standin_response(response):
+        return
+
     # Proxy Compatibility (Task C): Bypass check if explicit proxy env vars are set
     if any(k in os.environ for k in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy")):
         return
@@ -1713,6 +1783,7 @@ def read_response_safe(
     response: requests.Response,
     max_bytes: int = MAX_PAYLOAD_SIZE,
     timeout: float | tuple[float, float] | None = None,
+    on_chunk: Callable[[bytes], None] | None = None,
 ) -> bytes:
     """Read response content safely, enforcing size limits and timeouts.
 
@@ -1720,10 +1791,16 @@ def read_response_safe(
         response: The requests Response object (must be opened with stream=True).
         max_bytes: Maximum allowed size in bytes.
         timeout: Maximum time in seconds allowed for reading the body.
+        on_chunk: Optional consumer for incremental parsing. Each chunk is
+            handed over as soon as it arrives instead of being buffered, and
+            the function returns ``b""``. Size and time limits apply
+            unchanged; time spent in the consumer counts against ``timeout``.
 
     Raises:
         ValueError: If Content-Length or actual size exceeds max_bytes.
         requests.Timeout: If the read operation exceeds the timeout.
+        FetchCancelled: If the surrounding fetch is cancelled mid-body
+            (see :mod:`src.utils.cancellation`).
     """
     # Check Content-Length header if present
     content_length = response.headers.get("Content-Length")
@@ -1747,10 +1824,14 @@ def read_response_safe(
     else:
         read_timeout = timeout
 
+    token = cancellation.current_token()
     for chunk in response.iter_content(chunk_size=8192):
         if read_timeout is not None and (time.monotonic() - start_time) > read_timeout:
             response.close()
             raise requests.Timeout(f"Read timed out after {read_timeout} seconds")
+        if token is not None and token.cancelled:
+            response.close()
+            token.raise_if_cancelled()
 
         # Check the prospective size BEFORE appending so the worst-case
         # in-memory buffer is bounded by ``max_bytes`` (not
@@ -1760,8 +1841,11 @@ def read_response_safe(
         if received + len(chunk) > max_bytes:
             response.close()
             raise ValueError(f"Response too large (> {max_bytes} bytes)")
-        chunks.append(chunk)
         received += len(chunk)
+        if on_chunk is not None:
+            on_chunk(chunk)
+        else:
+            chunks.append(chunk)
     return b"".join(chunks)
 
 
@@ -2004,6 +2088,36 @@ def _send_https_pinned(
     return adapter.send(prepped, **adapter_kwargs)
 
 
+def _send_standin(
+    session: requests.Session,
+    method: str,
+    parsed: Any,
+    port: int,
+    current_timeout: float | tuple[float, float] | None,
+    request_hooks: dict[str, Any],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Send the request to the loopback stand-in registered for its host.
+
+    Only reachable inside :func:`loopback_standins`. The stand-in speaks
+    plain HTTP; path and query are kept and the original host travels in
+    the ``Host`` header so the replay server can pick the recording.
+    """
+    standin_url = urlunparse(
+        ("http", f"{_STANDIN_HOST}:{port}", parsed.path, parsed.params, parsed.query, "")
+    )
+    kwargs["headers"]["Host"] = parsed.netloc
+    return session.request(
+        method,
+        standin_url,
+        stream=True,
+        timeout=current_timeout,
+        hooks=request_hooks,
+        allow_redirects=False,
+        **kwargs,
+    )
+
+
 def _strip_redirect_secrets(
     kwargs: dict[str, Any],
     current_url: str,
@@ -2218,6 +2332,7 @@ def request_safe(
     timeout: int | float | tuple[float, float] | None = None,
     allowed_content_types: Container[str] | None = None,
     raise_for_status: bool = True,
+    on_chunk: Callable[[bytes], None] | None = None,
     **kwargs: Any,
 ) -> requests.Response:
     """Perform an HTTP request through the project's security state machine.
@@ -2286,6 +2401,9 @@ def request_safe(
             :meth:`Response.raise_for_status` on the final response.
             Set ``False`` only when the caller needs to inspect 4xx/5xx
             payloads (e.g. ``Retry-After`` parsing).
+        on_chunk: Optional body consumer passed to
+            :func:`read_response_safe`; the body is streamed into it
+            (e.g. an incremental XML parser) and ``.content`` stays empty.
         **kwargs: Additional keyword arguments forwarded to
             :meth:`Session.request`. The ``allow_redirects``, ``stream``,
             and ``hooks`` keys are stripped/managed by this function
@@ -2305,6 +2423,8 @@ def request_safe(
             (either pre-flight or during body streaming).
         requests.TooManyRedirects: If the redirect chain exceeds
             ``session.max_redirects`` (default 10).
+        FetchCancelled: If the calling provider fetch was cancelled or
+            hit its deadline (:mod:`src.utils.cancellation`).
         requests.RequestException: For network errors. The ``args``
             of the exception are sanitized to strip any URLs that
             might have contained query-string secrets.
@@ -2336,6 +2456,9 @@ def request_safe(
             elapsed = time.monotonic() - start_time
             _check_total_budget_or_raise(total_allowed_time, elapsed)
             current_timeout = _per_request_timeout(timeout, total_allowed_time, elapsed)
+            # A cancelled fetch stops before the next hop; otherwise no
+            # socket timeout may outlast the fetch's deadline.
+            current_timeout = cancellation.bound_timeout(current_timeout)
 
             safe_url = validate_http_url(current_url, check_dns=False)
             if not safe_url:
@@ -2344,7 +2467,12 @@ def request_safe(
                 raise ValueError(f"Unsafe or invalid URL: {sanitized_url}")
 
             parsed = urlparse(safe_url)
-            if parsed.scheme == "http":
+            standin_port = _LOOPBACK_STANDINS.get(parsed.hostname or "")
+            if standin_port is not None:
+                ctx = _send_standin(
+                    session, method, parsed, standin_port, current_timeout, request_hooks, kwargs
+                )
+            elif parsed.scheme == "http":
                 ctx = _send_http_pinned(
                     session, method, parsed, safe_url, current_timeout, request_hooks, kwargs
                 )
@@ -2357,7 +2485,7 @@ def request_safe(
             with ctx as r:
                 try:
                     # Manually dispatch hooks for HTTPS since we bypassed session.request
-                    if parsed.scheme == "https":
+                    if parsed.scheme == "https" and standin_port is None:
                         r = dispatch_hook("response", request_hooks, r, **kwargs)
 
                     redirect = _process_redirect(
@@ -2376,7 +2504,9 @@ def request_safe(
                     final_read_timeout = _compute_read_timeout(
                         timeout, total_allowed_time, current_elapsed
                     )
-                    content = read_response_safe(r, max_bytes, timeout=final_read_timeout)
+                    content = read_response_safe(
+                        r, max_bytes, timeout=final_read_timeout, on_chunk=on_chunk
+                    )
 
                     # Manually attach content to response object so it's usable after close
                     r._content = content
@@ -2405,9 +2535,14 @@ def fetch_content_safe(
     max_bytes: int = MAX_PAYLOAD_SIZE,
     timeout: int | float | tuple[float, float] | None = None,
     allowed_content_types: Container[str] | None = None,
+    on_chunk: Callable[[bytes], None] | None = None,
     **kwargs: Any,
 ) -> bytes:
-    """Fetch URL content with a size limit to prevent DoS (legacy wrapper)."""
+    """Fetch URL content with a size limit to prevent DoS (legacy wrapper).
+
+    With *on_chunk* the body is streamed into the consumer chunk by chunk
+    (see :func:`read_response_safe`) and ``b""`` is returned.
+    """
     # Explicitly enforce stream=True for downstream compatibility
     kwargs["stream"] = True
     response = request_safe(
@@ -2418,6 +2553,7 @@ def fetch_content_safe(
         timeout=timeout,
         allowed_content_types=allowed_content_types,
         raise_for_status=True,
+        on_chunk=on_chunk,
         **kwargs,
     )
     return cast(bytes, response.content)
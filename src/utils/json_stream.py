@@ -0,0 +1,281 @@
+"""Incremental reader for JSON objects dominated by one large array member.
+
+A WFS ``FeatureCollection`` spends almost all of its bytes in the
+``features`` array. :class:`StreamingArrayReader` is fed the response body
+chunk by chunk (see ``on_chunk`` in :func:`src.utils.http.fetch_content_safe`)
+and hands every element of that array to a callback as soon as its closing
+bracket arrives, so only one element is held in memory at a time. The
+remaining top-level members are decoded normally and returned by
+:meth:`StreamingArrayReader.close`.
+
+Every element and member is decoded through :func:`loads_finite`; nesting
+depth and element size are bounded before anything is decoded. Malformed,
+truncated or oversized input raises :class:`JSONStreamError`.
+"""
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Callable
+from typing import Any, Final
+
+from .files import loads_finite
+
+__all__ = ["JSONStreamError", "StreamingArrayReader"]
+
+# Nested ``[``/``{`` allowed inside one element. GeoJSON needs four
+# levels for a MultiPolygon; the cap keeps ``json.loads`` far from the
+# interpreter recursion limit.
+DEFAULT_MAX_DEPTH: Final = 64
+# Characters allowed for a single element or header member.
+DEFAULT_MAX_ELEMENT_CHARS: Final = 4 * 1024 * 1024
+
+_STRUCTURAL_RE: Final = re.compile(r'[\[\]{}"]')
+# Remainder of a string literal after its opening quote.
+_STRING_TAIL_RE: Final = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR_RE: Final = re.compile(r"[^\s,\]}:]+")
+_TOKEN_RE: Final = re.compile(r"[^ \t\r\n]")
+
+# Parser states between two tokens of the top-level object.
+_START, _FIRST_KEY, _KEY, _COLON, _VALUE, _MEMBER_SEP = range(6)
+_FIRST_ELEMENT, _ELEMENT, _ELEMENT_SEP, _DONE = range(6, 10)
+
+_INCOMPLETE: Final = object()
+
+
+class JSONStreamError(ValueError):
+    """The streamed document is not a well-formed, bounded JSON object."""
+
+
+class StreamingArrayReader:
+    """Push parser for ``{..., "<member>": [element, ...], ...}`` documents.
+
+    ``on_element`` receives each decoded element of the *member* array in
+    document order; :attr:`elements` counts them and :attr:`streamed`
+    records whether the member was present at all.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_decoder",
+        "_header",
+        "_key",
+        "_max_depth",
+        "_max_element_chars",
+        "_member",
+        "_on_element",
+        "_pos",
+        "_scan",
+        "_state",
+        "elements",
+        "streamed",
+    )
+
+    def __init__(
+        self,
+        member: str,
+        on_element: Callable[[Any], None],
+        *,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        max_element_chars: int = DEFAULT_MAX_ELEMENT_CHARS,
+    ) -> None:
+        self._member = member
+        self._on_element = on_element
+        self._max_depth = max_depth
+        self._max_element_chars = max_element_chars
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        # Resume point of an unfinished container value: offset from
+        # ``_pos`` and the bracket depth reached there.
+        self._scan = (0, 0)
+        self._state = _START
+        self._key = ""
+        self._header: dict[str, Any] = {}
+        self.elements = 0
+        self.streamed = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next *chunk* of the UTF-8 encoded document."""
+        self._extend(chunk, final=False)
+        self._advance(final=False)
+
+    def close(self) -> dict[str, Any]:
+        """Finish the document and return its members except the streamed one."""
+        self._extend(b"", final=True)
+        self._advance(final=True)
+        if self._state != _DONE:
+            raise JSONStreamError("Unexpected end of JSON document")
+        return self._header
+
+    def _extend(self, chunk: bytes, *, final: bool) -> None:
+        try:
+            text = self._decoder.decode(chunk, final)
+        except UnicodeDecodeError as exc:
+            raise JSONStreamError(f"Invalid UTF-8 in JSON document: {exc}") from exc
+        # Everything before ``_pos`` is consumed; the unfinished token
+        # keeps its ``_scan`` offset because it is relative to ``_pos``.
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+
+    def _advance(self, *, final: bool) -> None:
+        while True:
+            token = _TOKEN_RE.search(self._buffer, self._pos)
+            if token is None:
+                self._pos = len(self._buffer)
+                return
+            self._pos = token.start()
+            if not _HANDLERS[self._state](self, self._buffer[self._pos], final):
+                return
+
+    # -- state handlers: return ``False`` when more input is needed ------
+
+    def _on_start(self, char: str, _final: bool) -> bool:
+        self._expect(char, "{")
+        self._state = _FIRST_KEY
+        return True
+
+    def _on_key(self, char: str, final: bool) -> bool:
+        if char == "}" and self._state == _FIRST_KEY:
+            return self._step(_DONE)
+        if char != '"':
+            raise JSONStreamError(f"Expected object key at {char!r}")
+        key = self._take_value(final)
+        if key is _INCOMPLETE:
+            return False
+        self._key = str(key)
+        self._state = _COLON
+        return True
+
+    def _on_colon(self, char: str, _final: bool) -> bool:
+        self._expect(char, ":")
+        self._state = _VALUE
+        return True
+
+    def _on_member_value(self, char: str, final: bool) -> bool:
+        if char == "[" and self._key == self._member and not self.streamed:
+            self.streamed = True
+            return self._step(_FIRST_ELEMENT)
+        value = self._take_value(final)
+        if value is _INCOMPLETE:
+            return False
+        self._header[self._key] = value
+        self._state = _MEMBER_SEP
+        return True
+
+    def _on_member_sep(self, char: str, _final: bool) -> bool:
+        if char == ",":
+            return self._step(_KEY)
+        self._expect(char, "}")
+        self._state = _DONE
+        return True
+
+    def _on_array_value(self, char: str, final: bool) -> bool:
+        if char == "]" and self._state == _FIRST_ELEMENT:
+            return self._step(_MEMBER_SEP)
+        value = self._take_value(final)
+        if value is _INCOMPLETE:
+            return False
+        self.elements += 1
+        self._on_element(value)
+        self._state = _ELEMENT_SEP
+        return True
+
+    def _on_element_sep(self, char: str, _final: bool) -> bool:
+        if char == ",":
+            return self._step(_ELEMENT)
+        self._expect(char, "]")
+        self._state = _MEMBER_SEP
+        return True
+
+    def _on_done(self, char: str, _final: bool) -> bool:
+        raise JSONStreamError(f"Extra data after JSON document at {char!r}")
+
+    # -- helpers ----------------------------------------------------------
+
+    def _step(self, state: int) -> bool:
+        self._pos += 1
+        self._state = state
+        return True
+
+    def _expect(self, char: str, wanted: str) -> None:
+        if char != wanted:
+            raise JSONStreamError(f"Expected {wanted!r} at {char!r}")
+        self._pos += 1
+
+    def _take_value(self, final: bool) -> object:
+        """Decode the value starting at ``_pos`` or return ``_INCOMPLETE``."""
+        start = self._pos
+        end = self._value_end(final)
+        size = (len(self._buffer) if end is None else end) - start
+        if size > self._max_element_chars:
+            raise JSONStreamError(f"JSON value exceeds {self._max_element_chars} characters")
+        if end is None:
+            return _INCOMPLETE
+        try:
+            value = loads_finite(self._buffer[start:end])
+        except (json.JSONDecodeError, RecursionError) as exc:
+            raise JSONStreamError(f"Invalid JSON value: {exc}") from exc
+        except ValueError as exc:  # non-finite literal
+            raise JSONStreamError(str(exc)) from exc
+        self._pos = end
+        return value
+
+    def _value_end(self, final: bool) -> int | None:
+        buffer, start = self._buffer, self._pos
+        char = buffer[start]
+        if char in "[{":
+            return self._container_end()
+        if char == '"':
+            match = _STRING_TAIL_RE.match(buffer, start + 1)
+            return match.end() if match else None
+        scalar = _SCALAR_RE.match(buffer, start)
+        if scalar is None:
+            raise JSONStreamError(f"Unexpected character {char!r}")
+        # A number or literal touching the end of the buffer may continue
+        # in the next chunk.
+        if scalar.end() == len(buffer) and not final:
+            return None
+        return scalar.end()
+
+    def _container_end(self) -> int | None:
+        buffer, start = self._buffer, self._pos
+        offset, depth = self._scan
+        index = start + offset
+        while True:
+            match = _STRUCTURAL_RE.search(buffer, index)
+            if match is None:
+                self._scan = (len(buffer) - start, depth)
+                return None
+            bracket, index = match.group(), match.end()
+            if bracket == '"':
+                tail = _STRING_TAIL_RE.match(buffer, index)
+                if tail is None:
+                    # Rescan the string from its opening quote next time.
+                    self._scan = (match.start() - start, depth)
+                    return None
+                index = tail.end()
+            elif bracket in "[{":
+                depth += 1
+                if depth > self._max_depth:
+                    raise JSONStreamError(f"JSON nesting exceeds {self._max_depth} levels")
+            else:
+                depth -= 1
+                if depth == 0:
+                    self._scan = (0, 0)
+                    return index
+
+
+_HANDLERS: Final[dict[int, Callable[[StreamingArrayReader, str, bool], bool]]] = {
+    _START: StreamingArrayReader._on_start,
+    _FIRST_KEY: StreamingArrayReader._on_key,
+    _KEY: StreamingArrayReader._on_key,
+    _COLON: StreamingArrayReader._on_colon,
+    _VALUE: StreamingArrayReader._on_member_value,
+    _MEMBER_SEP: StreamingArrayReader._on_member_sep,
+    _FIRST_ELEMENT: StreamingArrayReader._on_array_value,
+    _ELEMENT: StreamingArrayReader._on_array_value,
+    _ELEMENT_SEP: StreamingArrayReader._on_element_sep,
+    _DONE: StreamingArrayReader._on_done,
+}
@@ -0,0 +1,293 @@
+"""Opt-in profiling for cron runs (feed build, provider cache updaters).
+
+Enabled per run via ``--profile[=MODE]`` (``python -m src.cli feed build``,
+``python -m src.cli cache update``, the ``scripts/update_*_cache.py``
+entry points) or the ``WIEN_OEPNV_PROFILE`` environment variable, so a
+slow cycle can be diagnosed on the actual runner without reproducing its
+data locally. Modes:
+
+``cprofile``
+    Deterministic :mod:`cProfile` of the calling thread, written as a
+    gzip-compressed ``.pstats.gz`` (``python -m src.utils.profiling show
+    <file>`` prints the top entries).
+``sample``
+    A daemon thread samples the stacks of *all* threads (provider fetches
+    run in executor threads) every :data:`DEFAULT_SAMPLE_INTERVAL` seconds
+    and writes a collapsed-stack ``.collapsed.txt`` that ``flamegraph.pl``
+    or https://www.speedscope.app render directly.
+``1`` / ``all``
+    Both at once.
+
+Artefacts land in ``log/profiles/`` named ``<label>-<UTC stamp>-<pid>``.
+After every write the directory is pruned to the newest
+:data:`MAX_PROFILE_FILES` files and :data:`MAX_PROFILE_DIR_BYTES` bytes;
+a single collapsed file is capped at :data:`MAX_COLLAPSED_BYTES` (the
+rarest stacks are dropped first). Profiling failures are logged and never
+fail the profiled run.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import logging
+import marshal
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Final
+
+from .files import atomic_write
+from .logging import sanitize_log_arg
+
+__all__ = [
+    "PROFILE_ENV",
+    "StackSampler",
+    "profile_modes",
+    "profiled",
+    "run_profiled_main",
+]
+
+log = logging.getLogger(__name__)
+
+PROFILE_ENV: Final = "WIEN_OEPNV_PROFILE"
+REPO_ROOT: Final = Path(__file__).resolve().parents[2]
+DEFAULT_PROFILE_DIR: Final = REPO_ROOT / "log" / "profiles"
+DEFAULT_SAMPLE_INTERVAL: Final = 0.005
+MAX_STACK_DEPTH: Final = 128
+MAX_PROFILE_FILES: Final = 20
+MAX_PROFILE_DIR_BYTES: Final = 64 * 1024 * 1024
+MAX_COLLAPSED_BYTES: Final = 8 * 1024 * 1024
+
+_MODES: Final = {
+    "1": frozenset({"cprofile", "sample"}),
+    "true": frozenset({"cprofile", "sample"}),
+    "all": frozenset({"cprofile", "sample"}),
+    "cprofile": frozenset({"cprofile"}),
+    "sample": frozenset({"sample"}),
+}
+_OFF: Final = frozenset({"", "0", "false", "off", "no"})
+_ARTEFACT_SUFFIXES: Final = (".pstats.gz", ".collapsed.txt")
+_UNSAFE_LABEL_RE: Final = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def profile_modes(explicit: str | None = None) -> frozenset[str]:
+    """Resolve the requested profilers; *explicit* (CLI flag) wins over the env var.
+
+    Unknown values are logged and treated as "off" so a typo in a cron
+    env never changes what the run does.
+    """
+    raw = explicit if explicit is not None else os.getenv(PROFILE_ENV, "")
+    value = raw.strip().lower()
+    if value in _OFF:
+        return frozenset()
+    modes = _MODES.get(value)
+    if modes is None:
+        log.warning("Unbekannter Profiling-Modus %s – Profiling bleibt aus.", sanitize_log_arg(raw))
+        return frozenset()
+    return modes
+
+
+def _code_label(code: CodeType) -> str:
+    filename = code.co_filename
+    try:
+        filename = Path(filename).resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        filename = Path(filename).name
+    # ``;`` separates frames in the collapsed format.
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+
+class StackSampler:
+    """Periodically record the stacks of every thread except its own."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.samples = 0
+        self._counts: Counter[str] = Counter()
+        # Resolving a code object's path is a syscall; sample loops hit the
+        # same few hundred code objects over and over.
+        self._labels: dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for tid, frame in sys._current_frames().items():
+                if tid == own:
+                    continue
+                stack: list[str] = []
+                current: FrameType | None = frame
+                while current is not None and len(stack) < MAX_STACK_DEPTH:
+                    code = current.f_code
+                    label = self._labels.get(code)
+                    if label is None:
+                        label = self._labels[code] = _code_label(code)
+                    stack.append(label)
+                    current = current.f_back
+                stack.append(names.get(tid, f"thread-{tid}").replace(";", ","))
+                self._counts[";".join(reversed(stack))] += 1
+                self.samples += 1
+
+    def collapsed(self, max_bytes: int = MAX_COLLAPSED_BYTES) -> str:
+        """Collapsed-stack text (``frame;frame;frame count``), heaviest stacks first."""
+        lines: list[str] = []
+        size = 0
+        dropped = 0
+        for stack, hits in self._counts.most_common():
+            line = f"{stack} {hits}\n"
+            if size + len(line.encode("utf-8")) > max_bytes:
+                dropped += hits
+                continue
+            lines.append(line)
+            size += len(line.encode("utf-8"))
+        if dropped:
+            lines.append(f"[truncated] {dropped}\n")
+        return "".join(lines)
+
+
+def _prune(directory: Path, *, max_files: int, max_bytes: int) -> None:
+    artefacts = [
+        path for path in directory.iterdir()
+        if path.is_file() and path.name.endswith(_ARTEFACT_SUFFIXES)
+    ]
+    artefacts.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+    kept_bytes = 0
+    for index, path in enumerate(artefacts):
+        size = path.stat().st_size
+        if index < max_files and kept_bytes + size <= max_bytes:
+            kept_bytes += size
+            continue
+        path.unlink(missing_ok=True)
+
+
+def _write_artefacts(
+    stem: Path,
+    profile: Any | None,
+    sampler: StackSampler | None,
+) -> list[Path]:
+    written: list[Path] = []
+    if profile is not None:
+        profile.create_stats()
+        target = stem.with_name(stem.name + ".pstats.gz")
+        with atomic_write(target, mode="wb", permissions=0o644) as handle:
+            # ``marshal`` of ``Profile.stats`` is exactly what
+            # ``Profile.dump_stats`` writes; gzip keeps a large run small.
+            handle.write(gzip.compress(marshal.dumps(profile.stats)))
+        written.append(target)
+    if sampler is not None:
+        target = stem.with_name(stem.name + ".collapsed.txt")
+        with atomic_write(target, mode="w", encoding="utf-8", permissions=0o644) as handle:
+            handle.write(sampler.collapsed())
+        written.append(target)
+    return written
+
+
+@contextmanager
+def profiled(
+    label: str,
+    modes: frozenset[str] | None = None,
+    *,
+    directory: Path | None = None,
+    interval: float = DEFAULT_SAMPLE_INTERVAL,
+) -> Iterator[list[Path]]:
+    """Profile the enclosed block; yields the list the artefact paths are appended to.
+
+    *modes* defaults to :func:`profile_modes` (env var). With no mode the
+    block runs untouched and the list stays empty.
+    """
+    active = profile_modes() if modes is None else modes
+    written: list[Path] = []
+    if not active:
+        yield written
+        return
+
+    profile: Any | None = None
+    if "cprofile" in active:
+        # Imported on demand: unprofiled runs never load the profiler.
+        import cProfile
+
+        profile = cProfile.Profile()
+    sampler = StackSampler(interval) if "sample" in active else None
+    if sampler is not None:
+        sampler.start()
+    if profile is not None:
+        profile.enable()
+    try:
+        yield written
+    finally:
+        if profile is not None:
+            profile.disable()
+        if sampler is not None:
+            sampler.stop()
+        target_dir = directory or DEFAULT_PROFILE_DIR
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        safe_label = _UNSAFE_LABEL_RE.sub("_", label).strip("._") or "run"
+        try:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            written.extend(_write_artefacts(target_dir / f"{safe_label}-{stamp}-{os.getpid()}", profile, sampler))
+            _prune(target_dir, max_files=MAX_PROFILE_FILES, max_bytes=MAX_PROFILE_DIR_BYTES)
+        except OSError as exc:
+            log.warning("Profil konnte nicht geschrieben werden: %s", sanitize_log_arg(str(exc)))
+        else:
+            for path in written:
+                log.info("Profil geschrieben: %s", path)
+
+
+def run_profiled_main(label: str, main: Callable[[], int], argv: Sequence[str] | None = None) -> int:
+    """Entry-point helper for scripts: honour ``--profile[=MODE]`` and the env var.
+
+    The scripts take no other arguments; anything besides ``--profile`` is
+    rejected with argparse's usual usage error.
+    """
+    parser = argparse.ArgumentParser(prog=label)
+    parser.add_argument(
+        "--profile", nargs="?", const="all", default=None, choices=("cprofile", "sample", "all"),
+        help=f"Profile this run (cprofile, sample, all; default all). Overrides {PROFILE_ENV}.",
+    )
+    args = parser.parse_args(list(sys.argv[1:] if argv is None else argv))
+    with profiled(label, profile_modes(args.profile)):
+        return main()
+
+
+def _show(path: Path, limit: int) -> int:
+    import pstats
+
+    with gzip.open(path, "rb") as handle:
+        raw = handle.read()
+    stats = pstats.Stats()
+    # Only ever pointed at artefacts this module wrote into ``log/profiles``;
+    # marshal is the format ``pstats`` itself uses.
+    stats.stats = marshal.loads(raw)  # type: ignore[attr-defined]  # noqa: S302
+    stats.get_top_level_stats()
+    stats.sort_stats("cumulative").print_stats(limit)
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect profiles written by --profile.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    show = sub.add_parser("show", help="Print the top entries of a .pstats.gz profile.")
+    show.add_argument("path", type=Path)
+    show.add_argument("--limit", type=int, default=30)
+    args = parser.parse_args(argv)
+    return _show(args.path, args.limit)
+
+
+if __name__ == "__main__":  # pragma: no cover - manual inspection
+    raise SystemExit(main())
@@ -14,6 +14,7 @@ from functools import lru_cache
 from itertools import pairwise
 from pathlib import Path
 from typing import Any, NamedTuple
+from collections import Counter
 from collections.abc import Iterable
 
 from .files import _reject_non_finite_constant, _reject_non_finite_float
@@ -28,6 +29,7 @@ __all__ = [
     "station_by_oebb_id",
     "station_info",
     "text_has_vienna_connection",
+    "text_may_reference_region",
     "vor_station_ids",
 ]
 
@@ -1005,9 +1007,8 @@ def _mask_non_vienna_stations(text: str) -> str:
     return text
 
 
-@lru_cache(maxsize=1)
-def _vienna_stations_regex() -> re.Pattern[str]:
-    """Kompiliert einen Regex-Ausdruck mit allen bekannten Wiener Stationen."""
+def _vienna_station_terms() -> frozenset[str]:
+    """Kleingeschriebene Namen und Aliase aller Wiener Stationen (für den Text-Abgleich)."""
     vienna: set[str] = set()
     for entry in _station_entries():
         if entry.get("in_vienna"):
@@ -1027,7 +1028,13 @@ def _vienna_stations_regex() -> re.Pattern[str]:
     # referenzieren diese Stationen über den Vollnamen (Bug b11).
     vienna = {n for n in vienna if len(n) >= 4 and not n.isdigit()}
     vienna -= {"hbf", "bf", "bahnhof", "hauptbahnhof", "station"}
+    return frozenset(vienna)
 
+
+@lru_cache(maxsize=1)
+def _vienna_stations_regex() -> re.Pattern[str]:
+    """Kompiliert einen Regex-Ausdruck mit allen bekannten Wiener Stationen."""
+    vienna = _vienna_station_terms()
     if not vienna:
         return re.compile(r"(?!x)x")
 
@@ -1089,3 +1096,55 @@ def text_has_vienna_connection(text: str) -> bool:
         return True
 
     return False
+
+
+# ``_candidate_values`` also looks names up with ``Hbf`` spelled out, while
+# ``_normalize_token`` drops the abbreviation altogether.
+_HBF_ABBREVIATION_RE = re.compile(r"\bHbf\b", re.IGNORECASE)
+
+
+def _lookup_words(text: str) -> set[str]:
+    """Return the words of *text* in the normalised form of the lookup keys."""
+
+    text = _HBF_ABBREVIATION_RE.sub("Hbf Hauptbahnhof", text)
+    words = set(_normalize_token(text).split())
+    # Short codes (``Sue``) keep their ``ue`` in ``_normalize_token``; the
+    # whole text is long enough to get folded, so add them separately.
+    words.update(_normalize_token(word) for word in re.findall(r"\w+", text) if len(word) <= 3)
+    return words
+
+
+@lru_cache(maxsize=1)
+def _regional_anchor_words() -> frozenset[str]:
+    """One word per Vienna/commuter-belt lookup key and Vienna text term.
+
+    Every key has to appear word for word in a text it is matched in, so
+    its rarest word across the whole directory is a necessary (and mostly
+    selective) trigger for it. ``Wien``/``Vienna`` and the U-Bahn lines
+    cover the generic checks of :func:`text_has_vienna_connection`.
+    """
+
+    lookup = _station_lookup()
+    frequency = Counter(word for key in lookup for word in set(key.split()))
+    keys = [key for key, info in lookup.items() if info.in_vienna or info.pendler]
+    keys.extend(_normalize_token(term) for term in _vienna_station_terms())
+    anchors = {"wien", "vienna", *(f"u{line}" for line in range(1, 7))}
+    for key in keys:
+        words = key.split()
+        if words:
+            anchors.add(min(words, key=lambda word: (frequency[word], -len(word))))
+    return frozenset(anchors)
+
+
+def text_may_reference_region(text: str) -> bool:
+    """Cheap pre-check: could *text* mention Vienna or a commuter station at all?
+
+    ``False`` guarantees that neither :func:`station_info` lookups on parts
+    of *text* nor :func:`text_has_vienna_connection` can find a Vienna or
+    Pendler reference, so callers may drop the text before running their
+    expensive route and station extraction. ``True`` proves nothing.
+    """
+
+    if not text:
+        return False
+    return not _regional_anchor_words().isdisjoint(_lookup_words(text))
@@ -7,7 +7,7 @@ that it can be reused in scripts, tests and CI jobs.
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 import csv
 import io
@@ -17,6 +17,8 @@ import math
 import os
 import re
 from collections.abc import Iterable, Iterator, Mapping, Sequence
+from time import perf_counter
+from typing import Any, ClassVar, Generic, TypeVar
 
 from src.utils.files import (
     _reject_non_finite_constant,
@@ -178,6 +180,21 @@ class CrossNameAliasIssue:
     distance_m: int
 
 
+@dataclass(frozen=True)
+class RuleTiming:
+    """Wall-clock cost of one rule in a :func:`validate_station_entries` run.
+
+    ``rule`` is the :attr:`ValidationRule.name` (or ``"index"`` for the
+    shared :class:`StationIndex` build that precedes the traversal);
+    ``seconds`` sums the rule's per-station ``check`` calls and its
+    ``finish`` call.
+    """
+
+    rule: str
+    seconds: float
+    issues: int
+
+
 # Per-cell length cap applied at every ``stations.json``-derived
 # Markdown sink in :meth:`ValidationReport.to_markdown`. Mirrors the
 # canonical ``_DASHBOARD_FIELD_MAX_LEN`` constant in
@@ -227,6 +244,10 @@ class ValidationReport:
     # constructors in the test suite keep working without the new key —
     # same rationale as ``identity_field_conflicts`` above.
     cross_name_alias_issues: tuple[CrossNameAliasIssue, ...] = ()
+    # Per-rule cost of the single-pass engine, in rule order. Excluded
+    # from equality so two reports over the same directory still compare
+    # equal although their timings differ run to run.
+    rule_timings: tuple[RuleTiming, ...] = field(default=(), compare=False)
 
     @property
     def has_issues(self) -> bool:
@@ -419,40 +440,55 @@ def validate_stations(
     gtfs_stops_path: Path | None = None,
     decimal_places: int = 5,
     coordinate_bounds: tuple[float, float, float, float] | None = None,
+    rules: Sequence[ValidationRule[Any]] | None = None,
 ) -> ValidationReport:
-    stations = _load_stations(stations_path)
-    gtfs_stop_ids, gtfs_count = _load_gtfs_stop_ids(gtfs_stops_path)
-
-    duplicates = tuple(
-        _format_duplicate_group(key, entries)
-        for key, entries in _find_duplicate_coordinate_groups(stations, decimal_places)
+    return validate_station_entries(
+        _load_stations(stations_path),
+        gtfs_stops_path=gtfs_stops_path,
+        decimal_places=decimal_places,
+        coordinate_bounds=coordinate_bounds,
+        rules=rules,
     )
 
-    alias_issues = tuple(_find_alias_issues(stations))
-    coordinate_issues = tuple(
-        _find_coordinate_issues(stations, bounds=coordinate_bounds)
-    )
-    gtfs_issues = tuple(_find_gtfs_issues(stations, gtfs_stop_ids))
-    security_issues = tuple(_find_security_issues(stations))
-    cross_station_id_issues = tuple(_find_cross_station_id_conflicts(stations))
-    provider_issues = tuple(_find_provider_issues(stations))
-    naming_issues = tuple(_find_naming_issues(stations))
-    identity_field_conflicts = tuple(_find_identity_field_conflicts(stations))
-    cross_name_alias_issues = tuple(_find_cross_name_alias_issues(stations))
 
+def validate_station_entries(
+    stations: Sequence[Mapping[str, object]],
+    *,
+    gtfs_stops_path: Path | None = None,
+    decimal_places: int = 5,
+    coordinate_bounds: tuple[float, float, float, float] | None = None,
+    rules: Sequence[ValidationRule[Any]] | None = None,
+) -> ValidationReport:
+    """Validate an already-loaded station list.
+
+    In-memory counterpart of :func:`validate_stations` used by the
+    in-process stage graph in ``scripts/update_all_stations.py``, which
+    keeps the merged directory in memory instead of re-reading it from
+    disk. Callers are responsible for the load-time defences
+    (size cap, finite-literal rejection) that :func:`_load_stations`
+    applies to a file.
+
+    All checks run through :func:`run_rules`: one :class:`StationIndex`
+    build plus a single traversal, so the cost stays linear in the
+    directory size. *rules* replaces the :func:`default_rules` set
+    (``gtfs_stops_path`` / ``decimal_places`` / ``coordinate_bounds``
+    only configure the defaults); each rule's issues land in the report
+    field named by its :attr:`ValidationRule.category`.
+    """
+    gtfs_stop_ids, gtfs_count = _load_gtfs_stop_ids(gtfs_stops_path)
+    if rules is None:
+        rules = default_rules(
+            gtfs_stop_ids=gtfs_stop_ids,
+            decimal_places=decimal_places,
+            coordinate_bounds=coordinate_bounds,
+        )
+
+    issues, timings = run_rules(stations, rules)
     return ValidationReport(
         total_stations=len(stations),
-        duplicates=duplicates,
-        alias_issues=alias_issues,
-        coordinate_issues=coordinate_issues,
-        gtfs_issues=gtfs_issues,
-        security_issues=security_issues,
-        cross_station_id_issues=cross_station_id_issues,
-        provider_issues=provider_issues,
-        naming_issues=naming_issues,
         gtfs_stop_count=gtfs_count,
-        identity_field_conflicts=identity_field_conflicts,
-        cross_name_alias_issues=cross_name_alias_issues,
+        rule_timings=timings,
+        **{category: tuple(issues.get(category, ())) for category in RULE_CATEGORIES},
     )
 
 
@@ -551,24 +587,6 @@ def _load_gtfs_stop_ids(path: Path | None) -> tuple[set[str], int]:
     return stop_ids, len(stop_ids)
 
 
-def _find_duplicate_coordinate_groups(
-    stations: Sequence[Mapping[str, object]],
-    decimal_places: int,
-) -> Iterator[tuple[tuple[float, float], list[Mapping[str, object]]]]:
-    buckets: dict[tuple[float, float], list[Mapping[str, object]]] = defaultdict(list)
-    for station in stations:
-        lat = _extract_float(station.get("latitude"))
-        lon = _extract_float(station.get("longitude"))
-        if lat is None or lon is None:
-            continue
-        key = (round(lat, decimal_places), round(lon, decimal_places))
-        buckets[key].append(station)
-
-    for key, entries in buckets.items():
-        if len(entries) > 1:
-            yield key, entries
-
-
 def _extract_float(value: object) -> float | None:
     val: float
     if isinstance(value, int | float):
@@ -591,10 +609,10 @@ def _extract_float(value: object) -> float | None:
 
 def _format_duplicate_group(
     key: tuple[float, float],
-    entries: Sequence[Mapping[str, object]],
+    records: Sequence[StationRecord],
 ) -> DuplicateGroup:
-    identifiers = tuple(_format_identifier(entry) for entry in entries)
-    names = tuple(str(entry.get("name", "")) for entry in entries)
+    identifiers = tuple(record.identifier for record in records)
+    names = tuple(str(record.entry.get("name", "")) for record in records)
     return DuplicateGroup(
         latitude=key[0],
         longitude=key[1],
@@ -648,34 +666,278 @@ def _format_identifier(entry: Mapping[str, object]) -> str:
     return " / ".join(parts)
 
 
-def _find_alias_issues(
-    stations: Sequence[Mapping[str, object]]
-) -> Iterator[AliasIssue]:
+_IssueT = TypeVar("_IssueT")
+
+# Identity fields an alias must not shadow on another station (see
+# ``_CrossStationIDRule``). Order matters: it fixes the order of the
+# colliding owners, and therefore of the reported issues.
+_ALIAS_SHADOW_FIELDS = ("bst_id", "bst_code", "vor_id", "wl_diva")
+
+# ``ValidationReport`` fields a rule may report into, in report order.
+RULE_CATEGORIES = (
+    "duplicates",
+    "alias_issues",
+    "coordinate_issues",
+    "gtfs_issues",
+    "security_issues",
+    "cross_station_id_issues",
+    "provider_issues",
+    "naming_issues",
+    "identity_field_conflicts",
+    "cross_name_alias_issues",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StationRecord:
+    """Per-station facts derived once and shared by every rule.
+
+    Before the single-pass engine each finder re-ran
+    :func:`_format_identifier`, :func:`_extract_float`,
+    :func:`_extract_source_tokens` and the name normalisation on every
+    entry — ten-plus times per station and run. ``entry`` stays
+    available for the rare field only one rule reads.
+    """
+
+    entry: Mapping[str, object]
+    identifier: str
+    # Report display name: stripped ``name`` or ``"<unknown>"``.
+    name: str
+    latitude: float | None
+    longitude: float | None
+    # String aliases verbatim; ``None`` when ``aliases`` is not a list.
+    aliases: tuple[str, ...] | None
+    sources: frozenset[str]
+    # :func:`_bare_station_name` of ``name`` (cross-name comparison token).
+    bare_name: str
+    # :func:`_normalize_token` of each :data:`_ALIAS_SHADOW_FIELDS` value.
+    id_tokens: Mapping[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class StationIndex:
+    """Directory-wide lookups the cross-station rules need up front.
+
+    Built by :func:`build_station_index` in the same pass that derives
+    the :class:`StationRecord` list, so a rule that compares one
+    station against all others is a dictionary lookup per label rather
+    than a nested scan.
+    """
+
+    records: tuple[StationRecord, ...]
+    # Normalised identity token → ``(owner, field)`` in directory order.
+    id_owners: Mapping[str, list[tuple[StationRecord, str]]]
+    # Bare canonical-name token → ``(display name, owner coordinates)``.
+    name_owners: Mapping[str, tuple[str, list[tuple[float, float]]]]
+    # ``bst_code`` values (as ``str``) of every OEBB-sourced station.
+    oebb_codes: frozenset[str]
+    vor_count: int
+
+
+def _build_station_record(entry: Mapping[str, object]) -> StationRecord:
+    aliases_obj = entry.get("aliases")
+    aliases: tuple[str, ...] | None = None
+    if isinstance(aliases_obj, Sequence) and not isinstance(aliases_obj, str | bytes):
+        aliases = tuple(alias for alias in aliases_obj if isinstance(alias, str))
+    id_tokens: dict[str, str] = {}
+    for id_field in _ALIAS_SHADOW_FIELDS:
+        value = entry.get(id_field)
+        if isinstance(value, str | int):
+            token = _normalize_token(str(value))
+            if token:
+                id_tokens[id_field] = token
+    return StationRecord(
+        entry=entry,
+        identifier=_format_identifier(entry),
+        name=str(entry.get("name", "")).strip() or "<unknown>",
+        latitude=_extract_float(entry.get("latitude")),
+        longitude=_extract_float(entry.get("longitude")),
+        aliases=aliases,
+        sources=frozenset(_extract_source_tokens(entry.get("source"))),
+        bare_name=_bare_station_name(entry.get("name")),
+        id_tokens=id_tokens,
+    )
+
+
+def build_station_index(stations: Iterable[Mapping[str, object]]) -> StationIndex:
+    """Derive every :class:`StationRecord` and the shared lookups in one pass."""
+    records: list[StationRecord] = []
+    id_owners: dict[str, list[tuple[StationRecord, str]]] = defaultdict(list)
+    name_owners: dict[str, tuple[str, list[tuple[float, float]]]] = {}
+    oebb_codes: set[str] = set()
+    vor_count = 0
     for entry in stations:
-        aliases_obj = entry.get("aliases")
-        name = str(entry.get("name", "")).strip()
-        identifier = _format_identifier(entry)
-
-        if not isinstance(aliases_obj, Sequence) or isinstance(aliases_obj, str | bytes):
-            yield AliasIssue(identifier=identifier, name=name or "<unknown>", reason="missing aliases list")
-            continue
-
-        aliases: list[str] = []
-        for item in aliases_obj:
-            if isinstance(item, str):
-                token = item.strip()
-                if token:
-                    aliases.append(token)
+        record = _build_station_record(entry)
+        records.append(record)
+        for id_field, token in record.id_tokens.items():
+            id_owners[token].append((record, id_field))
+        if record.latitude is not None and record.longitude is not None and record.bare_name:
+            name_owners.setdefault(record.bare_name, (record.name, []))[1].append(
+                (record.latitude, record.longitude)
+            )
+        if "vor" in record.sources:
+            vor_count += 1
+        if "oebb" in record.sources:
+            bst_code = entry.get("bst_code")
+            # Type-guard mirrors every other rule in this module: per the
+            # documented threat model the on-disk ``stations.json`` is a
+            # planted-input boundary, so a malformed entry with a list /
+            # dict ``bst_code`` must be skipped, not crash the validator
+            # with ``TypeError: unhashable type``. Normalised to ``str``
+            # so an OEBB code serialised as int 900100 and a VOR code
+            # serialised as the string "900100" collide correctly (a set
+            # treats ``int`` and ``str`` members as distinct).
+            if isinstance(bst_code, str | int) and bst_code:
+                oebb_codes.add(str(bst_code))
+    return StationIndex(
+        records=tuple(records),
+        id_owners=id_owners,
+        name_owners=name_owners,
+        oebb_codes=frozenset(oebb_codes),
+        vor_count=vor_count,
+    )
+
+
+class ValidationRule(Generic[_IssueT]):
+    """One pluggable check of the single-pass validation engine.
+
+    :func:`run_rules` calls :meth:`check` once per station, in directory
+    order, and :meth:`finish` once after the traversal; the issues both
+    return are appended to the :class:`ValidationReport` field named by
+    :attr:`category` (one of :data:`RULE_CATEGORIES`), after those of
+    the rules listed before it. Rule instances may keep state across
+    the traversal, so build fresh ones per run (see :func:`default_rules`).
+    """
+
+    name: ClassVar[str]
+    category: ClassVar[str]
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterable[_IssueT]:
+        return ()
+
+    def finish(self, index: StationIndex) -> Iterable[_IssueT]:
+        return ()
+
+
+def run_rules(
+    stations: Iterable[Mapping[str, object]],
+    rules: Sequence[ValidationRule[Any]],
+) -> tuple[dict[str, list[Any]], tuple[RuleTiming, ...]]:
+    """Run *rules* over *stations* in a single traversal.
+
+    Returns the issues grouped by report category and one
+    :class:`RuleTiming` per rule, preceded by the ``"index"`` entry for
+    the shared :class:`StationIndex` build.
+    """
+    for rule in rules:
+        if rule.category not in RULE_CATEGORIES:
+            raise ValueError(f"Validation rule {rule.name!r} reports into unknown category {rule.category!r}")
+
+    started = perf_counter()
+    index = build_station_index(stations)
+    index_seconds = perf_counter() - started
+
+    found: list[list[Any]] = [[] for _ in rules]
+    elapsed = [0.0] * len(rules)
+    for record in index.records:
+        for position, rule in enumerate(rules):
+            started = perf_counter()
+            found[position].extend(rule.check(record, index))
+            elapsed[position] += perf_counter() - started
+    for position, rule in enumerate(rules):
+        started = perf_counter()
+        found[position].extend(rule.finish(index))
+        elapsed[position] += perf_counter() - started
+
+    issues: dict[str, list[Any]] = {}
+    for rule, rule_issues in zip(rules, found, strict=True):
+        issues.setdefault(rule.category, []).extend(rule_issues)
+    timings = (
+        RuleTiming(rule="index", seconds=index_seconds, issues=0),
+        *(
+            RuleTiming(rule=rule.name, seconds=seconds, issues=len(rule_issues))
+            for rule, seconds, rule_issues in zip(rules, elapsed, found, strict=True)
+        ),
+    )
+    return issues, timings
+
+
+def _run_rule(
+    stations: Sequence[Mapping[str, object]],
+    rule: ValidationRule[_IssueT],
+) -> Iterator[_IssueT]:
+    """Run one rule on its own — backs the legacy ``_find_*`` helpers."""
+    issues, _timings = run_rules(stations, [rule])
+    return iter(issues.get(rule.category, []))
+
+
+def default_rules(
+    *,
+    gtfs_stop_ids: Iterable[str] = (),
+    decimal_places: int = 5,
+    coordinate_bounds: tuple[float, float, float, float] | None = None,
+) -> list[ValidationRule[Any]]:
+    """Return fresh instances of the built-in rules, in report order."""
+    return [
+        _DuplicateCoordinateRule(decimal_places),
+        _AliasRule(),
+        _CoordinateRule(coordinate_bounds),
+        _GTFSRule(gtfs_stop_ids),
+        _SecurityRule(),
+        _CrossStationIDRule(),
+        _VorIdFormatRule(),
+        _VorOebbCollisionRule(),
+        _SourceFormatRule(),
+        _RegionFlagRule(),
+        _IdentityFieldRule(),
+        _CrossNameAliasRule(),
+    ]
+
+
+class _DuplicateCoordinateRule(ValidationRule[DuplicateGroup]):
+    name = "duplicate-coordinates"
+    category = "duplicates"
+
+    def __init__(self, decimal_places: int) -> None:
+        self._decimal_places = decimal_places
+        self._buckets: dict[tuple[float, float], list[StationRecord]] = defaultdict(list)
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterable[DuplicateGroup]:
+        if record.latitude is not None and record.longitude is not None:
+            key = (round(record.latitude, self._decimal_places), round(record.longitude, self._decimal_places))
+            self._buckets[key].append(record)
+        return ()
+
+    def finish(self, index: StationIndex) -> Iterable[DuplicateGroup]:
+        return [
+            _format_duplicate_group(key, records)
+            for key, records in self._buckets.items()
+            if len(records) > 1
+        ]
+
+
+class _AliasRule(ValidationRule[AliasIssue]):
+    name = "aliases"
+    category = "alias_issues"
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[AliasIssue]:
+        if record.aliases is None:
+            yield AliasIssue(identifier=record.identifier, name=record.name, reason="missing aliases list")
+            return
+
+        aliases = [token for token in (alias.strip() for alias in record.aliases) if token]
         if not aliases:
-            yield AliasIssue(identifier=identifier, name=name or "<unknown>", reason="aliases list is empty")
-            continue
+            yield AliasIssue(identifier=record.identifier, name=record.name, reason="aliases list is empty")
+            return
 
+        entry = record.entry
         required: list[str] = []
+        name = str(entry.get("name", "")).strip()
         if name:
             required.append(name)
         # Accept ``str | int`` for the identity fields (bst_code / vor_id),
-        # matching the sibling validators _find_cross_station_id_conflicts and
-        # _find_identity_field_conflicts. A directory entry whose bst_code is a
+        # matching the sibling rules _CrossStationIDRule and
+        # _IdentityFieldRule. A directory entry whose bst_code is a
         # JSON integer would otherwise be silently skipped here, so a genuinely
         # missing required alias for that station went unreported (bug #8).
         bst_code = entry.get("bst_code")
@@ -690,30 +952,29 @@ def _find_alias_issues(
         if missing_required:
             missing_text = ", ".join(missing_required)
             yield AliasIssue(
-                identifier=identifier,
-                name=name or "<unknown>",
+                identifier=record.identifier,
+                name=record.name,
                 reason=f"missing required aliases: {missing_text}",
             )
 
 
-def _find_coordinate_issues(
-    stations: Sequence[Mapping[str, object]],
-    *,
-    bounds: tuple[float, float, float, float] | None,
-) -> Iterator[CoordinateIssue]:
-    if bounds is None:
-        min_lat, max_lat, min_lon, max_lon = (47.0, 48.8, 15.4, 17.2)
-    else:
-        min_lat, max_lat, min_lon, max_lon = bounds
+def _find_alias_issues(
+    stations: Sequence[Mapping[str, object]]
+) -> Iterator[AliasIssue]:
+    return _run_rule(stations, _AliasRule())
 
-    for entry in stations:
-        identifier = _format_identifier(entry)
-        name = str(entry.get("name", "")).strip() or "<unknown>"
 
-        latitude_value = entry.get("latitude")
-        longitude_value = entry.get("longitude")
-        latitude = _extract_float(latitude_value)
-        longitude = _extract_float(longitude_value)
+class _CoordinateRule(ValidationRule[CoordinateIssue]):
+    name = "coordinates"
+    category = "coordinate_issues"
+
+    def __init__(self, bounds: tuple[float, float, float, float] | None) -> None:
+        self._bounds = (47.0, 48.8, 15.4, 17.2) if bounds is None else bounds
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[CoordinateIssue]:
+        min_lat, max_lat, min_lon, max_lon = self._bounds
+        latitude = record.latitude
+        longitude = record.longitude
 
         missing_components: list[str] = []
         if latitude is None:
@@ -723,15 +984,15 @@ def _find_coordinate_issues(
 
         if missing_components:
             reason = ", ".join(missing_components)
-            yield CoordinateIssue(identifier=identifier, name=name, reason=reason)
-            continue
+            yield CoordinateIssue(identifier=record.identifier, name=record.name, reason=reason)
+            return
 
         # Mypy guard
         if latitude is None or longitude is None:
-            continue
+            return
 
         if not (min_lat <= latitude <= max_lat) or not (min_lon <= longitude <= max_lon):
-            entry_type_raw = entry.get("type")
+            entry_type_raw = record.entry.get("type")
             entry_type = entry_type_raw.strip() if isinstance(entry_type_raw, str) else None
             if entry_type in ("manual_foreign_city", "manual_distant_at"):
                 # Manual cross-country entries (München, Roma, Berlin Hbf,
@@ -739,34 +1000,46 @@ def _find_coordinate_issues(
                 # outside the Wien-Region bounding box. The schema docstring
                 # explicitly tolerates this — skip the bounds check and
                 # don't pollute the report with 21 false positives.
-                continue
+                return
             swapped_hint = min_lat <= longitude <= max_lat and min_lon <= latitude <= max_lon
             if swapped_hint:
                 reason = f"coordinates look swapped (lat={latitude}, lon={longitude})"
             else:
                 reason = f"coordinates out of bounds (lat={latitude}, lon={longitude})"
-            yield CoordinateIssue(identifier=identifier, name=name, reason=reason)
+            yield CoordinateIssue(identifier=record.identifier, name=record.name, reason=reason)
 
 
-def _find_gtfs_issues(
+def _find_coordinate_issues(
     stations: Sequence[Mapping[str, object]],
-    gtfs_stop_ids: Iterable[str],
-) -> Iterator[GTFSIssue]:
-    stops = set(gtfs_stop_ids)
-    if not stops:
-        return
+    *,
+    bounds: tuple[float, float, float, float] | None,
+) -> Iterator[CoordinateIssue]:
+    return _run_rule(stations, _CoordinateRule(bounds))
 
-    for entry in stations:
-        vor_id_obj = entry.get("vor_id")
+
+class _GTFSRule(ValidationRule[GTFSIssue]):
+    name = "gtfs"
+    category = "gtfs_issues"
+
+    def __init__(self, gtfs_stop_ids: Iterable[str]) -> None:
+        self._stops = frozenset(gtfs_stop_ids)
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[GTFSIssue]:
+        if not self._stops:
+            return
+        vor_id_obj = record.entry.get("vor_id")
         if not isinstance(vor_id_obj, str):
-            continue
+            return
         vor_id = vor_id_obj.strip()
-        if not vor_id:
-            continue
-        if vor_id not in stops:
-            name = str(entry.get("name", "")).strip() or "<unknown>"
-            identifier = _format_identifier(entry)
-            yield GTFSIssue(identifier=identifier, name=name, vor_id=vor_id)
+        if vor_id and vor_id not in self._stops:
+            yield GTFSIssue(identifier=record.identifier, name=record.name, vor_id=vor_id)
+
+
+def _find_gtfs_issues(
+    stations: Sequence[Mapping[str, object]],
+    gtfs_stop_ids: Iterable[str],
+) -> Iterator[GTFSIssue]:
+    return _run_rule(stations, _GTFSRule(gtfs_stop_ids))
 
 
 # Unsafe character class for ``stations.json`` validation. Sized as the
@@ -870,67 +1143,49 @@ def is_synthetic_vor_id(value: object) -> bool:
     return isinstance(value, str) and _VOR_ID_PATTERN.fullmatch(value) is not None
 
 
-def _find_cross_station_id_conflicts(
-    stations: Sequence[Mapping[str, object]]
-) -> Iterator[CrossStationIDIssue]:
-    id_map: dict[str, list[tuple[Mapping[str, object], str]]] = defaultdict(list)
-
-    for entry in stations:
-        for field in ("bst_id", "bst_code", "vor_id", "wl_diva"):
-            val = entry.get(field)
-            if isinstance(val, str | int):
-                norm_val = _normalize_token(str(val))
-                if norm_val:
-                    id_map[norm_val].append((entry, field))
-
-    for entry in stations:
-        aliases_obj = entry.get("aliases")
-        if not isinstance(aliases_obj, Sequence) or isinstance(aliases_obj, str | bytes):
-            continue
-
-        for alias in aliases_obj:
-            if not isinstance(alias, str):
-                continue
+class _CrossStationIDRule(ValidationRule[CrossStationIDIssue]):
+    name = "cross-station-ids"
+    category = "cross_station_id_issues"
 
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[CrossStationIDIssue]:
+        for alias in record.aliases or ():
             norm_alias = _normalize_token(alias)
             if not norm_alias:
                 continue
-
-            if norm_alias in id_map:
-                for colliding_entry, field in id_map[norm_alias]:
-                    if colliding_entry is entry:
-                        continue
-                    # Skip when the alias is simply the entry's OWN identity
-                    # code in the same field. ``enrich_station_aliases``
-                    # deliberately lists a station's own ``bst_code`` among
-                    # its aliases, so a duplicate / shared-code record (e.g.
-                    # two "Mb  H2H" Siebenhirten entries) makes each copy's
-                    # own-code alias "shadow" the other's ``bst_code``. That
-                    # is a duplicate / shared-identity collision — surfaced
-                    # (non-blocking) by ``_find_identity_field_conflicts`` —
-                    # not a genuine alias-shadows-another-station ambiguity.
-                    # Firing here would auto-quarantine *every* copy and drop
-                    # the station entirely (Wien Siebenhirten / Handelskai).
-                    own_val = entry.get(field)
-                    if (
-                        isinstance(own_val, str | int)
-                        and _normalize_token(str(own_val)) == norm_alias
-                    ):
-                        continue
-                    yield CrossStationIDIssue(
-                        identifier=_format_identifier(entry),
-                        name=str(entry.get("name", "")).strip() or "<unknown>",
-                        alias=alias.strip(),
-                        colliding_identifier=_format_identifier(colliding_entry),
-                        colliding_name=str(colliding_entry.get("name", "")).strip() or "<unknown>",
-                        colliding_field=field,
-                    )
+            for owner, id_field in index.id_owners.get(norm_alias, ()):
+                if owner is record:
+                    continue
+                # Skip when the alias is simply the entry's OWN identity
+                # code in the same field. ``enrich_station_aliases``
+                # deliberately lists a station's own ``bst_code`` among
+                # its aliases, so a duplicate / shared-code record (e.g.
+                # two "Mb  H2H" Siebenhirten entries) makes each copy's
+                # own-code alias "shadow" the other's ``bst_code``. That
+                # is a duplicate / shared-identity collision — surfaced
+                # (non-blocking) by ``_IdentityFieldRule`` —
+                # not a genuine alias-shadows-another-station ambiguity.
+                # Firing here would auto-quarantine *every* copy and drop
+                # the station entirely (Wien Siebenhirten / Handelskai).
+                if record.id_tokens.get(id_field) == norm_alias:
+                    continue
+                yield CrossStationIDIssue(
+                    identifier=record.identifier,
+                    name=record.name,
+                    alias=alias.strip(),
+                    colliding_identifier=owner.identifier,
+                    colliding_name=owner.name,
+                    colliding_field=id_field,
+                )
 
 
-def _find_identity_field_conflicts(
+def _find_cross_station_id_conflicts(
     stations: Sequence[Mapping[str, object]]
-) -> Iterator[IdentityFieldConflict]:
-    """Yield one issue per value that appears on more than one station.
+) -> Iterator[CrossStationIDIssue]:
+    return _run_rule(stations, _CrossStationIDRule())
+
+
+class _IdentityFieldRule(ValidationRule[IdentityFieldConflict]):
+    """Report one issue per value that appears on more than one station.
 
     Checks each of the five structural identifier fields
     (``wl_diva`` / ``vor_id`` / ``bst_id`` / ``bst_code`` / ``eva_nr``).
@@ -950,36 +1205,50 @@ def _find_identity_field_conflicts(
     **case-sensitively** — ÖBB ``bst_code``s are case-significant
     (``Aw`` and ``aw`` are distinct Betriebsstellen), so case-folding
     here would manufacture false-positive collisions; the alias-shadow
-    sibling :func:`_find_cross_station_id_conflicts` *does* casefold via
+    sibling :class:`_CrossStationIDRule` *does* casefold via
     :func:`_normalize_token` because it matches free-text aliases.
     ``None`` and empty strings are ignored.  Distinct from
-    :func:`_find_cross_station_id_conflicts`, which fires only when an
+    :class:`_CrossStationIDRule`, which fires only when an
     *alias* on one station shadows an *identity* field on a different
-    station — this function fires on raw identity collisions.
+    station — this rule fires on raw identity collisions.
     """
-    for field in ("wl_diva", "vor_id", "bst_id", "bst_code", "eva_nr"):
-        seen: dict[str, list[Mapping[str, object]]] = defaultdict(list)
-        for entry in stations:
-            val = entry.get(field)
+
+    name = "identity-fields"
+    category = "identity_field_conflicts"
+    _FIELDS = ("wl_diva", "vor_id", "bst_id", "bst_code", "eva_nr")
+
+    def __init__(self) -> None:
+        self._seen: dict[str, dict[str, list[StationRecord]]] = {
+            id_field: defaultdict(list) for id_field in self._FIELDS
+        }
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterable[IdentityFieldConflict]:
+        for id_field, seen in self._seen.items():
+            val = record.entry.get(id_field)
             if not isinstance(val, str | int):
                 continue
             key = str(val).strip()
-            if not key:
-                continue
-            seen[key].append(entry)
-        for value, entries in seen.items():
-            if len(entries) <= 1:
-                continue
-            identifiers = tuple(_format_identifier(e) for e in entries)
-            names = tuple(
-                str(e.get("name", "")).strip() or "<unknown>" for e in entries
-            )
-            yield IdentityFieldConflict(
-                field=field,
-                value=value,
-                identifiers=identifiers,
-                names=names,
-            )
+            if key:
+                seen[key].append(record)
+        return ()
+
+    def finish(self, index: StationIndex) -> Iterator[IdentityFieldConflict]:
+        for id_field, seen in self._seen.items():
+            for value, records in seen.items():
+                if len(records) <= 1:
+                    continue
+                yield IdentityFieldConflict(
+                    field=id_field,
+                    value=value,
+                    identifiers=tuple(record.identifier for record in records),
+                    names=tuple(record.name for record in records),
+                )
+
+
+def _find_identity_field_conflicts(
+    stations: Sequence[Mapping[str, object]]
+) -> Iterator[IdentityFieldConflict]:
+    return _run_rule(stations, _IdentityFieldRule())
 
 
 def _extract_source_tokens(value: object) -> set[str]:
@@ -996,150 +1265,121 @@ def _extract_source_tokens(value: object) -> set[str]:
     return set()
 
 
-def _find_provider_issues(
-    stations: Sequence[Mapping[str, object]]
-) -> Iterator[ProviderIssue]:
-    """Find VOR/OEBB consistency issues.
+class _VorIdFormatRule(ValidationRule[ProviderIssue]):
+    """VOR provider checks 1 and 2 (see :func:`_find_provider_issues`)."""
 
-    Replicates the checks from the previous inline implementation in
-    ``scripts/validate_stations.py``:
+    name = "vor-id-format"
+    category = "provider_issues"
 
-    1. At least two stations must declare VOR as a source.
-    2. Each VOR station's ``bst_id`` and ``bst_code`` must match the VOR id
-       pattern (``_VOR_ID_PATTERN``).
-    3. No VOR station's ``bst_code`` may collide with the ``bst_code`` of any
-       OEBB-sourced station.
-    """
-    vor_entries: list[Mapping[str, object]] = []
-    # Normalise to ``str`` so an OEBB code serialised as int 900100 and a
-    # VOR code serialised as the string "900100" collide correctly (a set
-    # treats ``int`` and ``str`` members as distinct), mirroring the
-    # ``str(...)`` normalisation used by the sibling identity finders.
-    oebb_codes: set[str] = set()
-
-    for entry in stations:
-        sources = _extract_source_tokens(entry.get("source"))
-        if "vor" in sources:
-            vor_entries.append(entry)
-        if "oebb" in sources:
-            bst_code = entry.get("bst_code")
-            # Type-guard mirrors every other ``_find_*`` finder in this
-            # module: per the documented threat model the on-disk
-            # ``stations.json`` is a planted-input boundary, so a
-            # malformed entry with a list / dict ``bst_code`` must yield
-            # a ``ProviderIssue`` (or be skipped), not crash the
-            # validator with ``TypeError: unhashable type``. Without the
-            # guard ``oebb_codes.add(bst_code)`` (set add of a list /
-            # dict) and the later ``in oebb_codes`` membership test both
-            # raise and propagate out of the public ``validate_stations``
-            # entry point.
-            if isinstance(bst_code, str | int) and bst_code:
-                oebb_codes.add(str(bst_code))
-
-    if len(vor_entries) < 2:
-        yield ProviderIssue(
-            identifier="<global>",
-            name="<global>",
-            reason="Need at least two VOR entries",
-        )
-        return
-
-    for entry in vor_entries:
-        identifier = _format_identifier(entry)
-        name = str(entry.get("name", "")).strip() or "<unknown>"
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[ProviderIssue]:
+        if index.vor_count < 2 or "vor" not in record.sources:
+            return
         for key in ("bst_id", "bst_code"):
-            value = entry.get(key)
+            value = record.entry.get(key)
             if not is_synthetic_vor_id(value):
                 yield ProviderIssue(
-                    identifier=identifier,
-                    name=name,
+                    identifier=record.identifier,
+                    name=record.name,
                     reason=f"Invalid {key} for VOR: {value}",
                 )
 
-    for entry in vor_entries:
+    def finish(self, index: StationIndex) -> Iterable[ProviderIssue]:
+        if index.vor_count >= 2:
+            return ()
+        return (
+            ProviderIssue(
+                identifier="<global>",
+                name="<global>",
+                reason="Need at least two VOR entries",
+            ),
+        )
+
+
+class _VorOebbCollisionRule(ValidationRule[ProviderIssue]):
+    """VOR provider check 3 (see :func:`_find_provider_issues`)."""
+
+    name = "vor-oebb-collision"
+    category = "provider_issues"
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[ProviderIssue]:
         # A station sourced from BOTH ``oebb`` and ``vor`` already contributed
-        # its own ``bst_code`` to ``oebb_codes`` above, so an ``in oebb_codes``
+        # its own ``bst_code`` to ``index.oebb_codes``, so an ``in oebb_codes``
         # test would flag it as colliding with itself. It IS the OEBB entry,
         # not a distinct VOR-only station, so skip the cross-provider check.
-        if "oebb" in _extract_source_tokens(entry.get("source")):
-            continue
-        bst_code = entry.get("bst_code")
-        # Same type-guard as the OEBB-side ``oebb_codes.add`` above: a
+        if index.vor_count < 2 or "vor" not in record.sources or "oebb" in record.sources:
+            return
+        bst_code = record.entry.get("bst_code")
+        # Same type-guard as the OEBB-side ``oebb_codes`` build: a
         # malformed list / dict ``bst_code`` would otherwise raise
         # ``TypeError: unhashable`` on the ``in oebb_codes`` membership
         # test and crash the validator. A non-hashable VOR ``bst_code``
         # cannot in principle collide with the (string / int) OEBB
-        # entries that were admitted above, so skipping it here is
+        # entries that were admitted, so skipping it here is
         # semantically correct as well as crash-safe.
-        if isinstance(bst_code, str | int) and str(bst_code) in oebb_codes:
+        if isinstance(bst_code, str | int) and str(bst_code) in index.oebb_codes:
             yield ProviderIssue(
-                identifier=_format_identifier(entry),
-                name=str(entry.get("name", "")).strip() or "<unknown>",
+                identifier=record.identifier,
+                name=record.name,
                 reason="VOR bst_code collides with OEBB",
             )
 
 
-def _find_naming_issues(
+def _find_provider_issues(
     stations: Sequence[Mapping[str, object]]
-) -> Iterator[NamingIssue]:
-    """Validate flag-consistency invariants.
+) -> Iterator[ProviderIssue]:
+    """Find VOR/OEBB consistency issues.
 
-    Two checks (was three pre-2026-05-12):
+    Replicates the checks from the previous inline implementation in
+    ``scripts/validate_stations.py``:
 
-    1. **Source-field formatting** – the comma-separated provider source
-       string must not contain whitespace inside tokens (e.g.
-       ``"google_places, vor"``). Whitespace breaks naive ``==``-based
-       lookup branches and signals an unnormalized write path.
-    2. **Vienna/pendler mutual exclusivity** – ``in_vienna`` and ``pendler``
-       partition the directory: every entry is *either* inside the city
-       limits *or* a commuter-belt station outside, never both. The
-       exceptions are ``type: manual_foreign_city`` (München, Roma) and
-       ``type: manual_distant_at`` (Salzburg, Graz, Linz etc.) where
-       both flags may legitimately be ``false``.
+    1. At least two stations must declare VOR as a source.
+    2. Each VOR station's ``bst_id`` and ``bst_code`` must match the VOR id
+       pattern (``_VOR_ID_PATTERN``).
+    3. No VOR station's ``bst_code`` may collide with the ``bst_code`` of any
+       OEBB-sourced station.
 
-    The pre-2026-05-12 canonical-name uniqueness check has been
-    removed. ``name`` is the operator-facing display label, not a
-    primary key; structured identifiers (``wl_diva``, ``bst_id``,
-    ``vor_id``, ``bst_code``) carry the project's eindeutigkeits-
-    Garantie. Wiener Linien's OGD-Echtzeit ``PlatformText`` is
-    legitimately duplicated for the ten remaining non-mergeable
-    multi-DIVA groups (Lokalbahn × 4, Bahnhof × 2, etc.); blocking
-    them on name-uniqueness produced exactly the RSS feed clutter
-    (``Wien Bahnhof (WL 60205022)``) that the disambiguation work
-    in PR #1448 had to introduce. Removing the gate lets the
-    upstream ``_disambiguate_duplicate_names`` step retire too, so
-    the published feed shows ``Wien Bahnhof (WL)`` without a DIVA
-    suffix.
+    When check 1 fails only the ``<global>`` issue is reported. Checks 1
+    and 2 run as ``_VorIdFormatRule``, check 3 as
+    ``_VorOebbCollisionRule``; listed in that order, the engine reports
+    every format issue before the first collision.
     """
+    issues, _timings = run_rules(stations, [_VorIdFormatRule(), _VorOebbCollisionRule()])
+    return iter(issues.get("provider_issues", []))
 
-    for entry in stations:
-        source = entry.get("source")
+
+class _SourceFormatRule(ValidationRule[NamingIssue]):
+    name = "source-format"
+    category = "naming_issues"
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[NamingIssue]:
+        source = record.entry.get("source")
         if not isinstance(source, str) or not source:
-            continue
+            return
         # The format is comma-separated tokens; only the comma is a valid
         # delimiter. Any internal whitespace (including the leading or
         # trailing whitespace around a token) signals inconsistent
         # serialisation.
         if any(part.strip() != part for part in source.split(",")) or " " in source:
-            identifier = _format_identifier(entry)
-            name = str(entry.get("name", "")).strip() or "<unknown>"
             yield NamingIssue(
-                identifier=identifier,
-                name=name,
+                identifier=record.identifier,
+                name=record.name,
                 reason=f"source field has whitespace: {source!r} (expected comma-separated, no spaces)",
             )
 
-    for entry in stations:
+
+class _RegionFlagRule(ValidationRule[NamingIssue]):
+    name = "region-flags"
+    category = "naming_issues"
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[NamingIssue]:
+        entry = record.entry
         in_vienna = bool(entry.get("in_vienna"))
         pendler = bool(entry.get("pendler"))
-        identifier = _format_identifier(entry)
-        name = str(entry.get("name", "")).strip() or "<unknown>"
-        entry_type = entry.get("type")
 
         if in_vienna and pendler:
             yield NamingIssue(
-                identifier=identifier,
-                name=name,
+                identifier=record.identifier,
+                name=record.name,
                 reason=(
                     "in_vienna and pendler are both true — flags must be "
                     "mutually exclusive (a Vienna station cannot also be a "
@@ -1149,11 +1389,11 @@ def _find_naming_issues(
         elif (
             not in_vienna
             and not pendler
-            and entry_type not in ("manual_foreign_city", "manual_distant_at")
+            and entry.get("type") not in ("manual_foreign_city", "manual_distant_at")
         ):
             yield NamingIssue(
-                identifier=identifier,
-                name=name,
+                identifier=record.identifier,
+                name=record.name,
                 reason=(
                     "in_vienna and pendler are both false — entry should "
                     "either be classified as a Vienna station, a commuter "
@@ -1163,12 +1403,53 @@ def _find_naming_issues(
             )
 
 
-def _find_security_issues(
+def _find_naming_issues(
     stations: Sequence[Mapping[str, object]]
-) -> Iterator[SecurityIssue]:
-    for entry in stations:
-        identifier = _format_identifier(entry)
-        name = str(entry.get("name", "")).strip() or "<unknown>"
+) -> Iterator[NamingIssue]:
+    """Validate flag-consistency invariants.
+
+    Two checks (was three pre-2026-05-12):
+
+    1. **Source-field formatting** – the comma-separated provider source
+       string must not contain whitespace inside tokens (e.g.
+       ``"google_places, vor"``). Whitespace breaks naive ``==``-based
+       lookup branches and signals an unnormalized write path.
+    2. **Vienna/pendler mutual exclusivity** – ``in_vienna`` and ``pendler``
+       partition the directory: every entry is *either* inside the city
+       limits *or* a commuter-belt station outside, never both. The
+       exceptions are ``type: manual_foreign_city`` (München, Roma) and
+       ``type: manual_distant_at`` (Salzburg, Graz, Linz etc.) where
+       both flags may legitimately be ``false``.
+
+    Check 1 runs as ``_SourceFormatRule``, check 2 as
+    ``_RegionFlagRule``, so every source-format issue is reported before
+    the first flag issue.
+
+    The pre-2026-05-12 canonical-name uniqueness check has been
+    removed. ``name`` is the operator-facing display label, not a
+    primary key; structured identifiers (``wl_diva``, ``bst_id``,
+    ``vor_id``, ``bst_code``) carry the project's eindeutigkeits-
+    Garantie. Wiener Linien's OGD-Echtzeit ``PlatformText`` is
+    legitimately duplicated for the ten remaining non-mergeable
+    multi-DIVA groups (Lokalbahn × 4, Bahnhof × 2, etc.); blocking
+    them on name-uniqueness produced exactly the RSS feed clutter
+    (``Wien Bahnhof (WL 60205022)``) that the disambiguation work
+    in PR #1448 had to introduce. Removing the gate lets the
+    upstream ``_disambiguate_duplicate_names`` step retire too, so
+    the published feed shows ``Wien Bahnhof (WL)`` without a DIVA
+    suffix.
+    """
+    issues, _timings = run_rules(stations, [_SourceFormatRule(), _RegionFlagRule()])
+    return iter(issues.get("naming_issues", []))
+
+
+class _SecurityRule(ValidationRule[SecurityIssue]):
+    name = "security"
+    category = "security_issues"
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[SecurityIssue]:
+        identifier = record.identifier
+        name = record.name
 
         # Check name
         if _UNSAFE_CHARS_RE.search(name):
@@ -1179,7 +1460,7 @@ def _find_security_issues(
             )
 
         # Check bst_code
-        bst_code = str(entry.get("bst_code") or "")
+        bst_code = str(record.entry.get("bst_code") or "")
         if _UNSAFE_CHARS_RE.search(bst_code):
             yield SecurityIssue(
                 identifier=identifier,
@@ -1188,7 +1469,7 @@ def _find_security_issues(
             )
 
         # Check vor_id
-        vor_id = str(entry.get("vor_id") or "")
+        vor_id = str(record.entry.get("vor_id") or "")
         if _UNSAFE_CHARS_RE.search(vor_id):
             yield SecurityIssue(
                 identifier=identifier,
@@ -1197,15 +1478,19 @@ def _find_security_issues(
             )
 
         # Check aliases
-        aliases_obj = entry.get("aliases")
-        if isinstance(aliases_obj, Sequence) and not isinstance(aliases_obj, str | bytes):
-            for alias in aliases_obj:
-                if isinstance(alias, str) and _UNSAFE_CHARS_RE.search(alias):
-                    yield SecurityIssue(
-                        identifier=identifier,
-                        name=name,
-                        reason=f"Unsafe characters in alias: {alias!r}"
-                    )
+        for alias in record.aliases or ():
+            if _UNSAFE_CHARS_RE.search(alias):
+                yield SecurityIssue(
+                    identifier=identifier,
+                    name=name,
+                    reason=f"Unsafe characters in alias: {alias!r}"
+                )
+
+
+def _find_security_issues(
+    stations: Sequence[Mapping[str, object]]
+) -> Iterator[SecurityIssue]:
+    return _run_rule(stations, _SecurityRule())
 
 
 def _haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -1280,29 +1565,7 @@ def _iter_entry_labels(entry: Mapping[str, object]) -> Iterator[tuple[str, str]]
                     yield "wl_stop", stop_name
 
 
-def _build_cross_name_index(
-    stations: Sequence[Mapping[str, object]]
-) -> dict[str, tuple[str, list[tuple[float, float]]]]:
-    """Map bare canonical-name token → (display name, owner coordinates)."""
-    index: dict[str, tuple[str, list[tuple[float, float]]]] = {}
-    for entry in stations:
-        lat = _extract_float(entry.get("latitude"))
-        lon = _extract_float(entry.get("longitude"))
-        if lat is None or lon is None:
-            continue
-        token = _bare_station_name(entry.get("name"))
-        if not token:
-            continue
-        display = str(entry.get("name", "")).strip() or "<unknown>"
-        index.setdefault(token, (display, []))[1].append((lat, lon))
-    return index
-
-
-def _find_cross_name_alias_issues(
-    stations: Sequence[Mapping[str, object]],
-    *,
-    threshold_m: float = _CROSS_NAME_DISTANCE_THRESHOLD_M,
-) -> Iterator[CrossNameAliasIssue]:
+class _CrossNameAliasRule(ValidationRule[CrossNameAliasIssue]):
     """Flag alias / ``wl_stop`` labels matching a far-away station's name.
 
     See :class:`CrossNameAliasIssue`. Both the label and the owner names
@@ -1314,33 +1577,47 @@ def _find_cross_name_alias_issues(
     full-form ``Wien X`` label, the belt-and-suspenders case the
     conservative guard leaves in place. The all-owners-distant rule keeps
     a label that also resolves to a nearby interchange of the same name.
+    The owners come from :attr:`StationIndex.name_owners`.
     """
-    name_index = _build_cross_name_index(stations)
 
-    for entry in stations:
-        lat = _extract_float(entry.get("latitude"))
-        lon = _extract_float(entry.get("longitude"))
+    name = "cross-name-aliases"
+    category = "cross_name_alias_issues"
+
+    def __init__(self, threshold_m: float = _CROSS_NAME_DISTANCE_THRESHOLD_M) -> None:
+        self._threshold_m = threshold_m
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[CrossNameAliasIssue]:
+        lat = record.latitude
+        lon = record.longitude
         if lat is None or lon is None:
-            continue
-        own = _bare_station_name(entry.get("name"))
-        for kind, label in _iter_entry_labels(entry):
+            return
+        for kind, label in _iter_entry_labels(record.entry):
             # Bare the label too (not just owner names): a full-form
             # "Wien Karlsplatz" label bares to the same token as the
             # "Karlsplatz" owner, so it is caught alongside the short form.
             token = _bare_station_name(label)
-            if not token or token == own:
+            if not token or token == record.bare_name:
                 continue
-            owner = name_index.get(token)
+            owner = index.name_owners.get(token)
             if owner is None:
                 continue
             owner_name, coords = owner
             distances = [_haversine_m(lat, lon, olat, olon) for olat, olon in coords]
-            if distances and all(dist > threshold_m for dist in distances):
+            if distances and all(dist > self._threshold_m for dist in distances):
                 yield CrossNameAliasIssue(
-                    identifier=_format_identifier(entry),
-                    name=str(entry.get("name", "")).strip() or "<unknown>",
+                    identifier=record.identifier,
+                    name=record.name,
                     label=label.strip(),
                     label_kind=kind,
                     colliding_name=owner_name,
                     distance_m=round(min(distances)),
                 )
+
+
+def _find_cross_name_alias_issues(
+    stations: Sequence[Mapping[str, object]],
+    *,
+    threshold_m: float = _CROSS_NAME_DISTANCE_THRESHOLD_M,
+) -> Iterator[CrossNameAliasIssue]:
+    """Run :class:`_CrossNameAliasRule` on its own."""
+    return _run_rule(stations, _CrossNameAliasRule(threshold_m))
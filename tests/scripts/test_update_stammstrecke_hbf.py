@@ -972,3 +972,60 @@ def test_process_tick_quota_exhausted_does_not_trip_breaker(
     assert result == "quota_exceeded"
     assert fetched["called"] is False
     assert script._BREAKER.consecutive_failures == failures_before
+
+
+# ---- Quota-aware poll plan -------------------------------------------------
+
+
+def _evening_plan() -> Any:
+    plan = script._PollPlan.empty()
+    weekday = plan.density["werktag"]
+    weekday[18], weekday[23] = 2.0, 1.0
+    for hour in range(19, 23):
+        weekday[hour] = 10.0
+    return plan
+
+
+def test_poll_plan_polls_every_tick_while_the_quota_lasts() -> None:
+    plan = _evening_plan()
+    when = datetime(2026, 5, 18, 18, 0, tzinfo=VIENNA_TZ)  # Monday, 12 ticks left
+
+    assert script._plan_polls(plan, when, used=80) is True
+    assert len(plan.ticks) == 12
+    assert plan.reserve == 2
+
+
+def test_poll_plan_spends_a_short_budget_on_the_densest_ticks() -> None:
+    plan = _evening_plan()
+    when = datetime(2026, 5, 18, 18, 0, tzinfo=VIENNA_TZ)
+
+    # 10 requests left, 2 held in reserve -> the 8 rush-hour ticks win.
+    assert script._plan_polls(plan, when, used=90) is False
+    assert plan.ticks == [f"{hour}:{minute}" for hour in range(19, 23) for minute in ("00", "30")]
+    assert plan.remaining_quota == 10
+
+    assert script._plan_polls(plan, when.replace(hour=19), used=90) is True
+    assert script._plan_polls(plan, when.replace(hour=19), used=100) is False
+    assert plan.ticks == []
+
+
+def test_process_tick_learns_density_and_plan_round_trips(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    departures = [_dep(name="S 1"), _dep(name="S 3", direction="Stockerau", track="2")]
+    monkeypatch.setattr(script, "_query_departure_board", lambda *_a, **_kw: departures)
+    script._BREAKER.reset()
+    plan = script._PollPlan.empty()
+    when = datetime(2026, 5, 16, 8, 0, tzinfo=VIENNA_TZ)  # Saturday
+
+    assert script._process_tick(object(), {}, when=when, plan=plan) == "ok"
+    assert plan.density["wochenende"][8] == 2.0
+    script._record_board_density(plan, when, 12)
+    assert plan.density["wochenende"][8] == 5.0
+
+    path = tmp_path / "poll_plan.json"
+    assert script._save_poll_plan(path, plan)
+    assert script._load_poll_plan(path).density == plan.density
+
+    path.write_text('{"density": {"werktag": [NaN]}}', encoding="utf-8")
+    assert script._load_poll_plan(path).density == script._PollPlan.empty().density
@@ -1795,6 +1795,73 @@ def test_finalize_departed_empty_state_returns_empty_list() -> None:
     assert script._finalize_departed(state, direction="Meidling", now=now) == []
 
 
+def _indexed_and_plain(
+    trips: dict[str, script._PendingTrip],
+) -> tuple[script._PendingLedger, dict[str, script._PendingTrip]]:
+    return script._PendingLedger(trips), dict(trips)
+
+
+def test_pending_ledger_finalises_like_the_plain_mapping() -> None:
+    """The indexed ledger pops the same trips, in the same order, as the scan."""
+    base = datetime(2026, 5, 9, 8, 0, tzinfo=VIENNA_TZ)
+    trips: dict[str, script._PendingTrip] = {}
+    for offset, direction, name in [
+        (30, "Meidling", "S80"), (0, "Meidling", "S1"), (0, "Meidling", "S2"),
+        (10, "Floridsdorf", "S3"), (90, "Meidling", "S4"), (20, "Meidling", "S7"),
+    ]:
+        sched = base + timedelta(minutes=offset)
+        trips[script._identity_key(direction, name, sched)] = _make_pending(
+            direction=direction, name=name, scheduled=sched, latest_delay_minutes=float(offset)
+        )
+    suppressed = script._identity_key("Meidling", "S7", base + timedelta(minutes=20))
+    ledger, plain = _indexed_and_plain(trips)
+    now = base + timedelta(minutes=45)
+
+    for state in (ledger, plain):
+        recently = {suppressed: base}
+        finalised = script._finalize_departed(state, direction="Meidling", now=now, recently_finalised=recently)
+        assert [trip.name for trip in finalised] == ["S1", "S2", "S80"]
+        assert set(recently) == {suppressed} | {script._identity_key("Meidling", t.name, t.scheduled) for t in finalised}
+    assert ledger == plain  # S7 (already finalised), S3 and S4 stay pending
+
+    # A re-observed trip keeps a single index entry and is still found later.
+    s4_key = script._identity_key("Meidling", "S4", base + timedelta(minutes=90))
+    ledger[s4_key] = _make_pending(
+        direction="Meidling", name="S4", scheduled=base + timedelta(minutes=90),
+        latest_delay_minutes=12.0, last_seen_at=now,
+    )
+    later = script._finalize_departed(ledger, direction="Meidling", now=base + timedelta(hours=2))
+    assert [(trip.name, trip.latest_delay_minutes) for trip in later] == [("S7", 20.0), ("S4", 12.0)]
+
+
+def test_pending_ledger_purge_honours_the_latest_sighting() -> None:
+    """The TTL purge pops stale entries only, re-observed trips survive."""
+    base = datetime(2026, 5, 9, 8, 0, tzinfo=VIENNA_TZ)
+    stale = _make_pending(name="S1", last_seen_at=base - timedelta(hours=7))
+    refreshed = _make_pending(name="S2", last_seen_at=base - timedelta(hours=7))
+    ledger = script._PendingLedger({"stale": stale, "refreshed": refreshed})
+    ledger["refreshed"] = _make_pending(name="S2", last_seen_at=base)
+
+    assert script._purge_stale_entries(ledger, cutoff=base - script.PENDING_TTL) == 1
+    assert list(ledger) == ["refreshed"]
+
+
+def test_load_pending_trips_returns_an_indexed_ledger(tmp_path: Path) -> None:
+    """The loader hands ``main`` the indexed ledger; unchanged saves are skipped."""
+    path = tmp_path / "state.json"
+    trip = _make_pending(name="S2")
+    key = script._identity_key(trip.direction, trip.name, trip.scheduled)
+    assert script._save_pending_trips(path, {key: trip}) is True
+
+    loaded = script._load_pending_trips(path)
+    assert isinstance(loaded, script._PendingLedger)
+    assert loaded == {key: trip}
+    # A quiet tick writes the same ledger back: the file is left in place.
+    inode = path.stat().st_ino
+    assert script._save_pending_trips(path, loaded) is True
+    assert path.stat().st_ino == inode
+
+
 # ---- End-to-end: observe across two ticks, finalise the latest reading ----
 
 
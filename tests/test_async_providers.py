@@ -0,0 +1,140 @@
+"""``async def`` providers on the event loop next to the thread pool.
+
+``_collect_items`` runs coroutine loaders as tasks with the same deadline,
+concurrency-group and ``RunReport`` accounting as the thread-pool path,
+which keeps serving sync providers alongside.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from src import build_feed
+from src.feed import latency
+from src.feed.reporting import RunReport
+from src.utils import cancellation
+
+
+def _collect(monkeypatch: pytest.MonkeyPatch, *fetchers: Any) -> tuple[list[Any], RunReport]:
+    monkeypatch.setattr(build_feed, "PROVIDERS", [(f"{fetch.__name__.upper()}_ENABLE", fetch) for fetch in fetchers])
+    monkeypatch.setattr(build_feed, "_PROVIDERS_INITIALIZED", True)
+    report = RunReport([])
+    return build_feed._collect_items(report), report
+
+
+def test_async_and_sync_providers_run_side_by_side(monkeypatch: pytest.MonkeyPatch) -> None:
+    loop_threads: list[int] = []
+
+    async def async_provider() -> list[dict[str, Any]]:
+        loop_threads.append(threading.get_ident())
+        await asyncio.sleep(0.3)
+        return [{"guid": "async"}]
+
+    def sync_provider() -> list[dict[str, Any]]:
+        time.sleep(0.3)
+        return [{"guid": "sync"}]
+
+    started = time.monotonic()
+    items, report = _collect(monkeypatch, async_provider, sync_provider)
+
+    assert time.monotonic() - started < 0.55  # concurrent, not back to back
+    assert sorted(item["guid"] for item in items) == ["async", "sync"]
+    assert loop_threads == [threading.get_ident()]
+    assert report.providers["async_provider"].fetch_type == "async"
+    assert report.providers["async_provider"].status == "ok"
+    assert report.providers["sync_provider"].fetch_type == "network"
+
+
+def test_async_deadline_is_reported_like_an_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(build_feed.feed_config, "PROVIDER_TIMEOUT", 1)
+    received: list[Any] = []
+    tokens: list[cancellation.CancelToken | None] = []
+
+    async def stuck_provider(timeout: float | None = None) -> list[dict[str, Any]]:
+        received.append(timeout)
+        tokens.append(await asyncio.to_thread(cancellation.current_token))
+        await asyncio.sleep(30)
+        return []
+
+    async def quick_provider() -> list[dict[str, Any]]:
+        return [{"guid": "quick"}]
+
+    started = time.monotonic()
+    items, report = _collect(monkeypatch, stuck_provider, quick_provider)
+
+    assert time.monotonic() - started < 3
+    assert items == [{"guid": "quick"}]
+    assert report.providers["stuck_provider"].status == "error"
+    assert report.providers["stuck_provider"].detail == "Timeout nach 1s"
+    assert received and 0 < received[0] <= 1
+    (token,) = tokens
+    assert token is not None and token.cancelled and token.reason == "Timeout"
+
+
+
+def test_async_token_deadline_in_thread_is_reported_as_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The token expires long before ``asyncio.timeout`` would fire, so the
+    # sync call in ``to_thread`` raises ``FetchCancelled`` first.
+    monkeypatch.setattr(build_feed.feed_config, "PROVIDER_TIMEOUT", 5)
+    monkeypatch.setattr(
+        cancellation.CancelToken,
+        "with_timeout",
+        classmethod(lambda cls, timeout: cls(time.monotonic() + 0.05)),
+    )
+    timeouts: list[str] = []
+    monkeypatch.setattr(latency, "observe_timeout", timeouts.append)
+
+    async def blocking_provider() -> list[dict[str, Any]]:
+        await asyncio.to_thread(cancellation.sleep, 30)
+        return []
+
+    started = time.monotonic()
+    _items, report = _collect(monkeypatch, blocking_provider)
+
+    assert time.monotonic() - started < 2
+    assert report.providers["blocking_provider"].detail == "Timeout nach 5s"
+    assert timeouts == ["blocking_provider"]
+
+def test_async_concurrency_group_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PROVIDER_MAX_WORKERS_SHARED", "1")
+    running = 0
+    peak = 0
+
+    async def _fetch() -> list[dict[str, Any]]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return []
+
+    async def first_member() -> list[dict[str, Any]]:
+        return await _fetch()
+
+    async def second_member() -> list[dict[str, Any]]:
+        return await _fetch()
+
+    for member in (first_member, second_member):
+        member._provider_concurrency_key = "shared"  # type: ignore[attr-defined]
+    _items, report = _collect(monkeypatch, first_member, second_member)
+
+    assert peak == 1
+    assert {entry.status for entry in report.providers.values()} == {"empty"}
+
+
+def test_async_failures_are_isolated(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def broken_provider() -> list[dict[str, Any]]:
+        raise RuntimeError("upstream \x1b[31mkaputt")
+
+    async def fine_provider() -> list[dict[str, Any]]:
+        return [{"guid": "fine"}]
+
+    items, report = _collect(monkeypatch, broken_provider, fine_provider)
+
+    assert items == [{"guid": "fine"}]
+    detail = report.providers["broken_provider"].detail or ""
+    assert detail.startswith("Fetch fehlgeschlagen") and "\x1b" not in detail
@@ -0,0 +1,170 @@
+"""Streaming GeoJSON parsing for the Baustellen updater.
+
+``StreamingArrayReader`` (``src/utils/json_stream.py``) must agree with
+``json.loads`` for every chunking of a document and keep the depth, size
+and non-finite guards of the whole-body parser. ``_fetch_remote`` feeds
+it from ``on_chunk`` and compacts each feature as it arrives;
+``_fetch_layers`` fetches the feature types concurrently.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from scripts import update_baustellen_cache
+from src.utils.json_stream import JSONStreamError, StreamingArrayReader
+
+
+def _feature(name: str, coordinates: Any) -> dict[str, Any]:
+    return {
+        "type": "Feature",
+        "geometry": {"type": "LineString", "coordinates": coordinates},
+        "properties": {"NAME": name, "STRASSE": "Ringstraße", "BEGINN": "2026-03-01", "ENDE": "2026-04-30"},
+    }
+
+
+COLLECTION: dict[str, Any] = {
+    "type": "FeatureCollection",
+    "totalFeatures": 2,
+    "features": [
+        _feature('U2 "Schottentor" \\ Ersatzverkehr 🚧', [[16.36, 48.21], [16.37, 48.22]]),
+        _feature("Gleisbau Ring", [[[16.1, 48.1e0], [16.2, 48.2]]]),
+    ],
+    "crs": {"type": "name", "properties": {"name": "urn:ogc:def:crs:EPSG::4326"}},
+}
+
+
+def _stream(body: bytes, chunk_size: int) -> dict[str, Any]:
+    elements: list[Any] = []
+    reader = StreamingArrayReader("features", elements.append)
+    for start in range(0, len(body), chunk_size):
+        reader.feed(body[start:start + chunk_size])
+    header = reader.close()
+    if reader.streamed:
+        header["features"] = elements
+    return header
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        json.dumps(COLLECTION).encode(),
+        json.dumps(COLLECTION, indent=2, ensure_ascii=False).encode(),
+        b'{"features": []}',
+        b"{}",
+        b' {"features" : [1, "a", null, -2.5e3, true], "features2": {"x": "]}"}} ',
+    ],
+)
+def test_every_chunking_matches_json_loads(body: bytes) -> None:
+    expected = json.loads(body)
+    for chunk_size in range(1, 24):
+        assert _stream(body, chunk_size) == expected
+
+
+def test_elements_arrive_before_the_document_ends() -> None:
+    seen: list[Any] = []
+    reader = StreamingArrayReader("features", seen.append)
+    reader.feed(b'{"features": [{"a": 1}, {"b"')
+    assert seen == [{"a": 1}]
+    reader.feed(b": 2}]}")
+    assert seen == [{"a": 1}, {"b": 2}]
+    assert reader.close() == {}
+    assert reader.elements == 2
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"features": [1,]}',
+        b'{"features": [1',
+        b"[]",
+        b'{"features": [NaN]}',
+        b'{"total": 1e1000}',
+        b'{"a": 1} {}',
+        b'{"a" 1}',
+        b'{"features": [{]]}',
+        b'{"features": ["\xff"]}',
+        b'{"features": [' + b"[" * 70 + b"]" * 70 + b"]}",
+    ],
+    ids=[
+        "trailing-comma", "truncated", "not-an-object", "nan", "overflow",
+        "extra-data", "missing-colon", "mismatched", "invalid-utf8", "too-deep",
+    ],
+)
+def test_malformed_documents_are_rejected(body: bytes) -> None:
+    with pytest.raises(JSONStreamError):
+        _stream(body, 4)
+
+
+def test_oversized_element_is_rejected_before_it_completes() -> None:
+    reader = StreamingArrayReader("features", lambda _element: None, max_element_chars=64)
+    reader.feed(b'{"features": [{"name": "')
+    with pytest.raises(JSONStreamError, match="exceeds 64"):
+        reader.feed(b"x" * 100)
+
+
+def _serve(
+    monkeypatch: pytest.MonkeyPatch,
+    respond: Callable[[str], bytes | None],
+    chunk_size: int = 32,
+) -> None:
+    def fake_fetch(_session: Any, url: str, on_chunk: Callable[[bytes], None], **_kwargs: Any) -> bytes:
+        body = respond(url)
+        if body is None:
+            raise ValueError("Invalid Content-Type: text/xml")
+        for start in range(0, len(body), chunk_size):
+            on_chunk(body[start:start + chunk_size])
+        return b""
+
+    monkeypatch.setattr(update_baustellen_cache, "validate_http_url", lambda url, **_kw: url)
+    monkeypatch.setattr(update_baustellen_cache, "fetch_content_safe", fake_fetch)
+
+
+def test_fetch_remote_streams_compact_features(monkeypatch: pytest.MonkeyPatch) -> None:
+    _serve(monkeypatch, lambda _url: json.dumps(COLLECTION).encode())
+
+    payload = update_baustellen_cache._fetch_remote(update_baustellen_cache.DEFAULT_DATA_URL, timeout=5)
+
+    assert payload is not None
+    assert payload["totalFeatures"] == 2
+    assert [feature["geometry"] for feature in payload["features"]] == [
+        {"type": "Point", "coordinates": [16.36, 48.21]},
+        {"type": "Point", "coordinates": [16.1, 48.1]},
+    ]
+    # Compacting keeps everything the event mapping reads.
+    assert update_baustellen_cache._collect_events(payload) == update_baustellen_cache._collect_events(COLLECTION)
+
+
+def test_fetch_remote_rejects_a_malformed_stream(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    _serve(monkeypatch, lambda _url: json.dumps(COLLECTION).encode()[:-30])
+    assert update_baustellen_cache._fetch_remote(update_baustellen_cache.DEFAULT_DATA_URL, timeout=5) is None
+    assert "Ungültiges JSON" in caplog.text
+
+
+def test_layers_are_fetched_concurrently_and_merged_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    typenames = update_baustellen_cache.BAUSTELLEN_TYPENAMES
+    barrier = threading.Barrier(len(typenames), timeout=5)
+
+    def respond(url: str) -> bytes | None:
+        if "outputFormat=json" in url:
+            return None  # forces the format negotiation inside each worker
+        index = next(i for i, typename in enumerate(typenames) if typename in url)
+        barrier.wait()  # every layer is in flight at the same time
+        body = dict(COLLECTION, features=[COLLECTION["features"][index]])
+        return json.dumps(body).encode()
+
+    _serve(monkeypatch, respond)
+
+    events = update_baustellen_cache._fetch_layers(update_baustellen_cache.DEFAULT_DATA_URL, timeout=5)
+
+    assert events is not None
+    assert [event["title"] for event in events] == [
+        'U2 "Schottentor" \\ Ersatzverkehr 🚧',
+        "Gleisbau Ring",
+    ]
@@ -0,0 +1,112 @@
+"""Tests for the benchmark suite in ``benchmarks/``.
+
+Timings themselves are not asserted (they depend on the machine); these
+tests pin what the numbers rest on: the generator is deterministic and
+scales linearly, the sandbox is what the feed build actually reads, and
+the regression comparison only flags real slowdowns.
+"""
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from benchmarks import generator, run, translation
+from src.utils import cache as cache_module
+
+_NOW = datetime(2026, 3, 2, 8, 30, tzinfo=UTC)
+
+
+def test_generator_is_deterministic_per_seed_and_scale() -> None:
+    first = generator.generate_payloads(2, seed=7, now=_NOW)
+    second = generator.generate_payloads(2, seed=7, now=_NOW)
+    other = generator.generate_payloads(2, seed=8, now=_NOW)
+
+    assert first == second
+    assert first.wl != other.wl
+
+
+@pytest.mark.parametrize("scale", [1, 10])
+def test_volume_scales_with_base_volume(scale: int) -> None:
+    payloads = generator.generate_payloads(scale, now=_NOW)
+    volume = payloads.volume()
+
+    assert volume["wl"] == generator.BASE_VOLUME["wl"] * scale
+    assert volume["oebb"] == generator.BASE_VOLUME["oebb"] * scale
+    assert volume["baustellen"] == generator.BASE_VOLUME["baustellen"] * scale
+    # One row per sample and direction.
+    assert volume["stammstrecke_rows"] == (
+        2 * generator.BASE_VOLUME["stammstrecke_samples_per_hour"] * scale * generator._LEDGER_HOURS
+    )
+
+
+@pytest.mark.parametrize("scale", [0, -1, float("nan"), float("inf")])
+def test_generator_rejects_non_positive_scale(scale: float) -> None:
+    with pytest.raises(ValueError, match="scale"):
+        generator.generate_payloads(scale, now=_NOW)
+
+
+def test_wl_payload_plants_exact_and_fuzzy_duplicates() -> None:
+    items = generator.generate_payloads(1, now=_NOW).wl
+    guids = [item["guid"] for item in items]
+
+    assert len(set(guids)) < len(guids)
+    assert len({item["title"] for item in items}) < len(items)
+
+
+def test_sandbox_is_read_by_the_feed_cache_and_stats(tmp_path: Path) -> None:
+    payloads = generator.generate_payloads(0.1, now=_NOW)
+    paths = generator.write_sandbox(payloads, tmp_path)
+
+    with run.feed_sandbox(paths):
+        assert cache_module.read_cache("wl") == payloads.wl
+        assert cache_module.read_cache("baustellen") == payloads.baustellen
+    assert sorted(p.name for p in paths.stats_dir.iterdir()) == [f"stammstrecke_{_NOW.year}.csv"]
+
+
+def _results(**stages: float) -> dict[str, object]:
+    return {"scales": {"1": {"stages": {name: {"median_s": value} for name, value in stages.items()}}}}
+
+
+def test_compare_results_requires_relative_and_absolute_slowdown() -> None:
+    baseline = _results(big=0.100, tiny=0.0001, gone=0.5)
+    current = _results(big=0.150, tiny=0.0003, new=0.2)
+
+    rows = {row["stage"]: row for row in run.compare_results(baseline, current, threshold=0.25, min_delta_s=0.002)}
+
+    assert set(rows) == {"big", "tiny"}
+    assert rows["big"]["regressed"] is True
+    assert rows["tiny"]["regressed"] is False  # 3× slower, but only 0.2 ms
+
+
+def test_run_scale_smoke(tmp_path: Path) -> None:
+    result = run.run_scale(0.05, repeat=1, seed=0, workdir=tmp_path)
+
+    stages = result["stages"]
+    assert list(stages) == [
+        "collect_items", "drop_old_items", "dedupe_items", "deduplicate_fuzzy",
+        "make_rss_de", "make_rss_en", "make_rss_en_cached", "save_state",
+        "pipeline", "network_deadline",
+    ]
+    assert stages["collect_items"]["items_out"] > 0
+    assert stages["dedupe_items"]["items_out"] <= stages["dedupe_items"]["items_in"]
+    # The blocked provider is evicted at the deadline instead of being waited for.
+    assert stages["network_deadline"]["median_s"] < 3.0
+
+
+def test_translation_benchmark_runs_both_variants(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    tiny = {
+        **translation._SYNTHETIC_CONFIG,
+        "vocab_size": 64, "d_model": 16, "encoder_layers": 1, "decoder_layers": 1,
+        "encoder_attention_heads": 2, "decoder_attention_heads": 2,
+        "encoder_ffn_dim": 32, "decoder_ffn_dim": 32, "pad_token_id": 63, "decoder_start_token_id": 63,
+    }
+    monkeypatch.setattr(translation, "_SYNTHETIC_CONFIG", tiny)
+
+    for variant in translation.VARIANTS:
+        result = translation.measure(variant, None, tokens=3, beams=1, threads=0)
+        assert result["variant"] == variant
+        assert set(result) >= {"load_s", "median_ms", "total_s", "resident_mb", "peak_rss_mb"}
@@ -0,0 +1,189 @@
+"""Cross-process circuit-breaker state (``src/utils/breaker_store.py``).
+
+Two :class:`CircuitBreaker` instances with the same name and store stand
+in for two cron steps: an OPEN breaker must stay open for the next
+process, the failure streak is shared, and only one process may probe
+in HALF_OPEN until its lease resolves or expires.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.utils import breaker_store
+from src.utils.breaker_store import BreakerStore, default_store
+from src.utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpen, CircuitState
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+class FakeClock:
+    def __init__(self, start: float = 1_767_225_600.0) -> None:
+        self.t = start
+
+    def __call__(self) -> float:
+        return self.t
+
+    def advance(self, dt: float) -> None:
+        self.t += dt
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def store(tmp_path: Path, clock: FakeClock) -> BreakerStore:
+    return BreakerStore(tmp_path / "breakers.json", probe_lease=30.0, clock=clock)
+
+
+def _process(store: BreakerStore, clock: FakeClock, threshold: int = 2) -> CircuitBreaker:
+    return CircuitBreaker("upstream", failure_threshold=threshold, recovery_timeout=60.0, clock=clock, store=store)
+
+
+def _fail() -> None:
+    raise ConnectionError("upstream down")
+
+
+def _state(breaker: CircuitBreaker) -> CircuitState:
+    return breaker.state
+
+
+def test_open_state_survives_into_the_next_process(store: BreakerStore, clock: FakeClock) -> None:
+    first = _process(store, clock)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            first.call(_fail)
+
+    second = _process(store, clock)
+    calls: list[int] = []
+    with pytest.raises(CircuitBreakerOpen):
+        second.call(calls.append, 1)
+    assert calls == []
+    assert _state(second) is CircuitState.OPEN
+
+
+def test_failure_streak_is_shared(store: BreakerStore, clock: FakeClock) -> None:
+    first, second = _process(store, clock, threshold=3), _process(store, clock, threshold=3)
+    first.record_failure()
+    second.record_failure()
+    first.record_failure()
+    assert _state(second) is CircuitState.OPEN
+    assert second.consecutive_failures == 3
+
+
+def test_only_one_process_probes_until_the_probe_resolves(store: BreakerStore, clock: FakeClock) -> None:
+    prober, other = _process(store, clock), _process(store, clock)
+    prober.record_failure()
+    prober.record_failure()
+    clock.advance(61)
+
+    def probe() -> str:
+        with pytest.raises(CircuitBreakerOpen, match="probe in flight"):
+            other.call(lambda: "second probe")
+        return "recovered"
+
+    assert prober.call(probe) == "recovered"
+    assert other.call(lambda: "after recovery") == "after recovery"
+    assert _state(other) is CircuitState.CLOSED
+
+
+def test_lease_of_a_crashed_prober_expires(store: BreakerStore, clock: FakeClock) -> None:
+    crashed = _process(store, clock)
+    crashed.record_failure()
+    crashed.record_failure()
+    clock.advance(61)
+    crashed._shared(crashed._admit)  # admitted, then the process died
+
+    successor = _process(store, clock)
+    with pytest.raises(CircuitBreakerOpen):
+        successor.call(lambda: None)
+    clock.advance(31)
+    with pytest.raises(ConnectionError):
+        successor.call(_fail)
+    assert _state(successor) is CircuitState.OPEN
+
+
+def test_healthy_calls_never_write_the_file(store: BreakerStore, clock: FakeClock) -> None:
+    breaker = _process(store, clock)
+    for _ in range(3):
+        breaker.call(lambda: None)
+    assert not store.path.exists()
+
+    breaker.record_failure()
+    record = json.loads(store.path.read_text(encoding="utf-8"))["breakers"]["upstream"]
+    assert record == {"failures": 1, "opened_at": None, "probe_until": None, "state": "closed"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["{broken", '{"format": 1, "breakers": {"upstream": {"state": "exploded", "failures": 1}}}', "[]"],
+    ids=["corrupt", "invalid-record", "not-a-mapping"],
+)
+def test_unusable_files_are_ignored(store: BreakerStore, clock: FakeClock, content: str) -> None:
+    store.path.write_text(content, encoding="utf-8")
+    breaker = _process(store, clock)
+    assert _state(breaker) is CircuitState.CLOSED
+    breaker.record_failure()
+    assert store.read("upstream") == {"state": "closed", "failures": 1, "opened_at": None, "probe_until": None}
+
+
+def test_unavailable_store_falls_back_to_process_local_state(
+    tmp_path: Path, clock: FakeClock, caplog: pytest.LogCaptureFixture
+) -> None:
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("", encoding="utf-8")
+    breaker = _process(BreakerStore(blocker / "breakers.json", clock=clock), clock)
+
+    caplog.set_level(logging.WARNING, logger="src.utils.circuit_breaker")
+    breaker.record_failure()
+    breaker.record_failure()
+    assert _state(breaker) is CircuitState.OPEN
+    assert "process-local state" in caplog.text
+
+
+def test_state_is_shared_between_real_processes(tmp_path: Path) -> None:
+    path = tmp_path / "breakers.json"
+    script = (
+        "from pathlib import Path\n"
+        "from src.utils.breaker_store import BreakerStore\n"
+        "from src.utils.circuit_breaker import CircuitBreaker\n"
+        f"breaker = CircuitBreaker('upstream', failure_threshold=1, store=BreakerStore(Path({str(path)!r})))\n"
+        "breaker.record_failure()\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, check=True, timeout=60)  # noqa: S603
+
+    breaker = CircuitBreaker("upstream", recovery_timeout=300.0, store=BreakerStore(path))
+    assert _state(breaker) is CircuitState.OPEN
+
+
+@pytest.fixture
+def fresh_default_store() -> object:
+    default_store.cache_clear()
+    yield
+    default_store.cache_clear()
+
+
+@pytest.mark.usefixtures("fresh_default_store")
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("", None),
+        ("cache/circuit_breakers.json", REPO_ROOT / "cache" / "circuit_breakers.json"),
+        ("data/first_seen.json", None),
+        ("cache/../src/utils/circuit_breaker.py", None),
+        ("/etc/passwd", None),
+    ],
+)
+def test_default_store_is_confined_to_the_cache_directory(
+    monkeypatch: pytest.MonkeyPatch, value: str, expected: Path | None
+) -> None:
+    monkeypatch.setenv(breaker_store.BREAKER_STATE_ENV, value)
+    store = default_store()
+    assert (store.path if store is not None else None) == expected
@@ -155,6 +155,9 @@ def test_save_state_failure_calls_report_add_warning_in_main() -> None:
     monitoring / dashboards saw a fully-successful build while
     first_seen / translations / stats drifted out of sync with the
     on-disk feed.
+
+    The pipeline body lives in ``_run_build`` (``main`` only loads the
+    configuration and activates the run's tracer around it).
     """
     import ast
     import inspect
@@ -162,10 +165,10 @@ def test_save_state_failure_calls_report_add_warning_in_main() -> None:
     tree = ast.parse(inspect.getsource(build_feed))
     main_func: ast.FunctionDef | None = None
     for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == "main":
+        if isinstance(node, ast.FunctionDef) and node.name == "_run_build":
             main_func = node
             break
-    assert main_func is not None, "build_feed.main not found"
+    assert main_func is not None, "build_feed._run_build not found"
 
     found_warning_call = False
     for node in ast.walk(main_func):
@@ -1,8 +1,9 @@
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 import src.build_feed as bf
 
-def test_build_feed_mutation() -> None:
+def test_build_feed_mutation(tmp_path: Path) -> None:
     items = [{"title": "original", "guid": "123"}]
 
     with patch.object(bf, "_invoke_collect_items", return_value=items), \
@@ -13,7 +14,9 @@ def test_build_feed_mutation() -> None:
          patch.object(bf, "_make_rss", return_value=""), \
          patch.object(bf, "_load_state", return_value={}), \
          patch.object(bf, "_save_state"), \
-         patch.object(bf, "atomic_write", MagicMock()):
+         patch.object(bf, "atomic_write", MagicMock()), \
+         patch.object(bf, "_render_cache_path", return_value=tmp_path / "state.render.json"), \
+         patch.object(bf, "_latency_history_path", return_value=tmp_path / "state.latency.json"):
 
         # Make a hook to capture pre_dedupe_items before it goes to dedupe functions
         original_summarize = bf._summarize_duplicates
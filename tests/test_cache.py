@@ -90,6 +90,16 @@ def test_write_cache_env_compact(tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     assert cache_file.read_text(encoding="utf-8") == expected
 
 
+def test_write_cache_reports_unchanged_payload(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_file = _prepare_cache(tmp_path, monkeypatch, "quiet-provider")
+
+    assert cache.write_cache("quiet-provider", [{"guid": "a"}, {"guid": "b"}]) is True
+    inode = cache_file.stat().st_ino
+    assert cache.write_cache("quiet-provider", [{"guid": "b"}, {"guid": "a"}]) is False
+    assert cache_file.stat().st_ino == inode
+    assert cache.write_cache("quiet-provider", [{"guid": "c"}]) is True
+
+
 def test_write_status_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     base = tmp_path / "cache-root"
     monkeypatch.setattr(cache, "_CACHE_DIR", base, raising=False)
@@ -0,0 +1,102 @@
+"""Tests for the cursor-based change log (``src/feed/changes.py``)."""
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src import build_feed
+from src.feed import changes
+from src.feed_types import FeedItem, FeedRecord
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _item(guid: str, title: str) -> FeedItem:
+    item: dict[str, Any] = {
+        "source": "Wiener Linien",
+        "category": "Störung",
+        "title": title,
+        "description": "<p>Unregelmäßige Intervalle.</p>",
+        "guid": guid,
+        "pubDate": datetime(2026, 3, 1, 8, 0, tzinfo=UTC),
+        "starts_at": datetime(2026, 2, 28, 8, 0, tzinfo=UTC),
+    }
+    return FeedRecord.adopt(item)  # type: ignore[return-value]
+
+
+def _entries(*items: FeedItem) -> list[dict[str, str]]:
+    return changes.feed_entries(build_feed._make_rss(list(items), NOW, {}))
+
+
+def test_feed_entries_carry_the_rendered_fields() -> None:
+    (entry,) = _entries(_item("wl-1", "U1: Störung Karlsplatz"))
+
+    assert entry["guid"] == "wl-1"
+    assert "Karlsplatz" in entry["title"]
+    assert entry["first_seen"] and entry["starts_at"] and entry["pubDate"]
+    assert "encoded" not in entry
+
+
+def test_unchanged_feed_leaves_the_file_untouched(tmp_path: Path) -> None:
+    path = tmp_path / "changes.json"
+    log = changes.ChangeLog.load(path)
+    entries = _entries(_item("wl-1", "U1: Störung"), _item("wl-2", "U2: Störung"))
+
+    first = log.advance(entries)
+    assert first is not None and first.seq == 1 and first.added == ("wl-1", "wl-2")
+    assert log.save(path)
+    written = path.read_bytes()
+
+    reloaded = changes.ChangeLog.load(path)
+    assert reloaded.epoch == log.epoch
+    assert reloaded.advance(entries) is None
+    assert not reloaded.save(path)
+    assert path.read_bytes() == written
+
+
+def test_batches_record_added_updated_and_removed() -> None:
+    log = changes.ChangeLog()
+    log.advance(_entries(_item("wl-1", "U1: Störung"), _item("wl-2", "U2: Störung")))
+
+    batch = log.advance(_entries(_item("wl-3", "U3: Störung"), _item("wl-1", "U1: Störung behoben")))
+
+    assert batch == changes.ChangeBatch(2, added=("wl-3",), updated=("wl-1",), removed=("wl-2",))
+    assert [guid for guid, _digest in log.items] == ["wl-3", "wl-1"]
+    assert set(log.entries) == {"wl-1", "wl-3"}
+    assert "behoben" in log.entries["wl-1"]["title"]
+    assert log.to_json()["oldest"] == 0
+
+
+def test_window_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(changes, "MAX_BATCHES", 2)
+    log = changes.ChangeLog()
+    for round_ in range(4):
+        log.advance(_entries(_item(f"wl-{round_}", "Störung")))
+
+    assert [batch.seq for batch in log.batches] == [3, 4]
+    assert log.oldest == 2
+    assert set(log.entries) == {"wl-3"}
+
+
+def test_corrupt_file_starts_a_new_epoch(tmp_path: Path) -> None:
+    path = tmp_path / "changes.json"
+    path.write_text('{"format": 1, "epoch": "abcd", "seq": "7"}', encoding="utf-8")
+
+    log = changes.ChangeLog.load(path)
+
+    assert log.seq == 0 and log.epoch != "abcd"
+
+
+def test_build_writes_a_change_log_per_language(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "docs").mkdir()
+    rss = build_feed._make_rss([_item("wl-1", "U1: Störung")], NOW, {}, lang="en")
+
+    build_feed._save_change_log(tmp_path / "docs" / "feed.en.xml", rss, lang="en")
+
+    log = changes.ChangeLog.load(tmp_path / "docs" / "changes.en.json")
+    assert log.seq == 1 and [guid for guid, _digest in log.items] == ["wl-1"]
+    assert not (tmp_path / "docs" / "changes.json").exists()
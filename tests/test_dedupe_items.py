@@ -50,6 +50,7 @@ def test_main_dedupes_items(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) ->
         deletions: Any = None,
         *,
         lang: str = "de",
+        shard_index: Any = None,
     ) -> str:
         # Capture only on the first (German) call; the build pipeline now
         # also invokes ``_make_rss`` a second time for the EN mirror.
@@ -45,6 +45,7 @@ def test_item_with_past_ends_at_is_dropped(
         deletions: Any = None,
         *,
         lang: str = "de",
+        shard_index: Any = None,
     ) -> str:
         # Capture only on the first (German) call; the build pipeline now
         # also invokes ``_make_rss`` a second time for the EN mirror.
@@ -0,0 +1,181 @@
+"""Tests for the incremental mode of scripts/enrich_station_aliases.py.
+
+A memoised alias list may only be reused when neither the station's own
+alias inputs nor any source record its computation looked up changed —
+the result must always equal a full recomputation. Feeding the enriched
+output back in (the next refresh) must still hit.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts import enrich_station_aliases as esa
+
+
+def _sources(**overrides: object) -> esa.AliasSources:
+    base: dict[str, object] = {
+        "vor_names": {"490001": "Wien Meidling Bahnhof"},
+        "vor_mapping": {},
+        "gtfs_index": {"praterstern": {"Praterstern Bahnsteig 1", "Wien Nord"}},
+        "pendler_alt_names": {"angern": ["Angern an der March"]},
+    }
+    base.update(overrides)
+    return esa.AliasSources(**base)  # type: ignore[arg-type]
+
+
+def _stations() -> list[dict[str, object]]:
+    return [
+        {"name": "Wien Meidling", "vor_id": "490001", "aliases": []},
+        {"name": "Wien Praterstern", "aliases": ["Praterstern"]},
+        {"name": "Angern", "bst_code": "An", "aliases": []},
+        {"name": "St. Pölten Hbf", "aliases": []},
+    ]
+
+
+def _full(stations: list[dict[str, object]], sources: esa.AliasSources) -> list[dict[str, object]]:
+    expected = copy.deepcopy(stations)
+    esa.enrich_aliases(expected, sources)
+    return expected
+
+
+def _incremental(
+    stations: list[dict[str, object]], sources: esa.AliasSources, path: Path
+) -> tuple[list[dict[str, object]], esa.AliasCache]:
+    result = copy.deepcopy(stations)
+    cache = esa.AliasCache.load(path)
+    esa.enrich_aliases(result, sources, cache)
+    cache.save()
+    return result, cache
+
+
+def test_warm_cache_reuses_every_station_and_matches_full_run(tmp_path: Path) -> None:
+    path = tmp_path / "stations.json.aliases.cache.json"
+    sources = _sources()
+
+    cold, cold_cache = _incremental(_stations(), sources, path)
+    warm, warm_cache = _incremental(_stations(), sources, path)
+
+    assert cold == warm == _full(_stations(), sources)
+    assert (cold_cache.hits, cold_cache.misses) == (0, 4)
+    assert (warm_cache.hits, warm_cache.misses) == (4, 0)
+
+
+def test_enriched_output_as_next_input_hits_cache(tmp_path: Path) -> None:
+    # The next refresh reads the enriched stations.json back in; the
+    # rewritten ``aliases`` must not turn every station into a miss.
+    path = tmp_path / "cache.json"
+    sources = _sources()
+    enriched, _cold_cache = _incremental(_stations(), sources, path)
+
+    result, cache = _incremental(enriched, sources, path)
+
+    assert result == _full(enriched, sources)
+    assert (cache.hits, cache.misses) == (4, 0)
+
+
+def test_edited_aliases_are_recomputed(tmp_path: Path) -> None:
+    path = tmp_path / "cache.json"
+    enriched, _cold_cache = _incremental(_stations(), _sources(), path)
+    enriched[2]["aliases"] = [*enriched[2]["aliases"], "Angern Bahnhof"]  # type: ignore[misc]
+
+    result, cache = _incremental(enriched, _sources(), path)
+
+    assert result == _full(enriched, _sources())
+    assert "Angern Bahnhof" in result[2]["aliases"]  # type: ignore[operator]
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_changed_source_record_recomputes_only_dependent_station(tmp_path: Path) -> None:
+    path = tmp_path / "cache.json"
+    _incremental(_stations(), _sources(), path)
+    changed = _sources(gtfs_index={"praterstern": {"Praterstern Nord"}})
+
+    result, cache = _incremental(_stations(), changed, path)
+
+    assert result == _full(_stations(), changed)
+    assert "Praterstern Nord" in result[1]["aliases"]  # type: ignore[operator]
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_renamed_station_changes_collision_filter_for_others(tmp_path: Path) -> None:
+    path = tmp_path / "cache.json"
+    _incremental(_stations(), _sources(), path)
+    stations = _stations()
+    # "Meidling" now is another station's canonical name, so the
+    # cross-station-collision filter must drop it from Wien Meidling.
+    stations.append({"name": "Meidling", "aliases": []})
+
+    result, cache = _incremental(stations, _sources(), path)
+
+    assert result == _full(stations, _sources())
+    assert "Meidling" not in result[0]["aliases"]  # type: ignore[operator]
+    assert cache.misses >= 2
+
+
+def test_iterating_a_source_records_it_as_a_whole() -> None:
+    deps: dict[tuple[str, object], None] = {}
+    view = esa._RecordingLookup("gtfs_index", {"praterstern": {"Wien Nord"}}, deps)
+
+    assert list(view) == ["praterstern"]
+    assert dict(view.items()) == {"praterstern": {"Wien Nord"}}
+
+    dep_list = [[label, key] for label, key in deps]
+    before = esa._dependency_digest(dep_list, {"gtfs_index": {"praterstern": {"Wien Nord"}}})
+    grown = {"praterstern": {"Wien Nord"}, "meidling": {"Wien Meidling"}}
+    assert esa._dependency_digest(dep_list, {"gtfs_index": grown}) != before
+
+
+def test_stale_code_digest_discards_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "cache.json"
+    _incremental(_stations(), _sources(), path)
+    monkeypatch.setattr(esa, "_alias_code_digest", lambda: "other-code")
+
+    _result, cache = _incremental(_stations(), _sources(), path)
+
+    assert cache.hits == 0
+
+
+def test_malformed_cache_record_is_recomputed(tmp_path: Path) -> None:
+    path = tmp_path / "cache.json"
+    _incremental(_stations(), _sources(), path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    for record in payload["stations"].values():
+        record["aliases"] = ["<planted>", 7]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    result, cache = _incremental(_stations(), _sources(), path)
+
+    assert result == _full(_stations(), _sources())
+    assert cache.hits == 0
+
+
+def test_main_writes_cache_sidecar_unless_disabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stations_path = tmp_path / "stations.json"
+    stations_path.write_text(json.dumps({"stations": _stations()}), encoding="utf-8")
+    base_argv = [
+        "enrich_station_aliases",
+        "--stations", str(stations_path),
+        "--vor-stops", str(tmp_path / "missing_vor.csv"),
+        "--vor-mapping", str(tmp_path / "missing_vor_mapping.json"),
+        "--gtfs-stops", str(tmp_path / "missing_gtfs.txt"),
+        "--pendler-candidates", str(tmp_path / "missing_pendler.json"),
+    ]
+    sidecar = tmp_path / "stations.json.aliases.cache.json"
+
+    monkeypatch.setattr(sys, "argv", [*base_argv, "--no-incremental"])
+    assert esa.main() == 0
+    assert not sidecar.exists()
+
+    monkeypatch.setattr(sys, "argv", base_argv)
+    assert esa.main() == 0
+    assert set(json.loads(sidecar.read_text(encoding="utf-8"))["stations"]) == {
+        esa._station_fingerprint(entry)
+        for entry in json.loads(stations_path.read_text(encoding="utf-8"))["stations"]
+    }
@@ -0,0 +1,168 @@
+"""Tests for ``FeedRecord`` (``src/feed_types.py``), the memoising item type.
+
+A record must behave exactly like the plain ``dict`` providers hand in,
+keep derived values out of the mapping, and never serve a memo computed
+from fields that have since changed.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+from datetime import UTC, datetime
+from typing import Any, cast
+
+import pytest
+
+from src import build_feed
+from src.feed_types import FeedItem, FeedRecord, as_record
+from src.utils.serialize import serialize_for_cache
+
+
+def _item(**overrides: Any) -> dict[str, Any]:
+    item: dict[str, Any] = {
+        "source": "Wiener Linien",
+        "category": "Störung",
+        "title": "U1: Störung Karlsplatz",
+        "description": "Unregelmäßige Intervalle.",
+        "starts_at": datetime(2026, 3, 1, 8, 0, tzinfo=UTC),
+    }
+    item.update(overrides)
+    return item
+
+
+def _record(**overrides: Any) -> FeedRecord:
+    return FeedRecord.adopt(_item(**overrides))
+
+
+# ``FeedRecord`` is a ``dict`` subclass, not the ``FeedItem`` TypedDict, as
+# far as the type checker is concerned; the pipeline passes it as ``Any``.
+def _identity(item: Any) -> str:
+    return build_feed._identity_for_item(item)
+
+
+def _dedupe_key(item: Any) -> tuple[str, bool]:
+    return build_feed._dedupe_key_for_item(item, warn_on_missing=False)
+
+
+def _memos(record: FeedRecord) -> tuple[Any, ...]:
+    return (record.identity, record.dedupe_key, record.recency, record.end)
+
+
+def test_record_is_a_plain_mapping_for_consumers() -> None:
+    record = _record(guid="g-1")
+    _identity(record)
+    _dedupe_key(record)
+
+    assert isinstance(record, dict)
+    assert record == _item(guid="g-1")
+    assert not any(key.startswith("_calculated") for key in record)
+    assert json.loads(json.dumps(serialize_for_cache(record))) == serialize_for_cache(_item(guid="g-1"))
+    assert not isinstance(record.as_dict(), FeedRecord)
+    assert not hasattr(record, "__dict__")
+
+
+def test_adopt_reuses_records_and_drops_legacy_derived_keys() -> None:
+    record = FeedRecord.adopt(_item(_calculated_identity="stale", _calculated_recency="stale"))
+
+    assert FeedRecord.adopt(record) is record
+    assert "_calculated_identity" not in record
+    assert "_calculated_recency" not in record
+    assert _identity(record) != "stale"
+    assert FeedRecord.adopt_all([record, "not-a-mapping"]) == [record, "not-a-mapping"]
+
+
+def test_identity_and_dedupe_key_are_memoised_per_record(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    compute = build_feed._compute_identity
+
+    def counting(item: Any) -> str:
+        calls.append(item["title"])
+        return compute(item)
+
+    monkeypatch.setattr(build_feed, "_compute_identity", counting)
+    record = _record()
+
+    first = _identity(record)
+    assert _identity(record) == first
+    assert _dedupe_key(record) == (first, True)
+    assert calls == ["U1: Störung Karlsplatz"]
+
+    # Plain dicts are still accepted but never memoised (nor mutated).
+    plain = _item()
+    _identity(plain)
+    _identity(plain)
+    assert len(calls) == 3
+    assert plain == _item()
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda r: r.__setitem__("title", "U2: Störung Praterstern"),
+        lambda r: r.__delitem__("starts_at"),
+        lambda r: r.pop("starts_at"),
+        lambda r: r.update(title="U2: Störung Praterstern"),
+        lambda r: r.__ior__({"title": "U2: Störung Praterstern"}),
+        lambda r: r.setdefault("guid", "g-new"),
+        lambda r: r.popitem(),
+        lambda r: r.clear(),
+    ],
+    ids=["setitem", "delitem", "pop", "update", "ior", "setdefault", "popitem", "clear"],
+)
+def test_every_mutation_invalidates_the_memos(mutate: Any) -> None:
+    record = _record()
+    _identity(record)
+    _dedupe_key(record)
+    assert _memos(record) != (None, None, None, None)
+
+    mutate(record)
+
+    assert _memos(record) == (None, None, None, None)
+
+
+def test_reassigning_the_same_object_keeps_the_memos() -> None:
+    record = _record()
+    ident = _identity(record)
+
+    # ``_emit_item`` re-coerces the datetime fields in place; an already
+    # parsed value comes back as the very same object.
+    build_feed._coerce_datetime_field(record, "starts_at")
+    record.pop("missing", None)
+    record.setdefault("title", "ignored")
+
+    assert record.identity == ident
+
+
+def test_copies_start_without_memos_and_pickle_round_trips() -> None:
+    record = _record()
+    _identity(record)
+
+    for clone in (record.copy(), copy.copy(record), pickle.loads(pickle.dumps(record))):  # noqa: S301 - own data
+        assert isinstance(clone, FeedRecord)
+        assert clone == record
+        assert clone.identity is None
+
+
+def test_no_title_identity_does_not_depend_on_earlier_stages() -> None:
+    # The no-title identity hashes the whole item; derived values stored as
+    # dict keys used to change that hash once a dedupe pass had run.
+    record = _record(title="", ends_at=datetime(2026, 3, 2, tzinfo=UTC))
+    fresh = build_feed._compute_identity(cast(FeedItem, record))
+
+    build_feed._dedupe_items(FeedRecord.adopt_all([record, _record(title="", guid="other")]))
+    record.identity = None
+
+    assert _identity(record) == fresh
+
+
+def test_collect_items_yields_records(monkeypatch: pytest.MonkeyPatch) -> None:
+    def record_test_provider() -> list[dict[str, Any]]:
+        return [_item(guid="g-1", pubDate="2026-03-01T08:00:00+01:00")]
+
+    monkeypatch.setattr(build_feed, "PROVIDERS", [("RECORD_TEST_ENABLE", record_test_provider)])
+
+    items = build_feed._collect_items()
+
+    assert [as_record(item) is item for item in items] == [True]
+    assert items[0]["pubDate"] == datetime.fromisoformat("2026-03-01T08:00:00+01:00")
@@ -0,0 +1,104 @@
+"""Per-line and per-category shard feeds (``src/feed/shards.py``)."""
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src import build_feed
+from src.feed import shards
+from src.feed_types import FeedItem, FeedRecord
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _item(guid: str, title: str, category: str = "Störung") -> FeedItem:
+    item: dict[str, Any] = {
+        "source": "Wiener Linien",
+        "category": category,
+        "title": title,
+        "description": "<p>Unregelmäßige Intervalle.</p>",
+        "guid": guid,
+        "pubDate": datetime(2026, 3, 1, 8, 0, tzinfo=UTC),
+        "starts_at": datetime(2026, 2, 28, 8, 0, tzinfo=UTC),
+    }
+    return FeedRecord.adopt(item)  # type: ignore[return-value]
+
+
+ITEMS = [
+    _item("wl-1", "U6: Störung Spittelau"),
+    _item("wl-2", "U4/U6: Störung Längenfeldgasse"),
+    _item("wl-3", "13A: Umleitung", category="Baustelle"),
+]
+
+
+@pytest.fixture
+def docs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "docs").mkdir()
+    return tmp_path / "docs"
+
+
+def _build(docs: Path, items: list[FeedItem], now: datetime = NOW, state: dict[str, Any] | None = None) -> str:
+    index = shards.ShardIndex()
+    rss = build_feed._make_rss(items, now, {} if state is None else state, shard_index=index)
+    build_feed._write_feed_shards(docs / "feed.xml", index, now)
+    return rss
+
+
+def _guids(path: Path) -> list[str]:
+    return [guid.text or "" for guid in ET.parse(path).getroot().iter("guid")]
+
+
+def test_index_groups_items_by_line_and_category(docs: Path) -> None:
+    rss = _build(docs, ITEMS)
+
+    assert _guids(docs / "feeds" / "line-U6.xml") == ["wl-1", "wl-2"]
+    assert _guids(docs / "feeds" / "line-U4.xml") == ["wl-2"]
+    assert _guids(docs / "feeds" / "category-stoerung.xml") == ["wl-1", "wl-2"]
+    assert _guids(docs / "feeds" / "category-baustelle.xml") == ["wl-3"]
+
+    shard = (docs / "feeds" / "line-U6.xml").read_text(encoding="utf-8")
+    item_start = rss.index("<item>")
+    assert rss[item_start : rss.index("</item>") + 7] in shard
+    assert "feeds/line-U6.xml" in shard and "– Linie U6" in shard
+
+    manifest = json.loads((docs / "feeds" / "index.json").read_text(encoding="utf-8"))
+    assert manifest["shards"]["line-U6"]["items"] == 2
+    assert manifest["shards"]["category-baustelle"]["label"] == "Baustelle"
+
+
+def test_unchanged_shards_keep_their_bytes(docs: Path) -> None:
+    state: dict[str, Any] = {}
+    _build(docs, ITEMS, state=state)
+    before = {path.name: path.read_bytes() for path in (docs / "feeds").iterdir()}
+
+    later = NOW + timedelta(minutes=30)
+    _build(docs, [ITEMS[0], _item("wl-2", "U4/U6: Störung behoben"), ITEMS[2]], later, state)
+
+    after = {path.name: path.read_bytes() for path in (docs / "feeds").iterdir()}
+    assert after["category-baustelle.xml"] == before["category-baustelle.xml"]
+    assert after["line-U6.xml"] != before["line-U6.xml"]
+    assert b"behoben" in after["line-U4.xml"]
+
+
+def test_vanished_shard_stays_empty_until_retired(docs: Path) -> None:
+    _build(docs, ITEMS)
+    _build(docs, ITEMS[:2], NOW + timedelta(hours=1))
+
+    assert _guids(docs / "feeds" / "category-baustelle.xml") == []
+
+    _build(docs, ITEMS[:2], NOW + timedelta(hours=1) + shards.RETIRE_AFTER)
+
+    assert not (docs / "feeds" / "category-baustelle.xml").exists()
+    manifest = json.loads((docs / "feeds" / "index.json").read_text(encoding="utf-8"))
+    assert "category-baustelle" not in manifest["shards"]
+
+
+def test_category_slug_is_ascii() -> None:
+    assert shards.category_slug("Störung") == "stoerung"
+    assert shards.category_slug(" Bau-/Straßenarbeiten ") == "bau-strassenarbeiten"
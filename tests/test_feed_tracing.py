@@ -0,0 +1,183 @@
+"""Tests for the per-stage tracing spans (``src/feed/tracing.py``).
+
+Disabled tracing must be a no-op; an active tracer aggregates spans from
+every thread into ``feed-health.json`` and, on request, exports a Chrome
+trace.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src import build_feed
+from src.feed import tracing
+from src.feed.reporting import (
+    FeedHealthMetrics,
+    RunReport,
+    build_feed_health_payload,
+    render_feed_health_markdown,
+)
+from src.utils import stats as stats_module
+
+
+@pytest.fixture(autouse=True)
+def _no_active_tracer() -> Iterator[None]:
+    previous = tracing.activate(None)
+    yield
+    tracing.activate(previous)
+
+
+def test_disabled_tracing_is_a_shared_noop() -> None:
+    calls: list[int] = []
+
+    @tracing.traced("stage")
+    def stage(value: int) -> int:
+        calls.append(value)
+        return value * 2
+
+    assert tracing.span("a") is tracing.span("b")
+    with tracing.span("a"):
+        tracing.count("hits")
+    assert stage(21) == 42
+    assert calls == [21]
+    assert stage.__name__ == "stage"
+
+
+def test_spans_and_counters_aggregate_across_threads() -> None:
+    tracer = tracing.Tracer()
+    tracing.activate(tracer)
+
+    @tracing.traced("work")
+    def work() -> None:
+        tracing.count("units")
+
+    threads = [threading.Thread(target=lambda: [work() for _ in range(50)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with pytest.raises(ValueError), tracing.span("failing"):
+        raise ValueError("boom")
+
+    summary = tracer.summary()
+    assert summary["spans"]["work"]["count"] == 200
+    assert summary["spans"]["work"]["total_s"] >= summary["spans"]["work"]["max_s"] >= 0
+    assert summary["spans"]["failing"]["count"] == 1
+    assert summary["counters"] == {"units": 200}
+
+
+def test_chrome_trace_records_events_per_thread_and_caps_them(tmp_path: Path) -> None:
+    tracer = tracing.Tracer(record_events=True, max_events=3)
+    tracing.activate(tracer)
+    with tracing.span("outer", items=2, ratio=float("nan")):
+        with tracing.span("inner"):
+            pass
+    with pytest.raises(KeyError), tracing.span("failing"):
+        raise KeyError("x")
+    with tracing.span("dropped"):
+        pass
+
+    path = tmp_path / "trace.json"
+    tracer.write_chrome_trace(path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+
+    complete = [event for event in payload["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in complete] == ["inner", "outer", "failing"]
+    outer = complete[1]
+    assert outer["args"] == {"items": 2, "ratio": None}
+    assert outer["ts"] <= complete[0]["ts"]
+    assert outer["ts"] + outer["dur"] >= complete[0]["ts"] + complete[0]["dur"]
+    assert complete[2]["args"] == {"error": "KeyError"}
+    assert {event["name"] for event in payload["traceEvents"] if event["ph"] == "M"} == {"thread_name"}
+    # Aggregates still see the dropped event.
+    assert tracer.summary()["spans"]["dropped"]["count"] == 1
+    assert tracer.summary()["counters"]["tracing.dropped_events"] == 1
+
+
+def test_health_payload_and_markdown_carry_scrubbed_trace() -> None:
+    report = RunReport([])
+    report.trace = {
+        "spans": {"provider.fetch:Evil\u202eName": {"count": 1, "total_s": 0.5, "max_s": 0.5}},
+        "counters": {"translation.cache_hit": 3},
+    }
+    metrics = FeedHealthMetrics(raw_items=0, filtered_items=0, deduped_items=0, new_items=0, duplicate_count=0, duplicates=())
+
+    payload = build_feed_health_payload(report, metrics)
+    markdown = render_feed_health_markdown(report, metrics)
+
+    assert payload["trace"]["spans"] == {"provider.fetch:EvilName": {"count": 1, "total_s": 0.5, "max_s": 0.5}}
+    assert payload["trace"]["counters"] == {"translation.cache_hit": 3}
+    assert "### Stufen-Spans" in markdown
+    assert "\u202e" not in json.dumps(payload, ensure_ascii=False)
+    assert build_feed_health_payload(RunReport([]), metrics)["trace"] == {"spans": {}, "counters": {}}
+
+
+def test_main_exports_stage_spans(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def trace_test_provider() -> list[dict[str, Any]]:
+        return [{
+            "source": "Wiener Linien",
+            "category": "Störung",
+            "title": "U1: Störung Karlsplatz",
+            "description": "Unregelmäßige Intervalle.",
+            "guid": "trace-test-1",
+            "pubDate": datetime(2026, 3, 1, 8, 0, tzinfo=UTC),
+        }]
+
+    paths = {
+        "OUT_PATH": tmp_path / "feed.xml",
+        "FEED_HEALTH_PATH": tmp_path / "feed-health.md",
+        "FEED_HEALTH_JSON_PATH": tmp_path / "feed-health.json",
+        "STATE_PATH": tmp_path / "state.json",
+        "FEED_TRACE_PATH": tmp_path / "feed-trace.json",
+    }
+    for env, path in paths.items():
+        monkeypatch.setenv(env, str(path))
+    monkeypatch.setattr(build_feed.feed_config, "validate_path", lambda path, _name: Path(path))
+    monkeypatch.setattr(build_feed, "validate_path", lambda path, _name: Path(path))
+    monkeypatch.setattr(build_feed, "PROVIDERS", [("TRACE_TEST_ENABLE", trace_test_provider)])
+    monkeypatch.setattr(
+        build_feed, "_get_translation_pipeline",
+        lambda: lambda text, **_kw: [{"translation_text": f"{text} (EN)"}],
+    )
+    monkeypatch.setattr(stats_module, "DEFAULT_STATS_DIR", tmp_path / "stats")
+
+    assert build_feed.main() == 0
+    assert tracing.active_tracer() is None
+
+    health = json.loads(paths["FEED_HEALTH_JSON_PATH"].read_text(encoding="utf-8"))
+    spans = health["trace"]["spans"]
+    for name in (
+        "collect", "provider.fetch:trace_test_provider", "provider.postprocess:trace_test_provider",
+        "age_filter", "identity", "dedupe.strict", "dedupe.fuzzy", "render:de", "render:en",
+        "serialize:de", "serialize:en", "write:de", "write:en", "translation.model",
+        "state.load", "state.save",
+    ):
+        assert spans[name]["count"] >= 1, name
+    assert health["trace"]["counters"]["translation.cache_miss"] >= 1
+
+    trace = json.loads(paths["FEED_TRACE_PATH"].read_text(encoding="utf-8"))
+    assert {event["name"] for event in trace["traceEvents"] if event["ph"] == "X"} == set(spans)
+
+
+def test_network_fetch_span_is_attributed_to_the_executor_thread() -> None:
+    tracer = tracing.Tracer(record_events=True)
+    tracing.activate(tracer)
+
+    def network_provider() -> list[dict[str, Any]]:
+        return []
+
+    report = RunReport([("network_provider", True)])
+    with tracing.span("collect"):
+        build_feed._run_network_fetchers(
+            [network_provider], {network_provider: "network_provider"},
+            {network_provider: None}, report, lambda *_args: None,
+        )
+
+    events = {event["name"]: event for event in tracer.chrome_trace()["traceEvents"] if event["ph"] == "X"}
+    assert events["provider.fetch:network_provider"]["tid"] != events["collect"]["tid"]
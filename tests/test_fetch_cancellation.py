@@ -0,0 +1,93 @@
+"""Cooperative fetch cancellation (``src/utils/cancellation.py``).
+
+The orchestrator hands every network fetch a token carrying its deadline;
+the HTTP helpers bound socket timeouts by it and stop reading once it is
+cancelled, and the collect phase returns without joining stuck workers.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src import build_feed
+from src.feed.reporting import RunReport
+from src.utils import cancellation
+from src.utils.cancellation import CancelToken, FetchCancelled, run_with_token
+from src.utils.http import read_response_safe
+
+
+def test_bound_timeout_caps_socket_timeouts_at_the_deadline() -> None:
+    assert cancellation.bound_timeout(10) == 10  # no token installed
+
+    token = CancelToken.with_timeout(2)
+    bounded = run_with_token(token, lambda: cancellation.bound_timeout((5.0, 30.0)))
+    assert isinstance(bounded, tuple)
+    assert 1.5 < bounded[0] <= 2.0 and 1.5 < bounded[1] <= 2.0
+    assert run_with_token(token, lambda: cancellation.bound_timeout(0.5)) == 0.5
+    assert run_with_token(CancelToken(), lambda: cancellation.bound_timeout(None)) is None
+
+    token.cancel("Timeout")
+    with pytest.raises(FetchCancelled, match="Timeout"):
+        run_with_token(token, lambda: cancellation.bound_timeout(10))
+
+
+def test_expired_deadline_counts_as_cancelled() -> None:
+    token = CancelToken(time.monotonic() - 1)
+    assert token.cancelled
+    assert token.remaining() == 0.0
+    with pytest.raises(FetchCancelled, match="Deadline"):
+        token.raise_if_cancelled()
+
+
+def test_sleep_wakes_up_on_cancellation() -> None:
+    token = CancelToken()
+    threading.Timer(0.05, token.cancel, args=("Timeout",)).start()
+    started = time.monotonic()
+    with pytest.raises(FetchCancelled):
+        run_with_token(token, lambda: cancellation.sleep(5))
+    assert time.monotonic() - started < 2
+
+
+def test_read_response_stops_at_the_next_chunk_once_cancelled() -> None:
+    token = CancelToken()
+    response = MagicMock()
+    response.headers = {}
+
+    def chunks(chunk_size: int) -> Any:
+        yield b"a" * chunk_size
+        token.cancel("Timeout")
+        yield b"b" * chunk_size
+        raise AssertionError("read past the cancellation checkpoint")
+
+    response.iter_content.side_effect = chunks
+    with pytest.raises(FetchCancelled):
+        run_with_token(token, lambda: read_response_safe(response))
+    response.close.assert_called()
+
+
+def test_collect_phase_does_not_wait_for_a_stuck_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(build_feed.feed_config, "PROVIDER_TIMEOUT", 1)
+    release = threading.Event()
+    seen: list[CancelToken | None] = []
+
+    def stuck_provider() -> list[dict[str, Any]]:
+        seen.append(cancellation.current_token())
+        release.wait(10)  # ignores every cancellation checkpoint
+        return []
+
+    try:
+        started = time.monotonic()
+        build_feed._run_network_fetchers(
+            [stuck_provider], {stuck_provider: "stuck_provider"},
+            {stuck_provider: None}, RunReport([]), lambda *_args: None,
+        )
+        assert time.monotonic() - started < 5
+        (token,) = seen
+        assert token is not None and token.cancelled
+        assert token.reason == "Timeout"
+    finally:
+        release.set()
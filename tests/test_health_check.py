@@ -0,0 +1,142 @@
+"""Concurrent source checks and ``--probe`` mode of ``scripts/health_check.py``."""
+from __future__ import annotations
+
+import time
+from typing import Any
+from urllib.parse import quote
+
+import pytest
+
+from scripts import health_check
+from scripts.health_check import Check
+
+
+def test_full_mode_runs_the_updaters_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    def slow_check(name: str, script: str) -> Check:
+        time.sleep(0.3)
+        return Check(name, ok=True, summary=script)
+
+    monkeypatch.setattr(health_check, "check_source", slow_check)
+    started = time.monotonic()
+    checks = health_check.check_sources(probe=False)
+
+    assert time.monotonic() - started < 0.6
+    assert [(check.name, check.summary) for check in checks] == health_check.UPDATERS
+
+
+def test_probe_mode_reports_failures_per_source(monkeypatch: pytest.MonkeyPatch) -> None:
+    def broken() -> str:
+        raise ValueError("Antwort ist kein RSS-Dokument")
+
+    monkeypatch.setattr(
+        health_check,
+        "PROBES",
+        {"Wiener Linien": lambda: "3 Störungsmeldungen", "ÖBB": broken, "Baustellen (OGD)": lambda: "2 Layer antworten"},
+    )
+    checks = {check.name: check for check in health_check.check_sources(probe=True)}
+
+    assert checks["Wiener Linien"].ok and checks["Wiener Linien"].summary.endswith("3 Störungsmeldungen")
+    assert not checks["ÖBB"].ok
+    assert checks["ÖBB"].detail == "ValueError: Antwort ist kein RSS-Dokument"
+    assert checks["Baustellen (OGD)"].ok
+
+
+def test_oebb_probe_stops_reading_after_the_feed_head(monkeypatch: pytest.MonkeyPatch) -> None:
+    import utils.http
+
+    delivered: list[int] = []
+
+    def fake_fetch(_session: Any, _url: str, *, on_chunk: Any, **_kwargs: Any) -> bytes:
+        on_chunk(b'<?xml version="1.0"?><rss version="2.0"><channel><title>OEBB</title>')
+        for _ in range(100):
+            delivered.append(1)
+            on_chunk(b"<item>" + b"x" * 16 * 1024 + b"</item>")
+        return b""
+
+    monkeypatch.setattr(utils.http, "fetch_content_safe", fake_fetch)
+    assert health_check._probe_oebb() == "RSS-Kopf gelesen (64 KiB)"
+    assert len(delivered) == 4
+
+
+def test_wl_probe_counts_the_traffic_infos(monkeypatch: pytest.MonkeyPatch) -> None:
+    import utils.http
+
+    requests_seen: list[tuple[str, Any]] = []
+
+    def fake_fetch(_session: Any, url: str, *, params: Any, **_kwargs: Any) -> bytes:
+        requests_seen.append((url, params))
+        return b'{"data": {"trafficInfos": [{"name": "a"}, {"name": "b"}, {"name": "c"}]}, "message": {}}'
+
+    monkeypatch.setattr(utils.http, "fetch_content_safe", fake_fetch)
+    assert health_check._probe_wl() == "3 Störungsmeldungen"
+    ((url, params),) = requests_seen
+    assert url.endswith("/trafficInfoList") and params == [("name", "stoerunglang")]
+
+    monkeypatch.setattr(utils.http, "fetch_content_safe", lambda *_args, **_kwargs: b'{"data": {}}')
+    assert health_check._probe_wl() == "keine Störungsmeldungen"
+
+
+def test_wl_probe_rejects_a_payload_without_data(monkeypatch: pytest.MonkeyPatch) -> None:
+    import utils.http
+
+    monkeypatch.setattr(
+        utils.http, "fetch_content_safe", lambda *_args, **_kwargs: b'{"message": {"value": "Wartung"}}'
+    )
+    with pytest.raises(ValueError, match="kein OGD-Objekt"):
+        health_check._probe_wl()
+
+
+def _fake_wfs(rejected_formats: set[str], payload: bytes) -> tuple[Any, list[str]]:
+    """``fetch_content_safe`` stand-in; *rejected_formats* get an XML exception report."""
+    urls: list[str] = []
+
+    def fake_fetch(_session: Any, url: str, *, params: Any, **_kwargs: Any) -> bytes:
+        urls.append(url)
+        assert params == {"count": "1", "maxFeatures": "1"}
+        if any(f"outputFormat={quote(token, safe='/')}" in url for token in rejected_formats):
+            return b"<ows:ExceptionReport/>"
+        return payload
+
+    return fake_fetch, urls
+
+
+def test_baustellen_probe_asks_every_layer_for_one_feature(monkeypatch: pytest.MonkeyPatch) -> None:
+    import utils.http
+    from scripts import update_baustellen_cache as baustellen
+
+    first_format, second_format = baustellen.OUTPUT_FORMAT_CANDIDATES[:2]
+    fake_fetch, urls = _fake_wfs({first_format}, b'{"type": "FeatureCollection", "features": [{"type": "Feature"}]}')
+    monkeypatch.setattr(utils.http, "fetch_content_safe", fake_fetch)
+    monkeypatch.delenv("BAUSTELLEN_DATA_URL", raising=False)
+
+    assert health_check._probe_baustellen() == f"{len(baustellen.BAUSTELLEN_TYPENAMES)} Layer antworten"
+    # The rejected token falls through to the next candidate, per layer.
+    assert len(urls) == 2 * len(baustellen.BAUSTELLEN_TYPENAMES)
+    for typename in baustellen.BAUSTELLEN_TYPENAMES:
+        layer_urls = [url for url in urls if f"typeName={typename}" in url]
+        assert len(layer_urls) == 2
+        assert f"outputFormat={quote(second_format, safe='/')}" in layer_urls[1]
+        assert all(url.startswith("https://data.wien.gv.at/") for url in layer_urls)
+
+
+def test_baustellen_probe_fails_when_no_format_yields_features(monkeypatch: pytest.MonkeyPatch) -> None:
+    import utils.http
+    from scripts import update_baustellen_cache as baustellen
+
+    fake_fetch, urls = _fake_wfs(set(), b'{"type": "ExceptionReport", "exceptions": []}')
+    monkeypatch.setattr(utils.http, "fetch_content_safe", fake_fetch)
+    monkeypatch.delenv("BAUSTELLEN_DATA_URL", raising=False)
+
+    with pytest.raises(ValueError, match=f"Layer {baustellen.BAUSTELLEN_TYPENAMES[0]} liefert keine FeatureCollection"):
+        health_check._probe_baustellen()
+    assert len(urls) == len(baustellen.OUTPUT_FORMAT_CANDIDATES)
+
+
+def test_main_prints_the_probe_report(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setattr(health_check, "PROBES", dict.fromkeys(health_check.PROBES, lambda: "ok"))
+    monkeypatch.setattr(health_check, "check_feed_freshness", lambda now: Check("Feed-Build", ok=True, summary="OK"))
+    monkeypatch.setattr(health_check, "check_stations", lambda now: Check("Stationsverzeichnis", ok=True, summary="OK"))
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+
+    assert health_check.main(["--probe"]) == 0
+    assert "QUELLEN (Probe)" in capsys.readouterr().out
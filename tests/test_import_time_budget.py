@@ -0,0 +1,96 @@
+"""Import budget per CLI subcommand, counted in loaded modules.
+
+Each case runs a fresh interpreter that imports ``src.cli``, parses the
+subcommand and resolves the lazy handler dependencies that subcommand
+uses. Script-dispatching subcommands must not load the feed pipeline,
+``requests`` or dnspython, and no import may start a thread. The budget
+is the number of modules the CLI import pulls in rather than wall-clock
+time, so a loaded CI runner cannot trip it: the limits are several times
+the current count and only a structural regression — an eager heavy
+import creeping back — exceeds them. ``python -X importtime`` shows where
+the time goes when a budget does trip.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+_FEED_STACK = ("src.build_feed", "src.feed", "requests", "dns")
+_OPTIONAL_HEAVY = ("openpyxl", "transformers", "torch")
+
+# argv, lazy ``cli`` attributes the handler resolves, budget in newly
+# loaded modules (currently ~11 / ~51 / ~376), modules that must stay
+# unloaded.
+_CASES: list[tuple[list[str], tuple[str, ...], int, tuple[str, ...]]] = [
+    (["cache", "update"], (), 40, (*_FEED_STACK, *_OPTIONAL_HEAVY)),
+    (["stations", "update", "all"], (), 40, (*_FEED_STACK, *_OPTIONAL_HEAVY)),
+    (["tokens", "verify"], (), 40, (*_FEED_STACK, *_OPTIONAL_HEAVY)),
+    (["checks"], (), 40, (*_FEED_STACK, *_OPTIONAL_HEAVY)),
+    (["config", "wizard"], (), 40, (*_FEED_STACK, *_OPTIONAL_HEAVY)),
+    (["security", "scan"], (), 40, (*_FEED_STACK, *_OPTIONAL_HEAVY)),
+    (["stations", "validate"], ("validate_stations",), 150, (*_FEED_STACK, *_OPTIONAL_HEAVY)),
+    (["feed", "lint"], ("build_feed_module",), 1000, _OPTIONAL_HEAVY),
+]
+
+_CHILD = """
+import json, sys, threading
+before = set(sys.modules)
+from src import cli
+cli.build_parser().parse_args({argv!r})
+for name in {lazy!r}:
+    cli._lazy(name)
+print(json.dumps({{
+    "loaded": len(set(sys.modules) - before),
+    "modules": sorted(name for name in {watch!r} if name in sys.modules),
+    "threads": threading.active_count(),
+}}))
+"""
+
+
+def _run_child(argv: list[str], lazy: tuple[str, ...], watch: tuple[str, ...]) -> dict[str, object]:
+    env = dict(os.environ)
+    # The feed config validates FEED_LINK at import; keep the child
+    # offline and deterministic regardless of the caller's environment.
+    env.pop("FEED_LINK", None)
+    code = _CHILD.format(argv=argv, lazy=lazy, watch=watch)
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=50,
+        check=True,
+    )
+    report: dict[str, object] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return report
+
+
+@pytest.mark.parametrize(("argv", "lazy", "budget", "forbidden"), _CASES, ids=[" ".join(case[0]) for case in _CASES])
+def test_subcommand_import_budget(
+    argv: list[str], lazy: tuple[str, ...], budget: int, forbidden: tuple[str, ...]
+) -> None:
+    report = _run_child(argv, lazy, forbidden)
+
+    assert report["modules"] == [], f"{' '.join(argv)} imported {report['modules']}"
+    assert report["threads"] == 1, "importing the CLI must not start threads"
+    loaded = report["loaded"]
+    assert isinstance(loaded, int)
+    assert 0 < loaded <= budget, f"{' '.join(argv)}: {loaded} modules > {budget}"
+
+
+def test_lazy_cli_attribute_is_cached_and_unknown_names_raise() -> None:
+    from src import cli
+
+    first = cli.validate_stations
+    assert cli._lazy("validate_stations") is first
+    assert cli.__dict__["validate_stations"] is first
+    with pytest.raises(AttributeError):
+        cli.__getattr__("not_a_lazy_attribute")
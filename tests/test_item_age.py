@@ -58,6 +58,7 @@ def test_main_filters_items_older_than_max(
         deletions: Any = None,
         *,
         lang: str = "de",
+        shard_index: Any = None,
     ) -> str:
         # Capture only on the first (German) call; the build pipeline now
         # also invokes ``_make_rss`` a second time for the EN mirror.
@@ -106,6 +107,7 @@ def test_main_filters_items_older_than_absolute(
         deletions: Any = None,
         *,
         lang: str = "de",
+        shard_index: Any = None,
     ) -> str:
         # Capture only on the first (German) call; the build pipeline now
         # also invokes ``_make_rss`` a second time for the EN mirror.
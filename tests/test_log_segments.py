@@ -0,0 +1,148 @@
+"""Per-day log segments (``src/feed/logging.py``).
+
+The file handlers write one segment per local day, pruning deletes whole
+expired segments without reading them, and the reader stitches the
+retained segments back together in write order.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src import cli
+from src.feed import logging as feed_logging
+from src.feed import reporting
+from src.feed.config import LOG_TIMEZONE
+from src.feed.logging import (
+    DailySegmentHandler,
+    log_segment_path,
+    log_segments,
+    prune_log_segments,
+    read_log_segments,
+)
+
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=LOG_TIMEZONE)
+
+
+def _record(message: str, when: datetime) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.ERROR, __file__, 1, message, None, None)
+    record.created = when.timestamp()
+    return record
+
+
+def _write_segment(base: Path, day: date, text: str, backup: int = 0) -> Path:
+    path = log_segment_path(base, day)
+    if backup:
+        path = path.with_name(f"{path.name}.{backup}")
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_handler_switches_segment_at_local_midnight(tmp_path: Path) -> None:
+    base = tmp_path / "errors.log"
+    handler = DailySegmentHandler(base, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        assert list(tmp_path.iterdir()) == []  # segments are created lazily
+        handler.handle(_record("late", datetime(2026, 3, 1, 23, 59, tzinfo=LOG_TIMEZONE)))
+        handler.handle(_record("early", datetime(2026, 3, 2, 0, 1, tzinfo=LOG_TIMEZONE)))
+    finally:
+        handler.close()
+
+    assert log_segment_path(base, date(2026, 3, 1)).read_text(encoding="utf-8") == "late\n"
+    assert log_segment_path(base, date(2026, 3, 2)).read_text(encoding="utf-8") == "early\n"
+    assert log_segment_path(base, date(2026, 3, 2)).name == "errors.2026-03-02.log"
+
+
+def test_size_rotation_stays_within_the_day(tmp_path: Path) -> None:
+    base = tmp_path / "diagnostics.log"
+    handler = DailySegmentHandler(base, maxBytes=64, backupCount=10, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        for index in range(6):
+            handler.handle(_record(f"record {index:02d} " + "x" * 30, NOW))
+    finally:
+        handler.close()
+
+    segments = log_segments(base)
+    assert {day for day, _path in segments} == {NOW.date()}
+    assert segments[-1][1] == log_segment_path(base, NOW.date())
+    assert read_log_segments(base).splitlines() == [f"record {index:02d} " + "x" * 30 for index in range(6)]
+
+
+def test_prune_deletes_expired_segments_without_reading_them(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    base = tmp_path / "errors.log"
+    expired = [
+        _write_segment(base, date(2026, 3, 1), "old\n"),
+        _write_segment(base, date(2026, 3, 2), "old\n", backup=1),
+    ]
+    kept = [_write_segment(base, date(2026, 3, 3), "edge\n"), _write_segment(base, date(2026, 3, 10), "today\n")]
+    unrelated = tmp_path / "errors.notes.txt"
+    unrelated.write_text("keep", encoding="utf-8")
+
+    def _no_reads(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("pruning must not read log contents")
+
+    monkeypatch.setattr(feed_logging, "read_capped_text", _no_reads)
+    assert prune_log_segments(base, now=NOW, keep_days=7) == 2
+
+    assert not any(path.exists() for path in expired)
+    assert all(path.exists() for path in kept)
+    assert unrelated.exists()
+    assert prune_log_segments(base, now=NOW, keep_days=0) == 0
+
+
+def test_prune_expires_pre_segment_files_by_mtime(tmp_path: Path) -> None:
+    base = tmp_path / "errors.log"
+    legacy, legacy_backup = base, tmp_path / "errors.log.1"
+    for path in (legacy, legacy_backup):
+        path.write_text("2026-02-01 10:00:00,000 ERROR old\n", encoding="utf-8")
+    stale = (NOW - timedelta(days=30)).timestamp()
+    os.utime(legacy_backup, (stale, stale))
+
+    assert prune_log_segments(base, now=NOW, keep_days=7) == 1
+    assert legacy.exists()
+    assert not legacy_backup.exists()
+
+
+def test_reader_concatenates_in_write_order_and_respects_the_budget(tmp_path: Path) -> None:
+    base = tmp_path / "diagnostics.log"
+    _write_segment(base, date(2026, 3, 8), "a\n")
+    _write_segment(base, date(2026, 3, 9), "b1\n", backup=2)
+    _write_segment(base, date(2026, 3, 9), "b2\n", backup=1)
+    _write_segment(base, date(2026, 3, 9), "b3\n")
+    _write_segment(base, date(2026, 3, 10), "c\n")
+
+    assert read_log_segments(base) == "a\nb1\nb2\nb3\nc\n"
+    assert read_log_segments(base, since=date(2026, 3, 9)) == "b1\nb2\nb3\nc\n"
+    # Newest segments win when the budget runs out.
+    assert read_log_segments(base, max_bytes=7) == "b3\nc\n"
+    assert read_log_segments(tmp_path / "missing.log") == ""
+
+
+def test_run_report_points_at_the_current_error_segment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(reporting, "error_log_path", tmp_path / "errors.log")
+    report = reporting.RunReport([])
+    expected_day = report.started_at.astimezone(LOG_TIMEZONE).date()
+    assert report.error_log_segment() == log_segment_path(tmp_path / "errors.log", expected_day)
+
+
+def test_cli_prints_the_requested_segments(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    base = tmp_path / "errors.log"
+    today = datetime.now(LOG_TIMEZONE).date()
+    _write_segment(base, today - timedelta(days=3), "older\n")
+    _write_segment(base, today, "current\n")
+    monkeypatch.setattr(feed_logging, "error_log_path", base)
+
+    assert cli.main(["feed", "logs", "--errors", "--days", "1"]) == 0
+    assert capsys.readouterr().out == "current\n"
+    assert cli.main(["feed", "logs", "--errors"]) == 0
+    assert capsys.readouterr().out == "older\ncurrent\n"
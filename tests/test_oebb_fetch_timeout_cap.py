@@ -45,7 +45,7 @@ def test_fetch_events_clamps_huge_timeout_to_cap(
     the cap collapses the value to ``MAX_OEBB_FETCH_TIMEOUT``."""
     recorded: dict[str, Any] = {}
 
-    def fake_fetch_xml(url: str, timeout: Any) -> ET.Element:
+    def fake_fetch_xml(url: str, timeout: Any, **_kwargs: Any) -> ET.Element:
         recorded["timeout"] = timeout
         root = ET.Element("rss")
         ET.SubElement(root, "channel")
@@ -65,7 +65,7 @@ def test_fetch_events_at_cap_passes_cap_through(
     cap clamps to its documented value, not silently to a tighter bound."""
     recorded: dict[str, Any] = {}
 
-    def fake_fetch_xml(url: str, timeout: Any) -> ET.Element:
+    def fake_fetch_xml(url: str, timeout: Any, **_kwargs: Any) -> ET.Element:
         recorded["timeout"] = timeout
         root = ET.Element("rss")
         ET.SubElement(root, "channel")
@@ -85,7 +85,7 @@ def test_fetch_events_below_cap_passes_through(
     and tighter operator overrides)."""
     recorded: dict[str, Any] = {}
 
-    def fake_fetch_xml(url: str, timeout: Any) -> ET.Element:
+    def fake_fetch_xml(url: str, timeout: Any, **_kwargs: Any) -> ET.Element:
         recorded["timeout"] = timeout
         root = ET.Element("rss")
         ET.SubElement(root, "channel")
@@ -104,7 +104,7 @@ def test_fetch_events_default_timeout_unchanged(
     through unchanged so the production call sites are unaffected."""
     recorded: dict[str, Any] = {}
 
-    def fake_fetch_xml(url: str, timeout: Any) -> ET.Element:
+    def fake_fetch_xml(url: str, timeout: Any, **_kwargs: Any) -> ET.Element:
         recorded["timeout"] = timeout
         root = ET.Element("rss")
         ET.SubElement(root, "channel")
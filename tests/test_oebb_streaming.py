@@ -0,0 +1,221 @@
+"""Streaming ÖBB RSS parsing and the anchor-word pre-check.
+
+``_fetch_xml`` feeds the body into the defusedxml parser chunk by chunk
+and hands every finished ``<channel><item>`` to the collector while the
+download is still running. ``text_may_reference_region`` lets
+``_build_item_from_xml`` drop items that cannot pass ``_is_relevant``
+before the route and station extraction runs.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+from defusedxml import ElementTree as ET
+
+import src.providers.oebb as oebb
+from src.utils import stations
+
+ITEM = """<item>
+<title><![CDATA[ Bauarbeiten in Wien Floridsdorf {n} ]]></title>
+<link>https://fahrplan.oebb.at/bin/help.exe/dn?L=vs_scotty&amp;tpl=showmap_external&amp;</link>
+<guid isPermaLink="false">stream-{n}</guid>
+<pubDate>Mon, 02 Feb 2026 08:04:19 +0000</pubDate>
+<description><![CDATA[ Wegen Bauarbeiten in Wien können keine S-Bahnen fahren. ]]></description>
+</item>
+"""
+
+
+def _rss(count: int) -> bytes:
+    items = "".join(ITEM.format(n=n) for n in range(count))
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n<rss version="2.0"><channel>'
+        f"<title>ÖBB - Streckeninfo</title>{items}</channel></rss>"
+    ).encode()
+
+
+class _Session:
+    def __enter__(self) -> _Session:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+
+def _serve(
+    monkeypatch: pytest.MonkeyPatch,
+    bodies: list[bytes | BaseException],
+    chunk_size: int = 256,
+    on_chunk_seen: Callable[[], None] | None = None,
+) -> None:
+    """Stream *bodies* (one per attempt) into ``on_chunk`` like ``read_response_safe``."""
+    attempts: Iterator[bytes | BaseException] = iter(bodies)
+
+    def fake_fetch(_session: Any, _url: str, on_chunk: Callable[[bytes], None], **_kwargs: Any) -> bytes:
+        body = next(attempts)
+        if isinstance(body, BaseException):
+            raise body
+        for start in range(0, len(body), chunk_size):
+            on_chunk(body[start:start + chunk_size])
+            if on_chunk_seen is not None:
+                on_chunk_seen()
+        return b""
+
+    monkeypatch.setattr(oebb, "session_with_retries", lambda *_a, **_kw: _Session())
+    monkeypatch.setattr(oebb, "fetch_content_safe", fake_fetch)
+
+
+def test_items_are_processed_while_downloading_and_dropped_from_the_tree(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collector = oebb._ItemCollector()
+    progress: list[int] = []
+    _serve(monkeypatch, [_rss(5)], on_chunk_seen=lambda: progress.append(collector.seen))
+
+    root = oebb._fetch_xml("https://fahrplan.oebb.at/rss", collector=collector)
+
+    assert root is not None
+    channel = root.find("channel")
+    assert channel is not None
+    assert channel.findall("item") == []
+    assert channel.findtext("title") == "ÖBB - Streckeninfo"
+    assert collector.seen == 5
+    # Items reached the collector before the last chunk had arrived.
+    assert 0 < progress[len(progress) // 2] < 5
+
+
+def test_fetch_events_matches_whole_document_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = _rss(3)
+    _serve(monkeypatch, [body])
+    streamed = oebb.fetch_events()
+
+    monkeypatch.setattr(oebb, "_fetch_xml", lambda *_a, **_kw: ET.fromstring(body))
+    assert oebb.fetch_events() == streamed
+    assert [item["guid"] for item in streamed] == ["stream-0", "stream-1", "stream-2"]
+
+
+def test_retry_restarts_the_collector(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = _rss(4)
+    failing = iter([None])
+
+    def fail_midway() -> None:
+        if next(failing, True) is None:
+            raise requests.ConnectionError("connection reset")
+
+    _serve(monkeypatch, [body, body], chunk_size=len(body) // 2 + 1, on_chunk_seen=fail_midway)
+
+    events = oebb.fetch_events()
+    assert [item["guid"] for item in events] == [f"stream-{n}" for n in range(4)]
+
+
+def test_malformed_stream_yields_no_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    _serve(monkeypatch, [_rss(3)[:-40] + b"</broken>"])
+    assert oebb.fetch_events() == []
+
+
+def test_failing_item_is_skipped_without_dropping_the_rest(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    original = oebb._build_item_from_xml
+
+    def build(item: Any) -> Any:
+        if item.findtext("guid") == "stream-1":
+            raise ValueError("bad pubDate")
+        return original(item)
+
+    monkeypatch.setattr(oebb, "_build_item_from_xml", build)
+    _serve(monkeypatch, [_rss(3)])
+
+    with caplog.at_level("WARNING", logger=oebb.log.name):
+        events = oebb.fetch_events()
+
+    assert [item["guid"] for item in events] == ["stream-0", "stream-2"]
+    assert "Item 2 übersprungen (ValueError" in caplog.text
+
+
+def test_entity_declarations_stay_forbidden(monkeypatch: pytest.MonkeyPatch) -> None:
+    bomb = (
+        b'<?xml version="1.0"?><!DOCTYPE rss [<!ENTITY a "aaaaaaaaaa">]>'
+        b"<rss><channel><item><title>&a;</title></item></channel></rss>"
+    )
+    _serve(monkeypatch, [bomb])
+    assert oebb.fetch_events() == []
+
+
+@pytest.fixture
+def directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    data = [
+        {"name": "Wien Floridsdorf", "in_vienna": True, "pendler": False, "bst_code": "Fl", "aliases": ["Floridsdorf"]},
+        {"name": "Wien Süßenbrunn", "in_vienna": True, "pendler": False, "bst_code": "Sue"},
+        {"name": "Mödling", "in_vienna": False, "pendler": True, "aliases": ["Moedling"]},
+        {"name": "Tulln Hauptbahnhof", "in_vienna": False, "pendler": True},
+        {"name": "Linz Hauptbahnhof", "in_vienna": False, "pendler": False, "aliases": ["Linz"]},
+        {"name": "Wels Hauptbahnhof", "in_vienna": False, "pendler": False, "aliases": ["Wels"]},
+    ]
+    path = tmp_path / "stations.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    monkeypatch.setattr(stations, "_STATIONS_PATH", path)
+
+    def clear() -> None:
+        for value in vars(stations).values():
+            if callable(getattr(value, "cache_clear", None)):
+                value.cache_clear()
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.mark.usefixtures("directory")
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Bauarbeiten in Floridsdorf", True),
+        ("Störung zwischen Moedling und Baden", True),
+        ("Tulln Hbf: Gleissperre", True),
+        ("Halt in Sue entfällt", True),
+        ("Aufzug in der Station Wien Mitte", True),
+        ("U6 steht", True),
+        ("Linz Hbf ↔ Wels Hbf", False),
+        ("Gmünd NÖ ↔ Ceske Velenice", False),
+        ("", False),
+    ],
+)
+def test_anchor_words_cover_every_regional_reference(text: str, expected: bool) -> None:
+    assert stations.text_may_reference_region(text) is expected
+
+
+@pytest.mark.usefixtures("directory")
+@pytest.mark.parametrize(
+    ("title", "description", "relevant"),
+    [
+        ("Floridsdorf ↔ Mödling", "", True),
+        ("Bauarbeiten", "Zwischen Mödling und Wien Floridsdorf fahren keine Züge.", True),
+        ("Störung Sue", "Halt in Sue entfällt.", True),
+        ("Linz ↔ Wels", "Schienenersatzverkehr zwischen Linz und Wels.", False),
+        ("Sturm", "Linz und Wels betroffen.", False),
+    ],
+)
+def test_pre_check_agrees_with_the_relevance_filter(title: str, description: str, relevant: bool) -> None:
+    assert oebb._is_relevant(title, description) is relevant
+    assert stations.text_may_reference_region(f"{title} {description}") is relevant
+
+
+def test_pre_check_skips_route_extraction(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def route_title(title: str, _desc: str) -> str:
+        calls.append(title)
+        return title
+
+    monkeypatch.setattr(oebb, "_apply_route_title", route_title)
+    elem = ET.fromstring(
+        "<item><title>Bauarbeiten: Linz ↔ Wels</title><guid>x</guid>"
+        "<description>Keine Züge zwischen Linz und Wels.</description></item>"
+    )
+    assert oebb._build_item_from_xml(elem) is None
+    assert calls == []
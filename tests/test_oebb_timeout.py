@@ -10,7 +10,7 @@ import src.providers.oebb as oebb
 def test_fetch_events_passes_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     recorded = {}
 
-    def fake_fetch_xml(url: str, timeout: Any) -> ET.Element:
+    def fake_fetch_xml(url: str, timeout: Any, **_kwargs: Any) -> ET.Element:
         recorded["timeout"] = timeout
         root = ET.Element("rss")
         ET.SubElement(root, "channel")
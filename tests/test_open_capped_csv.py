@@ -0,0 +1,106 @@
+"""Tests for the streaming capped CSV reader in ``src.utils.files``."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.files import CappedCsvError, detect_csv_delimiter, open_capped_csv
+
+
+def test_rows_expose_exact_and_fuzzy_lookup(tmp_path: Path) -> None:
+    path = tmp_path / "haltepunkte.csv"
+    path.write_text(
+        "StopID;DIVA;StopText;Latitude\n"
+        "1;60200001; Karlsplatz ;48.2\n"
+        "\n"
+        "2;60200002;Stephansplatz\n",
+        encoding="utf-8",
+    )
+
+    with open_capped_csv(path, delimiter=";") as reader:
+        assert reader is not None
+        assert reader.fieldnames == ("StopID", "DIVA", "StopText", "Latitude")
+        rows = list(reader)
+
+    assert len(rows) == 2
+    assert rows[0].field("StopText") == " Karlsplatz "
+    assert rows[0].get("stop_text", "NAME") == "Karlsplatz"
+    assert rows[0].get("LATITUDE") == "48.2"
+    # Short rows behave like ``csv.DictReader`` (missing → ``None``).
+    assert rows[1].field("Latitude") is None
+    assert rows[1].get("Latitude") == ""
+    assert rows[1].field("Unknown") is None
+
+
+def test_delimiter_is_detected_once_from_sample(tmp_path: Path) -> None:
+    path = tmp_path / "vor.csv"
+    path.write_text(
+        "﻿StopPointId,StopPointName\n"
+        "430470800,Wien Hauptbahnhof\n",
+        encoding="utf-8",
+    )
+
+    with open_capped_csv(path, encoding="utf-8-sig") as reader:
+        assert reader is not None
+        assert reader.delimiter == ","
+        rows = [(row.field("StopPointId"), row.field("StopPointName")) for row in reader]
+
+    assert rows == [("430470800", "Wien Hauptbahnhof")]
+    assert detect_csv_delimiter("a;b,c") == ";"
+    assert detect_csv_delimiter("plain") == ";"
+
+
+def test_rows_spanning_the_sample_boundary_stay_intact(tmp_path: Path) -> None:
+    path = tmp_path / "stops.txt"
+    lines = ["stop_id,stop_name"] + [f"S{i},\"Halt, Nr. {i}\"" for i in range(2000)]
+    path.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
+
+    with open_capped_csv(path, delimiter=",") as reader:
+        assert reader is not None
+        parsed = [(row.field("stop_id"), row.field("stop_name")) for row in reader]
+
+    assert parsed == [(f"S{i}", f"Halt, Nr. {i}") for i in range(2000)]
+
+
+def test_missing_and_oversized_files_yield_none(tmp_path: Path) -> None:
+    with open_capped_csv(tmp_path / "missing.csv") as reader:
+        assert reader is None
+
+    path = tmp_path / "huge.csv"
+    path.write_text("stop_id\n" + "x" * 4096, encoding="utf-8")
+    with open_capped_csv(path, 1024) as reader:
+        assert reader is None
+
+
+def test_cap_is_enforced_while_streaming(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A file whose ``fstat`` under-reports its size (FIFO, character
+    device) is stopped by the incremental cap instead of being buffered."""
+    path = tmp_path / "special.csv"
+    path.write_text("stop_id\n" + "S1\n" * 20_000, encoding="utf-8")
+    real_fstat = os.fstat
+    monkeypatch.setattr(
+        os,
+        "fstat",
+        lambda fd: SimpleNamespace(st_size=0, st_mode=real_fstat(fd).st_mode),
+    )
+
+    with open_capped_csv(path, 16 * 1024) as reader:
+        assert reader is not None
+        with pytest.raises(CappedCsvError):
+            for _row in reader:
+                pass
+
+
+def test_undecodable_payload_raises_csv_error(tmp_path: Path) -> None:
+    path = tmp_path / "latin1.csv"
+    path.write_bytes(b"stop_id\n" + b"S1\n" * 5000 + b"\xff\xfe\n")
+
+    with open_capped_csv(path) as reader:
+        assert reader is not None
+        with pytest.raises(CappedCsvError):
+            list(reader)
@@ -0,0 +1,181 @@
+"""Tests for the opt-in run profiler (``src/utils/profiling.py``)."""
+from __future__ import annotations
+
+import gzip
+import logging
+import marshal
+import os
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src import cli
+from src.utils import profiling
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(200))
+
+
+@pytest.mark.parametrize(
+    ("env", "explicit", "expected"),
+    [
+        ("", None, frozenset()),
+        ("0", None, frozenset()),
+        ("1", None, frozenset({"cprofile", "sample"})),
+        (" Sample ", None, frozenset({"sample"})),
+        ("sample", "cprofile", frozenset({"cprofile"})),
+        ("all", "off", frozenset()),
+    ],
+)
+def test_profile_modes_prefers_explicit_flag_over_env(
+    monkeypatch: pytest.MonkeyPatch, env: str, explicit: str | None, expected: frozenset[str]
+) -> None:
+    monkeypatch.setenv(profiling.PROFILE_ENV, env)
+    assert profiling.profile_modes(explicit) == expected
+
+
+def test_unknown_profile_mode_is_logged_and_disabled(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING, logger="src.utils.profiling"):
+        assert profiling.profile_modes("flame\u202e") == frozenset()
+    assert "Profiling-Modus" in caplog.text
+    assert "\u202e" not in caplog.text
+
+
+def test_disabled_profiling_writes_nothing(tmp_path: Path) -> None:
+    target = tmp_path / "profiles"
+    with profiling.profiled("feed-build", frozenset(), directory=target) as written:
+        _busy(0.01)
+    assert written == []
+    assert not target.exists()
+
+
+def test_profiled_writes_pstats_and_collapsed_stacks_of_all_threads(tmp_path: Path) -> None:
+    worker = threading.Thread(target=_busy, args=(0.3,), name="provider-worker")
+    with profiling.profiled(
+        "feed build/../x", frozenset({"cprofile", "sample"}), directory=tmp_path, interval=0.001
+    ) as written:
+        worker.start()
+        _busy(0.3)
+        worker.join()
+
+    assert [path.parent for path in written] == [tmp_path, tmp_path]
+    pstats_path, collapsed_path = written
+    assert pstats_path.name.startswith("feed_build_.._x-")
+    assert pstats_path.name.endswith(f"-{os.getpid()}.pstats.gz")
+
+    with gzip.open(pstats_path, "rb") as handle:
+        stats = marshal.loads(handle.read())  # noqa: S302 - artefact written above
+    assert any(func_name == "_busy" for (_file, _line, func_name) in stats)
+
+    lines = collapsed_path.read_text(encoding="utf-8").splitlines()
+    assert lines
+    roots = {line.split(";", 1)[0] for line in lines}
+    assert {"MainThread", "provider-worker"} <= roots
+    assert not any(root == "profile-sampler" for root in roots)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("_busy (tests/test_profiling.py:" in line for line in lines)
+
+
+def test_show_prints_the_top_entries(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with profiling.profiled("show", frozenset({"cprofile"}), directory=tmp_path) as written:
+        _busy(0.01)
+
+    assert profiling.main(["show", str(written[0]), "--limit", "3"]) == 0
+    assert "cumulative" in capsys.readouterr().out
+
+
+def test_collapsed_output_drops_the_rarest_stacks_beyond_the_cap() -> None:
+    sampler = profiling.StackSampler()
+    sampler._counts.update({"MainThread;hot": 50, "MainThread;warm": 5, "MainThread;cold": 1})
+
+    text = sampler.collapsed(max_bytes=len("MainThread;hot 50\nMainThread;warm 5\n"))
+
+    assert text.splitlines() == ["MainThread;hot 50", "MainThread;warm 5", "[truncated] 1"]
+
+
+def test_profile_directory_is_rotated_by_count_and_size(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for index in range(5):
+        path = tmp_path / f"old-{index}.collapsed.txt"
+        path.write_text("x" * 100, encoding="utf-8")
+        os.utime(path, (1_000 + index, 1_000 + index))
+    unrelated = tmp_path / "notes.txt"
+    unrelated.write_text("keep", encoding="utf-8")
+    monkeypatch.setattr(profiling, "MAX_PROFILE_FILES", 3)
+
+    with profiling.profiled("new", frozenset({"sample"}), directory=tmp_path) as written:
+        pass
+
+    remaining = sorted(path.name for path in tmp_path.iterdir())
+    assert remaining == sorted([written[0].name, "old-3.collapsed.txt", "old-4.collapsed.txt", "notes.txt"])
+
+    profiling._prune(tmp_path, max_files=10, max_bytes=150)
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([written[0].name, "old-4.collapsed.txt", "notes.txt"])
+
+
+def test_write_failure_does_not_fail_the_run(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    blocker = tmp_path / "profiles"
+    blocker.write_text("not a directory", encoding="utf-8")
+
+    with caplog.at_level(logging.WARNING, logger="src.utils.profiling"):
+        with profiling.profiled("feed-build", frozenset({"sample"}), directory=blocker) as written:
+            result = 42
+
+    assert result == 42
+    assert written == []
+    assert "Profil konnte nicht geschrieben werden" in caplog.text
+
+
+def test_run_profiled_main_parses_the_profile_flag(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(profiling, "DEFAULT_PROFILE_DIR", tmp_path)
+    monkeypatch.delenv(profiling.PROFILE_ENV, raising=False)
+
+    assert profiling.run_profiled_main("update_wl_cache", lambda: 3, []) == 3
+    assert list(tmp_path.iterdir()) == []
+
+    assert profiling.run_profiled_main("update_wl_cache", lambda: 0, ["--profile=cprofile"]) == 0
+    assert [path.name.split("-")[0] for path in tmp_path.iterdir()] == ["update_wl_cache"]
+
+    with pytest.raises(SystemExit) as excinfo:
+        profiling.run_profiled_main("update_wl_cache", lambda: 0, ["--verbose"])
+    assert excinfo.value.code == 2
+
+
+def test_cli_feed_build_profile_flag_wraps_the_build(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(profiling, "DEFAULT_PROFILE_DIR", tmp_path)
+    monkeypatch.delenv(profiling.PROFILE_ENV, raising=False)
+    monkeypatch.setattr(cli, "build_feed_module", SimpleNamespace(main=lambda: 0), raising=False)
+
+    assert cli.main(["feed", "build"]) == 0
+    assert list(tmp_path.iterdir()) == []
+
+    assert cli.main(["feed", "build", "--profile"]) == 0
+    assert sorted(path.name.rsplit("-", 1)[1] for path in tmp_path.iterdir()) == [
+        f"{os.getpid()}.collapsed.txt", f"{os.getpid()}.pstats.gz",
+    ]
+
+
+def test_cli_cache_update_forwards_the_profile_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str, list[str]]] = []
+
+    def fake_run_script(script_name: str, *, extra_args: list[str] | None = None) -> int:
+        calls.append((script_name, list(extra_args or [])))
+        return 0
+
+    monkeypatch.setattr(cli, "_run_script", fake_run_script)
+
+    assert cli.main(["cache", "update", "wl", "--profile", "sample"]) == 0
+    assert cli.main(["cache", "update", "oebb"]) == 0
+    assert calls == [("update_wl_cache.py", ["--profile=sample"]), ("update_oebb_cache.py", [])]
+
+
+def test_cli_profile_flag_rejects_unknown_modes() -> None:
+    # ``--profile wl`` must not silently swallow the provider name.
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["cache", "update", "--profile", "wl"])
+    assert excinfo.value.code == 2
@@ -0,0 +1,212 @@
+"""Adaptive provider deadlines (``src/feed/latency.py``).
+
+The history keeps a rolling window of fetch durations per provider; the
+orchestrator derives a p99-based deadline from it only when
+``PROVIDER_ADAPTIVE_TIMEOUTS`` is on, never above the static timeout, and
+falls back to the static timeout plus a single worker after a streak of
+timeouts.
+"""
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src import build_feed
+from src.feed import latency
+from src.feed.latency import LatencyHistory
+from src.feed.reporting import (
+    FeedHealthMetrics,
+    RunReport,
+    build_feed_health_payload,
+    render_feed_health_markdown,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_active_history() -> Iterator[None]:
+    previous = latency.activate(None)
+    yield
+    latency.activate(previous)
+
+
+def _history(name: str, samples: list[float]) -> LatencyHistory:
+    return LatencyHistory({name: samples})
+
+
+def test_percentile_uses_the_nearest_rank() -> None:
+    samples = [float(value) for value in range(1, 101)]
+    assert latency.percentile(samples, 0.5) == 50.0
+    assert latency.percentile(samples, 0.99) == 99.0
+    assert latency.percentile([3.0], 0.99) == 3.0
+
+
+def test_adaptive_deadline_derives_from_p99_within_bounds() -> None:
+    assert _history("wl", [1.0] * 4).adaptive_deadline("wl", 25) is None  # too few samples
+    assert _history("wl", [1.0] * 9 + [6.0]).adaptive_deadline("wl", 25) == (11, 6.0)
+    assert _history("wl", [0.1] * 10).adaptive_deadline("wl", 25) == (latency.MIN_ADAPTIVE_TIMEOUT, 0.1)
+    assert _history("wl", [20.0] * 10).adaptive_deadline("wl", 25) is None  # never above the cap
+
+
+def test_timeout_streak_restores_the_static_deadline_and_serialises() -> None:
+    history = _history("oebb", [1.0] * 10)
+    for _ in range(latency.TIMEOUT_STREAK_LIMIT):
+        assert history.worker_limit("oebb") is None
+        history.observe_timeout("oebb")
+
+    assert history.adaptive_deadline("oebb", 25) is None
+    assert history.worker_limit("oebb") == 1
+
+    history.observe("oebb", 30.0, deadline=25)  # a late completion does not end the streak
+    assert history.worker_limit("oebb") == 1
+    history.observe("oebb", 1.0, deadline=25)
+    assert history.worker_limit("oebb") is None
+
+
+def test_history_round_trips_and_only_writes_when_observed(tmp_path: Path) -> None:
+    path = tmp_path / "state.latency.json"
+    history = LatencyHistory()
+    assert history.save(path) is False
+    assert not path.exists()
+
+    for seconds in range(latency.MAX_SAMPLES + 5):
+        history.observe("wl", float(seconds))
+    history.observe_timeout("vor")
+    assert history.save(path) is True
+    assert history.save(path) is False
+
+    loaded = LatencyHistory.load(path)
+    assert loaded.summary("wl") == history.summary("wl")
+    assert loaded.summary("wl")["count"] == latency.MAX_SAMPLES
+    assert loaded.summary("vor") == {"count": 0, "timeout_streak": 1, "p50": None, "p95": None, "p99": None}
+
+
+def test_observation_during_save_is_kept_for_the_next_save(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "state.latency.json"
+    history = LatencyHistory()
+    history.observe("wl", 1.0)
+    real_dump = json.dump
+
+    def dump_while_a_straggler_reports(payload: Any, handle: Any, **kwargs: Any) -> None:
+        # A fetcher thread abandoned at its deadline finishes mid-write.
+        history.observe("wl", 2.0)
+        real_dump(payload, handle, **kwargs)
+
+    monkeypatch.setattr(json, "dump", dump_while_a_straggler_reports)
+    assert history.save(path) is True
+    monkeypatch.setattr(json, "dump", real_dump)
+
+    assert json.loads(path.read_text(encoding="utf-8"))["providers"]["wl"]["samples"] == [1.0]
+    assert history.save(path) is True
+    assert json.loads(path.read_text(encoding="utf-8"))["providers"]["wl"]["samples"] == [1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "{broken",
+        '{"format": 99, "providers": {}}',
+        '{"format": 1, "providers": {"wl": {"samples": [1, NaN, -1, "x", true], "timeout_streak": "3"}}}',
+    ],
+    ids=["corrupt", "unknown-format", "invalid-values"],
+)
+def test_unusable_history_files_are_ignored(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "state.latency.json"
+    path.write_text(content, encoding="utf-8")
+    summary = LatencyHistory.load(path).summary("wl")
+    assert summary["timeout_streak"] == 0
+    assert summary["count"] in (0, 1)
+
+
+def _submit(fetch: Any, report: RunReport) -> int:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futures, _deadlines, _pending, _tokens = build_feed._submit_network_fetches(
+            executor, [fetch], {fetch: "latency_provider"}, {fetch: "LATENCY_PROVIDER_ENABLE"}, report
+        )
+    ((_fetch, _name, timeout),) = futures.values()
+    return timeout
+
+
+def _latency_provider() -> list[dict[str, Any]]:
+    return []
+
+
+def test_orchestrator_applies_the_adaptive_deadline_only_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(build_feed.feed_config, "PROVIDER_TIMEOUT", 25)
+    latency.activate(_history("latency_provider", [1.0] * 10))
+
+    monkeypatch.setattr(build_feed.feed_config, "PROVIDER_ADAPTIVE_TIMEOUTS", False)
+    assert _submit(_latency_provider, RunReport([])) == 25
+
+    monkeypatch.setattr(build_feed.feed_config, "PROVIDER_ADAPTIVE_TIMEOUTS", True)
+    report = RunReport([])
+    assert _submit(_latency_provider, report) == 5
+    assert report.latency_decisions == {"latency_provider": "Timeout 5s statt 25s (p99 1.00s)"}
+
+    monkeypatch.setenv("LATENCY_PROVIDER_TIMEOUT", "7")
+    assert _submit(_latency_provider, RunReport([])) == 7  # an explicit override wins
+
+
+def test_orchestrator_serialises_a_group_on_a_timeout_streak(monkeypatch: pytest.MonkeyPatch) -> None:
+    history = LatencyHistory(streaks={"latency_provider": latency.TIMEOUT_STREAK_LIMIT})
+    latency.activate(history)
+    monkeypatch.setattr(build_feed.feed_config, "PROVIDER_ADAPTIVE_TIMEOUTS", True)
+    semaphores: list[Any] = []
+    real_build = build_feed._build_run_fetch
+
+    def spy(fetch: Any, timeout: Any, supports: bool, semaphore: Any, name: str) -> Any:
+        semaphores.append(semaphore)
+        return real_build(fetch, timeout, supports, semaphore, name)
+
+    monkeypatch.setattr(build_feed, "_build_run_fetch", spy)
+    report = RunReport([])
+    _submit(_latency_provider, report)
+
+    assert semaphores[0] is not None
+    assert report.latency_decisions["latency_provider"] == "Worker auf 1 begrenzt (Timeout-Serie)"
+
+
+def test_fetches_and_evictions_are_recorded(monkeypatch: pytest.MonkeyPatch) -> None:
+    history = LatencyHistory()
+    latency.activate(history)
+    monkeypatch.setattr(build_feed.feed_config, "PROVIDER_TIMEOUT", 1)
+
+    def fast_provider() -> list[dict[str, Any]]:
+        return []
+
+    def slow_provider() -> list[dict[str, Any]]:
+        time.sleep(1.3)
+        return []
+
+    fetchers = [fast_provider, slow_provider]
+    build_feed._run_network_fetchers(
+        fetchers, {fetch: fetch.__name__ for fetch in fetchers},
+        dict.fromkeys(fetchers), RunReport([]), lambda *_args: None,
+    )
+
+    assert history.summary("fast_provider")["count"] == 1
+    assert history.summary("slow_provider")["timeout_streak"] == 1
+
+
+def test_health_report_lists_latency_decisions() -> None:
+    report = RunReport([])
+    report.record_latency_decision("Evil\u202eName", "Timeout 5s statt 25s (p99 1.00s)")
+    report.record_latency_decision("Evil\u202eName", "Worker auf 1 begrenzt (Timeout-Serie)")
+    metrics = FeedHealthMetrics(raw_items=0, filtered_items=0, deduped_items=0, new_items=0, duplicate_count=0, duplicates=())
+
+    payload = build_feed_health_payload(report, metrics)
+    markdown = render_feed_health_markdown(report, metrics)
+
+    assert payload["latency_decisions"] == {
+        "EvilName": "Timeout 5s statt 25s (p99 1.00s); Worker auf 1 begrenzt (Timeout-Serie)"
+    }
+    assert "\u202e" not in json.dumps(payload, ensure_ascii=False)
+    assert "### Adaptive Provider-Deadlines" in markdown
+    assert "### Adaptive Provider-Deadlines" not in render_feed_health_markdown(RunReport([]), metrics)
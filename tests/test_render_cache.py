@@ -0,0 +1,201 @@
+"""Tests for the persisted render cache (``src/feed/render_cache.py``).
+
+A cached rendering must be byte-identical to a fresh one, miss as soon
+as any formatter input changes, and never pin an EN item that fell back
+to the German source.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src import build_feed
+from src.feed import render_cache
+from src.feed_types import FeedItem, FeedRecord
+from src.utils import stats as stats_module
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def _no_active_cache() -> Iterator[None]:
+    previous = render_cache.activate(None)
+    yield
+    render_cache.activate(previous)
+
+
+def _items(**overrides: Any) -> list[FeedItem]:
+    item: dict[str, Any] = {
+        "source": "Wiener Linien",
+        "category": "Störung",
+        "title": "U1: Störung Karlsplatz",
+        "description": "<p>Unregelmäßige Intervalle. Grund: Rettungseinsatz.</p>",
+        "guid": "render-1",
+        "pubDate": datetime(2026, 3, 1, 8, 0, tzinfo=UTC),
+        "starts_at": datetime(2026, 2, 28, 8, 0, tzinfo=UTC),
+    }
+    item.update(overrides)
+    return [FeedRecord.adopt(item)]  # type: ignore[list-item]
+
+
+@pytest.fixture
+def base_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    original = build_feed._format_item_base
+
+    def counting(it: FeedItem, *args: Any) -> Any:
+        calls.append(str(it.get("title")))
+        return original(it, *args)
+
+    monkeypatch.setattr(build_feed, "_format_item_base", counting)
+    return calls
+
+
+def _render(items: list[FeedItem], lang: str = "de") -> str:
+    return build_feed._make_rss(items, NOW, {}, lang=lang)
+
+
+def test_cached_rendering_is_identical_and_skips_the_formatter(base_calls: list[str]) -> None:
+    uncached = _render(_items())
+    render_cache.activate(render_cache.RenderCache())
+
+    first = _render(_items())
+    second = _render(_items())
+
+    assert first == second == uncached
+    assert base_calls == ["U1: Störung Karlsplatz"] * 2
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"title": "U1: Störung Praterstern"},
+        {"description": "Kurzführung."},
+        {"link": "https://www.wienerlinien.at/x"},
+        {"ends_at": datetime(2026, 3, 2, tzinfo=UTC)},
+    ],
+    ids=["title", "description", "link", "ends_at"],
+)
+def test_changed_inputs_miss(base_calls: list[str], override: dict[str, Any]) -> None:
+    render_cache.activate(render_cache.RenderCache())
+    _render(_items())
+    _render(_items(**override))
+    assert len(base_calls) == 2
+
+
+def test_formatter_config_is_part_of_the_key(base_calls: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    render_cache.activate(render_cache.RenderCache())
+    _render(_items())
+    monkeypatch.setattr(build_feed.feed_config, "TITLE_CHAR_LIMIT", 10)
+    assert "<![CDATA[U1: Störun …]]>" in _render(_items())
+    assert len(base_calls) == 2
+
+
+def test_upcoming_start_flips_the_key_when_it_begins() -> None:
+    item = _items()[0]
+    tomorrow = datetime.now(UTC) + timedelta(days=2)
+    upcoming = build_feed._render_inputs(item, "id", tomorrow, None, "de")
+    started = build_feed._render_inputs(item, "id", tomorrow - timedelta(days=4), None, "de")
+    assert upcoming[-5] is True
+    assert started[-5] is False
+
+
+def test_en_fallback_is_not_cached(base_calls: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = render_cache.RenderCache()
+    render_cache.activate(cache)
+    monkeypatch.setattr(build_feed, "_cached_translation", lambda text, *_a, **_kw: (text, False))
+    _render(_items(), lang="en")
+    _render(_items(), lang="en")
+    assert len(base_calls) == 2
+    assert len(cache) == 0
+
+    monkeypatch.setattr(build_feed, "_cached_translation", lambda text, *_a, **_kw: (f"{text} (EN)", True))
+    en = _render(_items(), lang="en")
+    assert _render(_items(), lang="en") == en
+    assert "(EN)" in en
+    assert len(base_calls) == 3
+
+
+def test_en_hit_replays_the_translation_state(base_calls: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    render_cache.activate(render_cache.RenderCache())
+    monkeypatch.setattr(build_feed, "_translate_text_attempt", lambda text, **_kw: f"{text} (EN)")
+    warm: dict[str, Any] = {}
+    en = build_feed._make_rss(_items(), NOW, warm, lang="en")
+    ident = next(iter(warm))
+    translations = warm[ident]["translations"]
+
+    # A fresh state (e.g. the item's entry was pruned meanwhile, or an
+    # older epoch is on record) must end up as if the overlay had run.
+    stale: dict[str, Any] = {ident: {"translations": {"epoch": 0, "en": {"title": "old"}}}}
+    assert build_feed._make_rss(_items(), NOW, stale, lang="en") == en
+    assert len(base_calls) == 1
+    assert stale[ident]["translations"] == translations
+    assert translations["epoch"] == build_feed._TRANSLATION_CACHE_EPOCH
+    assert translations["en"]["title"].endswith("(EN)")
+
+
+def test_save_keeps_only_used_entries_and_skips_unchanged_files(tmp_path: Path) -> None:
+    path = tmp_path / "state.render.json"
+    cache = render_cache.RenderCache({"old": ("x",)})
+    cache.put("new", ["a", "\u202eb"])
+
+    assert cache.save(path)
+    raw = path.read_text(encoding="utf-8")
+    assert "\u202e" not in raw
+    assert json.loads(raw)["entries"] == {"new": ["a", "\u202eb"]}
+
+    reloaded = render_cache.RenderCache.load(path)
+    assert reloaded.get("new", 2) == ("a", "\u202eb")
+    assert reloaded.get("new", 3) is None
+    assert not reloaded.save(path)
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["{not json", '{"format": 99, "entries": {"k": ["v"]}}', '{"format": 1, "entries": {"k": [NaN]}}', "[]"],
+    ids=["corrupt", "other-format", "non-finite", "not-a-mapping"],
+)
+def test_unusable_files_start_an_empty_cache(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "state.render.json"
+    path.write_text(content, encoding="utf-8")
+    assert len(render_cache.RenderCache.load(path)) == 0
+    assert len(render_cache.RenderCache.load(tmp_path / "missing.json")) == 0
+
+
+def test_main_persists_the_cache_next_to_the_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def render_test_provider() -> list[dict[str, Any]]:
+        return [dict(_items()[0])]
+
+    paths = {
+        "OUT_PATH": tmp_path / "feed.xml",
+        "FEED_HEALTH_PATH": tmp_path / "feed-health.md",
+        "FEED_HEALTH_JSON_PATH": tmp_path / "feed-health.json",
+        "STATE_PATH": tmp_path / "state.json",
+    }
+    for env, path in paths.items():
+        monkeypatch.setenv(env, str(path))
+    monkeypatch.setattr(build_feed.feed_config, "validate_path", lambda path, _name: Path(path))
+    monkeypatch.setattr(build_feed, "validate_path", lambda path, _name: Path(path))
+    monkeypatch.setattr(build_feed, "PROVIDERS", [("RENDER_TEST_ENABLE", render_test_provider)])
+    monkeypatch.setattr(
+        build_feed, "_get_translation_pipeline",
+        lambda: lambda text, **_kw: [{"translation_text": f"{text} (EN)"}],
+    )
+    monkeypatch.setattr(stats_module, "DEFAULT_STATS_DIR", tmp_path / "stats")
+
+    assert build_feed.main() == 0
+    cache_path = tmp_path / "state.render.json"
+    entries = json.loads(cache_path.read_text(encoding="utf-8"))["entries"]
+    assert len(entries) == 2  # one rendering per language
+    assert render_cache.active_cache() is None
+
+    mtime = cache_path.stat().st_mtime_ns
+    assert build_feed.main() == 0
+    health = json.loads(paths["FEED_HEALTH_JSON_PATH"].read_text(encoding="utf-8"))
+    assert health["trace"]["counters"]["render_cache.hit"] == 2
+    assert cache_path.stat().st_mtime_ns == mtime
@@ -150,7 +150,7 @@ def test_baustellen_url_validator_accepts_https(url: str) -> None:
 
 
 # ---------------------------------------------------------------------------
-# (2) End-to-end via ``_resolve_data_url`` — env-driven fallback to default.
+# (2) End-to-end via ``resolve_data_url`` — env-driven fallback to default.
 # ---------------------------------------------------------------------------
 
 
@@ -168,7 +168,7 @@ def test_baustellen_url_validator_accepts_https(url: str) -> None:
 def test_resolve_data_url_falls_back_on_http(
     caplog: pytest.LogCaptureFixture, url: str
 ) -> None:
-    """``_resolve_data_url`` is the public consumer that the cron
+    """``resolve_data_url`` is the public consumer that the cron
     pipeline reaches via ``BAUSTELLEN_DATA_URL`` env override.  An
     ``http://``-scheme override must NOT take effect — the resolver
     falls back to the safe HTTPS ``DEFAULT_DATA_URL`` and emits a
@@ -176,7 +176,7 @@ def test_resolve_data_url_falls_back_on_http(
     cause.
     """
     caplog.set_level(logging.WARNING, logger="update_baustellen_cache")
-    resolved = update_baustellen_cache._resolve_data_url(url)
+    resolved = update_baustellen_cache.resolve_data_url(url)
 
     assert resolved == update_baustellen_cache.DEFAULT_DATA_URL
     assert any(
@@ -269,4 +269,4 @@ def test_module_reload_succeeds() -> None:
     module-level evaluation path and should never raise."""
     importlib.reload(update_baustellen_cache)
     assert callable(update_baustellen_cache._validated_baustellen_data_url)
-    assert callable(update_baustellen_cache._resolve_data_url)
+    assert callable(update_baustellen_cache.resolve_data_url)
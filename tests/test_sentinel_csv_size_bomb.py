@@ -67,6 +67,7 @@ sibling site that needs the same canonical defence.
 
 from __future__ import annotations
 
+import ast
 import io
 from pathlib import Path
 
@@ -138,20 +139,48 @@ def test_precondition_gtfs_cap_exists() -> None:
 # ============================================================================
 
 
+# ``open_capped_csv`` is the canonical streaming reader: its ``csv.reader``
+# consumes a byte-capped stream rather than a raw handle. The exemption is
+# scoped to that one reviewed function, not to its module, so a new
+# unbounded reader anywhere else in ``src/utils/files.py`` is still flagged.
+CSV_READER_ALLOWLIST: frozenset[tuple[str, str]] = frozenset(
+    {("src/utils/files.py", "open_capped_csv")}
+)
+
+
+def _allowlisted_lines(py_file: Path, relative: str) -> dict[int, str]:
+    """Map each line of an allowlisted function in *py_file* to its name."""
+    names = {name for path, name in CSV_READER_ALLOWLIST if path == relative}
+    if not names:
+        return {}
+    tree = ast.parse(py_file.read_text(encoding="utf-8"))
+    lines: dict[int, str] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name in names:
+            end = node.end_lineno or node.lineno
+            lines.update(dict.fromkeys(range(node.lineno, end + 1), node.name))
+    return lines
+
+
 def test_no_unbounded_csv_dictreader_in_src_or_scripts() -> None:
     """Drift defence: every csv reader must consume capped text.
 
     Walk ``src/`` and ``scripts/`` and assert every ``csv.DictReader``
     or ``csv.reader`` callsite is constructed from an in-memory
     ``StringIO`` wrapper (i.e. text loaded via ``read_capped_text``)
-    rather than a raw file handle from ``path.open(...)``.
+    rather than a raw file handle from ``path.open(...)``. Streaming
+    loaders go through ``open_capped_csv`` and never construct a reader
+    themselves.
     """
     repo_root = Path(__file__).resolve().parents[1]
     offenders: list[tuple[Path, int, str]] = []
+    exempted: set[tuple[str, str]] = set()
     for sub in ("src", "scripts"):
         for py_file in (repo_root / sub).rglob("*.py"):
             if py_file.name.startswith("test_"):
                 continue
+            relative = py_file.relative_to(repo_root).as_posix()
+            allowed_lines = _allowlisted_lines(py_file, relative)
             try:
                 lines = py_file.read_text(encoding="utf-8").splitlines()
             except OSError:  # pragma: no cover - defensive
@@ -164,6 +193,9 @@ def test_no_unbounded_csv_dictreader_in_src_or_scripts() -> None:
                     continue
                 if "csv.DictReader(" not in line and "csv.reader(" not in line:
                     continue
+                if idx in allowed_lines:
+                    exempted.add((relative, allowed_lines[idx]))
+                    continue
                 # The constructor MUST receive a StringIO buffer (loaded
                 # via read_capped_text). Raw ``handle`` from
                 # ``path.open(...)`` is the unbounded shape.
@@ -174,6 +206,9 @@ def test_no_unbounded_csv_dictreader_in_src_or_scripts() -> None:
         "+ io.StringIO before constructing csv.DictReader / csv.reader:\n"
         + "\n".join(f"  {p}:{n}: {ln}" for p, n, ln in offenders)
     )
+    # A stale entry (function renamed or its reader removed) must be
+    # dropped from the allowlist rather than silently linger.
+    assert exempted == CSV_READER_ALLOWLIST
 
 
 # ============================================================================
@@ -31,7 +31,7 @@ by this PoC:
       - L827  ``_parse_int``          generic int env   (``REQUEST_MAX_RETRIES``)
 
   * ``scripts/update_baustellen_cache.py``
-      - L352  ``_resolve_data_url``   ``BAUSTELLEN_DATA_URL`` env override
+      - L352  ``resolve_data_url``   ``BAUSTELLEN_DATA_URL`` env override
       - L626  ``main``                ``BAUSTELLEN_TIMEOUT``  env override
 
   * ``src/build_feed.py``
@@ -295,20 +295,20 @@ def test_baustellen_resolve_data_url_strips_primitive(
     primitive_label: str,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """L352: ``_resolve_data_url`` rejects unknown-host ``BAUSTELLEN_DATA_URL``."""
+    """L352: ``resolve_data_url`` rejects unknown-host ``BAUSTELLEN_DATA_URL``."""
     from scripts.update_baustellen_cache import (
         DEFAULT_DATA_URL,
-        _resolve_data_url,
+        resolve_data_url,
     )
 
     # Construct an https URL pointing at a non-allowlisted host that
     # carries the primitive — the host check fails and the WARNING fires.
     poisoned = f"https://attacker.example.com/poisoned{primitive}path.geojson"
     caplog.set_level(logging.WARNING)
-    result = _resolve_data_url(poisoned)
+    result = resolve_data_url(poisoned)
     assert result == DEFAULT_DATA_URL
     _assert_primitive_absent_from_record_state(
-        caplog, primitive, primitive_label, "update_baustellen_cache:_resolve_data_url"
+        caplog, primitive, primitive_label, "update_baustellen_cache:resolve_data_url"
     )
 
 
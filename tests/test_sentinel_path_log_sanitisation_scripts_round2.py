@@ -388,7 +388,7 @@ def test_usd_load_gtfs_locations_csverror_strips_primitive(
     tmp_path: Path,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """L478: ``csv.Error`` branch — patch ``csv.DictReader`` to raise so the
+    """L478: ``csv.Error`` branch — patch ``open_capped_csv`` to raise so the
     caller hits the WARNING line that interpolates ``path``."""
     from scripts.update_station_directory import _load_gtfs_locations
 
@@ -399,7 +399,7 @@ def test_usd_load_gtfs_locations_csverror_strips_primitive(
         raise csv.Error("planted")
 
     caplog.set_level(logging.WARNING)
-    with patch("scripts.update_station_directory.csv.DictReader", _raising_reader):
+    with patch("scripts.update_station_directory.open_capped_csv", _raising_reader):
         result = _load_gtfs_locations(path)
     assert result == {}
     _assert_primitive_absent(
@@ -444,7 +444,7 @@ def test_usd_load_wl_locations_csverror_strips_primitive(
         raise csv.Error("planted")
 
     caplog.set_level(logging.WARNING)
-    with patch("scripts.update_station_directory.csv.DictReader", _raising_reader):
+    with patch("scripts.update_station_directory.open_capped_csv", _raising_reader):
         result = _load_wienerlinien_locations(path)
     assert result == {}
     _assert_primitive_absent(
@@ -492,7 +492,7 @@ def test_usd_load_vor_locations_csverror_strips_primitive(
         raise csv.Error("planted")
 
     caplog.set_level(logging.WARNING)
-    with patch("scripts.update_station_directory.csv.DictReader", _raising_reader):
+    with patch("scripts.update_station_directory.open_capped_csv", _raising_reader):
         result = _load_vor_locations(path)
     assert result == {}
     _assert_primitive_absent(
@@ -562,7 +562,7 @@ def test_usd_load_vor_stops_csverror_strips_primitive(
         raise csv.Error("planted")
 
     caplog.set_level(logging.WARNING)
-    with patch("scripts.update_station_directory.csv.DictReader", _raise_csv):
+    with patch("scripts.update_station_directory.open_capped_csv", _raise_csv):
         result = load_vor_stops(path)
     assert result == []
     _assert_primitive_absent(
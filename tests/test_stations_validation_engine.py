@@ -0,0 +1,145 @@
+"""Tests for the single-pass rule engine behind ``validate_station_entries``.
+
+The per-category finders keep their own test modules; these tests pin the
+engine contract itself: one shared index build, one traversal, rule order
+fixing report order, pluggable rules and the per-rule timing report.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pytest
+
+from src.utils import stations_validation as sv
+from src.utils.stations_validation import (
+    NamingIssue,
+    StationIndex,
+    StationRecord,
+    ValidationRule,
+    build_station_index,
+    default_rules,
+    run_rules,
+    validate_station_entries,
+)
+
+
+def _make_entry(**overrides: object) -> dict[str, object]:
+    base: dict[str, object] = {
+        "name": "Default",
+        "latitude": 48.2,
+        "longitude": 16.3,
+        "in_vienna": True,
+        "pendler": False,
+        "source": "wl",
+        "aliases": ["Default"],
+    }
+    base.update(overrides)
+    return base
+
+
+class _CountingRule(ValidationRule[NamingIssue]):
+    name = "counting"
+    category = "naming_issues"
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+        self.finished = 0
+
+    def check(self, record: StationRecord, index: StationIndex) -> Iterator[NamingIssue]:
+        self.seen.append(record.name)
+        if record.name.startswith("Bad"):
+            yield NamingIssue(identifier=record.identifier, name=record.name, reason="custom")
+
+    def finish(self, index: StationIndex) -> Iterable[NamingIssue]:
+        self.finished += 1
+        return ()
+
+
+def test_index_derives_each_identifier_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[object] = []
+    real = sv._format_identifier
+
+    def counting(entry: Any) -> str:
+        calls.append(entry)
+        return real(entry)
+
+    monkeypatch.setattr(sv, "_format_identifier", counting)
+    stations = [
+        _make_entry(name=f"Station {i}", wl_diva=str(i), aliases=[f"Station {i}", "Shared"])
+        for i in range(20)
+    ]
+
+    validate_station_entries(stations)
+
+    # The legacy finders re-derived the identifier once per finder and
+    # again for every reported issue; the index derives it exactly once.
+    assert len(calls) == len(stations)
+
+
+def test_index_collects_cross_station_lookups() -> None:
+    index = build_station_index([
+        _make_entry(name="Wien Karlsplatz (WL)", bst_code="Kp", source="oebb,vor"),
+        _make_entry(name="Karlsplatz", bst_code=900100, source="vor", latitude="48.3"),
+        _make_entry(name="Nowhere", latitude=None, aliases="not-a-list"),
+    ])
+
+    assert index.vor_count == 2
+    assert index.oebb_codes == frozenset({"Kp"})
+    assert [owner.name for owner, _ in index.id_owners["kp"]] == ["Wien Karlsplatz (WL)"]
+    assert index.name_owners["karlsplatz"] == ("Wien Karlsplatz (WL)", [(48.2, 16.3), (48.3, 16.3)])
+    assert index.records[2].aliases is None
+    assert index.records[2].latitude is None
+
+
+def test_custom_rule_runs_once_per_station_and_extends_category() -> None:
+    rule = _CountingRule()
+    stations = [_make_entry(name="Good"), _make_entry(name="Bad one", in_vienna=False)]
+
+    report = validate_station_entries(stations, rules=[*default_rules(), rule])
+
+    assert rule.seen == ["Good", "Bad one"]
+    assert rule.finished == 1
+    # The built-in naming rules run first, so their issue precedes the
+    # custom rule's issue in the shared ``naming_issues`` category.
+    assert [issue.reason for issue in report.naming_issues][-1] == "custom"
+    assert report.naming_issues[0].reason.startswith("in_vienna and pendler are both false")
+
+
+def test_rules_argument_replaces_default_set() -> None:
+    stations = [_make_entry(name="Bad", aliases=[])]
+
+    report = validate_station_entries(stations, rules=[_CountingRule()])
+
+    assert report.alias_issues == ()
+    assert report.provider_issues == ()
+    assert [issue.reason for issue in report.naming_issues] == ["custom"]
+
+
+def test_rule_timings_cover_index_and_every_rule() -> None:
+    report = validate_station_entries([_make_entry(), _make_entry(name="Other", aliases=[])])
+
+    names = [timing.rule for timing in report.rule_timings]
+    assert names == ["index", *(rule.name for rule in default_rules())]
+    assert all(timing.seconds >= 0 for timing in report.rule_timings)
+    by_rule = {timing.rule: timing.issues for timing in report.rule_timings}
+    assert by_rule["aliases"] == len(report.alias_issues) == 1
+    # Provider issues come from two rules; only the format rule reports the
+    # global "fewer than two VOR entries" issue.
+    assert by_rule["vor-id-format"] == 1
+    assert by_rule["vor-oebb-collision"] == 0
+
+
+def test_rule_timings_do_not_affect_report_equality() -> None:
+    stations = [_make_entry(), _make_entry(name="Other")]
+
+    assert validate_station_entries(stations) == validate_station_entries(stations)
+
+
+def test_unknown_rule_category_is_rejected() -> None:
+    class _Stray(ValidationRule[Any]):
+        name = "stray"
+        category = "not_a_report_field"
+
+    with pytest.raises(ValueError, match="stray"):
+        run_rules([_make_entry()], [_Stray()])
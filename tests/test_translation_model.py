@@ -0,0 +1,261 @@
+"""Optional int8 translation model (``src/feed/translation_model.py``).
+
+Most tests fake the quantization and pin the corpus, the quality gate,
+the cache record and how ``build_feed`` chooses between int8 and float32.
+The save/load round trip runs against a tiny random Marian model and is
+skipped without torch.
+"""
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src import build_feed
+from src.feed import config as feed_config
+from src.feed import translation_model
+
+VERSIONS = {"torch": "2.5.1", "transformers": "4.57.6"}
+
+
+class _FakePipe:
+    def __init__(self, translate: dict[str, str]) -> None:
+        self.translate = translate
+        self.model = object()
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(self, text: str, **kwargs: Any) -> list[dict[str, str]]:
+        self.calls.append(kwargs)
+        return [{"translation_text": self.translate.get(text, text)}]
+
+
+class _FakeCache:
+    def __init__(self, status: str | None) -> None:
+        self._status = status
+        self.saved: dict[str, Any] | None = None
+        self.rejected: dict[str, Any] | None = None
+
+    def status(self) -> str | None:
+        return self._status
+
+    def load_pipeline(self) -> Any:
+        return "cached-int8"
+
+    def save(self, model: Any, **record: Any) -> None:
+        self.saved = record
+
+    def reject(self, **record: Any) -> None:
+        self.rejected = record
+
+
+def _write_feed(path: Path, items: list[tuple[str, str, str]]) -> None:
+    body = "".join(
+        f"<item><guid>{guid}</guid><title>{title}</title><description>{description}</description></item>"
+        for guid, title, description in items
+    )
+    path.write_text(f"<rss><channel>{body}</channel></rss>", encoding="utf-8")
+
+
+def _translated(title: str, summary: str, epoch: int = 3) -> dict[str, Any]:
+    return {"translations": {"en": {"title": title, "summary": summary}, "epoch": epoch}}
+
+
+def test_chrf_bounds() -> None:
+    assert translation_model.chrf("Line U6 disrupted", "Line U6 disrupted") == 1.0
+    assert translation_model.chrf("xyz", "abc") == 0.0
+    assert 0.5 < translation_model.chrf("Line U6 is disrupted", "Line U6 disrupted") < 1.0
+
+
+def test_golden_corpus_pairs_feed_text_with_current_translations(tmp_path: Path) -> None:
+    feed = tmp_path / "feed.xml"
+    _write_feed(
+        feed,
+        [
+            ("g1", "U6: Umleitung", "Wegen Bauarbeiten Umleitung. [Seit 05.01.2026]"),
+            ("g2", "U4: Störung", "Verspätungen."),
+            ("g3", "13A: Karlsplatz", "Haltestelle verlegt."),
+        ],
+    )
+    state = {
+        "g1": _translated("U6: diversion", "Diversion due to construction work."),
+        "g2": _translated("U4: disruption", "Delays.", epoch=2),
+        # Entity-only title: the "translation" is the German text itself.
+        "g3": _translated("13A: Karlsplatz", "Stop moved."),
+    }
+
+    pairs = translation_model.golden_corpus(feed, state, epoch=3)
+
+    assert pairs == [
+        ("U6: Umleitung", "U6: diversion"),
+        ("Wegen Bauarbeiten Umleitung.", "Diversion due to construction work."),
+        ("Haltestelle verlegt.", "Stop moved."),
+    ]
+    assert translation_model.golden_corpus(tmp_path / "missing.xml", state, epoch=3) == []
+
+
+def test_golden_corpus_skips_truncated_summaries(tmp_path: Path) -> None:
+    feed = tmp_path / "feed.xml"
+    _write_feed(feed, [("g1", "U6: Umleitung", "Wegen Bauarbeiten ist die Linie U6 zwischen... [TRUNCATED]")])
+    state = {"g1": _translated("U6: diversion", "Due to construction work, line U6 is diverted.")}
+
+    assert translation_model.golden_corpus(feed, state, epoch=3) == [("U6: Umleitung", "U6: diversion")]
+
+
+def test_cache_record_is_tied_to_the_installed_versions(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(translation_model, "_versions", lambda: dict(VERSIONS))
+    cache = translation_model.QuantizedModelCache.for_model("org/model", root=tmp_path)
+    assert cache.status() is None
+
+    cache.reject(score=0.5, pairs=12)
+    record = json.loads(cache.metadata_path.read_text(encoding="utf-8"))
+    assert record["status"] == "rejected" and record["pairs"] == 12
+    assert cache.status() == "rejected"
+
+    monkeypatch.setattr(translation_model, "_versions", lambda: {**VERSIONS, "torch": "2.6.0"})
+    assert cache.status() is None
+
+
+def test_accepted_record_requires_matching_weights(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(translation_model, "_versions", lambda: dict(VERSIONS))
+    cache = translation_model.QuantizedModelCache.for_model("org/model", root=tmp_path)
+    cache.directory.mkdir(parents=True)
+    cache.weights_path.write_bytes(b"weights")
+    cache._record("accepted", score=0.97, pairs=20, sha256=translation_model._file_digest(cache.weights_path))
+    assert cache.status() == "accepted"
+
+    cache.weights_path.write_bytes(b"tampered")
+    assert cache.status() is None
+
+
+@pytest.fixture
+def quantize(monkeypatch: pytest.MonkeyPatch) -> _FakePipe:
+    pipe = _FakePipe({"Guten Morgen": "Good morning", "Vielen Dank": "Thank you"})
+    monkeypatch.setattr(build_feed, "_load_float_translation_pipeline", lambda: pipe)
+    monkeypatch.setattr(translation_model, "quantize_int8", lambda model: model)
+    monkeypatch.setattr(build_feed, "_load_state", lambda: {})
+    return pipe
+
+
+def test_verified_int8_model_is_cached(quantize: _FakePipe, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = _FakeCache(None)
+    monkeypatch.setattr(translation_model.QuantizedModelCache, "for_model", lambda name: cache)
+    corpus = [("Guten Morgen", "Good morning"), ("Vielen Dank", "Thank you")] * 5
+    monkeypatch.setattr(translation_model, "golden_corpus", lambda *args, **kwargs: corpus)
+
+    assert build_feed._load_quantized_translation_pipeline() is quantize
+    assert cache.saved == {"score": 1.0, "pairs": 10}
+
+
+def test_degraded_int8_model_is_rejected(quantize: _FakePipe, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = _FakeCache(None)
+    monkeypatch.setattr(translation_model.QuantizedModelCache, "for_model", lambda name: cache)
+    corpus = [("Guten Morgen", "Signal failure"), ("Vielen Dank", "Detour")] * 5
+    monkeypatch.setattr(translation_model, "golden_corpus", lambda *args, **kwargs: corpus)
+
+    assert build_feed._load_quantized_translation_pipeline() is None
+    assert cache.saved is None
+    assert cache.rejected is not None and cache.rejected["score"] < translation_model.MIN_CORPUS_CHRF
+
+
+def test_cache_status_short_circuits_verification(quantize: _FakePipe, monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_corpus(*args: Any, **kwargs: Any) -> list[tuple[str, str]]:
+        raise AssertionError("corpus must not be built")
+
+    monkeypatch.setattr(translation_model, "golden_corpus", no_corpus)
+    monkeypatch.setattr(translation_model.QuantizedModelCache, "for_model", lambda name: _FakeCache("accepted"))
+    assert build_feed._load_quantized_translation_pipeline() == "cached-int8"
+    monkeypatch.setattr(translation_model.QuantizedModelCache, "for_model", lambda name: _FakeCache("rejected"))
+    assert build_feed._load_quantized_translation_pipeline() is None
+
+
+def test_pipeline_falls_back_to_float32_and_applies_runtime_settings(
+    quantize: _FakePipe, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    threads: list[int] = []
+    monkeypatch.setattr(translation_model, "set_num_threads", threads.append)
+    monkeypatch.setattr(build_feed, "_load_quantized_translation_pipeline", lambda: None)
+    monkeypatch.setattr(feed_config, "TRANSLATION_QUANTIZE", "int8")
+    monkeypatch.setattr(feed_config, "TRANSLATION_THREADS", 2)
+    monkeypatch.setattr(feed_config, "TRANSLATION_NUM_BEAMS", 2)
+    monkeypatch.setitem(build_feed._TRANSLATION_STATE, "pipeline", None)
+    monkeypatch.setitem(build_feed._TRANSLATION_STATE, "load_failed", False)
+
+    assert build_feed._get_translation_pipeline() is quantize
+    assert threads == [2]
+    assert build_feed._translate_text_attempt("Guten Morgen") == "Good morning"
+    assert quantize.calls[-1] == {"max_length": 512, "truncation": True, "num_beams": 2}
+
+
+_TINY_CORPUS = [
+    "Wegen Bauarbeiten Umleitung der Linie U6",
+    "Verspätungen auf der Linie U4",
+    "Haltestelle Karlsplatz verlegt",
+    "Diversion due to construction work",
+    "Delays on line U4",
+]
+
+
+def _tiny_marian(directory: Path) -> Any:
+    """Write a randomly initialised two-layer Marian model with tokenizer."""
+    torch = pytest.importorskip("torch")
+    spm = pytest.importorskip("sentencepiece")
+    transformers = pytest.importorskip("transformers")
+
+    directory.mkdir()
+    spm_model = io.BytesIO()
+    spm.SentencePieceTrainer.train(
+        sentence_iterator=iter(_TINY_CORPUS * 10), model_writer=spm_model, vocab_size=60, hard_vocab_limit=False, minloglevel=2
+    )
+    (directory / "spm.model").write_bytes(spm_model.getvalue())
+    pieces = spm.SentencePieceProcessor(model_file=str(directory / "spm.model"))
+    vocab = {pieces.id_to_piece(index): index for index in range(pieces.get_piece_size())}
+    vocab["<pad>"] = len(vocab)
+    (directory / "vocab.json").write_text(json.dumps(vocab), encoding="utf-8")
+    tokenizer = transformers.MarianTokenizer(
+        str(directory / "spm.model"), str(directory / "spm.model"), str(directory / "vocab.json")
+    )
+    tokenizer.save_pretrained(directory)
+    config = transformers.MarianConfig(
+        vocab_size=len(vocab), d_model=32, encoder_layers=2, decoder_layers=2,
+        encoder_attention_heads=2, decoder_attention_heads=2, encoder_ffn_dim=64, decoder_ffn_dim=64,
+        max_position_embeddings=64, init_std=0.5, pad_token_id=vocab["<pad>"],
+        eos_token_id=vocab["</s>"], decoder_start_token_id=vocab["<pad>"],
+    )
+    torch.manual_seed(0)
+    transformers.MarianMTModel(config).save_pretrained(directory)
+    transformers.GenerationConfig(
+        max_length=24, num_beams=1, pad_token_id=config.pad_token_id,
+        eos_token_id=config.eos_token_id, decoder_start_token_id=config.decoder_start_token_id,
+    ).save_pretrained(directory)
+    return tokenizer
+
+
+def test_quantized_model_survives_save_and_load(tmp_path: Path) -> None:
+    model_dir = tmp_path / "tiny-marian"
+    tokenizer = _tiny_marian(model_dir)
+    import torch
+    import transformers
+
+    model = transformers.MarianMTModel.from_pretrained(model_dir)
+    translation_model.quantize_int8(model)
+    model.generation_config = transformers.GenerationConfig.from_pretrained(model_dir)
+    in_memory = transformers.pipeline(  # type: ignore[call-overload, unused-ignore]
+        "translation_de_to_en", model=model, tokenizer=tokenizer
+    )
+    cache = translation_model.QuantizedModelCache.for_model(str(model_dir), root=tmp_path / "hf")
+
+    cache.save(model, score=0.97, pairs=12)
+    assert cache.status() == "accepted"
+    loaded = cache.load_pipeline()
+
+    for german in _TINY_CORPUS[:3]:
+        assert loaded(german) == in_memory(german)
+    batch = tokenizer(_TINY_CORPUS, return_tensors="pt", padding=True)
+    start = torch.full((len(_TINY_CORPUS), 1), model.config.decoder_start_token_id)
+    with torch.no_grad():
+        expected = model(**batch, decoder_input_ids=start).logits
+        actual = loaded.model(**batch, decoder_input_ids=start).logits
+    assert torch.equal(actual, expected)
@@ -247,9 +247,9 @@ def test_wrapper_auto_quarantines_matching_stations(
     )
 
     monkeypatch.setattr(
-        "scripts.update_all_stations.subprocess.run", lambda *a, **kw: None
+        wrapper, "run_stage_graph", lambda args, stations, results: list(stations)
     )
-    monkeypatch.setattr(wrapper, "validate_stations", lambda *a, **kw: failing_report)
+    monkeypatch.setattr(wrapper, "validate_station_entries", lambda *a, **kw: failing_report)
 
     quarantine_path = data_dir / "quarantine.json"
     # The wrapper now accepts ``--target`` / ``--heartbeat`` /
@@ -334,9 +334,9 @@ def test_wrapper_skips_quarantine_for_global_only_issue(
     )
 
     monkeypatch.setattr(
-        "scripts.update_all_stations.subprocess.run", lambda *a, **kw: None
+        wrapper, "run_stage_graph", lambda args, stations, results: list(stations)
     )
-    monkeypatch.setattr(wrapper, "validate_stations", lambda *a, **kw: global_only_report)
+    monkeypatch.setattr(wrapper, "validate_station_entries", lambda *a, **kw: global_only_report)
 
     quarantine_path = data_dir / "quarantine.json"
     # See ``test_wrapper_auto_quarantines_matching_stations`` above for
@@ -370,9 +370,14 @@ def test_wrapper_writes_heartbeat_and_diff_on_success(
     """A successful run produces both observability artefacts."""
     from src.utils.stations_validation import ValidationReport
 
-    monkeypatch.setattr(
-        "scripts.update_all_stations.subprocess.run", lambda *a, **kw: None
-    )
+    def fake_stage_graph(
+        args: object, stations: list[dict[str, object]], results: list[dict[str, object]]
+    ) -> list[dict[str, object]]:
+        for name in wrapper._SCRIPT_ORDER:
+            results.append({"name": name, "exit_code": 0, "duration_s": 0.0})
+        return list(stations)
+
+    monkeypatch.setattr(wrapper, "run_stage_graph", fake_stage_graph)
     clean_report = ValidationReport(
         total_stations=0,
         duplicates=(),
@@ -385,7 +390,7 @@ def test_wrapper_writes_heartbeat_and_diff_on_success(
         naming_issues=(),
         gtfs_stop_count=0,
     )
-    monkeypatch.setattr(wrapper, "validate_stations", lambda *a, **kw: clean_report)
+    monkeypatch.setattr(wrapper, "validate_station_entries", lambda *a, **kw: clean_report)
 
     # Redirect every wrapper output to tmp_path via the CLI args so
     # the live files stay untouched. The legacy ``_DEFAULT_*``
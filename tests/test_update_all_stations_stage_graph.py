@@ -0,0 +1,285 @@
+"""Tests for the in-process stage graph of ``scripts/update_all_stations.py``.
+
+The real stages download the ÖBB workbook and read the WL / VOR / GTFS
+snapshots; these tests swap the four stage modules for small fakes so the
+graph's own contract is pinned in isolation: concurrent input loading,
+stage order, the JSON stage boundary, per-stage timing and failure
+propagation as :class:`StageFailed`.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+import pytest
+
+from scripts import update_all_stations as wrapper
+
+
+def _fake_modules(calls: list[str], **overrides: Any) -> dict[str, ModuleType]:
+    def parse_args(argv: list[str]) -> argparse.Namespace:
+        return argparse.Namespace(argv=argv, overrides=Path("overrides.json"))
+
+    def build_station_directory(
+        args: argparse.Namespace, stations: list[dict[str, Any]], sources: object
+    ) -> list[dict[str, Any]]:
+        calls.append("directory")
+        return [*stations, {"name": "Fresh", "source": "oebb"}]
+
+    def merge_wl_entries(
+        existing: list[dict[str, Any]], entries: list[dict[str, Any]], *, reconcile: object
+    ) -> list[dict[str, Any]] | None:
+        calls.append("wl")
+        return [*existing, *entries]
+
+    def enrich_aliases(stations: list[dict[str, Any]], sources: object, cache: object) -> int:
+        calls.append("aliases")
+        for entry in stations:
+            entry["aliases"] = [entry["name"]]
+        return len(stations)
+
+    def apply_override_list(stations: list[dict[str, Any]], overrides: list[Any]) -> int:
+        calls.append("overrides")
+        return 0
+
+    usd = SimpleNamespace(
+        parse_args=parse_args,
+        _refresh_provider_caches=lambda: calls.append("caches"),
+        load_directory_sources=lambda args, executor: "directory-sources",
+        build_station_directory=build_station_directory,
+    )
+    uws = SimpleNamespace(
+        parse_args=parse_args,
+        prepare_wl_entries=lambda args: SimpleNamespace(
+            entries=[{"name": "WL Stop", "source": "wl"}], reconcile=None
+        ),
+        merge_wl_entries=merge_wl_entries,
+    )
+    esa = SimpleNamespace(
+        parse_args=parse_args,
+        load_alias_sources=lambda args: "alias-sources",
+        open_alias_cache=lambda args: None,
+        enrich_aliases=enrich_aliases,
+    )
+    aso = SimpleNamespace(
+        parse_args=parse_args,
+        load_override_list=lambda path: [],
+        apply_override_list=apply_override_list,
+    )
+    modules: dict[str, Any] = {
+        "update_station_directory.py": usd,
+        "update_wl_stations.py": uws,
+        "enrich_station_aliases.py": esa,
+        "apply_station_overrides.py": aso,
+    }
+    for dotted, value in overrides.items():
+        script, attr = dotted.split(":")
+        setattr(modules[script], attr, value)
+    return modules
+
+
+def _install(monkeypatch: pytest.MonkeyPatch, modules: dict[str, ModuleType]) -> None:
+    monkeypatch.setattr(wrapper, "_import_stage_module", lambda name: modules[name])
+
+
+def _args(tmp_path: Path) -> argparse.Namespace:
+    return wrapper.parse_args(["--target", str(tmp_path / "stations.json")])
+
+
+def test_stage_graph_runs_stages_in_order_on_private_copies(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    calls: list[str] = []
+    _install(monkeypatch, _fake_modules(calls))
+    before = [{"name": "Existing", "source": "manual"}]
+    results: list[dict[str, Any]] = []
+
+    merged = wrapper.run_stage_graph(_args(tmp_path), before, results)
+
+    assert [c for c in calls if c != "caches"] == ["directory", "wl", "aliases", "overrides"]
+    assert "caches" in calls
+    assert [entry["name"] for entry in merged] == ["Existing", "Fresh", "WL Stop"]
+    assert all(entry["aliases"] == [entry["name"]] for entry in merged)
+    # The stage boundary hands out copies: the caller's snapshot (used
+    # for the before/after diff) must not see the stage mutations.
+    assert before == [{"name": "Existing", "source": "manual"}]
+    assert [r["name"] for r in results] == ["load_sources", *wrapper._SCRIPT_ORDER]
+    assert all(r["exit_code"] == 0 for r in results)
+    assert not (tmp_path / "stations.json").exists()
+
+
+def test_stage_graph_passes_script_cli_defaults(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    seen: dict[str, list[str]] = {}
+
+    def build(args: argparse.Namespace, stations: list[dict[str, Any]], sources: object) -> list[dict[str, Any]]:
+        seen["usd"] = args.argv
+        return stations
+
+    _install(monkeypatch, _fake_modules([], **{"update_station_directory.py:build_station_directory": build}))
+    args = wrapper.parse_args(["--target", str(tmp_path / "stations.json"), "--verbose"])
+
+    wrapper.run_stage_graph(args, [], [])
+
+    assert seen["usd"] == ["--output", str(tmp_path / "stations.json"), "--verbose"]
+
+
+def test_stage_graph_loads_directory_after_wl_download(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    # The WL download may replace the haltepunkte CSV the directory's
+    # coordinate lookup reads; the directory load must see the new file.
+    order: list[str] = []
+
+    def prepare(args: argparse.Namespace) -> SimpleNamespace:
+        order.append("wl")
+        return SimpleNamespace(entries=[], reconcile=None)
+
+    def load_directory(args: argparse.Namespace, executor: object) -> str:
+        order.append("directory")
+        return "directory-sources"
+
+    modules = _fake_modules(
+        [],
+        **{
+            "update_wl_stations.py:prepare_wl_entries": prepare,
+            "update_station_directory.py:load_directory_sources": load_directory,
+        },
+    )
+    _install(monkeypatch, modules)
+
+    wrapper.run_stage_graph(_args(tmp_path), [], [])
+
+    assert order == ["wl", "directory"]
+
+
+def test_stage_graph_wl_floor_keeps_previous_list(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    modules = _fake_modules([], **{"update_wl_stations.py:merge_wl_entries": lambda *a, **kw: None})
+    _install(monkeypatch, modules)
+
+    merged = wrapper.run_stage_graph(_args(tmp_path), [{"name": "Existing"}], [])
+
+    assert [entry["name"] for entry in merged] == ["Existing", "Fresh"]
+
+
+def test_stage_graph_missing_wl_input_fails_wl_stage(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    modules = _fake_modules([], **{"update_wl_stations.py:prepare_wl_entries": lambda args: None})
+    _install(monkeypatch, modules)
+    results: list[dict[str, Any]] = []
+
+    with pytest.raises(wrapper.StageFailed) as excinfo:
+        wrapper.run_stage_graph(_args(tmp_path), [], results)
+
+    assert excinfo.value.name == "update_wl_stations.py"
+    assert excinfo.value.exit_code == 1
+    assert results[-1]["name"] == "update_wl_stations.py"
+    assert results[-1]["exit_code"] == 1
+
+
+def test_stage_graph_directory_floor_system_exit_is_recorded(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def refuse(*args: object) -> list[dict[str, Any]]:
+        raise SystemExit("Refusing to overwrite station directory")
+
+    _install(monkeypatch, _fake_modules([], **{"update_station_directory.py:build_station_directory": refuse}))
+    results: list[dict[str, Any]] = []
+
+    with pytest.raises(wrapper.StageFailed) as excinfo:
+        wrapper.run_stage_graph(_args(tmp_path), [], results)
+
+    assert excinfo.value.exit_code == 1
+    assert [r["name"] for r in results] == ["load_sources", "update_station_directory.py"]
+
+
+def test_stage_graph_rejects_non_finite_values_at_stage_boundary(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def poison(args: object, stations: list[dict[str, Any]], sources: object) -> list[dict[str, Any]]:
+        return [{"name": "Poisoned", "latitude": math.nan}]
+
+    _install(monkeypatch, _fake_modules([], **{"update_station_directory.py:build_station_directory": poison}))
+
+    with pytest.raises(wrapper.StageFailed) as excinfo:
+        wrapper.run_stage_graph(_args(tmp_path), [], [])
+
+    assert excinfo.value.name == "update_station_directory.py"
+
+
+def test_main_writes_stage_graph_result_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from src.utils.stations_validation import ValidationReport
+
+    target = tmp_path / "stations.json"
+    target.write_text(json.dumps({"stations": [{"name": "Existing", "bst_id": 1}]}), encoding="utf-8")
+    _install(monkeypatch, _fake_modules([]))
+    writes: list[Path] = []
+    real_write = wrapper._write_stations_payload
+
+    def record_write(path: Path, stations: Any) -> None:
+        writes.append(path)
+        real_write(path, stations)
+
+    monkeypatch.setattr(wrapper, "_write_stations_payload", record_write)
+    monkeypatch.setattr(
+        wrapper,
+        "validate_station_entries",
+        lambda stations: ValidationReport(
+            total_stations=len(stations),
+            duplicates=(),
+            alias_issues=(),
+            coordinate_issues=(),
+            gtfs_issues=(),
+            security_issues=(),
+            cross_station_id_issues=(),
+            provider_issues=(),
+            naming_issues=(),
+            gtfs_stop_count=0,
+        ),
+    )
+
+    exit_code = wrapper.main([
+        "--target", str(target),
+        "--heartbeat", str(tmp_path / "heartbeat.json"),
+        "--diff-report", str(tmp_path / "diff.md"),
+        "--quarantine", str(tmp_path / "quarantine.json"),
+        "--polygon", str(tmp_path / "missing-polygon.json"),
+    ])
+
+    assert exit_code == 0
+    assert writes == [target.resolve()]
+    names = [entry["name"] for entry in json.loads(target.read_text(encoding="utf-8"))["stations"]]
+    assert names == ["Existing", "Fresh", "WL Stop"]
+    heartbeat = json.loads((tmp_path / "heartbeat.json").read_text(encoding="utf-8"))
+    assert heartbeat["stations"] == {"before": 1, "after": 3, "delta": 2}
+    assert heartbeat["sub_scripts"][0]["name"] == "load_sources"
+
+
+def test_main_returns_stage_exit_code_without_writing(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    target = tmp_path / "stations.json"
+    original = json.dumps({"stations": [{"name": "Existing"}]})
+    target.write_text(original, encoding="utf-8")
+    _install(monkeypatch, _fake_modules([], **{"update_wl_stations.py:prepare_wl_entries": lambda args: None}))
+
+    exit_code = wrapper.main([
+        "--target", str(target),
+        "--heartbeat", str(tmp_path / "heartbeat.json"),
+        "--diff-report", str(tmp_path / "diff.md"),
+        "--quarantine", str(tmp_path / "quarantine.json"),
+    ])
+
+    assert exit_code == 1
+    assert target.read_text(encoding="utf-8") == original
+    assert not (tmp_path / "heartbeat.json").exists()
@@ -120,8 +120,8 @@ def test_wrapper_proceeds_when_no_quarantineable_match(
 ) -> None:
     """Auto-Quarantine ohne passende Station: bytewise unverändert + exit 0.
 
-    Verfahren: sub-scripts werden zu no-ops gemockt (subprocess.run gibt
-    None zurück), validate_stations liefert einen Report mit einem
+    Verfahren: die Stages werden zu no-ops gemockt (run_stage_graph gibt
+    die Eingabe zurück), validate_station_entries liefert einen Report mit einem
     provider_issue, dessen Identifier auf keine reale Station passt.
     Die Auto-Quarantine-Logik findet keinen Match und proceedet mit dem
     unveränderten Merge-Set. Erwartung: exit 0 und Bytes unverändert.
@@ -133,12 +133,10 @@ def test_wrapper_proceeds_when_no_quarantineable_match(
     target_stations, wrapper_args = _wrapper_args_for(tmp_path)
     original_bytes = target_stations.read_bytes()
 
-    # Replace sub-script subprocess invocations with no-ops. String target form
-    # keeps mypy --no-implicit-reexport happy without broadening the mock — the
-    # patch still applies only to subprocess.run as accessed through
-    # scripts.update_all_stations, not globally.
+    # Replace the in-process stage graph with a no-op that hands the
+    # loaded stations straight through to validation.
     monkeypatch.setattr(
-        "scripts.update_all_stations.subprocess.run", lambda *a, **kw: None
+        wrapper, "run_stage_graph", lambda args, stations, results: list(stations)
     )
 
     # The identifier ``<test>`` matches no station, so auto-quarantine
@@ -162,7 +160,7 @@ def test_wrapper_proceeds_when_no_quarantineable_match(
         naming_issues=(),
         gtfs_stop_count=0,
     )
-    monkeypatch.setattr(wrapper, "validate_stations", lambda *a, **kw: failing_report)
+    monkeypatch.setattr(wrapper, "validate_station_entries", lambda *a, **kw: failing_report)
 
     exit_code = wrapper.main(wrapper_args)
 
@@ -180,7 +178,7 @@ def test_wrapper_preserves_stations_json_on_atomic_write_failure(
 ) -> None:
     """Bei Fehler im finalen atomic_write bleibt data/stations.json bytewise unverändert.
 
-    Verfahren: sub-scripts werden zu no-ops gemockt, validate_stations liefert
+    Verfahren: die Stages werden zu no-ops gemockt, validate_station_entries liefert
     einen sauberen (issue-freien) Report — der Wrapper erreicht also den
     finalen copy-back-Block. atomic_write wird zum Fehlschlagen gebracht
     (OSError beim Aufruf). Erwartung: die Exception propagiert hoch und das
@@ -193,9 +191,9 @@ def test_wrapper_preserves_stations_json_on_atomic_write_failure(
     target_stations, wrapper_args = _wrapper_args_for(tmp_path)
     original_bytes = target_stations.read_bytes()
 
-    # Sub-scripts as no-ops.
+    # Stages as no-ops.
     monkeypatch.setattr(
-        "scripts.update_all_stations.subprocess.run", lambda *a, **kw: None
+        wrapper, "run_stage_graph", lambda args, stations, results: list(stations)
     )
 
     # Validation passes with a clean report — the wrapper proceeds to the
@@ -212,7 +210,7 @@ def test_wrapper_preserves_stations_json_on_atomic_write_failure(
         naming_issues=(),
         gtfs_stop_count=0,
     )
-    monkeypatch.setattr(wrapper, "validate_stations", lambda *a, **kw: clean_report)
+    monkeypatch.setattr(wrapper, "validate_station_entries", lambda *a, **kw: clean_report)
 
     # Force atomic_write to raise immediately on call.
     def failing_atomic_write(*args: object, **kwargs: object) -> None:
@@ -334,7 +332,7 @@ def test_wrapper_cli_args_redirect_outputs_to_tmp_path(
     pre_diff = real_diff.read_bytes() if real_diff.exists() else None
 
     monkeypatch.setattr(
-        "scripts.update_all_stations.subprocess.run", lambda *a, **kw: None
+        wrapper, "run_stage_graph", lambda args, stations, results: list(stations)
     )
     clean_report = ValidationReport(
         total_stations=0,
@@ -348,7 +346,7 @@ def test_wrapper_cli_args_redirect_outputs_to_tmp_path(
         naming_issues=(),
         gtfs_stop_count=0,
     )
-    monkeypatch.setattr(wrapper, "validate_stations", lambda *a, **kw: clean_report)
+    monkeypatch.setattr(wrapper, "validate_station_entries", lambda *a, **kw: clean_report)
 
     exit_code = wrapper.main(wrapper_args)
     assert exit_code == 0
@@ -263,7 +263,7 @@ def test_main_uses_fallback_when_remote_fails(
 
 
 def test_with_output_format_rewrites_only_the_token() -> None:
-    rewritten = update_baustellen_cache._with_output_format(
+    rewritten = update_baustellen_cache.with_output_format(
         update_baustellen_cache.DEFAULT_DATA_URL, "application/json"
     )
     assert rewritten.endswith("outputFormat=application/json")
@@ -276,13 +276,13 @@ def test_with_output_format_rewrites_only_the_token() -> None:
 def test_with_output_format_appends_when_absent() -> None:
     base = "https://data.wien.gv.at/daten/geo?service=WFS"
     assert (
-        update_baustellen_cache._with_output_format(base, "geojson")
+        update_baustellen_cache.with_output_format(base, "geojson")
         == base + "&outputFormat=geojson"
     )
 
 
 def test_with_typename_rewrites_only_the_token() -> None:
-    rewritten = update_baustellen_cache._with_typename(
+    rewritten = update_baustellen_cache.with_typename(
         update_baustellen_cache.DEFAULT_DATA_URL, "ogdwien:BAUSTELLENPKTOGD"
     )
     assert "typeName=ogdwien:BAUSTELLENPKTOGD" in rewritten
@@ -298,7 +298,7 @@ def test_fetch_layers_merges_both_typenames(monkeypatch: pytest.MonkeyPatch) ->
 
     def fake_fetch_remote(url: str, timeout: int) -> dict[str, Any]:
         # Record which layer was requested; return one feature per layer.
-        for typename in update_baustellen_cache._BAUSTELLEN_TYPENAMES:
+        for typename in update_baustellen_cache.BAUSTELLEN_TYPENAMES:
             if typename in url:
                 seen_typenames.append(typename)
         return {"type": "FeatureCollection", "features": []}
@@ -308,7 +308,7 @@ def test_fetch_layers_merges_both_typenames(monkeypatch: pytest.MonkeyPatch) ->
         update_baustellen_cache.DEFAULT_DATA_URL, timeout=5
     )
     assert events == []  # empty FeatureCollections → no events, but not None
-    assert set(seen_typenames) == set(update_baustellen_cache._BAUSTELLEN_TYPENAMES)
+    assert set(seen_typenames) == set(update_baustellen_cache.BAUSTELLEN_TYPENAMES)
 
 
 def test_fetch_layers_returns_none_when_all_layers_fail(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -490,15 +490,15 @@ def test_resolve_fallback_path_blocks_symlink_escape(tmp_path: Path) -> None:
 
 def test_resolve_data_url_default_when_unset() -> None:
     assert (
-        update_baustellen_cache._resolve_data_url(None)
+        update_baustellen_cache.resolve_data_url(None)
         == update_baustellen_cache.DEFAULT_DATA_URL
     )
     assert (
-        update_baustellen_cache._resolve_data_url("")
+        update_baustellen_cache.resolve_data_url("")
         == update_baustellen_cache.DEFAULT_DATA_URL
     )
     assert (
-        update_baustellen_cache._resolve_data_url("   ")
+        update_baustellen_cache.resolve_data_url("   ")
         == update_baustellen_cache.DEFAULT_DATA_URL
     )
 
@@ -508,7 +508,7 @@ def test_resolve_data_url_accepts_official_host() -> None:
     candidate = (
         "https://data.wien.gv.at/daten/geo?service=WFS&typeName=ogdwien:BAUSTELLEOGD"
     )
-    resolved = update_baustellen_cache._resolve_data_url(candidate)
+    resolved = update_baustellen_cache.resolve_data_url(candidate)
     assert resolved == candidate
 
 
@@ -532,7 +532,7 @@ def test_resolve_data_url_rejects_untrusted_host(
     import logging
 
     caplog.set_level(logging.WARNING, logger="update_baustellen_cache")
-    resolved = update_baustellen_cache._resolve_data_url(url)
+    resolved = update_baustellen_cache.resolve_data_url(url)
     # Must fall back to the default — no fetch goes to the attacker.
     assert resolved == update_baustellen_cache.DEFAULT_DATA_URL
     assert any(
@@ -0,0 +1,101 @@
+"""Record/replay stand-in for the upstream APIs (``benchmarks/upstream.py``).
+
+The stand-in must be reachable through the real ``request_safe`` path only
+inside ``loopback_standins``; recordings must not keep credentials.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from benchmarks import upstream
+from benchmarks.upstream import Recording, ReplayProfile
+from src.utils import http as http_module
+from src.utils.http import fetch_content_safe, request_safe
+
+_WL_HOST = "www.wienerlinien.at"
+_TRAFFIC_INFOS = Recording(
+    host=_WL_HOST,
+    path="/ogd_realtime/trafficInfoList",
+    query="name=stoerungkurz&name=stoerunglang",
+    status=200,
+    content_type="application/json",
+    body=json.dumps({"data": {"trafficInfos": [{"name": "a"}, {"name": "b"}]}}).encode(),
+)
+
+
+def test_scale_payload_repeats_json_records_and_rss_items() -> None:
+    scaled = json.loads(upstream.scale_payload(_TRAFFIC_INFOS.body, "application/json", 3))
+    assert [info["name"] for info in scaled["data"]["trafficInfos"]] == ["a", "b"] * 3
+
+    rss = b"<rss><channel><title>t</title><item>1</item><item>2</item></channel></rss>"
+    assert upstream.scale_payload(rss, "application/rss+xml", 2) == (
+        b"<rss><channel><title>t</title><item>1</item><item>2</item><item>1</item><item>2</item></channel></rss>"
+    )
+    assert upstream.scale_payload(b"plain", "text/plain", 5) == b"plain"
+
+
+def test_request_safe_reaches_the_standin_only_inside_the_block() -> None:
+    url = f"https://{_WL_HOST}/ogd_realtime/trafficInfoList?name=stoerunglang&name=stoerungkurz&accessId=x"
+    with requests.Session() as session, upstream.serve([_TRAFFIC_INFOS]) as server:
+        response = request_safe(session, url, allowed_content_types=("application/json",))
+        assert response.content == _TRAFFIC_INFOS.body
+        assert server.stats.served == 1
+
+    assert http_module._LOOPBACK_STANDINS == {}
+    with pytest.raises(ValueError):
+        http_module.loopback_standins({_WL_HOST: 0}).__enter__()
+
+
+def test_injected_errors_surface_as_http_errors() -> None:
+    url = f"https://{_WL_HOST}/ogd_realtime/trafficInfoList"
+    with requests.Session() as session, upstream.serve([_TRAFFIC_INFOS], ReplayProfile(error_rate=1.0)) as server:
+        with pytest.raises(requests.HTTPError):
+            request_safe(session, url)
+        assert server.stats.injected_errors == 1
+
+
+def test_record_captures_streamed_bodies_without_secrets(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VOR_ACCESS_ID", "secret-access-id")
+    rss = Recording(
+        host="fahrplan.oebb.at", path="/rss", query="", status=200,
+        content_type="application/rss+xml",
+        body=b"<rss><channel><item>secret-access-id</item></channel></rss>",
+    )
+    streamed: list[bytes] = []
+
+    def driver(_live: bool) -> int:
+        with requests.Session() as session:
+            fetch_content_safe(session, "https://fahrplan.oebb.at/rss?accessId=secret-access-id&lang=de", on_chunk=streamed.append)
+        return 1
+
+    monkeypatch.setitem(upstream.SOURCES, "oebb", driver)
+    with upstream.serve([rss]):
+        (captured,) = upstream.record("oebb")
+
+    assert b"".join(streamed) == rss.body
+    assert captured.host == "fahrplan.oebb.at" and captured.query == "lang=de"
+    assert b"secret-access-id" not in captured.body and b"REDACTED" in captured.body
+
+    upstream.save_recordings(tmp_path, "oebb", [captured])
+    assert upstream.load_recordings(tmp_path, "oebb") == [captured]
+
+
+def test_bench_reports_latency_percentiles(monkeypatch: pytest.MonkeyPatch) -> None:
+    def driver(_live: bool) -> int:
+        with requests.Session() as session:
+            payload: Any = request_safe(session, f"https://{_WL_HOST}/ogd_realtime/trafficInfoList").json()
+        return len(payload["data"]["trafficInfos"])
+
+    monkeypatch.setitem(upstream.SOURCES, "wl", driver)
+    report = upstream.bench("wl", [_TRAFFIC_INFOS], ReplayProfile(latency_ms=20, scale=2), runs=4, concurrency=2)
+
+    assert report["items"] == 16 and report["failed_runs"] == 0
+    assert report["requests"] == 4 and report["unmatched_requests"] == 0
+    assert 0.02 <= report["median_s"] <= report["p95_s"] <= report["max_s"]
@@ -3,7 +3,7 @@ import os
 from pathlib import Path
 from typing import Any
 import pytest
-from src.utils.files import atomic_write
+from src.utils.files import WriteOutcome, atomic_write
 
 def test_atomic_write_creates_file(tmp_path: Path) -> None:
     target = tmp_path / "test.txt"
@@ -121,3 +121,59 @@ def test_atomic_write_closes_raw_fd_when_file_open_fails(
     # No temp file and no target should be left behind.
     assert not any(p.name.endswith(".tmp") for p in tmp_path.iterdir())
     assert not target.exists()
+
+
+def test_atomic_write_skip_unchanged_keeps_identical_target(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "stable.json"
+    with atomic_write(target, permissions=0o644) as f:
+        f.write('{"a": 1}\n')
+    inode = target.stat().st_ino
+    os.utime(target, (1_000_000, 1_000_000))
+
+    synced: list[int] = []
+    real_fsync = os.fsync
+
+    def tracking_fsync(fd: int) -> None:
+        synced.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", tracking_fsync)
+    outcome = WriteOutcome()
+    with atomic_write(target, permissions=0o644, skip_unchanged=True, outcome=outcome) as f:
+        f.write('{"a": ')
+        f.write("1}\n")
+
+    assert outcome.changed is False
+    assert synced == []
+    assert target.stat().st_ino == inode  # not replaced
+    assert target.stat().st_mtime > 1_000_000  # age checks still see it as current
+    assert [p.name for p in tmp_path.iterdir()] == ["stable.json"]
+
+
+@pytest.mark.parametrize(
+    ("existing", "permissions"),
+    [(b"old", 0o644), (b"new!", 0o644), (b"same", 0o600), (None, 0o644)],
+    ids=["size-differs", "digest-differs", "mode-differs", "missing"],
+)
+def test_atomic_write_skip_unchanged_replaces_differing_target(
+    tmp_path: Path, existing: bytes | None, permissions: int
+) -> None:
+    target = tmp_path / "blob.bin"
+    if existing is not None:
+        target.write_bytes(existing)
+        target.chmod(0o644)
+    outcome = WriteOutcome()
+    with atomic_write(target, mode="wb", permissions=permissions, skip_unchanged=True, outcome=outcome) as f:
+        f.write(b"same")
+
+    assert outcome.changed is True
+    assert target.read_bytes() == b"same"
+    assert target.stat().st_mode & 0o777 == permissions
+
+
+def test_atomic_write_skip_unchanged_rejects_non_write_modes(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="skip_unchanged"):
+        with atomic_write(tmp_path / "log.txt", mode="a", skip_unchanged=True):
+            pass